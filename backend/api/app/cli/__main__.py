@@ -0,0 +1,163 @@
+"""
+Command line tools of the API.
+
+Usage: python -m app.cli import <directory> [options]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from ..database.manager import db_manager
+from ..models import data_contract as _data_contract_model  # noqa: F401  Registers the table
+from .importer import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_PATTERN,
+    DataContractImporter,
+    ImportJournal,
+    ImportReport,
+    discover_files,
+)
+
+
+# Default journal of the import command, in the working directory
+DEFAULT_JOURNAL = Path(".mycelium-import.jsonl")
+
+# Number of errors detailed in the summary of an import
+MAX_REPORTED_ERRORS = 20
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the parser of the command line.
+
+    :return argparse.ArgumentParser: The parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli", description="Command line tools of the API."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser("import", help="Import a directory of data contract YAML files")
+    importer.add_argument("directory", type=Path, help="The directory to import, recursively")
+    importer.add_argument(
+        "--pattern", default=DEFAULT_PATTERN, help="Glob pattern of the file names"
+    )
+    importer.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Number of data contracts written per transaction",
+    )
+    importer.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of parsing processes, the number of CPUs by default, 0 to parse inline",
+    )
+    importer.add_argument(
+        "--replace",
+        action="store_true",
+        help="Replace existing data contracts rather than keeping them",
+    )
+    importer.add_argument(
+        "--journal",
+        type=Path,
+        default=DEFAULT_JOURNAL,
+        help="Journal of the imported files, used to resume an interrupted import",
+    )
+    importer.add_argument("--no-journal", action="store_true", help="Do not keep a journal")
+    importer.add_argument(
+        "--restart", action="store_true", help="Discard the journal and import every file"
+    )
+    return parser
+
+
+def _write_progress(report: ImportReport) -> None:
+    """
+    Prints the progress of an import on one refreshed line.
+
+    :param ImportReport report: The counters of the run
+    """
+    sys.stderr.write(
+        f"\r {report.parsed} files parsed, {report.created + report.replaced} written, "
+        f"{report.failed} failed ({report.files_per_second:.0f} files/s)"
+    )
+    sys.stderr.flush()
+
+
+def _write_summary(report: ImportReport) -> None:
+    """
+    Prints the summary of an import.
+
+    :param ImportReport report: The counters of the run
+    """
+    lines = [
+        "",
+        f" Files discovered:  {report.discovered}",
+        f" Already imported:  {report.resumed}",
+        f" Files parsed:      {report.parsed}",
+        f" Created:           {report.created}",
+        f" Replaced:          {report.replaced}",
+        f" Already existing:  {report.existing}",
+        f" Failed:            {report.failed}",
+        f" Elapsed:           {report.elapsed:.2f}s ({report.files_per_second:.0f} files/s)",
+    ]
+    for path, error in report.errors[:MAX_REPORTED_ERRORS]:
+        lines.append(f" ❌ {path}: {error}")
+    if report.failed > MAX_REPORTED_ERRORS:
+        lines.append(f" ... and {report.failed - MAX_REPORTED_ERRORS} more errors")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def import_directory(args: argparse.Namespace) -> int:
+    """
+    Runs the import command.
+
+    :param argparse.Namespace args: The parsed command line
+    :return int: The exit status, 1 if any file failed to import
+    """
+    if not args.directory.is_dir():
+        sys.stderr.write(f" ❌ Not a directory: {args.directory}\n")
+        return 2
+
+    journal_path = None if args.no_journal else args.journal
+    if journal_path is not None and args.restart:
+        journal_path.unlink(missing_ok=True)
+
+    db_manager.create_database()
+    db_manager.setup_engine()
+    db_manager.create_tables()
+    db_manager.run_migrations()
+
+    importer = DataContractImporter(
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        replace=args.replace,
+        journal=ImportJournal(journal_path),
+    )
+    files = discover_files(args.directory, args.pattern)
+    db = db_manager.get_db()
+    try:
+        report = importer.run(db, files, on_progress=_write_progress)
+    finally:
+        db.close()
+    _write_summary(report)
+    return 1 if report.failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the command line.
+
+    :param Optional[List[str]] argv: The arguments, those of the process if None
+    :return int: The exit status
+    """
+    args = build_parser().parse_args(argv)
+    if args.command == "import":
+        return import_directory(args)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
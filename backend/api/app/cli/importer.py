@@ -0,0 +1,329 @@
+"""Bulk import of data contract YAML files into the database."""
+
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import NamedTuple
+
+import yaml
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from ..crud.data_contract import DataContractCRUD
+from ..exceptions.crud.data_contract import (
+    DataContractAlreadyExistsError,
+    DataContractOperationError,
+)
+from ..schemas.data_contract.objects.data_contract import DataContract
+from ..utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Files picked up in the imported directory, at any depth
+DEFAULT_PATTERN = "*datacontract.y*ml"
+
+# Number of data contracts written per transaction
+DEFAULT_CHUNK_SIZE = 500
+
+# Number of files parsed by a worker process per task
+FILES_PER_TASK = 32
+
+# The libyaml loader is an order of magnitude faster than the pure Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class LoadedFile(NamedTuple):
+    """A data contract file, parsed and validated, or the reason it could not be."""
+
+    path: str
+    data_contract: DataContract | None
+    error: str | None
+
+
+def discover_files(directory: Path, pattern: str = DEFAULT_PATTERN) -> list[Path]:
+    """
+    Lists the data contract files of a directory and its subdirectories.
+
+    :param Path directory: The directory to import
+    :param str pattern: The glob pattern of the file names
+    :return List[Path]: The absolute paths of the files, sorted
+    """
+    return sorted(path.resolve() for path in directory.rglob(pattern) if path.is_file())
+
+
+def load_data_contracts(paths: list[str]) -> list[LoadedFile]:
+    """
+    Parses and validates data contract files, in a worker process.
+
+    :param List[str] paths: The paths of the files
+    :return List[LoadedFile]: The outcome of each file, in order
+    """
+    return [_load_data_contract(path) for path in paths]
+
+
+def _load_data_contract(path: str) -> LoadedFile:
+    """
+    Parses and validates one data contract file.
+
+    :param str path: The path of the file
+    :return LoadedFile: The validated data contract, or why the file was rejected
+    """
+    try:
+        document = yaml.load(Path(path).read_bytes(), Loader=YAML_LOADER)  # noqa: S506
+        return LoadedFile(path, DataContract.model_validate(document), None)
+    except yaml.YAMLError as e:
+        return LoadedFile(path, None, f"invalid YAML: {e}")
+    except ValidationError as e:
+        details = "; ".join(
+            f"{'.'.join(map(str, error['loc'])) or 'document'}: {error['msg']}"
+            for error in e.errors()
+        )
+        return LoadedFile(path, None, f"invalid data contract: {details}")
+    except OSError as e:
+        return LoadedFile(path, None, f"unreadable file: {e}")
+
+
+class ImportJournal:
+    """
+    Append-only record of the imported files, making interrupted imports resumable.
+
+    A file is recorded once its data contract is committed, along with its size and
+    modification time: a file changed since is imported again.
+    """
+
+    def __init__(self, path: Path | None):
+        """
+        Initialize the journal.
+
+        :param Optional[Path] path: The journal file, None to import every file every time
+        """
+        self.path = path
+
+    @staticmethod
+    def _key(path: Path) -> tuple[str, int, int]:
+        """
+        Identifies a version of a file.
+
+        :param Path path: The path of the file
+        :return Tuple[str, int, int]: The path, size and modification time of the file
+        """
+        stat = path.stat()
+        return str(path), stat.st_size, stat.st_mtime_ns
+
+    def pending(self, files: Iterable[Path]) -> tuple[list[Path], int]:
+        """
+        Filters out the files already imported, unchanged since.
+
+        :param Iterable[Path] files: The files to import
+        :return Tuple[List[Path], int]: The files left to import, and the number skipped
+        """
+        files = list(files)
+        if self.path is None or not self.path.exists():
+            return files, 0
+        with self.path.open(encoding="utf-8") as journal:
+            done = {tuple(json.loads(line)) for line in journal if line.strip()}
+        pending = [path for path in files if self._key(path) not in done]
+        return pending, len(files) - len(pending)
+
+    def record(self, paths: Iterable[str]) -> None:
+        """
+        Records imported files.
+
+        :param Iterable[str] paths: The paths of the files
+        """
+        if self.path is None:
+            return
+        with self.path.open("a", encoding="utf-8") as journal:
+            journal.writelines(f"{json.dumps(self._key(Path(path)))}\n" for path in paths)
+
+
+@dataclass
+class ImportReport:
+    """Counters of an import run."""
+
+    discovered: int = 0
+    resumed: int = 0
+    parsed: int = 0
+    created: int = 0
+    replaced: int = 0
+    existing: int = 0
+    errors: list[tuple[str, str]] = field(default_factory=list)
+    started_at: float = field(default_factory=perf_counter)
+
+    @property
+    def failed(self) -> int:
+        """
+        The number of files that could not be imported.
+
+        :return int: The number of errors
+        """
+        return len(self.errors)
+
+    @property
+    def elapsed(self) -> float:
+        """
+        The duration of the run so far.
+
+        :return float: The elapsed time in seconds
+        """
+        return perf_counter() - self.started_at
+
+    @property
+    def files_per_second(self) -> float:
+        """
+        The throughput of the run so far.
+
+        :return float: The number of files processed per second
+        """
+        return self.parsed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class DataContractImporter:
+    """
+    Imports a directory of data contract files.
+
+    Files are parsed and validated by a pool of worker processes, and their data contracts
+    are written in chunks as results stream back, each chunk in one transaction: with
+    INSERT ... ON CONFLICT DO NOTHING, or as upserts when existing data contracts are replaced.
+    """
+
+    def __init__(
+        self,
+        crud: DataContractCRUD | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: int | None = None,
+        replace: bool = False,
+        journal: ImportJournal | None = None,
+    ):
+        """
+        Initialize the importer.
+
+        :param Optional[DataContractCRUD] crud: The CRUD operations, new ones if None
+        :param int chunk_size: The number of data contracts written per transaction
+        :param Optional[int] workers: The number of parsing processes, the number of CPUs if
+            None, 0 to parse in this process
+        :param bool replace: Whether existing data contracts are replaced rather than kept
+        :param Optional[ImportJournal] journal: The journal of the imported files, if any
+        """
+        self._crud = crud or DataContractCRUD()
+        self.chunk_size = max(chunk_size, 1)
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.replace = replace
+        self.journal = journal or ImportJournal(None)
+
+    def run(
+        self,
+        db: Session,
+        files: list[Path],
+        on_progress: Callable[[ImportReport], None] | None = None,
+    ) -> ImportReport:
+        """
+        Imports data contract files.
+
+        :param Session db: The database session
+        :param List[Path] files: The files to import
+        :param Optional[Callable[[ImportReport], None]] on_progress: Called after each chunk
+        :return ImportReport: The counters and errors of the run
+        """
+        report = ImportReport(discovered=len(files))
+        files, report.resumed = self.journal.pending(files)
+        seen: dict[str, str] = {}
+        chunk: list[LoadedFile] = []
+
+        for loaded in self._load(files):
+            report.parsed += 1
+            if loaded.data_contract is None:
+                report.errors.append((loaded.path, loaded.error))
+                continue
+            first = seen.setdefault(loaded.data_contract.id, loaded.path)
+            if first != loaded.path:
+                report.errors.append((loaded.path, f"duplicate ID, already in {first}"))
+                continue
+            chunk.append(loaded)
+            if len(chunk) >= self.chunk_size:
+                self._write(db, chunk, report)
+                chunk = []
+                if on_progress is not None:
+                    on_progress(report)
+        if chunk:
+            self._write(db, chunk, report)
+        if on_progress is not None:
+            on_progress(report)
+        return report
+
+    def _load(self, files: list[Path]) -> Iterator[LoadedFile]:
+        """
+        Parses and validates files, keeping a bounded number of them in flight.
+
+        :param List[Path] files: The files to load
+        :return Iterator[LoadedFile]: The outcome of each file, in order
+        """
+        tasks = [
+            [str(path) for path in files[start : start + FILES_PER_TASK]]
+            for start in range(0, len(files), FILES_PER_TASK)
+        ]
+        if self.workers <= 0:
+            for task in tasks:
+                yield from load_data_contracts(task)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            yield from self._stream(pool, tasks)
+
+    def _stream(self, pool: Executor, tasks: list[list[str]]) -> Iterator[LoadedFile]:
+        """
+        Runs the loading tasks on a pool, yielding their results in order.
+
+        :param Executor pool: The worker pool
+        :param List[List[str]] tasks: The paths loaded by each task
+        :return Iterator[LoadedFile]: The outcome of each file, in order
+        """
+        in_flight: deque[Future] = deque()
+        max_in_flight = max(self.workers * 2, self.chunk_size // FILES_PER_TASK + 1)
+        for task in tasks:
+            in_flight.append(pool.submit(load_data_contracts, task))
+            if len(in_flight) >= max_in_flight:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+    def _write(self, db: Session, chunk: list[LoadedFile], report: ImportReport) -> None:
+        """
+        Writes a chunk of data contracts in one transaction and records its files.
+
+        :param Session db: The database session
+        :param List[LoadedFile] chunk: The loaded files of the chunk
+        :param ImportReport report: The report to update
+        """
+        data_contracts = [loaded.data_contract for loaded in chunk]
+        if self.replace:
+            try:
+                created = self._crud.upsert_data_contracts(db, data_contracts)
+            except DataContractOperationError as e:
+                report.errors.extend((loaded.path, e.message) for loaded in chunk)
+                return
+            report.created += sum(created.values())
+            report.replaced += len(created) - sum(created.values())
+            self.journal.record(loaded.path for loaded in chunk)
+            return
+
+        errors = self._crud.bulk_create_data_contracts(db, data_contracts, chunk_size=0)
+        imported = []
+        for loaded in chunk:
+            id = loaded.data_contract.id
+            error = errors.get(id)
+            if error is None:
+                report.created += 1
+            elif error == DataContractAlreadyExistsError(id).message:
+                report.existing += 1
+            else:
+                report.errors.append((loaded.path, error))
+                continue
+            imported.append(loaded.path)
+        self.journal.record(imported)
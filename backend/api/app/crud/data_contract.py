@@ -1,27 +1,208 @@
 """Data Contract CRUD operations module."""
 
+import json
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, datetime
+from functools import cache
+from typing import Any, Literal, NamedTuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import (
+    ColumnElement,
+    Double,
+    Insert,
+    Row,
+    Select,
+    String,
+    Text,
+    and_,
+    bindparam,
+    case,
+    cast,
+    delete,
+    false,
+    func,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    JSONB,
+    JSONPATH,
+    TSVECTOR,
+    insert as postgresql_insert,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
 
+from ..database.notifications import DATA_CONTRACT_CHANNEL, notify, notify_ids
 from ..exceptions.crud.data_contract import (
+    DataContractAlreadyExistsError,
+    DataContractConflictError,
+    DataContractOperationError,
+    DataContractPreconditionFailedError,
     raise_not_found_error,
+    raise_precondition_failed_error,
+    raise_section_validation_error,
     raise_sqlalchemy_error,
 )
+from ..exceptions.utils.pagination import InvalidCursorError
+from ..exceptions.utils.patch import NotAMergePatchError, PatchPathError
 from ..models.data_contract import DataContract as DataContractModel
+from ..models.data_migration import DataMigration as DataMigrationModel
 from ..schemas.data_contract.objects.data_contract import DataContract
+from ..schemas.data_contract.objects.data_contract_search_result import DataContractSearchResult
+from ..schemas.data_contract.objects.data_contract_summary import DataContractSummary
+from ..schemas.data_contract.objects.definition_object import DefinitionObject
+from ..schemas.data_contract.objects.model_object import ModelObject
+from ..schemas.data_contract.objects.server_object import ServerObject
 from ..schemas.data_contract.routes.data_contract_create import DataContractCreate
 from ..schemas.data_contract.routes.data_contract_delete import DataContractDelete
+from ..schemas.data_contract.routes.data_contract_list import DataContractFilter
 from ..schemas.data_contract.routes.data_contract_update import DataContractUpdate
+from ..utils.canonical import CanonicalDocument, canonical_columns, read_canonical
+from ..utils.conditional import IfMatch, ResourceVersion
 from ..utils.logger import get_logger
-from ..utils.tools import db_to_pydantic_model, pydantic_to_db_model
+from ..utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    decode_cursor,
+    decode_ranked_cursor,
+    encode_cursor,
+    encode_ranked_cursor,
+)
+from ..utils.patch import apply_json_patch, merge_patch, parse_pointer, validate_json_patch
+from ..utils.search import (
+    HEADLINE_OPTIONS,
+    SEARCH_CONFIG,
+    build_search_sections,
+    build_search_text,
+)
+from ..utils.tools import as_data_contract, data_contract_columns, db_to_pydantic_model
+from ..utils.trusted import trusted_document
+from .data_contract_change import ChangeEvent, DataContractChangeCRUD
+from .data_contract_revision import DataContractRevisionCRUD, NewRevision, stored_document
 
 
 logger = get_logger(__name__)
 
+# Attributes of the 'info' section projected into data contract summaries
+SUMMARY_INFO_FIELDS = ("title", "version", "description", "owner", "status")
+
+# Name under which the migration of the field references stored under "ref" is recorded
+LEGACY_REFERENCES_MIGRATION = "data_contracts.legacy_references"
+
+# Number of data contracts indexed per transaction when backfilling the search columns
+SEARCH_BACKFILL_BATCH_SIZE = 500
+
+# Number of data contracts serialized per transaction when backfilling canonical documents
+DOCUMENT_BACKFILL_BATCH_SIZE = 500
+
+# Number of data contracts inserted per transaction by bulk creation, 0 for a single one
+BULK_CHUNK_SIZE = 500
+
+# Text search weights, from the most to the least important section
+SEARCH_WEIGHTS = ("A", "B", "C", "D")
+
+# Sections whose entries are patched, validated and written one at a time
+ENTRY_SECTIONS = {"servers": ServerObject, "models": ModelObject, "definitions": DefinitionObject}
+
+# Sections the full-text search columns are built from
+SEARCH_SECTIONS = ("info", "models")
+
+# Number of times a patch is applied again after a concurrent write to the same data contract
+PATCH_ATTEMPTS = 3
+
+# Number of rows fetched at once from the server-side cursor of an export
+EXPORT_BATCH_SIZE = 500
+
+# Columns holding the data contract document, as returned by statements with RETURNING
+DOCUMENT_COLUMNS = tuple(getattr(DataContractModel, name) for name in DataContract.model_fields)
+
+# The canonical document, and the sections it is rebuilt from, only read when it is missing
+CANONICAL_COLUMNS = (
+    DataContractModel.document,
+    DataContractModel.document_hash,
+    *(
+        case((DataContractModel.document.is_(None), column)).label(column.key)
+        for column in DOCUMENT_COLUMNS
+    ),
+)
+
+# The version and canonical document of each data contract of a page, with its id
+PAGE_COLUMNS = (
+    DataContractModel.id,
+    DataContractModel.revision,
+    DataContractModel.updated_at,
+    *(column for column in CANONICAL_COLUMNS if column.key != "id"),
+)
+
+
+class DataContractWrite(NamedTuple):
+    """A data contract write, as batched by `apply_data_contract_writes`."""
+
+    operation: Literal["create", "upsert"]
+    data_contract: DataContractCreate | DataContractUpdate
+    expected: IfMatch | None = None
+
+
+@cache
+def _section_adapter(section: str) -> TypeAdapter:
+    """
+    Builds the validator of one section of a data contract, from its field in the schema.
+
+    :param str section: The name of the section
+    :return TypeAdapter: The validator of the section
+    """
+    return TypeAdapter(DataContract.model_fields[section].annotation)
+
 
 class DataContractCRUD:
     """CRUD operations for data contracts."""
 
+    def __init__(
+        self,
+        revisions: DataContractRevisionCRUD | None = None,
+        changes: DataContractChangeCRUD | None = None,
+    ):
+        """
+        Initialize the CRUD operations.
+
+        :param Optional[DataContractRevisionCRUD] revisions: The revision history every write
+            is recorded in, a new one if None
+        :param Optional[DataContractChangeCRUD] changes: The change feed every write and
+            deletion is appended to, a new one if None
+        """
+        self._revisions = revisions or DataContractRevisionCRUD()
+        self._changes = changes or DataContractChangeCRUD()
+
+    def _record_writes(self, db: Session, revisions: list[NewRevision]) -> None:
+        """
+        Records written revisions in the history and in the change feed, in the current
+        transaction, without committing it.
+
+        :param Session db: The database session
+        :param List[NewRevision] revisions: The written revisions, of distinct data contracts
+        :raises SQLAlchemyError: If there's a database error
+        """
+        self._revisions.record_revisions(db, revisions)
+        # Only a freshly inserted row is at revision 1
+        self._changes.record_changes(
+            db,
+            [
+                ChangeEvent(
+                    "create" if new.revision == 1 else "update", new.data_contract_id, new.revision
+                )
+                for new in revisions
+            ],
+        )
+
     def create_data_contract(self, db: Session, data_contract: DataContractCreate) -> DataContract:
         """
         Creates a new data contract in the database.
@@ -32,11 +213,8 @@ class DataContractCRUD:
         :raises SQLAlchemyError: If there's a database error
         """
         try:
-            created_data_contract = DataContract.model_validate(data_contract.model_dump())
-            db_data_contract = pydantic_to_db_model(created_data_contract)
-            db.add(db_data_contract)
+            created_data_contract = self._create(db, data_contract)
             db.commit()
-            db.refresh(db_data_contract)
         except SQLAlchemyError as e:
             db.rollback()
             logger.exception(" ❌ Failed to create data contract")
@@ -45,139 +223,2164 @@ class DataContractCRUD:
             logger.exception(" ❌ Unexpected error occurred while creating data contract")
             raise
         else:
-            logger.info(f" ✅ Data contract created successfully: {db_data_contract.id}")
+            logger.info(f" ✅ Data contract created successfully: {created_data_contract.id}")
             return created_data_contract
 
-    def get_data_contract(self, db: Session, id: str) -> DataContract:
+    def _create(self, db: Session, data_contract: DataContractCreate) -> DataContract:
         """
-        Retrieves a data contract from the database.
+        Inserts a new data contract in the current transaction, without committing it.
 
         :param Session db: The database session
-        :param str id: The ID of the data contract
-        :return DataContract: The data contract
-        :raises DataContractNotFoundError: If the data contract is not found
+        :param DataContractCreate data_contract: The data contract to create
+        :return DataContract: The created data contract
         :raises SQLAlchemyError: If there's a database error
         """
+        created_data_contract = as_data_contract(data_contract)
+        postgresql = db.get_bind().dialect.name == "postgresql"
+        values = self._insert_row(created_data_contract, postgresql)
+        updated_at = db.execute(
+            self._insert_statement(postgresql).returning(DataContractModel.updated_at), values
+        ).scalar_one()
+        self._record_writes(
+            db,
+            [NewRevision(created_data_contract.id, 1, updated_at, stored_document(values))],
+        )
+        notify(db, DATA_CONTRACT_CHANNEL, {"op": "create", "id": created_data_contract.id})
+        return created_data_contract
+
+    def apply_data_contract_writes(
+        self, db: Session, writes: list[DataContractWrite]
+    ) -> list[DataContract | tuple[DataContract, ResourceVersion, bool] | Exception]:
+        """
+        Applies a batch of independent writes in a single transaction.
+
+        Each write runs in its own savepoint, so that a failing write is rolled back alone
+        and reported as its result, the others being committed together by one commit.
+
+        :param Session db: The database session
+        :param List[DataContractWrite] writes: The writes, in order
+        :return List[Union[DataContract, Tuple[DataContract, ResourceVersion, bool], Exception]]:
+            The result of each write, as returned by `create_data_contract` or
+            `upsert_data_contract`, or its error
+        """
+        results: list[Any] = []
+        for write in writes:
+            try:
+                with db.begin_nested():
+                    if write.operation == "create":
+                        results.append(self._create(db, write.data_contract))
+                    else:
+                        results.append(self._upsert(db, write.data_contract, write.expected))
+            except SQLAlchemyError as e:
+                logger.warning(f" ⚠️ Batched {write.operation} failed: {write.data_contract.id}")
+                error = DataContractOperationError(
+                    "create" if write.operation == "create" else "update"
+                )
+                error.__cause__ = e
+                results.append(error)
+            except Exception as e:
+                logger.warning(f" ⚠️ Batched {write.operation} failed: {write.data_contract.id}")
+                results.append(e)
+
         try:
-            db_data_contract = db.query(DataContractModel).filter_by(id=id).first()
-            if db_data_contract is None:
-                logger.warning(f" ⚠️ Data contract not found: {id}")
-                raise_not_found_error(id)
+            db.commit()
         except SQLAlchemyError as e:
-            logger.exception(" ❌ Failed to retrieve data contract")
-            raise_sqlalchemy_error(e, "retrieve")
-        except Exception:
-            logger.exception(" ❌ Unexpected error occurred while retrieving data contract")
-            raise
+            db.rollback()
+            logger.exception(f" ❌ Failed to commit a batch of {len(writes)} writes")
+            error = DataContractOperationError("update")
+            error.__cause__ = e
+            return [result if isinstance(result, Exception) else error for result in results]
+        logger.info(f" ✅ Batch of {len(writes)} data contract writes committed")
+        return results
+
+    def bulk_create_data_contracts(
+        self,
+        db: Session,
+        data_contracts: list[DataContract],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> dict[str, str | None]:
+        """
+        Creates data contracts in batches, skipping the ones whose ID already exists.
+
+        Each chunk is inserted by one INSERT ... ON CONFLICT DO NOTHING RETURNING statement,
+        executed as a batched executemany, and committed on its own: a failing chunk is rolled
+        back without affecting the others. The data contracts must have distinct IDs.
+
+        :param Session db: The database session
+        :param List[DataContract] data_contracts: The validated data contracts to create
+        :param int chunk_size: The number of data contracts per transaction, 0 for a single one
+        :return Dict[str, Optional[str]]: The error message of each data contract by ID, None
+            for the created ones
+        """
+        postgresql = db.get_bind().dialect.name == "postgresql"
+        statement = self._bulk_insert_statement(postgresql)
+        rows = [self._insert_row(data_contract, postgresql) for data_contract in data_contracts]
+
+        results: dict[str, str | None] = {}
+        size = chunk_size or len(rows) or 1
+        for start in range(0, len(rows), size):
+            chunk = rows[start : start + size]
+            try:
+                created = {row.id: row.updated_at for row in db.execute(statement, chunk)}
+                self._record_writes(
+                    db,
+                    [
+                        NewRevision(row["id"], 1, created[row["id"]], stored_document(row))
+                        for row in chunk
+                        if row["id"] in created
+                    ],
+                )
+                db.commit()
+            except SQLAlchemyError:
+                db.rollback()
+                logger.exception(" ❌ Failed to create a chunk of data contracts")
+                error = DataContractOperationError("create").message
+                results.update((row["id"], error) for row in chunk)
+                continue
+            for row in chunk:
+                results[row["id"]] = (
+                    None
+                    if row["id"] in created
+                    else DataContractAlreadyExistsError(row["id"]).message
+                )
+
+        created_count = sum(error is None for error in results.values())
+        logger.info(f" ✅ Created {created_count} of {len(rows)} data contracts in bulk")
+        return results
+
+    def upsert_data_contracts(
+        self, db: Session, data_contracts: list[DataContract]
+    ) -> dict[str, bool]:
+        """
+        Creates or replaces data contracts in one transaction.
+
+        The data contracts are written by one INSERT ... ON CONFLICT (id) DO UPDATE ...
+        RETURNING statement, executed as a batched executemany. The other workers are notified
+        of the replaced data contracts. The data contracts must have distinct IDs.
+
+        :param Session db: The database session
+        :param List[DataContract] data_contracts: The validated data contracts to store
+        :return Dict[str, bool]: Whether each data contract was created rather than replaced,
+            by ID
+        :raises SQLAlchemyError: If there's a database error
+        """
+        if not data_contracts:
+            return {}
+        try:
+            postgresql = db.get_bind().dialect.name == "postgresql"
+            values = {
+                data_contract.id: self._insert_row(data_contract, postgresql)
+                for data_contract in data_contracts
+            }
+            rows = db.execute(
+                self._upsert_statement(postgresql, with_id=True), list(values.values())
+            ).all()
+            self._record_writes(
+                db,
+                [
+                    NewRevision(
+                        row.id, row.revision, row.updated_at, stored_document(values[row.id])
+                    )
+                    for row in rows
+                ],
+            )
+            # Replacing bumps the revision: only a freshly inserted row is at revision 1
+            created = {row.id: row.revision == 1 for row in rows}
+            notify_ids(
+                db, DATA_CONTRACT_CHANNEL, "update", (id for id, new in created.items() if not new)
+            )
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.exception(" ❌ Failed to upsert data contracts")
+            raise_sqlalchemy_error(e, "update")
         else:
-            data_contract = db_to_pydantic_model(db_data_contract)
-            logger.info(f" ✅ Data contract retrieved successfully: {id}")
-            return data_contract
+            logger.info(f" ✅ Upserted {len(created)} data contracts in bulk")
+            return created
 
-    def update_data_contract(
+    @classmethod
+    def _insert_statement(cls, postgresql: bool) -> Insert:
+        """
+        Builds the dialect-specific statement inserting a data contract from the parameters
+        built by `_insert_row`, without conflict handling.
+
+        :param bool postgresql: Whether the statement targets PostgreSQL
+        :return Insert: The insert statement
+        """
+        table = DataContractModel.__table__
+        if not postgresql:
+            return sqlite_insert(table)
+        # The weighted search vector is computed by the database from the row's sections
+        return postgresql_insert(table).values(
+            search_vector=cls._search_vector(
+                {weight: bindparam(f"search_{weight}", type_=Text) for weight in SEARCH_WEIGHTS}
+            )
+        )
+
+    @classmethod
+    def _bulk_insert_statement(cls, postgresql: bool) -> Insert:
+        """
+        Builds the statement inserting one data contract per parameter set, skipping the
+        existing IDs and returning the created ones, with their modification time.
+
+        :param bool postgresql: Whether the statement targets PostgreSQL
+        :return Insert: The insert statement
+        """
+        table = DataContractModel.__table__
+        return (
+            cls._insert_statement(postgresql)
+            .on_conflict_do_nothing(index_elements=[table.c.id])
+            .returning(table.c.id, table.c.updated_at)
+        )
+
+    @classmethod
+    def _upsert_statement(cls, postgresql: bool, with_id: bool = False) -> Insert:
+        """
+        Builds the statement inserting a data contract or replacing the stored one, returning
+        its new version.
+
+        A replaced data contract keeps its ID and gets its revision bumped, every other column
+        being overwritten by the inserted values, modification time included.
+
+        :param bool postgresql: Whether the statement targets PostgreSQL
+        :param bool with_id: Whether the ID is returned first, to tell the rows of a batch apart
+        :return Insert: The upsert statement
+        """
+        table = DataContractModel.__table__
+        statement = cls._insert_statement(postgresql)
+        replaced = {
+            column.name: statement.excluded[column.name]
+            for column in table.columns
+            if column.name not in {"id", "revision"}
+        }
+        returned = (table.c.id,) if with_id else ()
+        return statement.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={**replaced, "revision": table.c.revision + 1},
+        ).returning(*returned, table.c.revision, table.c.updated_at)
+
+    @staticmethod
+    def _insert_row(data_contract: DataContract, postgresql: bool) -> dict[str, Any]:
+        """
+        Builds the insert parameters of a data contract, search columns included.
+
+        This is the single mapping of every write path, from a data contract validated once
+        to the values of its row, its document being serialized in one pass.
+
+        :param DataContract data_contract: The data contract to insert
+        :param bool postgresql: Whether the parameters are for the PostgreSQL statement
+        :return Dict[str, Any]: The parameters of the row
+        """
+        row = data_contract_columns(data_contract)
+        row.update(canonical_columns(row))
+        sections = build_search_sections(row["info"], row["models"])
+        row["search_text"] = build_search_text(sections)
+        if postgresql:
+            row.update((f"search_{weight}", sections.get(weight, "")) for weight in SEARCH_WEIGHTS)
+        return row
+
+    @staticmethod
+    def _version_predicates(expected: IfMatch | None) -> list[ColumnElement]:
+        """
+        Builds the predicates restricting a write to the versions an If-Match header allows.
+
+        :param Optional[IfMatch] expected: The If-Match precondition, if any
+        :return List[ColumnElement]: The predicates, none when any version is allowed
+        """
+        if expected is None or expected.any_version:
+            return []
+        return [
+            or_(
+                false(),
+                *(
+                    and_(
+                        DataContractModel.revision == version.revision,
+                        DataContractModel.updated_at == version.updated_at,
+                    )
+                    for version in expected.versions
+                ),
+            )
+        ]
+
+    def _replace_data_contract(
         self,
         db: Session,
         id: str,
-        data_contract_update: DataContractUpdate,
-    ) -> DataContract | None:
+        data_contract: DataContract,
+        expected: IfMatch | None = None,
+    ) -> Row | None:
         """
-        Updates an existing data contract in the database.
+        Overwrites a stored data contract in a single compare-and-swap UPDATE ... RETURNING
+        statement, without loading nor locking the row beforehand.
 
-        :param Session db: The database session.
-        :param str id: The unique identifier of the data contract to update.
-        :param DataContractUpdate data_contract_update: The data contract update information.
-        :return Optional[DataContract]: The updated data contract, or None if not found.
-        :raises SQLAlchemyError: If there's an error during database operations.
-        :raises Exception: If there's any other unexpected error.
+        :param Session db: The database session
+        :param str id: The ID of the data contract to overwrite
+        :param DataContract data_contract: The validated data contract to store
+        :param Optional[IfMatch] expected: The versions the write may apply to, any if None
+        :return Optional[Row]: The new revision and modification time, or None if no stored
+            data contract has this ID and an allowed version
         """
-        try:
-            updated_data_contract = DataContract.model_validate(
-                data_contract_update.model_dump(exclude_unset=True)
+        postgresql = db.get_bind().dialect.name == "postgresql"
+        values = self._insert_row(data_contract, postgresql)
+        if postgresql:
+            values["search_vector"] = self._search_vector(
+                {weight: values.pop(f"search_{weight}") for weight in SEARCH_WEIGHTS}
+            )
+        row = db.execute(
+            update(DataContractModel)
+            .where(DataContractModel.id == id, *self._version_predicates(expected))
+            .values(
+                **values,
+                revision=DataContractModel.revision + 1,
+                updated_at=datetime.now(UTC),
             )
-            updated_data_contract_db = pydantic_to_db_model(updated_data_contract)
+            .returning(DataContractModel.revision, DataContractModel.updated_at)
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+        if row is not None:
+            self._record_writes(
+                db, [NewRevision(id, row.revision, row.updated_at, stored_document(values))]
+            )
+        return row
 
-            db_data_contract = db.query(DataContractModel).filter_by(id=id).first()
-            if db_data_contract is None:
-                logger.warning(f" ⚠️ Data contract not found for update: {id}")
-                return None
+    def upsert_data_contract(
+        self, db: Session, data_contract: DataContractUpdate, expected: IfMatch | None = None
+    ) -> tuple[DataContract, ResourceVersion, bool]:
+        """
+        Creates a data contract, or replaces the stored one with the same ID.
 
-            for key, value in updated_data_contract_db.__dict__.items():
-                if hasattr(db_data_contract, key) and key[0] != "_":
-                    setattr(db_data_contract, key, value)
-                else:
-                    logger.warning(f" ⚠️ Attribute {key} not found in DataContractModel")
+        The row is written by a single INSERT ... ON CONFLICT (id) DO UPDATE ... RETURNING
+        statement. The stored document is the validated one that was written, so it is
+        returned as is along with the version returned by the statement, without reading the
+        row back. With an If-Match precondition, the data contract is only replaced, by a
+        compare-and-swap UPDATE on its version.
+
+        :param Session db: The database session
+        :param DataContractUpdate data_contract: The complete data contract to store
+        :param Optional[IfMatch] expected: The versions the replaced data contract must be at
+        :return Tuple[DataContract, ResourceVersion, bool]: The stored data contract, its
+            version, and whether it was created rather than replaced
+        :raises DataContractPreconditionFailedError: If the stored data contract is missing or
+            at another version than expected
+        :raises SQLAlchemyError: If there's a database error
+        """
+        try:
+            stored_data_contract, version, created = self._upsert(db, data_contract, expected)
             db.commit()
-            db.refresh(db_data_contract)
-            updated_data_contract = db_to_pydantic_model(db_data_contract)
         except SQLAlchemyError as e:
             db.rollback()
-            logger.exception(" ❌ Failed to update data contract")
+            logger.exception(" ❌ Failed to upsert data contract")
             raise_sqlalchemy_error(e, "update")
+        except DataContractPreconditionFailedError:
+            db.rollback()
+            logger.warning(f" ⚠️ Data contract modified since it was read: {data_contract.id}")
+            raise
         except Exception:
-            logger.exception(" ❌ Unexpected error occurred while updating data contract")
+            logger.exception(" ❌ Unexpected error occurred while upserting data contract")
             raise
         else:
-            logger.info(f" ✅ Data contract updated successfully: {id}")
-            return updated_data_contract
+            action = "created" if created else "replaced"
+            logger.info(f" ✅ Data contract {action} successfully: {stored_data_contract.id}")
+            return stored_data_contract, version, created
 
-    def list_data_contracts(self, db: Session) -> list[DataContract]:
+    def _upsert(
+        self, db: Session, data_contract: DataContractUpdate, expected: IfMatch | None = None
+    ) -> tuple[DataContract, ResourceVersion, bool]:
         """
-        Retrieves all data contracts from the database.
+        Creates or replaces a data contract in the current transaction, without committing it.
 
-        :param Session db: The database session.
-        :return List[DataContract]: A list of all data contracts.
-        :raises SQLAlchemyError: If there's an error during database operations.
-        :raises Exception: If there's any other unexpected error.
+        :param Session db: The database session
+        :param DataContractUpdate data_contract: The complete data contract to store
+        :param Optional[IfMatch] expected: The versions the replaced data contract must be at
+        :return Tuple[DataContract, ResourceVersion, bool]: The stored data contract, its
+            version, and whether it was created rather than replaced
+        :raises DataContractPreconditionFailedError: If the stored data contract is missing or
+            at another version than expected
+        :raises SQLAlchemyError: If there's a database error
         """
-        try:
-            db_data_contracts = db.query(DataContractModel).all()
-        except SQLAlchemyError as e:
-            logger.exception(" ❌ Failed to retrieve data contracts")
-            raise_sqlalchemy_error(e, "retrieve")
-        except Exception:
-            logger.exception(" ❌ Unexpected error occurred while retrieving data contracts")
-            raise
+        stored_data_contract = as_data_contract(data_contract)
+        postgresql = db.get_bind().dialect.name == "postgresql"
+        if expected is None:
+            values = self._insert_row(stored_data_contract, postgresql)
+            row = db.execute(self._upsert_statement(postgresql), values).one()
+            self._record_writes(
+                db,
+                [
+                    NewRevision(
+                        stored_data_contract.id,
+                        row.revision,
+                        row.updated_at,
+                        stored_document(values),
+                    )
+                ],
+            )
         else:
-            data_contracts = [
-                db_to_pydantic_model(db_contract) for db_contract in db_data_contracts
-            ]
-            logger.info(f" ✅ Retrieved {len(data_contracts)} data contracts successfully")
-            return data_contracts
+            row = self._replace_data_contract(
+                db, stored_data_contract.id, stored_data_contract, expected
+            )
+            if row is None:
+                raise_precondition_failed_error(stored_data_contract.id)
+        # Replacing bumps the revision: only a freshly inserted row is at revision 1
+        created = expected is None and row.revision == 1
+        notify(
+            db,
+            DATA_CONTRACT_CHANNEL,
+            {"op": "create" if created else "update", "id": stored_data_contract.id},
+        )
+        return stored_data_contract, ResourceVersion(row.revision, row.updated_at), created
 
-    def delete_data_contract(
+    def patch_data_contract(
         self,
         db: Session,
-        data_contract_delete: DataContractDelete,
-    ) -> DataContract | None:
+        id: str,
+        patch: Any,
+        json_patch: bool = False,
+        expected: IfMatch | None = None,
+    ) -> ResourceVersion | None:
         """
-        Deletes a data contract from the database.
+        Applies a JSON Merge Patch (RFC 7386) or a JSON Patch (RFC 6902) to a data contract.
 
-        :param Session db: The database session.
-        :param DataContractDelete data_contract_delete: The data contract to be deleted.
-        :return Optional[DataContract]: The deleted data contract if found, None otherwise.
-        :raises SQLAlchemyError: If there's an error during database operations.
-        :raises Exception: If there's any other unexpected error.
+        Only the sections the patch touches are read, validated and written: for servers,
+        models and definitions, only the touched entries. They are read in one SELECT, patched
+        and validated in Python, then written by one UPDATE that sets only the touched columns,
+        with `jsonb_set` for single entries, and clears the canonical document, which reads
+        rebuild from the sections until `store_canonical_documents` stores it again. The UPDATE
+        only applies if the revision read is still current; the patch is applied again on the
+        new content otherwise, unless an If-Match precondition pinned the version to patch.
+
+        :param Session db: The database session
+        :param str id: The ID of the data contract
+        :param Any patch: The merge patch, or the JSON Patch operations
+        :param bool json_patch: Whether the patch is a JSON Patch rather than a merge patch
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any
+        :return Optional[ResourceVersion]: The new version, or None if the data contract is not found
+        :raises InvalidPatchError: If the patch is malformed or cannot be applied
+        :raises PatchTestFailedError: If a JSON Patch 'test' operation does not match
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
+        :raises DataContractValidationError: If a patched section is invalid
+        :raises DataContractConflictError: If concurrent writes kept changing the data contract
+        :raises SQLAlchemyError: If there's a database error
         """
+        units = self._patch_units(patch, json_patch)
+        if not units:
+            version = self.get_data_contract_version(db, id)
+            if expected is not None and not expected.matches(version):
+                raise_precondition_failed_error(id)
+            return version
+
+        postgresql = db.get_bind().dialect.name == "postgresql"
         try:
-            db_data_contract = (
-                db.query(DataContractModel).filter_by(id=data_contract_delete.id).first()
-            )
-            if db_data_contract is None:
-                logger.warning(
-                    f" ⚠️ Data contract not found for deletion: {data_contract_delete.id}"
+            for _ in range(PATCH_ATTEMPTS):
+                current = self._read_patch_units(db, id, units)
+                if expected is not None and not expected.matches(current[0] if current else None):
+                    raise_precondition_failed_error(id)
+                if current is None:
+                    return None
+                version, document, full_sections = current
+                patched = (
+                    apply_json_patch(document, patch)
+                    if json_patch
+                    else merge_patch(document, patch)
                 )
-                return None
-
-            deleted_data_contract = db_to_pydantic_model(db_data_contract)
-            db.delete(db_data_contract)
-            db.commit()
+                values = self._patch_values(id, units, document, patched, full_sections, postgresql)
+                row = db.execute(
+                    update(DataContractModel)
+                    .where(
+                        DataContractModel.id == id, DataContractModel.revision == version.revision
+                    )
+                    .values(
+                        **values,
+                        revision=DataContractModel.revision + 1,
+                        updated_at=datetime.now(UTC),
+                        # Only the patched entries are written: the canonical document is
+                        # rebuilt by reads until the backfill stores it again
+                        document=None,
+                        document_hash=None,
+                    )
+                    .returning(
+                        DataContractModel.revision, DataContractModel.updated_at, *DOCUMENT_COLUMNS
+                    )
+                    .execution_options(synchronize_session=False)
+                ).one_or_none()
+                if row is not None:
+                    self._record_writes(
+                        db,
+                        [
+                            NewRevision(
+                                id, row.revision, row.updated_at, stored_document(row._mapping)
+                            )
+                        ],
+                    )
+                    notify(db, DATA_CONTRACT_CHANNEL, {"op": "update", "id": id})
+                    db.commit()
+                    break
+                # Written by someone else since it was read: patch the new content
+                db.rollback()
+            else:
+                raise DataContractConflictError(id)
         except SQLAlchemyError as e:
             db.rollback()
-            logger.exception(" ❌ Failed to delete data contract")
-            raise_sqlalchemy_error(e, "delete")
-        except Exception:
-            logger.exception(" ❌ Unexpected error occurred while deleting data contract")
-            raise
+            logger.exception(" ❌ Failed to patch data contract")
+            raise_sqlalchemy_error(e, "patch")
         else:
-            logger.info(f" ✅ Data contract deleted successfully: {data_contract_delete.id}")
-            return deleted_data_contract
+            logger.info(f" ✅ Data contract patched successfully: {id}")
+            return ResourceVersion(row.revision, row.updated_at)
+
+    @staticmethod
+    def _patch_paths(patch: Any, json_patch: bool) -> list[list[str]]:
+        """
+        Lists the paths a patch writes to or reads from, as JSON Pointer segments.
+
+        A merge patch of the servers, models or definitions yields the path of each entry,
+        so that only these entries are read and written.
+
+        :param Any patch: The merge patch, or the JSON Patch operations
+        :param bool json_patch: Whether the patch is a JSON Patch rather than a merge patch
+        :return List[List[str]]: The paths
+        :raises InvalidPatchError: If the patch is malformed
+        """
+        if json_patch:
+            paths = []
+            for operation in validate_json_patch(patch):
+                paths.append(parse_pointer(operation["path"]))
+                if "from" in operation:
+                    paths.append(parse_pointer(operation["from"]))
+            return paths
+        if not isinstance(patch, dict):
+            raise NotAMergePatchError
+        paths = []
+        for section, value in patch.items():
+            if section in ENTRY_SECTIONS and isinstance(value, dict):
+                paths.extend([section, entry] for entry in value)
+            else:
+                paths.append([section])
+        return paths
+
+    @classmethod
+    def _patch_units(cls, patch: Any, json_patch: bool) -> dict[str, set[str] | None]:
+        """
+        Lists the parts of a data contract a patch touches.
+
+        :param Any patch: The merge patch, or the JSON Patch operations
+        :param bool json_patch: Whether the patch is a JSON Patch rather than a merge patch
+        :return Dict[str, Optional[Set[str]]]: The touched entries of each touched section,
+            None when the section is touched as a whole
+        :raises InvalidPatchError: If the patch is malformed or targets unknown sections
+        """
+        units: dict[str, set[str] | None] = {}
+        for path in cls._patch_paths(patch, json_patch):
+            if not path:
+                raise PatchPathError("", "cannot be patched as a whole")
+            section = path[0]
+            if section not in DataContract.model_fields:
+                raise PatchPathError(f"/{section}", "is not a data contract section")
+            if section not in ENTRY_SECTIONS or len(path) == 1:
+                units[section] = None
+            elif units.get(section, set()) is not None:
+                units.setdefault(section, set()).add(path[1])
+        return units
+
+    @staticmethod
+    def _read_patch_units(
+        db: Session, id: str, units: dict[str, set[str] | None]
+    ) -> tuple[ResourceVersion, dict[str, Any], dict[str, Any]] | None:
+        """
+        Reads the parts of a data contract a patch touches, as stored.
+
+        The whole info and models sections are read when one of them is touched, as the
+        search columns are built from them.
+
+        :param Session db: The database session
+        :param str id: The ID of the data contract
+        :param Dict[str, Optional[Set[str]]] units: The touched parts, from `_patch_units`
+        :return Optional[Tuple[ResourceVersion, Dict[str, Any], Dict[str, Any]]]: The version,
+            the touched parts as a partial document, and the whole sections read; None if
+            not found
+        """
+        full = {section for section, entries in units.items() if entries is None}
+        if full.union(units).intersection(SEARCH_SECTIONS):
+            full.update(SEARCH_SECTIONS)
+        entries = [
+            (section, entry)
+            for section, section_entries in units.items()
+            if section not in full
+            for entry in sorted(section_entries)
+        ]
+        columns = [getattr(DataContractModel, section) for section in sorted(full)]
+        columns += [
+            getattr(DataContractModel, section)[entry].label(f"entry_{index}")
+            for index, (section, entry) in enumerate(entries)
+        ]
+        row = db.execute(
+            select(DataContractModel.revision, DataContractModel.updated_at, *columns).where(
+                DataContractModel.id == id
+            )
+        ).one_or_none()
+        if row is None:
+            return None
+
+        full_sections = {section: getattr(row, section) for section in full}
+        document: dict[str, Any] = {}
+        for section, section_entries in units.items():
+            if section_entries is None:
+                document[section] = full_sections[section]
+            elif section in full:
+                stored = full_sections[section] or {}
+                document[section] = {e: stored[e] for e in section_entries if e in stored}
+            else:
+                document[section] = {}
+        for index, (section, entry) in enumerate(entries):
+            value = getattr(row, f"entry_{index}")
+            if value is not None:
+                document[section][entry] = value
+        return ResourceVersion(row.revision, row.updated_at), document, full_sections
+
+    @classmethod
+    def _patch_values(
+        cls,
+        id: str,
+        units: dict[str, set[str] | None],
+        document: dict[str, Any],
+        patched: Any,
+        full_sections: dict[str, Any],
+        postgresql: bool,
+    ) -> dict[str, Any]:
+        """
+        Validates the patched parts of a data contract and builds the column assignments
+        writing them.
+
+        :param str id: The ID of the data contract
+        :param Dict[str, Optional[Set[str]]] units: The touched parts, from `_patch_units`
+        :param Dict[str, Any] document: The touched parts before the patch
+        :param Any patched: The touched parts after the patch
+        :param Dict[str, Any] full_sections: The whole sections read, updated with the patch
+        :param bool postgresql: Whether the assignments target PostgreSQL
+        :return Dict[str, Any]: The new value, or SQL expression, of each touched column
+        :raises InvalidPatchError: If the patch changes the ID or replaces a section by a non-object
+        :raises DataContractValidationError: If a patched section is invalid
+        """
+        if not isinstance(patched, dict):
+            raise PatchPathError("", "cannot be replaced")
+        values: dict[str, Any] = {}
+        for section, entries in units.items():
+            if section == "id":
+                if patched.get("id") != id:
+                    raise PatchPathError("/id", "cannot be changed")
+            elif entries is None:
+                value = cls._validated_section(section, patched.get(section))
+                values[section] = full_sections[section] = value
+            else:
+                expression = cls._patch_entries(
+                    section,
+                    entries,
+                    document[section],
+                    patched.get(section),
+                    full_sections,
+                    postgresql,
+                )
+                if expression is not None:
+                    values[section] = expression
+
+        if set(units).intersection(SEARCH_SECTIONS):
+            sections = build_search_sections(full_sections["info"], full_sections["models"])
+            values["search_text"] = build_search_text(sections)
+            if postgresql:
+                values["search_vector"] = cls._search_vector(sections)
+        return values
+
+    @classmethod
+    def _patch_entries(
+        cls,
+        section: str,
+        entries: set[str],
+        original: dict[str, Any],
+        patched: Any,
+        full_sections: dict[str, Any],
+        postgresql: bool,
+    ) -> ColumnElement | None:
+        """
+        Validates the patched entries of the servers, models or definitions of a data contract
+        and builds the SQL expression writing them.
+
+        :param str section: The name of the section
+        :param Set[str] entries: The touched entries
+        :param Dict[str, Any] original: The touched entries before the patch
+        :param Any patched: The touched entries after the patch
+        :param Dict[str, Any] full_sections: The whole sections read, updated with the patch
+        :param bool postgresql: Whether the expression targets PostgreSQL
+        :return Optional[ColumnElement]: The expression of the new value of the column,
+            or None if it does not change
+        :raises InvalidPatchError: If the patch replaces the section by a non-object
+        :raises DataContractValidationError: If a patched entry is invalid
+        """
+        if not isinstance(patched, dict):
+            raise PatchPathError(f"/{section}", "must stay an object")
+        column = expression = getattr(DataContractModel, section)
+        stored = dict(full_sections.get(section) or {})
+        for entry in sorted(entries):
+            if entry in patched:
+                value = cls._validated_entry(section, entry, patched[entry])
+                expression = cls._set_entry(expression, entry, value, postgresql)
+                stored[entry] = value
+            elif entry in original:
+                expression = cls._remove_entry(expression, entry, postgresql)
+                stored.pop(entry, None)
+        if section in full_sections:
+            full_sections[section] = stored
+        return None if expression is column else expression
+
+    @staticmethod
+    def _validated_section(section: str, value: Any) -> Any:
+        """
+        Validates a whole patched section of a data contract against its schema.
+
+        :param str section: The name of the section
+        :param Any value: The patched section, as stored
+        :return Any: The validated section, as stored
+        :raises DataContractValidationError: If the section is invalid
+        """
+        adapter = _section_adapter(section)
+        try:
+            return adapter.dump_python(adapter.validate_python(value), mode="json", by_alias=True)
+        except ValidationError as e:
+            raise_section_validation_error(f"/{section}", e)
+
+    @staticmethod
+    def _validated_entry(section: str, entry: str, value: Any) -> dict[str, Any]:
+        """
+        Validates one patched entry of the servers, models or definitions of a data contract.
+
+        :param str section: The name of the section
+        :param str entry: The name of the entry
+        :param Any value: The patched entry, as stored
+        :return Dict[str, Any]: The validated entry, as stored
+        :raises DataContractValidationError: If the entry is invalid
+        """
+        try:
+            return (
+                ENTRY_SECTIONS[section].model_validate(value).model_dump(mode="json", by_alias=True)
+            )
+        except ValidationError as e:
+            raise_section_validation_error(f"/{section}/{entry}", e)
+
+    @staticmethod
+    def _set_entry(
+        expression: ColumnElement, entry: str, value: Any, postgresql: bool
+    ) -> ColumnElement:
+        """
+        Builds the SQL expression setting one entry of a JSON object column.
+
+        :param ColumnElement expression: The column, or the expression of its value
+        :param str entry: The key of the entry
+        :param Any value: The JSON value of the entry
+        :param bool postgresql: Whether the expression targets PostgreSQL
+        :return ColumnElement: The expression of the new value of the column
+        """
+        if postgresql:
+            return func.jsonb_set(
+                func.coalesce(expression, cast({}, JSONB)),
+                cast([entry], ARRAY(Text)),
+                cast(value, JSONB),
+                type_=JSONB,
+            )
+        return func.json_set(
+            func.coalesce(expression, func.json("{}")),
+            f'$."{entry}"',
+            func.json(json.dumps(value)),
+        )
+
+    @staticmethod
+    def _remove_entry(expression: ColumnElement, entry: str, postgresql: bool) -> ColumnElement:
+        """
+        Builds the SQL expression removing one entry of a JSON object column.
+
+        :param ColumnElement expression: The column, or the expression of its value
+        :param str entry: The key of the entry
+        :param bool postgresql: Whether the expression targets PostgreSQL
+        :return ColumnElement: The expression of the new value of the column
+        """
+        if postgresql:
+            return type_coerce(expression, JSONB).op("-", return_type=JSONB)(cast(entry, Text))
+        return func.json_remove(expression, f'$."{entry}"')
+
+    def get_data_contract(self, db: Session, id: str) -> DataContract:
+        """
+        Retrieves a data contract from the database.
+
+        :param Session db: The database session
+        :param str id: The ID of the data contract
+        :return DataContract: The data contract
+        :raises DataContractNotFoundError: If the data contract is not found
+        :raises SQLAlchemyError: If there's a database error
+        """
+        return self.get_data_contract_with_version(db, id)[0]
+
+    def get_data_contract_with_version(
+        self, db: Session, id: str
+    ) -> tuple[DataContract, ResourceVersion]:
+        """
+        Retrieves a data contract and the version it was read at from the database.
+
+        :param Session db: The database session
+        :param str id: The ID of the data contract
+        :return Tuple[DataContract, ResourceVersion]: The data contract and its version
+        :raises DataContractNotFoundError: If the data contract is not found
+        :raises SQLAlchemyError: If there's a database error
+        """
+        document, version = self.get_data_contract_document(db, id)
+        return DataContract.model_validate(document), version
+
+    def get_data_contract_document(
+        self, db: Session, id: str
+    ) -> tuple[dict[str, Any], ResourceVersion]:
+        """
+        Retrieves the stored document of a data contract and the version it was read at,
+        without validating it again.
+
+        :param Session db: The database session
+        :param str id: The ID of the data contract
+        :return Tuple[Dict[str, Any], ResourceVersion]: The document, as `trusted_document`
+            extracts it, and its version
+        :raises DataContractNotFoundError: If the data contract is not found
+        :raises SQLAlchemyError: If there's a database error
+        """
+        try:
+            db_data_contract = db.query(DataContractModel).filter_by(id=id).first()
+            if db_data_contract is None:
+                logger.warning(f" ⚠️ Data contract not found: {id}")
+                raise_not_found_error(id)
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to retrieve data contract")
+            raise_sqlalchemy_error(e, "retrieve")
+        except Exception:
+            logger.exception(" ❌ Unexpected error occurred while retrieving data contract")
+            raise
+        else:
+            logger.info(f" ✅ Data contract retrieved successfully: {id}")
+            return trusted_document(db_data_contract), ResourceVersion(
+                db_data_contract.revision, db_data_contract.updated_at
+            )
+
+    def get_data_contract_json(
+        self, db: Session, id: str
+    ) -> tuple[CanonicalDocument, ResourceVersion]:
+        """
+        Retrieves the canonical JSON of a data contract and the version it was read at, as
+        stored on write, without parsing nor validating it.
+
+        :param Session db: The database session
+        :param str id: The ID of the data contract
+        :return Tuple[CanonicalDocument, ResourceVersion]: The canonical JSON and its version
+        :raises DataContractNotFoundError: If the data contract is not found
+        :raises DataContractOperationError: If there's a database error
+        """
+        try:
+            row = db.execute(
+                select(
+                    *CANONICAL_COLUMNS, DataContractModel.revision, DataContractModel.updated_at
+                ).where(DataContractModel.id == id)
+            ).one_or_none()
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to retrieve data contract")
+            raise_sqlalchemy_error(e, "retrieve")
+        if row is None:
+            logger.warning(f" ⚠️ Data contract not found: {id}")
+            raise_not_found_error(id)
+        logger.info(f" ✅ Data contract retrieved successfully: {id}")
+        return read_canonical(row._mapping), ResourceVersion(row.revision, row.updated_at)
+
+    def get_data_contract_version(self, db: Session, id: str) -> ResourceVersion | None:
+        """
+        Retrieves the version of a data contract, without loading its document.
+
+        :param Session db: The database session
+        :param str id: The ID of the data contract
+        :return Optional[ResourceVersion]: The version, or None if the data contract is not found
+        :raises SQLAlchemyError: If there's a database error
+        """
+        try:
+            row = (
+                db.query(DataContractModel.revision, DataContractModel.updated_at)
+                .filter_by(id=id)
+                .first()
+            )
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to retrieve data contract version")
+            raise_sqlalchemy_error(e, "retrieve")
+        else:
+            return ResourceVersion(row.revision, row.updated_at) if row is not None else None
+
+    def update_data_contract(
+        self,
+        db: Session,
+        id: str,
+        data_contract_update: DataContractUpdate,
+        expected: IfMatch | None = None,
+    ) -> DataContract | None:
+        """
+        Updates an existing data contract in the database.
+
+        The row is overwritten by a single compare-and-swap UPDATE ... RETURNING statement:
+        it is neither loaded nor locked beforehand, and with an If-Match precondition the
+        statement only applies if the row is still at one of the expected versions.
+
+        :param Session db: The database session.
+        :param str id: The unique identifier of the data contract to update.
+        :param DataContractUpdate data_contract_update: The data contract update information.
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any.
+        :return Optional[DataContract]: The updated data contract, or None if not found.
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        :raises Exception: If there's any other unexpected error.
+        """
+        try:
+            updated_data_contract = as_data_contract(data_contract_update)
+            row = self._replace_data_contract(db, id, updated_data_contract, expected)
+            if row is None:
+                if expected is not None:
+                    raise_precondition_failed_error(id)
+                logger.warning(f" ⚠️ Data contract not found for update: {id}")
+                return None
+
+            notify(db, DATA_CONTRACT_CHANNEL, {"op": "update", "id": id})
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.exception(" ❌ Failed to update data contract")
+            raise_sqlalchemy_error(e, "update")
+        except DataContractPreconditionFailedError:
+            db.rollback()
+            logger.warning(f" ⚠️ Data contract modified since it was read: {id}")
+            raise
+        except Exception:
+            logger.exception(" ❌ Unexpected error occurred while updating data contract")
+            raise
+        else:
+            logger.info(f" ✅ Data contract updated successfully: {id}")
+            return updated_data_contract
+
+    def list_data_contracts(
+        self,
+        db: Session,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContract], str | None]:
+        """
+        Retrieves one page of data contracts from the database.
+
+        Pages are ordered by id and fetched with a keyset predicate (``id > last id``),
+        so the cost of a page does not depend on how deep into the table it is.
+
+        :param Session db: The database session.
+        :param int limit: The maximum number of data contracts to return.
+        :param Optional[str] cursor: The cursor returned with the previous page, if any.
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match.
+        :return Tuple[List[DataContract], Optional[str]]: The page of data contracts and
+            the cursor of the next page, or None if this is the last page.
+        :raises InvalidCursorError: If the cursor is malformed.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        :raises Exception: If there's any other unexpected error.
+        """
+        data_contracts, _, next_cursor = self.list_versioned_data_contracts(
+            db, limit, cursor, filters
+        )
+        return data_contracts, next_cursor
+
+    def list_versioned_data_contracts(
+        self,
+        db: Session,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContract], list[tuple[str, int, datetime]], str | None]:
+        """
+        Retrieves one page of data contracts from the database, with their versions.
+
+        The versions are read from the same rows as the data contracts, so that the entity
+        tag of the page needs no other query.
+
+        :param Session db: The database session.
+        :param int limit: The maximum number of data contracts to return.
+        :param Optional[str] cursor: The cursor returned with the previous page, if any.
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match.
+        :return Tuple[List[DataContract], List[Tuple[str, int, datetime]], Optional[str]]: The
+            page of data contracts, the id, revision and modification time of each of them,
+            and the cursor of the next page, or None if this is the last page.
+        :raises InvalidCursorError: If the cursor is malformed.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        :raises Exception: If there's any other unexpected error.
+        """
+        try:
+            query = self._filter(db, db.query(DataContractModel), filters)
+            db_data_contracts, next_cursor = self._fetch_page(query, limit, cursor)
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to retrieve data contracts")
+            raise_sqlalchemy_error(e, "retrieve")
+        except InvalidCursorError:
+            logger.warning(f" ⚠️ Invalid pagination cursor: {cursor}")
+            raise
+        except Exception:
+            logger.exception(" ❌ Unexpected error occurred while retrieving data contracts")
+            raise
+        else:
+            data_contracts = [
+                db_to_pydantic_model(db_contract) for db_contract in db_data_contracts
+            ]
+            versions = [
+                (db_contract.id, db_contract.revision, db_contract.updated_at)
+                for db_contract in db_data_contracts
+            ]
+            logger.info(f" ✅ Retrieved {len(data_contracts)} data contracts successfully")
+            return data_contracts, versions, next_cursor
+
+    def list_data_contract_json(
+        self,
+        db: Session,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[CanonicalDocument], list[tuple[str, int, datetime]], str | None]:
+        """
+        Retrieves the canonical JSON of one page of data contracts, with their versions, as
+        stored on write, without parsing nor validating it.
+
+        The page is the one `list_versioned_data_contracts` returns for the same arguments.
+
+        :param Session db: The database session.
+        :param int limit: The maximum number of data contracts to return.
+        :param Optional[str] cursor: The cursor returned with the previous page, if any.
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match.
+        :return Tuple[List[CanonicalDocument], List[Tuple[str, int, datetime]], Optional[str]]:
+            The canonical JSON of the page, the id, revision and modification time of each
+            data contract, and the cursor of the next page, or None if this is the last page.
+        :raises InvalidCursorError: If the cursor is malformed.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        :raises Exception: If there's any other unexpected error.
+        """
+        try:
+            query = self._filter(db, db.query(*PAGE_COLUMNS), filters)
+            rows, next_cursor = self._fetch_page(query, limit, cursor)
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to retrieve data contracts")
+            raise_sqlalchemy_error(e, "retrieve")
+        except InvalidCursorError:
+            logger.warning(f" ⚠️ Invalid pagination cursor: {cursor}")
+            raise
+        except Exception:
+            logger.exception(" ❌ Unexpected error occurred while retrieving data contracts")
+            raise
+        else:
+            documents = [read_canonical(row._mapping) for row in rows]
+            versions = [(row.id, row.revision, row.updated_at) for row in rows]
+            logger.info(f" ✅ Retrieved {len(documents)} data contracts successfully")
+            return documents, versions, next_cursor
+
+    def list_data_contract_summaries(
+        self,
+        db: Session,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContractSummary], str | None]:
+        """
+        Retrieves one page of data contract summaries from the database.
+
+        Only the id and the summarized 'info' attributes are selected, extracted from the
+        JSON column in SQL, so the other contract sections are never loaded nor validated.
+
+        :param Session db: The database session.
+        :param int limit: The maximum number of summaries to return.
+        :param Optional[str] cursor: The cursor returned with the previous page, if any.
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match.
+        :return Tuple[List[DataContractSummary], Optional[str]]: The page of summaries and
+            the cursor of the next page, or None if this is the last page.
+        :raises InvalidCursorError: If the cursor is malformed.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        :raises Exception: If there's any other unexpected error.
+        """
+        summaries, _, next_cursor = self.list_versioned_data_contract_summaries(
+            db, limit, cursor, filters
+        )
+        return summaries, next_cursor
+
+    def list_versioned_data_contract_summaries(
+        self,
+        db: Session,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContractSummary], list[tuple[str, int, datetime]], str | None]:
+        """
+        Retrieves one page of data contract summaries from the database, with their versions.
+
+        The revision and modification time columns are selected along with the summarized
+        'info' attributes, so that the entity tag of the page needs no other query.
+
+        :param Session db: The database session.
+        :param int limit: The maximum number of summaries to return.
+        :param Optional[str] cursor: The cursor returned with the previous page, if any.
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match.
+        :return Tuple[List[DataContractSummary], List[Tuple[str, int, datetime]], Optional[str]]:
+            The page of summaries, the id, revision and modification time of each data
+            contract, and the cursor of the next page, or None if this is the last page.
+        :raises InvalidCursorError: If the cursor is malformed.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        :raises Exception: If there's any other unexpected error.
+        """
+        columns = [
+            DataContractModel.id,
+            DataContractModel.revision,
+            DataContractModel.updated_at,
+        ] + [DataContractModel.info[name].as_string().label(name) for name in SUMMARY_INFO_FIELDS]
+        try:
+            query = self._filter(db, db.query(*columns), filters)
+            rows, next_cursor = self._fetch_page(query, limit, cursor)
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to retrieve data contract summaries")
+            raise_sqlalchemy_error(e, "retrieve")
+        except InvalidCursorError:
+            logger.warning(f" ⚠️ Invalid pagination cursor: {cursor}")
+            raise
+        except Exception:
+            logger.exception(
+                " ❌ Unexpected error occurred while retrieving data contract summaries"
+            )
+            raise
+        else:
+            summaries = [
+                DataContractSummary.model_validate(
+                    {"id": row.id} | {name: row._mapping[name] for name in SUMMARY_INFO_FIELDS}
+                )
+                for row in rows
+            ]
+            versions = [(row.id, row.revision, row.updated_at) for row in rows]
+            logger.info(f" ✅ Retrieved {len(summaries)} data contract summaries successfully")
+            return summaries, versions, next_cursor
+
+    def list_data_contract_versions(
+        self,
+        db: Session,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[tuple[str, int, datetime]], bool]:
+        """
+        Retrieves the versions of the data contracts of one page, without loading their documents.
+
+        The page is the one `list_data_contracts` returns for the same arguments.
+
+        :param Session db: The database session.
+        :param int limit: The maximum number of data contracts in the page.
+        :param Optional[str] cursor: The cursor returned with the previous page, if any.
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match.
+        :return Tuple[List[Tuple[str, int, datetime]], bool]: The id, revision and modification
+            time of each data contract of the page, and whether another page follows.
+        :raises InvalidCursorError: If the cursor is malformed.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        """
+        columns = (DataContractModel.id, DataContractModel.revision, DataContractModel.updated_at)
+        try:
+            query = self._filter(db, db.query(*columns), filters)
+            rows, next_cursor = self._fetch_page(query, limit, cursor)
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to retrieve data contract versions")
+            raise_sqlalchemy_error(e, "retrieve")
+        except InvalidCursorError:
+            logger.warning(f" ⚠️ Invalid pagination cursor: {cursor}")
+            raise
+        else:
+            return [tuple(row) for row in rows], next_cursor is not None
+
+    @classmethod
+    def _export_statement(
+        cls,
+        dialect_name: str,
+        filters: DataContractFilter | None,
+        columns: tuple[ColumnElement, ...] = DOCUMENT_COLUMNS,
+    ) -> Select:
+        """
+        Builds the statement reading the documents of the exported data contracts, by id.
+
+        Rows are fetched by batches of `EXPORT_BATCH_SIZE` from a server-side cursor, so that
+        the whole result is never held in memory.
+
+        :param str dialect_name: The name of the database dialect
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :param Tuple[ColumnElement, ...] columns: The columns to read, the sections by default
+        :return Select: The statement
+        """
+        statement = select(*columns).order_by(DataContractModel.id)
+        if filters is not None:
+            statement = statement.where(*cls._filter_predicates(filters, dialect_name))
+        return statement.execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    def stream_data_contracts(
+        self, db: Session, filters: DataContractFilter | None = None
+    ) -> Iterator[DataContract]:
+        """
+        Streams every data contract from the database, ordered by id.
+
+        :param Session db: The database session
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return Iterator[DataContract]: The data contracts, validated as they are fetched
+        :raises DataContractOperationError: If there's a database error
+        """
+        statement = self._export_statement(db.get_bind().dialect.name, filters)
+        try:
+            for row in db.execute(statement):
+                yield DataContract.model_validate(row._mapping)
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to stream data contracts")
+            raise_sqlalchemy_error(e, "retrieve")
+
+    def stream_data_contract_json(
+        self, db: Session, filters: DataContractFilter | None = None
+    ) -> Iterator[CanonicalDocument]:
+        """
+        Streams the canonical JSON of every data contract, ordered by id, as stored on write,
+        without parsing nor validating it.
+
+        :param Session db: The database session
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return Iterator[CanonicalDocument]: The canonical JSON documents
+        :raises DataContractOperationError: If there's a database error
+        """
+        statement = self._export_statement(db.get_bind().dialect.name, filters, CANONICAL_COLUMNS)
+        try:
+            for row in db.execute(statement):
+                yield read_canonical(row._mapping)
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to stream data contracts")
+            raise_sqlalchemy_error(e, "retrieve")
+
+    def search_data_contracts(
+        self,
+        db: Session,
+        q: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[DataContractSearchResult], str | None]:
+        """
+        Searches the data contracts matching a full-text query, most relevant first.
+
+        On PostgreSQL, the query is parsed with ``websearch_to_tsquery`` (quoted phrases,
+        ``or`` and ``-`` exclusions), matched against the GIN-indexed search vector, ranked
+        with ``ts_rank_cd`` and highlighted with ``ts_headline``. Other dialects fall back to
+        matching every term of the query in the search text, without ranking nor highlighting.
+        Pages are fetched with a keyset predicate on (rank, id).
+
+        :param Session db: The database session.
+        :param str q: The search query.
+        :param int limit: The maximum number of results to return.
+        :param Optional[str] cursor: The cursor returned with the previous page, if any.
+        :return Tuple[List[DataContractSearchResult], Optional[str]]: The page of results and
+            the cursor of the next page, or None if this is the last page.
+        :raises InvalidCursorError: If the cursor is malformed.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        :raises Exception: If there's any other unexpected error.
+        """
+        try:
+            match, rank, highlight = self._search_clauses(db.get_bind().dialect.name, q)
+            columns = [
+                DataContractModel.id,
+                *(
+                    DataContractModel.info[name].as_string().label(name)
+                    for name in SUMMARY_INFO_FIELDS
+                ),
+                rank.label("rank"),
+                highlight.label("highlight"),
+            ]
+            query = db.query(*columns).filter(match)
+            if cursor is not None:
+                last_rank, last_id = decode_ranked_cursor(cursor)
+                query = query.filter(
+                    or_(rank < last_rank, and_(rank == last_rank, DataContractModel.id > last_id))
+                )
+            # One extra row tells whether another page follows
+            rows = query.order_by(rank.desc(), DataContractModel.id).limit(limit + 1).all()
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = encode_ranked_cursor(rows[-1].rank, rows[-1].id)
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to search data contracts")
+            raise_sqlalchemy_error(e, "search")
+        except InvalidCursorError:
+            logger.warning(f" ⚠️ Invalid pagination cursor: {cursor}")
+            raise
+        except Exception:
+            logger.exception(" ❌ Unexpected error occurred while searching data contracts")
+            raise
+        else:
+            results = [DataContractSearchResult.model_validate(row._asdict()) for row in rows]
+            logger.info(f" ✅ Found {len(results)} data contracts matching '{q}'")
+            return results, next_cursor
+
+    @staticmethod
+    def _search_clauses(dialect: str, q: str) -> tuple[ColumnElement, ColumnElement, ColumnElement]:
+        """
+        Builds the clauses matching, ranking and highlighting the data contracts for a query.
+
+        The rank ``ts_rank_cd`` returns is a ``real``, read back as its shortest decimal, which
+        as a ``double precision`` cursor value no longer equals the rank it came from: it is
+        cast to ``double precision`` for the cursor to compare exactly against ranks tied
+        with the last row of a page. Without full-text search, each term must be contained in
+        the search text, and terms excluded with ``-`` must not.
+
+        :param str dialect: The name of the database dialect
+        :param str q: The search query
+        :return Tuple[ColumnElement, ColumnElement, ColumnElement]: The match condition, the
+            rank and the highlight
+        """
+        if dialect == "postgresql":
+            ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+            return (
+                DataContractModel.search_vector.op("@@")(ts_query),
+                cast(func.ts_rank_cd(DataContractModel.search_vector, ts_query), Double),
+                func.ts_headline(
+                    SEARCH_CONFIG, DataContractModel.search_text, ts_query, HEADLINE_OPTIONS
+                ),
+            )
+        conditions = []
+        for term in q.replace('"', " ").split():
+            if term.lower() == "or" or term == "-":
+                continue
+            if term.startswith("-"):
+                conditions.append(~DataContractModel.search_text.contains(term[1:]))
+            else:
+                conditions.append(DataContractModel.search_text.contains(term))
+        return and_(*conditions), literal(0.0, Double), null()
+
+    def index_data_contracts_for_search(
+        self, db: Session, batch_size: int = SEARCH_BACKFILL_BATCH_SIZE
+    ) -> int:
+        """
+        Builds the search columns of the data contracts that have never been indexed.
+
+        Data contracts are indexed when they are written; this backfills the ones stored
+        before the search columns existed. A partial index on the data contracts never indexed
+        keeps the lookup cheap when there is none.
+
+        :param Session db: The database session.
+        :param int batch_size: The number of data contracts indexed per transaction.
+        :return int: The number of data contracts indexed.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        """
+        indexed = 0
+        try:
+            while True:
+                db_data_contracts = (
+                    db.query(DataContractModel)
+                    .filter(DataContractModel.search_text.is_(None))
+                    .order_by(DataContractModel.id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not db_data_contracts:
+                    break
+                for db_data_contract in db_data_contracts:
+                    self._index_for_search(db, db_data_contract)
+                db.commit()
+                indexed += len(db_data_contracts)
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.exception(" ❌ Failed to index data contracts for search")
+            raise_sqlalchemy_error(e, "index")
+        else:
+            if indexed:
+                logger.info(f" ✅ Indexed {indexed} data contracts for search")
+            return indexed
+
+    def store_canonical_documents(
+        self, db: Session, batch_size: int = DOCUMENT_BACKFILL_BATCH_SIZE
+    ) -> int:
+        """
+        Builds the canonical document of the data contracts that were stored without one.
+
+        Canonical documents are stored on every write but patches, which clear them; this
+        backfills the data contracts patched since, or stored before the column existed, which
+        reads rebuild from their sections meanwhile. Their sections may predate the current
+        way of storing them, so each data contract is validated again and its columns written
+        as on any write. A partial index on the missing documents keeps the lookup cheap when
+        there is none.
+
+        :param Session db: The database session.
+        :param int batch_size: The number of data contracts serialized per transaction.
+        :return int: The number of data contracts whose canonical document was stored.
+        :raises DataContractOperationError: If there's a database error.
+        """
+        try:
+            stored = self._rewrite_documents(
+                db, DataContractModel.document.is_(None), batch_size, True
+            )
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.exception(" ❌ Failed to store canonical data contract documents")
+            raise_sqlalchemy_error(e, "serialize")
+        else:
+            if stored:
+                logger.info(f" ✅ Stored the canonical document of {stored} data contracts")
+            return stored
+
+    def migrate_legacy_references(
+        self, db: Session, batch_size: int = DOCUMENT_BACKFILL_BATCH_SIZE
+    ) -> int:
+        """
+        Rewrites the field references of the data contracts stored under "ref" to "$ref".
+
+        Sections used to be stored dumped by field name, so reads, which serve the stored
+        sections as is, would show their references under "ref". The data contracts whose
+        models may hold one are validated again, which reads "ref" as "$ref", and their
+        columns and canonical document written as on any write. The migration runs once:
+        its completion is recorded, and the data contracts are not scanned again afterwards.
+
+        :param Session db: The database session.
+        :param int batch_size: The number of data contracts rewritten per transaction.
+        :return int: The number of data contracts rewritten.
+        :raises DataContractOperationError: If there's a database error.
+        """
+        legacy = cast(DataContractModel.models, Text).contains('"ref"')
+        try:
+            if db.get(DataMigrationModel, LEGACY_REFERENCES_MIGRATION) is not None:
+                return 0
+            # "ref" may also be an extra key of a field's config, which is left unchanged
+            migrated = self._rewrite_documents(db, legacy, batch_size, False)
+            db.add(DataMigrationModel(name=LEGACY_REFERENCES_MIGRATION))
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.exception(" ❌ Failed to migrate data contract field references")
+            raise_sqlalchemy_error(e, "migrate")
+        else:
+            if migrated:
+                logger.info(f" ✅ Migrated the field references of {migrated} data contracts")
+            return migrated
+
+    def _rewrite_documents(
+        self, db: Session, condition: ColumnElement, batch_size: int, unchanged: bool
+    ) -> int:
+        """
+        Validates again the stored data contracts matching a condition, and writes their
+        columns and canonical document as on any write.
+
+        Data contracts are read by batches ordered by id and locked, each batch committed on
+        its own. A data contract whose columns validation changes gets a new revision, recorded
+        in the history and in the change feed, so that the copies of clients are no longer
+        current. One that no longer validates is logged and left as is.
+
+        :param Session db: The database session.
+        :param ColumnElement condition: The condition the data contracts to rewrite match.
+        :param int batch_size: The number of data contracts rewritten per transaction.
+        :param bool unchanged: Whether to store the canonical document of the data contracts
+            whose columns validation leaves unchanged, keeping their revision.
+        :return int: The number of data contracts rewritten.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        """
+        rewritten, last_id = 0, None
+        while True:
+            statement = select(*DOCUMENT_COLUMNS, DataContractModel.revision).where(condition)
+            if last_id is not None:
+                statement = statement.where(DataContractModel.id > last_id)
+            rows = db.execute(
+                statement.order_by(DataContractModel.id).limit(batch_size).with_for_update()
+            ).all()
+            if not rows:
+                return rewritten
+            last_id = rows[-1].id
+            now = datetime.now(UTC)
+            changed, stored, revisions = [], [], []
+            for row in rows:
+                document = trusted_document(row._mapping)
+                try:
+                    columns = data_contract_columns(DataContract.model_validate(document))
+                except ValidationError:
+                    logger.warning(f" ⚠️ Stored data contract no longer validates: {row.id}")
+                    continue
+                if columns != document:
+                    revision = row.revision + 1
+                    changed.append(
+                        {
+                            **columns,
+                            **canonical_columns(columns),
+                            "revision": revision,
+                            "updated_at": now,
+                        }
+                    )
+                    revisions.append(NewRevision(row.id, revision, now, stored_document(columns)))
+                elif unchanged:
+                    stored.append({"id": row.id, **canonical_columns(columns)})
+            for values in (changed, stored):
+                if values:
+                    db.execute(update(DataContractModel), values)
+            if revisions:
+                self._record_writes(db, revisions)
+                notify_ids(
+                    db, DATA_CONTRACT_CHANNEL, "update", [new.data_contract_id for new in revisions]
+                )
+            db.commit()
+            rewritten += len(changed) + len(stored)
+
+    @staticmethod
+    def _index_for_search(db: Session, db_data_contract: DataContractModel) -> None:
+        """
+        Sets the full-text search columns of a data contract from its current content.
+
+        On PostgreSQL, the search vector is computed by the database in the same INSERT or
+        UPDATE statement, each section being weighted by its importance.
+
+        :param Session db: The database session, whose dialect selects the search columns.
+        :param DataContractModel db_data_contract: The data contract to index.
+        """
+        sections = build_search_sections(db_data_contract.info, db_data_contract.models)
+        # Never NULL, so that indexed contracts are told apart from the ones to backfill
+        db_data_contract.search_text = build_search_text(sections)
+
+        if db.get_bind().dialect.name != "postgresql":
+            return
+        db_data_contract.search_vector = DataContractCRUD._search_vector(sections)
+
+    @staticmethod
+    def _search_vector(sections: dict[str, Any]) -> ColumnElement:
+        """
+        Builds the PostgreSQL expression of a weighted search vector.
+
+        :param Dict[str, Any] sections: The text, or the expression of the text, of each weight
+        :return ColumnElement: The concatenation of the weighted vectors of the sections
+        """
+        vector = func.to_tsvector(SEARCH_CONFIG, "", type_=TSVECTOR)
+        for weight, text in sections.items():
+            # The weight is one of 'A' to 'D', inlined as setweight expects a "char"
+            weighted = func.setweight(
+                func.to_tsvector(SEARCH_CONFIG, text), literal_column(f"'{weight}'"), type_=TSVECTOR
+            )
+            vector = vector.op("||", return_type=TSVECTOR)(weighted)
+        return vector
+
+    @classmethod
+    def _filter(cls, db: Session, query: Query, filters: DataContractFilter | None) -> Query:
+        """
+        Applies the listing filters to a query as SQL predicates.
+
+        :param Session db: The database session, whose dialect selects the predicates.
+        :param Query query: The query selecting the data contract rows or columns.
+        :param Optional[DataContractFilter] filters: The filters to apply, if any.
+        :return Query: The filtered query.
+        """
+        if filters is None:
+            return query
+        predicates = cls._filter_predicates(filters, db.get_bind().dialect.name)
+        return query.filter(*predicates) if predicates else query
+
+    @staticmethod
+    def _filter_predicates(
+        filters: DataContractFilter, dialect_name: str
+    ) -> list[ColumnElement[bool]]:
+        """
+        Builds the SQL predicates of the listing filters.
+
+        On PostgreSQL, the predicates are written so that the table indexes apply: JSONB
+        containment ('@>') on the tags, a JSON path match ('@?') on the servers, both backed
+        by GIN indexes, and '->>' expressions matching the indexes on the 'info' attributes.
+        Other dialects fall back to their JSON functions.
+
+        :param DataContractFilter filters: The filters to apply.
+        :param str dialect_name: The name of the database dialect.
+        :return List[ColumnElement[bool]]: The predicates, all of which must match.
+        """
+        postgres = dialect_name == "postgresql"
+        predicates = []
+
+        if filters.tag:
+            if postgres:
+                predicates.append(type_coerce(DataContractModel.tags, JSONB).contains(filters.tag))
+            else:
+                for tag in filters.tag:
+                    tags = func.json_each(DataContractModel.tags).table_valued("value")
+                    predicates.append(
+                        select(1).select_from(tags).where(tags.c.value == tag).exists()
+                    )
+
+        for name in ("owner", "status"):
+            value = getattr(filters, name)
+            if value is None:
+                continue
+            if postgres:
+                # The key is inlined so that the expression matches the index definition
+                attribute = DataContractModel.info.op("->>", return_type=String)(
+                    literal_column(f"'{name}'")
+                )
+            else:
+                attribute = DataContractModel.info[name].as_string()
+            predicates.append(attribute == value)
+
+        server_conditions = {
+            key: value
+            for key, value in (("type", filters.server_type), ("environment", filters.environment))
+            if value is not None
+        }
+        if server_conditions:
+            if postgres:
+                # JSON string literals are valid JSON path string literals
+                path = "$.* ? ({})".format(
+                    " && ".join(
+                        f"@.{key} == {json.dumps(value)}"
+                        for key, value in server_conditions.items()
+                    )
+                )
+                predicates.append(
+                    type_coerce(DataContractModel.servers, JSONB).op("@?")(
+                        cast(literal(path), JSONPATH)
+                    )
+                )
+            else:
+                servers = func.json_each(DataContractModel.servers).table_valued("value")
+                predicates.append(
+                    select(1)
+                    .select_from(servers)
+                    .where(
+                        *(
+                            func.json_extract(servers.c.value, f"$.{key}") == value
+                            for key, value in server_conditions.items()
+                        )
+                    )
+                    .exists()
+                )
+
+        return predicates
+
+    @staticmethod
+    def _fetch_page(query: Query, limit: int, cursor: str | None) -> tuple[list[Any], str | None]:
+        """
+        Fetches one keyset page of a query ordered by data contract id.
+
+        :param Query query: The query selecting the data contract rows or columns.
+        :param int limit: The maximum number of rows to return.
+        :param Optional[str] cursor: The cursor returned with the previous page, if any.
+        :return Tuple[List[Any], Optional[str]]: The rows of the page and the next page cursor.
+        :raises InvalidCursorError: If the cursor is malformed.
+        """
+        if cursor is not None:
+            query = query.filter(DataContractModel.id > decode_cursor(cursor))
+        # One extra row tells whether another page follows
+        rows = query.order_by(DataContractModel.id).limit(limit + 1).all()
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1].id)
+
+    def delete_data_contract(
+        self,
+        db: Session,
+        data_contract_delete: DataContractDelete,
+        expected: IfMatch | None = None,
+    ) -> DataContract | None:
+        """
+        Deletes a data contract and its revision history from the database.
+
+        :param Session db: The database session.
+        :param DataContractDelete data_contract_delete: The data contract to be deleted.
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any.
+        :return Optional[DataContract]: The deleted data contract if found, None otherwise.
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        :raises Exception: If there's any other unexpected error.
+        """
+        try:
+            row = db.execute(
+                delete(DataContractModel)
+                .where(
+                    DataContractModel.id == data_contract_delete.id,
+                    *self._version_predicates(expected),
+                )
+                .returning(*DOCUMENT_COLUMNS)
+                .execution_options(synchronize_session=False)
+            ).one_or_none()
+            if row is None:
+                if expected is not None:
+                    raise_precondition_failed_error(data_contract_delete.id)
+                logger.warning(
+                    f" ⚠️ Data contract not found for deletion: {data_contract_delete.id}"
+                )
+                return None
+
+            deleted_data_contract = db_to_pydantic_model(row)
+            self._revisions.delete_history(db, [data_contract_delete.id])
+            self._changes.record_changes(db, [ChangeEvent("delete", data_contract_delete.id)])
+            notify(db, DATA_CONTRACT_CHANNEL, {"op": "delete", "id": data_contract_delete.id})
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.exception(" ❌ Failed to delete data contract")
+            raise_sqlalchemy_error(e, "delete")
+        except DataContractPreconditionFailedError:
+            db.rollback()
+            logger.warning(
+                f" ⚠️ Data contract modified since it was read: {data_contract_delete.id}"
+            )
+            raise
+        except Exception:
+            logger.exception(" ❌ Unexpected error occurred while deleting data contract")
+            raise
+        else:
+            logger.info(f" ✅ Data contract deleted successfully: {data_contract_delete.id}")
+            return deleted_data_contract
+
+    def bulk_delete_data_contracts(
+        self,
+        db: Session,
+        ids: list[str] | None = None,
+        filters: DataContractFilter | None = None,
+        return_documents: bool = False,
+    ) -> tuple[list[str], list[DataContract] | None]:
+        """
+        Deletes the data contracts having one of the IDs and matching the filters, in a single
+        DELETE ... RETURNING statement, after their revision history.
+
+        At least one ID or one filter is required: nothing is deleted otherwise.
+
+        :param Session db: The database session.
+        :param Optional[List[str]] ids: The IDs of the data contracts to delete, if any.
+        :param Optional[DataContractFilter] filters: The filters to match, if any.
+        :param bool return_documents: Whether to return the deleted documents, or only their IDs.
+        :return Tuple[List[str], Optional[List[DataContract]]]: The IDs of the deleted data
+            contracts, and the deleted data contracts if requested.
+        :raises SQLAlchemyError: If there's an error during database operations.
+        """
+        predicates = self._filter_predicates(filters, db.get_bind().dialect.name) if filters else []
+        if ids is not None:
+            predicates.append(DataContractModel.id.in_(ids))
+        if not predicates:
+            logger.warning(" ⚠️ Bulk deletion without IDs nor filters ignored")
+            return [], [] if return_documents else None
+
+        columns = DOCUMENT_COLUMNS if return_documents else (DataContractModel.id,)
+        try:
+            self._revisions.delete_history(db, select(DataContractModel.id).where(*predicates))
+            rows = db.execute(
+                delete(DataContractModel)
+                .where(*predicates)
+                .returning(*columns)
+                .execution_options(synchronize_session=False)
+            ).all()
+            deleted_ids = [row.id for row in rows]
+            documents = [db_to_pydantic_model(row) for row in rows] if return_documents else None
+            self._changes.record_changes(db, [ChangeEvent("delete", id) for id in deleted_ids])
+            notify_ids(db, DATA_CONTRACT_CHANNEL, "delete", deleted_ids)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.exception(" ❌ Failed to delete data contracts")
+            raise_sqlalchemy_error(e, "delete")
+        except Exception:
+            logger.exception(" ❌ Unexpected error occurred while deleting data contracts")
+            raise
+        else:
+            logger.info(f" ✅ Deleted {len(deleted_ids)} data contracts in bulk")
+            return deleted_ids, documents
+
+
+class AsyncDataContractCRUD:
+    """
+    Asynchronous CRUD operations for data contracts.
+
+    Each operation runs the synchronous implementation through ``AsyncSession.run_sync``:
+    the ORM code executes on the session's greenlet-adapted sync facade, so every database
+    round-trip goes through the async driver and yields to the event loop instead of blocking it.
+    """
+
+    def __init__(self):
+        """Initialize the asynchronous CRUD with the shared synchronous implementation."""
+        self._crud = DataContractCRUD()
+
+    async def create_data_contract(
+        self, db: AsyncSession, data_contract: DataContractCreate
+    ) -> DataContract:
+        """
+        Creates a new data contract in the database.
+
+        :param AsyncSession db: The asynchronous database session
+        :param DataContractCreate data_contract: The data contract to create
+        :return DataContract: The created data contract
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.create_data_contract, data_contract)
+
+    async def apply_data_contract_writes(
+        self, db: AsyncSession, writes: list[DataContractWrite]
+    ) -> list[DataContract | tuple[DataContract, ResourceVersion, bool] | Exception]:
+        """
+        Applies a batch of independent writes in a single transaction.
+
+        :param AsyncSession db: The asynchronous database session
+        :param List[DataContractWrite] writes: The writes, in order
+        :return List[Union[DataContract, Tuple[DataContract, ResourceVersion, bool], Exception]]:
+            The result of each write, or its error
+        """
+        return await db.run_sync(self._crud.apply_data_contract_writes, writes)
+
+    async def bulk_create_data_contracts(
+        self,
+        db: AsyncSession,
+        data_contracts: list[DataContract],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> dict[str, str | None]:
+        """
+        Creates data contracts in batches, skipping the ones whose ID already exists.
+
+        :param AsyncSession db: The asynchronous database session
+        :param List[DataContract] data_contracts: The validated data contracts to create
+        :param int chunk_size: The number of data contracts per transaction, 0 for a single one
+        :return Dict[str, Optional[str]]: The error message of each data contract by ID, None
+            for the created ones
+        """
+        return await db.run_sync(self._crud.bulk_create_data_contracts, data_contracts, chunk_size)
+
+    async def upsert_data_contract(
+        self, db: AsyncSession, data_contract: DataContractUpdate, expected: IfMatch | None = None
+    ) -> tuple[DataContract, ResourceVersion, bool]:
+        """
+        Creates a data contract, or replaces the stored one with the same ID.
+
+        :param AsyncSession db: The asynchronous database session
+        :param DataContractUpdate data_contract: The complete data contract to store
+        :param Optional[IfMatch] expected: The versions the replaced data contract must be at
+        :return Tuple[DataContract, ResourceVersion, bool]: The stored data contract, its
+            version, and whether it was created rather than replaced
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.upsert_data_contract, data_contract, expected)
+
+    async def patch_data_contract(
+        self,
+        db: AsyncSession,
+        id: str,
+        patch: Any,
+        json_patch: bool = False,
+        expected: IfMatch | None = None,
+    ) -> ResourceVersion | None:
+        """
+        Applies a JSON Merge Patch or a JSON Patch to a data contract.
+
+        :param AsyncSession db: The asynchronous database session
+        :param str id: The ID of the data contract
+        :param Any patch: The merge patch, or the JSON Patch operations
+        :param bool json_patch: Whether the patch is a JSON Patch rather than a merge patch
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any
+        :return Optional[ResourceVersion]: The new version, or None if the data contract is not found
+        :raises InvalidPatchError: If the patch is malformed or cannot be applied
+        :raises DataContractValidationError: If a patched section is invalid
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.patch_data_contract, id, patch, json_patch, expected)
+
+    async def get_data_contract(self, db: AsyncSession, id: str) -> DataContract:
+        """
+        Retrieves a data contract from the database.
+
+        :param AsyncSession db: The asynchronous database session
+        :param str id: The ID of the data contract
+        :return DataContract: The data contract
+        :raises DataContractNotFoundError: If the data contract is not found
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.get_data_contract, id)
+
+    async def get_data_contract_with_version(
+        self, db: AsyncSession, id: str
+    ) -> tuple[DataContract, ResourceVersion]:
+        """
+        Retrieves a data contract and the version it was read at from the database.
+
+        :param AsyncSession db: The asynchronous database session
+        :param str id: The ID of the data contract
+        :return Tuple[DataContract, ResourceVersion]: The data contract and its version
+        :raises DataContractNotFoundError: If the data contract is not found
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.get_data_contract_with_version, id)
+
+    async def get_data_contract_json(
+        self, db: AsyncSession, id: str
+    ) -> tuple[CanonicalDocument, ResourceVersion]:
+        """
+        Retrieves the canonical JSON of a data contract and the version it was read at, as
+        stored on write, without parsing nor validating it.
+
+        :param AsyncSession db: The asynchronous database session
+        :param str id: The ID of the data contract
+        :return Tuple[CanonicalDocument, ResourceVersion]: The canonical JSON and its version
+        :raises DataContractNotFoundError: If the data contract is not found
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.get_data_contract_json, id)
+
+    async def get_data_contract_version(self, db: AsyncSession, id: str) -> ResourceVersion | None:
+        """
+        Retrieves the version of a data contract, without loading its document.
+
+        :param AsyncSession db: The asynchronous database session
+        :param str id: The ID of the data contract
+        :return Optional[ResourceVersion]: The version, or None if the data contract is not found
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.get_data_contract_version, id)
+
+    async def update_data_contract(
+        self,
+        db: AsyncSession,
+        id: str,
+        data_contract_update: DataContractUpdate,
+        expected: IfMatch | None = None,
+    ) -> DataContract | None:
+        """
+        Updates an existing data contract in the database.
+
+        :param AsyncSession db: The asynchronous database session
+        :param str id: The unique identifier of the data contract to update
+        :param DataContractUpdate data_contract_update: The data contract update information
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any
+        :return Optional[DataContract]: The updated data contract, or None if not found
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(
+            self._crud.update_data_contract, id, data_contract_update, expected
+        )
+
+    async def list_data_contracts(
+        self,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContract], str | None]:
+        """
+        Retrieves one page of data contracts from the database.
+
+        :param AsyncSession db: The asynchronous database session
+        :param int limit: The maximum number of data contracts to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return Tuple[List[DataContract], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.list_data_contracts, limit, cursor, filters)
+
+    async def list_data_contract_summaries(
+        self,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContractSummary], str | None]:
+        """
+        Retrieves one page of data contract summaries from the database.
+
+        :param AsyncSession db: The asynchronous database session
+        :param int limit: The maximum number of summaries to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return Tuple[List[DataContractSummary], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.list_data_contract_summaries, limit, cursor, filters)
+
+    async def list_versioned_data_contracts(
+        self,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContract], list[tuple[str, int, datetime]], str | None]:
+        """
+        Retrieves one page of data contracts from the database, with their versions.
+
+        :param AsyncSession db: The asynchronous database session
+        :param int limit: The maximum number of data contracts to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return Tuple[List[DataContract], List[Tuple[str, int, datetime]], Optional[str]]: The page, its versions and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.list_versioned_data_contracts, limit, cursor, filters)
+
+    async def list_data_contract_json(
+        self,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[CanonicalDocument], list[tuple[str, int, datetime]], str | None]:
+        """
+        Retrieves the canonical JSON of one page of data contracts, with their versions.
+
+        :param AsyncSession db: The asynchronous database session
+        :param int limit: The maximum number of data contracts to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return Tuple[List[CanonicalDocument], List[Tuple[str, int, datetime]], Optional[str]]: The canonical JSON of the page, its versions and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.list_data_contract_json, limit, cursor, filters)
+
+    async def list_versioned_data_contract_summaries(
+        self,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContractSummary], list[tuple[str, int, datetime]], str | None]:
+        """
+        Retrieves one page of data contract summaries from the database, with their versions.
+
+        :param AsyncSession db: The asynchronous database session
+        :param int limit: The maximum number of summaries to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return Tuple[List[DataContractSummary], List[Tuple[str, int, datetime]], Optional[str]]: The page, its versions and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(
+            self._crud.list_versioned_data_contract_summaries, limit, cursor, filters
+        )
+
+    async def list_data_contract_versions(
+        self,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[tuple[str, int, datetime]], bool]:
+        """
+        Retrieves the versions of the data contracts of one page, without loading their documents.
+
+        :param AsyncSession db: The asynchronous database session
+        :param int limit: The maximum number of data contracts in the page
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return Tuple[List[Tuple[str, int, datetime]], bool]: The versions and whether another page follows
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.list_data_contract_versions, limit, cursor, filters)
+
+    async def stream_data_contracts(
+        self, db: AsyncSession, filters: DataContractFilter | None = None
+    ) -> AsyncIterator[DataContract]:
+        """
+        Streams every data contract from the database, ordered by id.
+
+        The rows come from a server-side cursor read with ``AsyncSession.stream``, so that
+        each batch is fetched, validated and handed over before the next one is read.
+
+        :param AsyncSession db: The asynchronous database session
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return AsyncIterator[DataContract]: The data contracts, validated as they are fetched
+        :raises DataContractOperationError: If there's a database error
+        """
+        statement = self._crud._export_statement(db.get_bind().dialect.name, filters)
+        try:
+            result = await db.stream(statement)
+            async for row in result:
+                yield DataContract.model_validate(row._mapping)
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to stream data contracts")
+            raise_sqlalchemy_error(e, "retrieve")
+
+    async def stream_data_contract_json(
+        self, db: AsyncSession, filters: DataContractFilter | None = None
+    ) -> AsyncIterator[CanonicalDocument]:
+        """
+        Streams the canonical JSON of every data contract, ordered by id, as stored on write,
+        without parsing nor validating it.
+
+        :param AsyncSession db: The asynchronous database session
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return AsyncIterator[CanonicalDocument]: The canonical JSON documents
+        :raises DataContractOperationError: If there's a database error
+        """
+        statement = self._crud._export_statement(
+            db.get_bind().dialect.name, filters, CANONICAL_COLUMNS
+        )
+        try:
+            result = await db.stream(statement)
+            async for row in result:
+                yield read_canonical(row._mapping)
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to stream data contracts")
+            raise_sqlalchemy_error(e, "retrieve")
+
+    async def search_data_contracts(
+        self,
+        db: AsyncSession,
+        q: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[DataContractSearchResult], str | None]:
+        """
+        Searches the data contracts matching a full-text query, most relevant first.
+
+        :param AsyncSession db: The asynchronous database session
+        :param str q: The search query
+        :param int limit: The maximum number of results to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :return Tuple[List[DataContractSearchResult], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.search_data_contracts, q, limit, cursor)
+
+    async def delete_data_contract(
+        self,
+        db: AsyncSession,
+        data_contract_delete: DataContractDelete,
+        expected: IfMatch | None = None,
+    ) -> DataContract | None:
+        """
+        Deletes a data contract from the database.
+
+        :param AsyncSession db: The asynchronous database session
+        :param DataContractDelete data_contract_delete: The data contract to be deleted
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any
+        :return Optional[DataContract]: The deleted data contract if found, None otherwise
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.delete_data_contract, data_contract_delete, expected)
+
+    async def bulk_delete_data_contracts(
+        self,
+        db: AsyncSession,
+        ids: list[str] | None = None,
+        filters: DataContractFilter | None = None,
+        return_documents: bool = False,
+    ) -> tuple[list[str], list[DataContract] | None]:
+        """
+        Deletes the data contracts having one of the IDs and matching the filters.
+
+        :param AsyncSession db: The asynchronous database session
+        :param Optional[List[str]] ids: The IDs of the data contracts to delete, if any
+        :param Optional[DataContractFilter] filters: The filters to match, if any
+        :param bool return_documents: Whether to return the deleted documents, or only their IDs
+        :return Tuple[List[str], Optional[List[DataContract]]]: The IDs of the deleted data
+            contracts, and the deleted data contracts if requested
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(
+            self._crud.bulk_delete_data_contracts, ids, filters, return_documents
+        )
@@ -0,0 +1,166 @@
+"""Data Contract change feed CRUD operations module."""
+
+from datetime import UTC, datetime
+from typing import NamedTuple
+
+from sqlalchemy import BigInteger, ColumnElement, Select, Text, cast, func, insert, select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..exceptions.crud.data_contract import raise_sqlalchemy_error
+from ..models.data_contract_change import DataContractChange as DataContractChangeModel
+from ..schemas.data_contract.objects.data_contract_change import DataContractChange
+from ..utils.logger import get_logger
+from ..utils.pagination import DEFAULT_PAGE_SIZE
+
+
+logger = get_logger(__name__)
+
+
+def _as_bigint(xact_id: ColumnElement) -> ColumnElement:
+    """
+    Casts a PostgreSQL transaction ID (``xid8``), which has no direct cast to integers.
+
+    :param ColumnElement xact_id: The transaction ID
+    :return ColumnElement: The transaction ID as a BIGINT
+    """
+    return cast(cast(xact_id, Text), BigInteger)
+
+
+class ChangeEvent(NamedTuple):
+    """A change of a data contract written in the current transaction."""
+
+    op: str
+    data_contract_id: str
+    revision: int | None = None
+
+
+class DataContractChangeCRUD:
+    """
+    CRUD operations for the change feed of data contracts, a transactional outbox.
+
+    Every write of a data contract appends its changes to the feed in its own transaction,
+    so that a change is visible if and only if its write committed. Writers take no lock:
+    offsets are allocated at insert, so concurrent transactions may commit them out of order.
+    The feed is rather ordered by transaction ID, then offset, and on PostgreSQL only holds
+    the changes of transactions older than every transaction still in flight (the ``xmin``
+    of the reader's snapshot). A change committed after a read thus always sorts after the
+    changes that read returned, and a consumer resuming from the last one never misses it.
+    SQLite serializes writers, so its changes all have a transaction ID of 0.
+    """
+
+    @staticmethod
+    def record_changes(db: Session, changes: list[ChangeEvent]) -> None:
+        """
+        Appends changes to the feed in the current transaction, without committing it.
+
+        :param Session db: The database session
+        :param List[ChangeEvent] changes: The changes, in order
+        :raises SQLAlchemyError: If there's a database error
+        """
+        if not changes:
+            return
+        statement = insert(DataContractChangeModel)
+        if db.get_bind().dialect.name == "postgresql":
+            statement = statement.values(xact_id=_as_bigint(func.pg_current_xact_id()))
+        created_at = datetime.now(UTC)
+        db.execute(
+            statement,
+            [
+                {
+                    "op": change.op,
+                    "data_contract_id": change.data_contract_id,
+                    "revision": change.revision,
+                    "created_at": created_at,
+                }
+                for change in changes
+            ],
+        )
+
+    @staticmethod
+    def _list_statement(dialect_name: str, since: int, limit: int) -> Select:
+        """
+        Builds the statement reading the changes following one, in feed order.
+
+        :param str dialect_name: The name of the database dialect
+        :param int since: The offset of the last change already processed, 0 for none
+        :param int limit: The maximum number of changes to return
+        :return Select: The statement
+        """
+        model = DataContractChangeModel
+        since_xact_id = select(model.xact_id).where(model.offset == since).scalar_subquery()
+        conditions = [
+            tuple_(model.xact_id, model.offset) > tuple_(func.coalesce(since_xact_id, 0), since)
+        ]
+        if dialect_name == "postgresql":
+            # Transactions from the oldest one in flight on may still commit changes
+            snapshot_xmin = func.pg_snapshot_xmin(func.pg_current_snapshot())
+            conditions.append(model.xact_id < _as_bigint(snapshot_xmin))
+        return (
+            select(model.offset, model.op, model.data_contract_id, model.revision, model.created_at)
+            .where(*conditions)
+            .order_by(model.xact_id, model.offset)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def list_changes(
+        db: Session, since: int = 0, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[DataContractChange]:
+        """
+        Retrieves the changes following the last one a consumer processed, in feed order.
+
+        The position of that change is looked up from its offset. An offset identifying no
+        change, such as 0, is taken at transaction ID 0, the one of the changes recorded on
+        SQLite or before transaction IDs were.
+
+        :param Session db: The database session
+        :param int since: The offset of the last change already processed, 0 for none
+        :param int limit: The maximum number of changes to return
+        :return List[DataContractChange]: The changes
+        :raises DataContractOperationError: If there's a database error
+        """
+        statement = DataContractChangeCRUD._list_statement(db.get_bind().dialect.name, since, limit)
+        try:
+            rows = db.execute(statement).all()
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to retrieve data contract changes")
+            raise_sqlalchemy_error(e, "retrieve")
+
+        logger.debug(f" 💡 Retrieved {len(rows)} data contract changes since offset {since}")
+        return [
+            DataContractChange(
+                offset=row.offset,
+                op=row.op,
+                id=row.data_contract_id,
+                revision=row.revision,
+                created_at=row.created_at,
+            )
+            for row in rows
+        ]
+
+
+class AsyncDataContractChangeCRUD:
+    """
+    Asynchronous CRUD operations for the change feed of data contracts, running the
+    synchronous implementation through ``AsyncSession.run_sync``.
+    """
+
+    def __init__(self):
+        """Initialize the asynchronous CRUD with the shared synchronous implementation."""
+        self._crud = DataContractChangeCRUD()
+
+    async def list_changes(
+        self, db: AsyncSession, since: int = 0, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[DataContractChange]:
+        """
+        Retrieves the changes following the last one a consumer processed, in feed order.
+
+        :param AsyncSession db: The asynchronous database session
+        :param int since: The offset of the last change already processed, 0 for none
+        :param int limit: The maximum number of changes to return
+        :return List[DataContractChange]: The changes
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.list_changes, since, limit)
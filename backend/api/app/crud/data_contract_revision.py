@@ -0,0 +1,322 @@
+"""Data Contract revision history CRUD operations module."""
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy import ColumnElement, and_, delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..exceptions.crud.data_contract import (
+    raise_revision_not_found_error,
+    raise_sqlalchemy_error,
+)
+from ..exceptions.utils.pagination import InvalidCursorError
+from ..models.data_contract_revision import DataContractRevision as DataContractRevisionModel
+from ..schemas.data_contract.objects.data_contract import DataContract
+from ..schemas.data_contract.objects.data_contract_revision import DataContractRevision
+from ..utils.conditional import ResourceVersion
+from ..utils.config import settings
+from ..utils.logger import get_logger
+from ..utils.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from ..utils.patch import apply_json_patch, diff_documents
+
+
+logger = get_logger(__name__)
+
+# Number of data contracts whose latest snapshots are read per query
+SNAPSHOT_LOOKUP_BATCH_SIZE = 500
+
+
+class NewRevision(NamedTuple):
+    """A revision of a data contract written in the current transaction."""
+
+    data_contract_id: str
+    revision: int
+    created_at: datetime
+    document: dict[str, Any]
+
+
+def stored_document(values: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Extracts the document of a data contract from its stored column values.
+
+    :param Mapping[str, Any] values: The column values, such as a row or insert parameters
+    :return Dict[str, Any]: The document, without the unset sections
+    """
+    return {
+        name: values[name] for name in DataContract.model_fields if values.get(name) is not None
+    }
+
+
+class DataContractRevisionCRUD:
+    """
+    CRUD operations for the revision history of data contracts.
+
+    Every write of a data contract records its new revision. One revision in
+    `snapshot_interval` is stored as a full snapshot of the document; the others are stored
+    as the JSON Patch turning the document of their latest snapshot into theirs. Fetching a
+    revision reads at most two rows, whatever the length of the history, and a delta only
+    holds what changed since its snapshot, however large the rest of the document.
+    """
+
+    def __init__(self, snapshot_interval: int | None = None):
+        """
+        Initialize the revision history operations.
+
+        :param Optional[int] snapshot_interval: The number of revisions between two snapshots,
+            from the settings if None, 1 or less storing every revision as a snapshot
+        """
+        self._snapshot_interval = snapshot_interval
+
+    @property
+    def snapshot_interval(self) -> int:
+        """
+        The number of revisions between two snapshots.
+
+        :return int: The snapshot spacing
+        """
+        if self._snapshot_interval is not None:
+            return self._snapshot_interval
+        return settings.DATA_CONTRACT_SNAPSHOT_INTERVAL
+
+    def record_revisions(self, db: Session, revisions: list[NewRevision]) -> None:
+        """
+        Records new revisions in the current transaction, without committing it.
+
+        A revision is stored as a snapshot when it is the first one, when its data contract
+        has no snapshot yet, or when its latest snapshot is `snapshot_interval` revisions old.
+        The revisions must be of distinct data contracts.
+
+        :param Session db: The database session
+        :param List[NewRevision] revisions: The new revisions
+        :raises SQLAlchemyError: If there's a database error
+        """
+        if not revisions:
+            return
+        snapshots = self._latest_snapshots(
+            db, [new.data_contract_id for new in revisions if new.revision != 1]
+        )
+        rows = []
+        for new in revisions:
+            base = snapshots.get(new.data_contract_id)
+            row = {
+                "data_contract_id": new.data_contract_id,
+                "revision": new.revision,
+                "created_at": new.created_at,
+                "base_revision": None,
+                "document": None,
+                "diff": None,
+            }
+            if (
+                base is None
+                or base[0] >= new.revision
+                or new.revision - base[0] >= self.snapshot_interval
+            ):
+                row["document"] = new.document
+            else:
+                row["base_revision"] = base[0]
+                row["diff"] = diff_documents(base[1], new.document)
+            rows.append(row)
+        db.execute(insert(DataContractRevisionModel), rows)
+
+    @staticmethod
+    def _latest_snapshots(db: Session, ids: list[str]) -> dict[str, tuple[int, dict[str, Any]]]:
+        """
+        Reads the latest snapshot of data contracts.
+
+        :param Session db: The database session
+        :param List[str] ids: The IDs of the data contracts
+        :return Dict[str, Tuple[int, Dict[str, Any]]]: The revision and document of the latest
+            snapshot of each data contract by ID, for those having one
+        """
+        model = DataContractRevisionModel
+        snapshots = {}
+        for start in range(0, len(ids), SNAPSHOT_LOOKUP_BATCH_SIZE):
+            latest = (
+                select(model.data_contract_id, func.max(model.revision).label("revision"))
+                .where(
+                    model.base_revision.is_(None),
+                    model.data_contract_id.in_(ids[start : start + SNAPSHOT_LOOKUP_BATCH_SIZE]),
+                )
+                .group_by(model.data_contract_id)
+                .subquery()
+            )
+            rows = db.execute(
+                select(model.data_contract_id, model.revision, model.document).join(
+                    latest,
+                    and_(
+                        model.data_contract_id == latest.c.data_contract_id,
+                        model.revision == latest.c.revision,
+                    ),
+                )
+            )
+            snapshots.update((row.data_contract_id, (row.revision, row.document)) for row in rows)
+        return snapshots
+
+    @staticmethod
+    def delete_history(db: Session, ids: list[str] | ColumnElement) -> None:
+        """
+        Deletes the history of data contracts in the current transaction, without committing.
+
+        A deleted data contract created again starts over at revision 1, with a new history.
+
+        :param Session db: The database session
+        :param Union[List[str], ColumnElement] ids: The IDs of the data contracts, or a
+            subquery selecting them
+        :raises SQLAlchemyError: If there's a database error
+        """
+        db.execute(
+            delete(DataContractRevisionModel)
+            .where(DataContractRevisionModel.data_contract_id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+
+    def list_revisions(
+        self,
+        db: Session,
+        id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[DataContractRevision], str | None]:
+        """
+        Retrieves one page of the history of a data contract, latest revision first.
+
+        :param Session db: The database session
+        :param str id: The ID of the data contract
+        :param int limit: The maximum number of revisions to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :return Tuple[List[DataContractRevision], Optional[str]]: The page of revisions and
+            the cursor of the next page, or None if this is the last page
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises DataContractOperationError: If there's a database error
+        """
+        model = DataContractRevisionModel
+        query = select(model.revision, model.created_at, model.base_revision).where(
+            model.data_contract_id == id
+        )
+        if cursor is not None:
+            last_revision = decode_cursor(cursor)
+            if not last_revision.isdigit():
+                raise InvalidCursorError(cursor)
+            query = query.where(model.revision < int(last_revision))
+        try:
+            # One extra row tells whether another page follows
+            rows = db.execute(query.order_by(model.revision.desc()).limit(limit + 1)).all()
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to retrieve data contract revisions")
+            raise_sqlalchemy_error(e, "retrieve")
+
+        revisions = [
+            DataContractRevision(
+                revision=row.revision,
+                created_at=row.created_at,
+                snapshot=row.base_revision is None,
+                base_revision=row.base_revision,
+            )
+            for row in rows[:limit]
+        ]
+        next_cursor = encode_cursor(str(revisions[-1].revision)) if len(rows) > limit else None
+        logger.info(f" ✅ Retrieved {len(revisions)} revisions of data contract: {id}")
+        return revisions, next_cursor
+
+    def get_revision(
+        self, db: Session, id: str, revision: int
+    ) -> tuple[DataContract, ResourceVersion]:
+        """
+        Rebuilds a data contract as it was at a revision.
+
+        The revision and its base snapshot are read in one query: the document is the
+        snapshot, patched with the diff of the revision when it is a delta.
+
+        :param Session db: The database session
+        :param str id: The ID of the data contract
+        :param int revision: The revision
+        :return Tuple[DataContract, ResourceVersion]: The data contract and the version it was
+            at, carrying the time the revision was written
+        :raises DataContractRevisionNotFoundError: If the revision is not in the history
+        :raises DataContractOperationError: If there's a database error
+        """
+        model = DataContractRevisionModel
+        base_revision = (
+            select(model.base_revision)
+            .where(model.data_contract_id == id, model.revision == revision)
+            .scalar_subquery()
+        )
+        try:
+            rows = {
+                row.revision: row
+                for row in db.execute(
+                    select(model).where(
+                        model.data_contract_id == id,
+                        model.revision.in_([revision, base_revision]),
+                    )
+                ).scalars()
+            }
+        except SQLAlchemyError as e:
+            logger.exception(" ❌ Failed to retrieve data contract revision")
+            raise_sqlalchemy_error(e, "retrieve")
+
+        target = rows.get(revision)
+        if target is None:
+            logger.warning(f" ⚠️ Revision {revision} of data contract not found: {id}")
+            raise_revision_not_found_error(id, revision)
+        if target.base_revision is None:
+            document = target.document
+        else:
+            base = rows.get(target.base_revision)
+            if base is None:
+                logger.error(f" ❌ Snapshot {target.base_revision} of data contract missing: {id}")
+                raise_revision_not_found_error(id, target.base_revision)
+            document = apply_json_patch(base.document, target.diff)
+
+        logger.info(f" ✅ Revision {revision} of data contract retrieved successfully: {id}")
+        return DataContract.model_validate(document), ResourceVersion(revision, target.created_at)
+
+
+class AsyncDataContractRevisionCRUD:
+    """
+    Asynchronous CRUD operations for the revision history of data contracts, running the
+    synchronous implementation through ``AsyncSession.run_sync``.
+    """
+
+    def __init__(self):
+        """Initialize the asynchronous CRUD with the shared synchronous implementation."""
+        self._crud = DataContractRevisionCRUD()
+
+    async def list_revisions(
+        self,
+        db: AsyncSession,
+        id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[DataContractRevision], str | None]:
+        """
+        Retrieves one page of the history of a data contract, latest revision first.
+
+        :param AsyncSession db: The asynchronous database session
+        :param str id: The ID of the data contract
+        :param int limit: The maximum number of revisions to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :return Tuple[List[DataContractRevision], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.list_revisions, id, limit, cursor)
+
+    async def get_revision(
+        self, db: AsyncSession, id: str, revision: int
+    ) -> tuple[DataContract, ResourceVersion]:
+        """
+        Rebuilds a data contract as it was at a revision.
+
+        :param AsyncSession db: The asynchronous database session
+        :param str id: The ID of the data contract
+        :param int revision: The revision
+        :return Tuple[DataContract, ResourceVersion]: The data contract and its version
+        :raises DataContractRevisionNotFoundError: If the revision is not in the history
+        :raises DataContractOperationError: If there's a database error
+        """
+        return await db.run_sync(self._crud.get_revision, id, revision)
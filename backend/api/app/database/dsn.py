@@ -78,10 +78,13 @@ class PostgresDSN:
         if has_socket and has_tcp:
             logger.warning(" ⚠️ Both socket and TCP configuration provided, socket will be used")
 
-    def get_connection_url(self) -> str:
+    def get_connection_url(self, driver: str | None = None) -> str:
         """
         Builds connection URL based on available parameters.
         Follows priority: Unix Socket > TCP
+
+        :param Optional[str] driver: The DBAPI driver to request (e.g. "asyncpg"), if any
+        :return str: The SQLAlchemy connection URL
         """
         # Encode credentials
         user = quote_plus(self.username)
@@ -89,7 +92,8 @@ class PostgresDSN:
         db = quote_plus(self.database)
 
         # Base connection string
-        url = f"postgresql://{user}:{pwd}@"
+        scheme = f"postgresql+{driver}" if driver else "postgresql"
+        url = f"{scheme}://{user}:{pwd}@"
 
         # Add connection specific parts
         if self.unix_socket:
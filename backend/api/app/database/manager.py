@@ -1,7 +1,12 @@
 import logging
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from time import perf_counter
+from typing import Any
 
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import Engine, create_engine, event, text
 from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.pool import QueuePool
@@ -10,12 +15,17 @@ from ..exceptions.database.manager import DatabaseInitializationError, Unsupport
 from ..utils.config import settings
 from ..utils.logger import get_logger
 from .dsn import PostgresDSN
+from .migrations import run_migrations
+from .pool import PoolStatistics
 
 
 logger = get_logger(__name__)
 
 logging.getLogger("sqlalchemy.engine").setLevel(settings.LOG_LEVEL)
 
+# Key of the PostgreSQL advisory lock serializing the database setup of the workers
+SETUP_LOCK_KEY = 0x6D7963656C697570
+
 
 class DatabaseManager:
     """
@@ -46,6 +56,10 @@ class DatabaseManager:
 
             self.engine = None
             self.SessionLocal = None
+            self.async_engine = None
+            self.AsyncSessionLocal = None
+            self.pool_stats = PoolStatistics()
+            self.async_pool_stats = PoolStatistics()
             self.initialized = True
             logger.info(" 💡 DatabaseManager initialized")
 
@@ -93,26 +107,88 @@ class DatabaseManager:
             self.dsn.get_connection_url(),
             echo=False,
             poolclass=QueuePool,
-            pool_size=5,
-            max_overflow=10,
-            pool_timeout=30,
-            pool_pre_ping=True,
-            pool_recycle=3600,
             isolation_level="READ COMMITTED",
+            **self._pool_options(),
+        )
+        self._register_pool_listeners(self.engine, self.pool_stats)
+
+        self.SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, bind=self.engine, expire_on_commit=False
+        )
+        logger.info(" ✅ Database engine setup completed")
+
+    def setup_async_engine(self) -> None:
+        """
+        Sets up the asynchronous database engine used by the API routes.
+        Uses the asyncpg driver with the same pooling settings as the synchronous engine.
+        """
+        self.async_engine = create_async_engine(
+            self.dsn.get_connection_url(driver="asyncpg"),
+            echo=False,
+            isolation_level="READ COMMITTED",
+            **self._pool_options(),
+        )
+        self._register_pool_listeners(self.async_engine.sync_engine, self.async_pool_stats)
+
+        self.AsyncSessionLocal = async_sessionmaker(
+            bind=self.async_engine, autoflush=False, expire_on_commit=False
         )
+        logger.info(" ✅ Async database engine setup completed")
 
-        @event.listens_for(self.engine, "connect")
+    @staticmethod
+    def _pool_options() -> dict[str, Any]:
+        """
+        Builds the connection pool options from the settings.
+
+        :return Dict[str, Any]: Keyword arguments for the engine factories
+        """
+        return {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+        }
+
+    @staticmethod
+    def _register_pool_listeners(engine: Engine, stats: PoolStatistics) -> None:
+        """
+        Registers the pool event listeners feeding the pool statistics.
+
+        :param Engine engine: The engine whose pool is observed
+        :param PoolStatistics stats: The statistics to update
+        """
+
+        @event.listens_for(engine, "connect")
         def receive_connect(dbapi_connection, connection_record):
+            stats.record_connect()
             logger.info(" ✅ New database connection established")
 
-        @event.listens_for(self.engine, "checkout")
+        @event.listens_for(engine, "checkout")
         def receive_checkout(dbapi_connection, connection_record, connection_proxy):
-            logger.debug(" 💡 Connection checked out from pool")
+            stats.record_checkout()
+            logger.debug(
+                f" 💡 Connection checked out from pool ({stats.checked_out} checked out, "
+                f"overflow {engine.pool.overflow() if isinstance(engine.pool, QueuePool) else 0})"
+            )
 
-        self.SessionLocal = sessionmaker(
-            autocommit=False, autoflush=False, bind=self.engine, expire_on_commit=False
-        )
-        logger.info(" ✅ Database engine setup completed")
+        @event.listens_for(engine, "checkin")
+        def receive_checkin(dbapi_connection, connection_record):
+            stats.record_checkin()
+
+    def get_pool_statistics(self) -> dict[str, Any]:
+        """
+        Returns live statistics of the connection pools.
+
+        :return Dict[str, Any]: The statistics of the synchronous and asynchronous pools
+        """
+        return {
+            "sync": self.pool_stats.snapshot(self.engine.pool if self.engine else None),
+            "async": self.async_pool_stats.snapshot(
+                self.async_engine.sync_engine.pool if self.async_engine else None
+            ),
+        }
 
     def create_tables(self) -> None:
         """
@@ -131,6 +207,49 @@ class DatabaseManager:
             logger.exception(" ❌ Failed to create database tables")
             raise
 
+    def run_migrations(self) -> None:
+        """
+        Applies the idempotent schema migrations to the existing tables.
+
+        :raises DatabaseInitializationError: If the database engine is not initialized
+        :raises Exception: If a migration fails
+        """
+        if not self.engine:
+            raise DatabaseInitializationError()
+
+        try:
+            run_migrations(self.engine, self.Base.metadata)
+        except Exception:
+            logger.exception(" ❌ Failed to apply schema migrations")
+            raise
+
+    @contextmanager
+    def setup_lock(self) -> Iterator[None]:
+        """
+        Serializes the database setup of the workers starting together.
+
+        On PostgreSQL, a session-level advisory lock is held on a dedicated connection for
+        the duration of the block, so that one worker creates, migrates and backfills the
+        tables while the others wait, then find nothing left to do. It is released when the
+        block exits, or when the connection is lost.
+
+        :raises DatabaseInitializationError: If the database engine is not initialized
+        """
+        if not self.engine:
+            raise DatabaseInitializationError()
+        if self.engine.dialect.name != "postgresql":
+            yield
+            return
+
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": SETUP_LOCK_KEY})
+            logger.debug(" 💡 Database setup lock acquired")
+            try:
+                yield
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SETUP_LOCK_KEY})
+                conn.commit()
+
     def get_db(self) -> Session:
         """
         Creates a new database session that can be used as a context manager.
@@ -144,8 +263,11 @@ class DatabaseManager:
 
         db = self.SessionLocal()
         try:
-            # Test the connection by executing a simple query
-            db.execute(text("SELECT 1"))
+            # Check a connection out eagerly so the pool wait time can be measured;
+            # liveness is already verified by the pool pre-ping.
+            start = perf_counter()
+            db.connection()
+            self.pool_stats.record_wait(perf_counter() - start)
             logger.debug(" 💡 New database session created")
         except OperationalError:
             logger.exception(" ❌ Database operation failed")
@@ -154,6 +276,24 @@ class DatabaseManager:
         else:
             return db
 
+    @asynccontextmanager
+    async def get_async_db(self) -> AsyncIterator[AsyncSession]:
+        """
+        Creates a new asynchronous database session as an async context manager.
+
+        :return AsyncIterator[AsyncSession]: A SQLAlchemy AsyncSession object, closed on exit
+        :raises DatabaseInitializationError: If the async database engine is not initialized
+        """
+        if not self.async_engine or not self.AsyncSessionLocal:
+            raise DatabaseInitializationError()
+
+        async with self.AsyncSessionLocal() as db:
+            start = perf_counter()
+            await db.connection()
+            self.async_pool_stats.record_wait(perf_counter() - start)
+            logger.debug(" 💡 New async database session created")
+            yield db
+
 
 # Singleton instance
 db_manager = DatabaseManager()
@@ -0,0 +1,108 @@
+"""Idempotent schema migrations applied at startup on PostgreSQL."""
+
+from sqlalchemy import Connection, Engine, MetaData, Table, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from ..utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def run_migrations(engine: Engine, metadata: MetaData) -> None:
+    """
+    Brings existing tables in line with the models.
+
+    ``create_all`` only creates missing tables, so tables created by earlier versions keep
+    their original column types and indexes. Every step below is safe to run repeatedly.
+
+    :param Engine engine: The database engine
+    :param MetaData metadata: The metadata describing the expected schema
+    """
+    if engine.dialect.name != "postgresql":
+        logger.info(" 💡 Schema migrations skipped: not a PostgreSQL database")
+        return
+
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            _add_missing_columns(conn, table)
+            _upgrade_json_columns(conn, table)
+            _create_missing_indexes(conn, table)
+    logger.info(" ✅ Schema migrations applied successfully")
+
+
+def _add_missing_columns(conn: Connection, table: Table) -> None:
+    """
+    Adds the columns declared in the model that do not exist yet.
+
+    Non-nullable columns can only be added with a server default, filling the existing rows.
+
+    :param Connection conn: The database connection
+    :param Table table: The table to migrate
+    """
+    existing_columns = set(
+        conn.execute(
+            text("SELECT column_name FROM information_schema.columns WHERE table_name = :table"),
+            {"table": table.name},
+        ).scalars()
+    )
+    if not existing_columns:
+        return
+
+    ddl_compiler = conn.dialect.ddl_compiler(conn.dialect, None)
+    for column in table.columns:
+        if column.name in existing_columns:
+            continue
+        column_spec = column.type.compile(dialect=conn.dialect)
+        if not column.nullable:
+            default = ddl_compiler.get_column_default_string(column)
+            if default is None:
+                logger.warning(f" ⚠️ Cannot add non-nullable column {table.name}.{column.name}")
+                continue
+            column_spec += f" NOT NULL DEFAULT {default}"
+        conn.execute(
+            text(
+                f'ALTER TABLE "{table.name}" ADD COLUMN IF NOT EXISTS "{column.name}" {column_spec}'
+            )
+        )
+        logger.info(f" ✅ Added column {table.name}.{column.name}")
+
+
+def _upgrade_json_columns(conn: Connection, table: Table) -> None:
+    """
+    Converts the JSON columns declared as JSONB in the model to JSONB.
+
+    :param Connection conn: The database connection
+    :param Table table: The table to migrate
+    """
+    json_columns = set(
+        conn.execute(
+            text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = :table AND data_type = 'json'"
+            ),
+            {"table": table.name},
+        ).scalars()
+    )
+    for column in table.columns:
+        if column.name in json_columns and isinstance(
+            column.type.dialect_impl(conn.dialect), JSONB
+        ):
+            conn.execute(
+                text(
+                    f'ALTER TABLE "{table.name}" ALTER COLUMN "{column.name}" '
+                    f'TYPE JSONB USING "{column.name}"::jsonb'
+                )
+            )
+            logger.info(f" ✅ Migrated {table.name}.{column.name} to JSONB")
+
+
+def _create_missing_indexes(conn: Connection, table: Table) -> None:
+    """
+    Creates the indexes declared in the model that do not exist yet.
+
+    :param Connection conn: The database connection
+    :param Table table: The table to migrate
+    """
+    for index in table.indexes:
+        index.create(conn, checkfirst=True)
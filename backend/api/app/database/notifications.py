@@ -0,0 +1,253 @@
+"""Cross-worker change notifications over PostgreSQL LISTEN/NOTIFY."""
+
+import json
+import select
+import threading
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session
+
+from ..utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Channels of the change notifications
+DATA_CONTRACT_CHANNEL = "data_contract_changes"
+TEMPLATE_CHANNEL = "template_changes"
+
+# Identifies this process, so that it can skip the notifications it sent itself
+WORKER_ID = uuid.uuid4().hex
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_SIZE = 7999
+
+NotificationCallback = Callable[[dict[str, Any]], None]
+
+
+def notify(db: Session | Engine, channel: str, payload: dict[str, Any]) -> bool:
+    """
+    Publishes a change notification to the other workers.
+
+    With a session, the notification is part of its transaction and is only delivered if the
+    transaction commits. With an engine, it is sent right away in its own transaction.
+    Other databases than PostgreSQL have no LISTEN/NOTIFY: nothing is sent.
+
+    :param Union[Session, Engine] db: The session of the change, or the engine
+    :param str channel: The channel to notify
+    :param Dict[str, Any] payload: The JSON-serializable description of the change
+    :return bool: True if the notification was sent
+    """
+    bind = db.get_bind() if isinstance(db, Session) else db
+    if bind.dialect.name != "postgresql":
+        return False
+
+    message = json.dumps({**payload, "origin": WORKER_ID}, separators=(",", ":"))
+    if len(message.encode("utf-8")) > MAX_PAYLOAD_SIZE:
+        logger.warning(f" ⚠️ Notification on {channel} too large to be sent")
+        return False
+
+    statement = text("SELECT pg_notify(:channel, :payload)")
+    params = {"channel": channel, "payload": message}
+    if isinstance(db, Session):
+        db.execute(statement, params)
+    else:
+        with db.begin() as conn:
+            conn.execute(statement, params)
+    return True
+
+
+def notify_ids(db: Session | Engine, channel: str, op: str, ids: Iterable[str]) -> bool:
+    """
+    Publishes that an operation changed many resources, as `{"op": op, "ids": [...]}`
+    notifications split so that each one fits in a NOTIFY payload.
+
+    :param Union[Session, Engine] db: The session of the change, or the engine
+    :param str channel: The channel to notify
+    :param str op: The operation
+    :param Iterable[str] ids: The IDs of the changed resources
+    :return bool: True if every notification was sent
+    """
+    overhead = len(json.dumps({"op": op, "ids": [], "origin": WORKER_ID}, separators=(",", ":")))
+    sent = True
+    batch: list[str] = []
+    size = overhead
+    for id in ids:
+        id_size = len(json.dumps(id).encode("utf-8")) + 1
+        if batch and size + id_size > MAX_PAYLOAD_SIZE:
+            sent = notify(db, channel, {"op": op, "ids": batch}) and sent
+            batch, size = [], overhead
+        batch.append(id)
+        size += id_size
+    if batch:
+        sent = notify(db, channel, {"op": op, "ids": batch}) and sent
+    return sent
+
+
+class NotificationListener:
+    """
+    Listens to change notifications on a dedicated connection and dispatches them.
+
+    The listener runs in a daemon thread that owns one connection detached from the pool,
+    in autocommit mode, on which it LISTENs to every subscribed channel. Notifications sent
+    by this process are skipped. When the connection is lost, notifications may have been
+    missed: once reconnected, the resync callbacks are called so that local state is rebuilt.
+    """
+
+    def __init__(self, poll_interval: float = 5.0, retry_interval: float = 5.0):
+        """
+        Initialize the listener.
+
+        :param float poll_interval: The maximum time in seconds to wait for notifications
+            before checking whether the listener has been stopped
+        :param float retry_interval: The time in seconds to wait before reconnecting
+        """
+        self.poll_interval = poll_interval
+        self.retry_interval = retry_interval
+        self._subscribers: defaultdict[str, list[NotificationCallback]] = defaultdict(list)
+        self._resync_callbacks: list[Callable[[], None]] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._engine: Engine | None = None
+
+    def subscribe(self, channel: str, callback: NotificationCallback) -> None:
+        """
+        Registers a callback called with the payload of each notification on a channel.
+
+        :param str channel: The channel to listen to
+        :param NotificationCallback callback: The callback
+        """
+        self._subscribers[channel].append(callback)
+
+    def on_resync(self, callback: Callable[[], None]) -> None:
+        """
+        Registers a callback called when notifications may have been missed.
+
+        :param Callable[[], None] callback: The callback
+        """
+        self._resync_callbacks.append(callback)
+
+    def start(self, engine: Engine) -> None:
+        """
+        Starts listening in a background thread.
+
+        :param Engine engine: The engine to take the dedicated connection from
+        """
+        if engine.dialect.name != "postgresql":
+            logger.info(" 💡 Change notifications disabled: not a PostgreSQL database")
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._engine = engine
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="notification-listener", daemon=True)
+        self._thread.start()
+        logger.info(" ✅ Change notification listener started")
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stops the background thread.
+
+        :param Optional[float] timeout: The maximum time in seconds to wait for the thread
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout if timeout is not None else self.poll_interval + 1)
+            self._thread = None
+            logger.info(" ✅ Change notification listener stopped")
+
+    def dispatch(self, channel: str, message: str) -> None:
+        """
+        Dispatches one notification to the subscribers of its channel.
+
+        :param str channel: The channel the notification was received on
+        :param str message: The raw payload of the notification
+        """
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            logger.warning(f" ⚠️ Ignoring malformed notification on {channel}: {message}")
+            return
+        if payload.get("origin") == WORKER_ID:
+            return
+
+        for callback in self._subscribers.get(channel, []):
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception(f" ❌ Failed to handle notification on {channel}")
+
+    def resync(self) -> None:
+        """Calls the resync callbacks, after notifications may have been missed."""
+        for callback in self._resync_callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception(" ❌ Failed to resynchronize after missed notifications")
+
+    def _run(self) -> None:
+        """Listens until stopped, reconnecting when the connection is lost."""
+        connected_before = False
+        while not self._stop.is_set():
+            try:
+                connection = self._connect()
+            except Exception:
+                logger.exception(" ❌ Change notification listener could not connect")
+                self._stop.wait(self.retry_interval)
+                continue
+
+            if connected_before:
+                self.resync()
+            connected_before = True
+            try:
+                self._listen(connection)
+            except Exception:
+                logger.exception(" ❌ Change notification listener connection lost")
+                self._stop.wait(self.retry_interval)
+            finally:
+                try:
+                    connection.close()
+                except Exception:
+                    logger.debug(" 💡 Listener connection already closed")
+
+    def _connect(self) -> Any:
+        """
+        Opens the dedicated listening connection.
+
+        :return Any: The DBAPI connection, LISTENing to every subscribed channel
+        """
+        pooled = self._engine.raw_connection()
+        pooled.detach()
+        connection = pooled.driver_connection
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            for channel in self._subscribers:
+                cursor.execute(f'LISTEN "{channel}"')
+        return connection
+
+    def _listen(self, connection: Any) -> None:
+        """
+        Waits for notifications on the connection and dispatches them until stopped.
+
+        :param Any connection: The listening DBAPI connection
+        """
+        while not self._stop.is_set():
+            readable, _, _ = select.select([connection], [], [], self.poll_interval)
+            if not readable:
+                # A dead connection is never readable: probe it while idle
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                continue
+            connection.poll()
+            while connection.notifies:
+                notification = connection.notifies.pop(0)
+                self.dispatch(notification.channel, notification.payload)
+
+
+# Singleton instance
+notification_listener = NotificationListener()
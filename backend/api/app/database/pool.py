@@ -0,0 +1,81 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.pool import Pool, QueuePool
+
+
+@dataclass
+class PoolStatistics:
+    """
+    Live statistics of a database connection pool.
+
+    Counters are fed by the engine's pool event listeners ('connect', 'checkout', 'checkin')
+    and by the session factories, which time how long it takes to obtain a connection.
+    """
+
+    connections_opened: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    checked_out: int = 0
+    peak_checked_out: int = 0
+    waits: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_connect(self) -> None:
+        """Record a new DBAPI connection opened by the pool."""
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_checkout(self) -> None:
+        """Record a connection checked out of the pool."""
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def record_checkin(self) -> None:
+        """Record a connection returned to the pool."""
+        with self._lock:
+            self.checkins += 1
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def record_wait(self, seconds: float) -> None:
+        """
+        Record the time spent obtaining a connection from the pool.
+
+        :param float seconds: The time spent waiting, in seconds
+        """
+        with self._lock:
+            self.waits += 1
+            self.total_wait_time += seconds
+            self.max_wait_time = max(self.max_wait_time, seconds)
+
+    def snapshot(self, pool: Pool | None = None) -> dict[str, Any]:
+        """
+        Build a point-in-time view of the statistics.
+
+        :param Optional[Pool] pool: The pool to read live sizing figures from, if any
+        :return Dict[str, Any]: The statistics, with wait times in milliseconds
+        """
+        with self._lock:
+            stats = {
+                "connections_opened": self.connections_opened,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "avg_wait_ms": round(self.total_wait_time / self.waits * 1000, 3)
+                if self.waits
+                else 0.0,
+                "max_wait_ms": round(self.max_wait_time * 1000, 3),
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                pool_size=pool.size(),
+                checked_in=pool.checkedin(),
+                overflow=pool.overflow(),
+            )
+        return stats
@@ -1,5 +1,6 @@
 """Data Contract CRUD related error classes."""
 
+from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
 
@@ -17,6 +18,40 @@ class DataContractNotFoundError(DataContractCRUDError):
         super().__init__(self.message)
 
 
+class DataContractRevisionNotFoundError(DataContractCRUDError):
+    """Exception raised when a revision of a data contract is not in its history."""
+
+    def __init__(self, contract_id: str, revision: int):
+        self.message = f" ❌ Revision {revision} of data contract with id '{contract_id}' not found"
+        super().__init__(self.message)
+
+
+class DataContractAlreadyExistsError(DataContractCRUDError):
+    """Exception raised when a data contract with the same ID already exists."""
+
+    def __init__(self, contract_id: str):
+        self.message = f" ❌ Data contract with id '{contract_id}' already exists"
+        super().__init__(self.message)
+
+
+class DataContractConflictError(DataContractCRUDError):
+    """Exception raised when a data contract keeps being modified by concurrent writes."""
+
+    def __init__(self, contract_id: str):
+        self.message = f" ❌ Data contract with id '{contract_id}' was modified concurrently"
+        super().__init__(self.message)
+
+
+class DataContractPreconditionFailedError(DataContractCRUDError):
+    """Exception raised when a data contract is not at the version a conditional write expects."""
+
+    def __init__(self, contract_id: str):
+        self.message = (
+            f" ❌ Data contract with id '{contract_id}' does not match the If-Match precondition"
+        )
+        super().__init__(self.message)
+
+
 class DataContractOperationError(DataContractCRUDError):
     """Exception raised when a data contract operation fails."""
 
@@ -43,6 +78,41 @@ def raise_not_found_error(id: str) -> None:
     raise DataContractNotFoundError(id)
 
 
+def raise_revision_not_found_error(id: str, revision: int) -> None:
+    """
+    Handle missing revisions by raising an appropriate exception.
+
+    :param str id: The ID of the data contract
+    :param int revision: The revision that was not found
+    :raises DataContractRevisionNotFoundError: With appropriate error message
+    """
+    raise DataContractRevisionNotFoundError(id, revision)
+
+
+def raise_precondition_failed_error(id: str) -> None:
+    """
+    Handle failed If-Match preconditions by raising an appropriate exception.
+
+    :param str id: The ID of the data contract that is not at the expected version
+    :raises DataContractPreconditionFailedError: With appropriate error message
+    """
+    raise DataContractPreconditionFailedError(id)
+
+
+def raise_section_validation_error(pointer: str, error: ValidationError) -> None:
+    """
+    Handle the validation errors of one patched section of a data contract.
+
+    :param str pointer: The JSON pointer of the validated section
+    :param ValidationError error: The validation error that occurred
+    :raises DataContractValidationError: With the location and message of each error
+    """
+    details = "; ".join(
+        f"{'/'.join([pointer, *map(str, item['loc'])])}: {item['msg']}" for item in error.errors()
+    )
+    raise DataContractValidationError(details) from error
+
+
 def raise_sqlalchemy_error(error: SQLAlchemyError, operation: str) -> None:
     """
     Handle SQLAlchemy errors by raising an appropriate exception.
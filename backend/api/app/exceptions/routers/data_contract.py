@@ -4,8 +4,18 @@ from fastapi import HTTPException, status
 from pydantic import ValidationError
 
 from ..crud.data_contract import (
+    DataContractConflictError,
     DataContractNotFoundError,
     DataContractOperationError,
+    DataContractPreconditionFailedError,
+    DataContractRevisionNotFoundError,
+)
+from ..utils.bulk import InvalidBulkBodyError, TooManyBulkItemsError
+from ..utils.pagination import InvalidCursorError
+from ..utils.patch import (
+    InvalidPatchError,
+    PatchTestFailedError,
+    UnsupportedPatchMediaTypeError,
 )
 
 
@@ -35,6 +45,113 @@ def raise_invalid_schema(err: ValueError) -> None:
     )
 
 
+def raise_revision_not_found(id: str, revision: int) -> None:
+    """
+    Raise HTTP 404 exception for a revision missing from the history of a data contract.
+
+    :param str id: The ID of the data contract
+    :param int revision: The revision that was not found
+    :raises HTTPException: 404 Not Found error with appropriate message
+    """
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=DataContractRevisionNotFoundError(id, revision).message,
+    )
+
+
+def raise_invalid_cursor(err: InvalidCursorError) -> None:
+    """
+    Raise HTTP 400 exception for an invalid pagination cursor.
+
+    :param InvalidCursorError err: The cursor error that occurred
+    :raises HTTPException: 400 Bad Request error with appropriate message
+    """
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=err.message,
+    ) from err
+
+
+def raise_invalid_bulk_body(err: InvalidBulkBodyError) -> None:
+    """
+    Raise HTTP 400 exception for a malformed bulk request body.
+
+    :param InvalidBulkBodyError err: The parsing error that occurred
+    :raises HTTPException: 400 Bad Request error with appropriate message
+    """
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=err.message,
+    ) from err
+
+
+def raise_too_many_bulk_items(err: TooManyBulkItemsError) -> None:
+    """
+    Raise HTTP 413 exception for a bulk request body holding too many items.
+
+    :param TooManyBulkItemsError err: The error that occurred
+    :raises HTTPException: 413 Content Too Large error with appropriate message
+    """
+    raise HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=err.message,
+    ) from err
+
+
+def raise_invalid_patch(err: InvalidPatchError) -> None:
+    """
+    Raise HTTP 400 exception for a malformed patch, or one that cannot be applied.
+
+    :param InvalidPatchError err: The patch error that occurred
+    :raises HTTPException: 400 Bad Request error with appropriate message
+    """
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=err.message,
+    ) from err
+
+
+def raise_patch_conflict(err: PatchTestFailedError | DataContractConflictError) -> None:
+    """
+    Raise HTTP 409 exception for a patch conflicting with the stored data contract.
+
+    :param Union[PatchTestFailedError, DataContractConflictError] err: The error that occurred
+    :raises HTTPException: 409 Conflict error with appropriate message
+    """
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=err.message,
+    ) from err
+
+
+def raise_precondition_failed(err: DataContractPreconditionFailedError) -> None:
+    """
+    Raise HTTP 412 exception for a write whose If-Match precondition does not hold.
+
+    :param DataContractPreconditionFailedError err: The error that occurred
+    :raises HTTPException: 412 Precondition Failed error with appropriate message
+    """
+    raise HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail=err.message,
+    ) from err
+
+
+def raise_unsupported_patch_media_type(err: UnsupportedPatchMediaTypeError, accept: str) -> None:
+    """
+    Raise HTTP 415 exception for a patch in an unsupported format.
+
+    :param UnsupportedPatchMediaTypeError err: The error that occurred
+    :param str accept: The supported patch media types, sent back in the Accept-Patch header
+    :raises HTTPException: 415 Unsupported Media Type error with appropriate message
+    """
+    raise HTTPException(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail=err.message,
+        headers={"Accept-Patch": accept},
+    ) from err
+
+
 def raise_internal_error(err: Exception, operation: str) -> None:
     """
     Raise HTTP 500 exception for internal errors.
@@ -61,6 +178,32 @@ def raise_missing_id_error() -> None:
     )
 
 
+def raise_missing_selection_error() -> None:
+    """
+    Raises an HTTP 400 exception for a bulk deletion selecting no data contract.
+
+    :raises HTTPException: 400 Bad Request error
+    """
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=" ❌ Data contract IDs or filters are required",
+    )
+
+
+def raise_id_mismatch_error(path_id: str, body_id: str) -> None:
+    """
+    Raises an HTTP 400 exception when the ID of the path and the ID of the body differ.
+
+    :param str path_id: The ID of the path
+    :param str body_id: The ID of the body
+    :raises HTTPException: 400 Bad Request error
+    """
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f" ❌ Data contract ID '{body_id}' does not match the path ID '{path_id}'",
+    )
+
+
 def handle_validation_error(e: ValidationError) -> None:
     """
     Handle validation errors by raising an appropriate HTTP exception.
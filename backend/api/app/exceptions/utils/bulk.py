@@ -0,0 +1,31 @@
+"""Bulk request body related error classes."""
+
+
+class BulkBodyError(Exception):
+    """Base exception class for bulk request body errors."""
+
+    pass
+
+
+class InvalidBulkBodyError(BulkBodyError):
+    """Exception raised when a bulk request body cannot be parsed."""
+
+    def __init__(self, details: str, line: int | None = None):
+        location = f" (line {line})" if line is not None else ""
+        self.message = f" ❌ Invalid bulk request body{location}: {details}"
+        super().__init__(self.message)
+
+
+class NotABulkArrayError(InvalidBulkBodyError):
+    """Exception raised when a bulk request body is not an array."""
+
+    def __init__(self):
+        super().__init__("expected an array")
+
+
+class TooManyBulkItemsError(BulkBodyError):
+    """Exception raised when a bulk request body holds more items than allowed."""
+
+    def __init__(self, max_items: int):
+        self.message = f" ❌ Too many items in bulk request: at most {max_items} are allowed"
+        super().__init__(self.message)
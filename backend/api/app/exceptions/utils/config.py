@@ -17,6 +17,22 @@ class InvalidPortError(ConfigError):
         super().__init__(self.message)
 
 
+class InvalidIntegerError(ConfigError):
+    """Exception raised when an integer setting is invalid."""
+
+    def __init__(self, key: str, value: Any):
+        self.message = f" ❌ Invalid integer for {key}: {value}"
+        super().__init__(self.message)
+
+
+class InvalidBooleanError(ConfigError):
+    """Exception raised when a boolean setting is invalid."""
+
+    def __init__(self, key: str, value: Any):
+        self.message = f" ❌ Invalid boolean for {key}: {value} (expected true/false)"
+        super().__init__(self.message)
+
+
 class MissingEnvironmentVariableError(ConfigError):
     """Exception raised when a required environment variable is missing."""
 
@@ -0,0 +1,15 @@
+"""Content negotiation related error classes."""
+
+
+class ContentError(Exception):
+    """Base exception class for content negotiation errors."""
+
+    pass
+
+
+class InvalidRequestBodyError(ContentError):
+    """Exception raised when a request body cannot be decoded from its media type."""
+
+    def __init__(self, media_type: str, details: str):
+        self.message = f" ❌ Invalid {media_type} request body: {details}"
+        super().__init__(self.message)
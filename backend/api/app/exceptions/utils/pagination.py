@@ -0,0 +1,15 @@
+"""Pagination related error classes."""
+
+
+class PaginationError(Exception):
+    """Base exception class for pagination errors."""
+
+    pass
+
+
+class InvalidCursorError(PaginationError):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        self.message = f" ❌ Invalid pagination cursor: {cursor}"
+        super().__init__(self.message)
@@ -0,0 +1,76 @@
+"""JSON patch related error classes."""
+
+
+class PatchError(Exception):
+    """Base exception class for JSON patch errors."""
+
+    pass
+
+
+class InvalidPatchError(PatchError):
+    """Exception raised when a patch is malformed or cannot be applied to the document."""
+
+    def __init__(self, details: str):
+        self.message = f" ❌ Invalid patch: {details}"
+        super().__init__(self.message)
+
+
+class MalformedPatchBodyError(InvalidPatchError):
+    """Exception raised when the body of a patch request is not valid JSON."""
+
+    def __init__(self):
+        super().__init__("the body is not valid JSON")
+
+
+class NotAMergePatchError(InvalidPatchError):
+    """Exception raised when a merge patch of a data contract is not an object."""
+
+    def __init__(self):
+        super().__init__("a merge patch must be an object")
+
+
+class NotAJsonPatchError(InvalidPatchError):
+    """Exception raised when a JSON Patch is not an array of operations."""
+
+    def __init__(self):
+        super().__init__("a JSON Patch must be an array of operations")
+
+
+class InvalidPointerError(InvalidPatchError):
+    """Exception raised when a JSON Pointer is malformed."""
+
+    def __init__(self, pointer: object):
+        super().__init__(f"malformed JSON pointer '{pointer}'")
+
+
+class InvalidPatchOperationError(InvalidPatchError):
+    """Exception raised when a JSON Patch operation is unknown or misses a member."""
+
+    def __init__(self, operation: object, member: str | None = None):
+        if member is None:
+            super().__init__(f"unknown operation {operation}")
+        else:
+            super().__init__(f"'{operation}' operation without '{member}'")
+
+
+class PatchPathError(InvalidPatchError):
+    """Exception raised when a JSON Patch operation targets a path it cannot apply to."""
+
+    def __init__(self, path: str, reason: str = "does not exist"):
+        super().__init__(f"path '{path}' {reason}")
+
+
+class PatchTestFailedError(PatchError):
+    """Exception raised when a JSON Patch 'test' operation does not match the document."""
+
+    def __init__(self, path: str):
+        self.message = f" ❌ Patch test failed at '{path}'"
+        super().__init__(self.message)
+
+
+class UnsupportedPatchMediaTypeError(PatchError):
+    """Exception raised when a patch is sent with a media type of no supported patch format."""
+
+    def __init__(self, media_type: str):
+        self.message = f" ❌ Unsupported patch media type '{media_type}'"
+        super().__init__(self.message)
@@ -1,17 +1,27 @@
 import importlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from functools import cache
 from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
 from sqlalchemy import text
 
 from .database.manager import db_manager
+from .database.notifications import notification_listener
+from .services.data_contract import (
+    async_data_contract_service,
+    data_contract_cache,
+    data_contract_service,
+)
 from .utils.config import settings
+from .utils.content import NegotiatedGZipMiddleware
+from .utils.example_model import resolve_examples
 from .utils.logger import get_logger
 
 
@@ -35,17 +45,34 @@ class AppManager:
                 title="Mycelium API",
                 description="An API for managing data contracts and related operations.",
                 version="1.0.0",
+                lifespan=self._lifespan,
             )
 
             self._configure_middleware()
             self.include_routers()
             self.setup_health_check()
+            self.app.openapi = self._openapi
 
             logger.info(" ✅ Application initialized successfully")
         except Exception as e:
             logger.critical(" 🔥 Critical error during application initialization")
             raise e from None
 
+    @staticmethod
+    @asynccontextmanager
+    async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """
+        Run the background services for the lifetime of the application.
+
+        :param FastAPI app: The application
+        """
+        if settings.CHANGE_NOTIFICATIONS_ENABLED:
+            notification_listener.start(db_manager.engine)
+        try:
+            yield
+        finally:
+            notification_listener.stop()
+
     @staticmethod
     def _ensure_directory_exists(directory: Path) -> None:
         """
@@ -80,8 +107,10 @@ class AppManager:
                 CORSMiddleware,
                 allow_origins=settings.ALLOWED_ORIGINS,
                 allow_credentials=True,
-                allow_methods=["GET", "POST", "PUT", "DELETE"],
+                allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
                 allow_headers=["*"],
+                # Lets browser clients read the validators to send back in conditional requests
+                expose_headers=["ETag", "Last-Modified"],
                 max_age=3600,
             )
 
@@ -91,8 +120,8 @@ class AppManager:
                 allowed_hosts=settings.ALLOWED_HOSTS,
             )
 
-            # Add compression middleware
-            self.app.add_middleware(GZipMiddleware, minimum_size=1000)
+            # Add compression middleware, leaving the binary media types uncompressed
+            self.app.add_middleware(NegotiatedGZipMiddleware, minimum_size=1000)
 
             logger.info(" ✅ Middleware configured successfully")
         except Exception:
@@ -135,8 +164,15 @@ class AppManager:
         try:
             db_manager.create_database()
             db_manager.setup_engine()
+            db_manager.setup_async_engine()
             self.import_models()
-            db_manager.create_tables()
+            # One worker at a time, the others finding the tables up to date
+            with db_manager.setup_lock():
+                db_manager.create_tables()
+                db_manager.run_migrations()
+                data_contract_service.migrate_legacy_references()
+                data_contract_service.index_data_contracts_for_search()
+                data_contract_service.store_canonical_documents()
             logger.info(" ✅ Database setup completed successfully")
         except Exception:
             logger.exception(" ❌ Database setup failed")
@@ -173,6 +209,23 @@ class AppManager:
             logger.exception(" ❌ Error including routers")
             raise
 
+    def _openapi(self) -> dict[str, Any]:
+        """
+        Build the OpenAPI schema when it is first requested, with the examples of the routes.
+
+        The examples of the routes and schemas are built lazily, so that starting a worker
+        does not build the documentation; they are built here, once, with the schema.
+
+        :return Dict[str, Any]: The OpenAPI schema
+        """
+        if self.app.openapi_schema is None:
+            routes = [route for router, _ in self._get_routers() for route in router.routes]
+            for route in routes:
+                if isinstance(route, APIRoute):
+                    resolve_examples(route.responses)
+                    resolve_examples(route.openapi_extra)
+        return FastAPI.openapi(self.app)
+
     def setup_health_check(self) -> None:
         """
         Set up health check endpoint with comprehensive checks.
@@ -199,6 +252,11 @@ class AppManager:
                         "status": "healthy",
                         "database": "connected",
                         "templates_directory": "ok" if templates_ok else "error",
+                        "pool": db_manager.get_pool_statistics(),
+                        "data_contract_cache": data_contract_cache.stats(),
+                        "data_contract_write_batches": (
+                            async_data_contract_service.write_coalescer.stats()
+                        ),
                         "version": "1.0.0",
                     },
                     status_code=200,
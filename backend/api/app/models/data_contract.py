@@ -1,11 +1,17 @@
+from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import JSON, String
+from sqlalchemy import JSON, DateTime, Index, Integer, LargeBinary, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..database.manager import db_manager
 
 
+# JSONB on PostgreSQL so documents can be indexed and queried server-side, JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
 class DataContract(db_manager.Base):
     """
     Represents a Data Contract in the database.
@@ -15,19 +21,77 @@ class DataContract(db_manager.Base):
     """
 
     __tablename__ = "data_contracts"
+    __table_args__ = (
+        # Containment ('@>') and JSON path ('@?') lookups on tags and servers
+        Index(
+            "ix_data_contracts_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_data_contracts_servers",
+            "servers",
+            postgresql_using="gin",
+            postgresql_ops={"servers": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # Equality lookups on scalar 'info' attributes
+        Index("ix_data_contracts_info_owner", text("(info ->> 'owner')")).ddl_if(
+            dialect="postgresql"
+        ),
+        Index("ix_data_contracts_info_status", text("(info ->> 'status')")).ddl_if(
+            dialect="postgresql"
+        ),
+        # Full-text search
+        Index("ix_data_contracts_search_vector", "search_vector", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+        # The rows the startup backfills look for, only ever a few: the indexes stay small and
+        # finding that there is none does not scan the table
+        Index(
+            "ix_data_contracts_search_missing", "id", postgresql_where=text("search_text IS NULL")
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_data_contracts_document_missing", "id", postgresql_where=text("document IS NULL")
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
     data_contract_specification: Mapped[str] = mapped_column(String, nullable=False)
-    info: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
-    servers: Mapped[dict[str, Any] | None] = mapped_column(JSON)
-    terms: Mapped[dict[str, Any] | None] = mapped_column(JSON)
-    models: Mapped[dict[str, Any] | None] = mapped_column(JSON)
-    definitions: Mapped[dict[str, Any] | None] = mapped_column(JSON)
-    examples: Mapped[list[dict[str, Any]] | None] = mapped_column(JSON)
-    service_level: Mapped[dict[str, Any] | None] = mapped_column(JSON)
-    quality: Mapped[dict[str, Any] | None] = mapped_column(JSON)
-    links: Mapped[dict[str, str] | None] = mapped_column(JSON)
-    tags: Mapped[list[str] | None] = mapped_column(JSON)
+    info: Mapped[dict[str, Any]] = mapped_column(JSONDocument, nullable=False)
+    servers: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument)
+    terms: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument)
+    models: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument)
+    definitions: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument)
+    examples: Mapped[list[dict[str, Any]] | None] = mapped_column(JSONDocument)
+    service_level: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument)
+    quality: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument)
+    links: Mapped[dict[str, str] | None] = mapped_column(JSONDocument)
+    tags: Mapped[list[str] | None] = mapped_column(JSONDocument)
+
+    # Version of the stored document, bumped on every write (ETag / Last-Modified)
+    revision: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text("1")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+    )
+
+    # Canonical JSON of the document, as reads serve it, zlib-compressed when large, and its
+    # SHA-256. NULL for the data contracts patched, or stored before they existed, until they
+    # are backfilled.
+    document: Mapped[bytes | None] = mapped_column(LargeBinary, deferred=True)
+    document_hash: Mapped[str | None] = mapped_column(String(64), deferred=True)
+
+    # Full-text search columns, maintained on every write and never loaded with the contract.
+    # The weighted vector is only built on PostgreSQL; other dialects match the plain text.
+    search_text: Mapped[str | None] = mapped_column(Text, deferred=True)
+    search_vector: Mapped[str | None] = mapped_column(
+        Text().with_variant(TSVECTOR(), "postgresql"), deferred=True
+    )
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,46 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database.manager import db_manager
+
+
+class DataContractChange(db_manager.Base):
+    """
+    Represents one change of a data contract in the change feed.
+
+    Changes are appended to this outbox in the transaction of the write they describe, so
+    the feed holds exactly the committed writes. They are ordered by the ID of their
+    transaction, then by their offset, which identifies them and lets consumers resume where
+    they stopped. It maps to the 'data_contract_changes' table in the database.
+    """
+
+    __tablename__ = "data_contract_changes"
+    __table_args__ = (Index("ix_data_contract_changes_position", "xact_id", "offset"),)
+
+    # SQLite only auto-increments INTEGER primary keys
+    offset: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+    op: Mapped[str] = mapped_column(String, nullable=False)
+    data_contract_id: Mapped[str] = mapped_column(String, nullable=False)
+
+    # The revision written, None for a deletion
+    revision: Mapped[int | None] = mapped_column(Integer)
+
+    # The ID of the writing transaction on PostgreSQL, 0 on SQLite and for earlier changes
+    xact_id: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the DataContractChange object.
+        :return str: A string representation of the DataContractChange object.
+        """
+        return (
+            f"<DataContractChange(offset={self.offset}, op='{self.op}', "
+            f"id='{self.data_contract_id}', revision={self.revision})>"
+        )
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database.manager import db_manager
+
+
+# Unlike data contract sections, a missing snapshot or diff is SQL NULL rather than JSON null
+NullableJSONDocument = JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql")
+
+
+class DataContractRevision(db_manager.Base):
+    """
+    Represents one revision of a data contract in its history.
+
+    A revision is either a snapshot, holding the whole document, or a delta, holding the JSON
+    Patch (RFC 6902) turning the document of its base snapshot into its own. It maps to the
+    'data_contract_revisions' table in the database.
+    """
+
+    __tablename__ = "data_contract_revisions"
+
+    data_contract_id: Mapped[str] = mapped_column(String, primary_key=True)
+    revision: Mapped[int] = mapped_column(Integer, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    # The revision of the snapshot the delta applies to, None for a snapshot
+    base_revision: Mapped[int | None] = mapped_column(Integer)
+    document: Mapped[dict[str, Any] | None] = mapped_column(NullableJSONDocument)
+    diff: Mapped[list[dict[str, Any]] | None] = mapped_column(NullableJSONDocument)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the DataContractRevision object.
+        :return str: A string representation of the DataContractRevision object.
+        """
+        kind = "snapshot" if self.base_revision is None else f"delta of {self.base_revision}"
+        return f"<DataContractRevision(id='{self.data_contract_id}', revision={self.revision}, {kind})>"
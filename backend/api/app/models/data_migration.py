@@ -0,0 +1,30 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database.manager import db_manager
+
+
+class DataMigration(db_manager.Base):
+    """
+    Represents a one-time data migration that completed.
+
+    Migrations rewriting stored data run at startup; once recorded here, they are skipped
+    instead of scanning the tables again. It maps to the 'data_migrations' table in the
+    database.
+    """
+
+    __tablename__ = "data_migrations"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    applied_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the DataMigration object.
+        :return str: A string representation of the DataMigration object.
+        """
+        return f"<DataMigration(name='{self.name}', applied_at={self.applied_at})>"
@@ -1,38 +1,130 @@
-from fastapi import APIRouter, HTTPException, status
+import json
+from collections.abc import AsyncIterator
+from typing import Literal
+
+import pydantic_core
+from fastapi import APIRouter, Header, HTTPException, Path, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
 from ..exceptions.crud.data_contract import (
+    DataContractConflictError,
+    DataContractNotFoundError,
+    DataContractPreconditionFailedError,
+    DataContractRevisionNotFoundError,
     DataContractValidationError,
 )
 from ..exceptions.routers.data_contract import (
     handle_validation_error,
+    raise_id_mismatch_error,
     raise_internal_error,
+    raise_invalid_bulk_body,
+    raise_invalid_cursor,
+    raise_invalid_patch,
     raise_invalid_schema,
     raise_missing_id_error,
+    raise_missing_selection_error,
     raise_not_found,
+    raise_patch_conflict,
+    raise_precondition_failed,
+    raise_revision_not_found,
+    raise_too_many_bulk_items,
+    raise_unsupported_patch_media_type,
+)
+from ..exceptions.utils.bulk import InvalidBulkBodyError, TooManyBulkItemsError
+from ..exceptions.utils.pagination import InvalidCursorError
+from ..exceptions.utils.patch import (
+    InvalidPatchError,
+    MalformedPatchBodyError,
+    PatchTestFailedError,
+    UnsupportedPatchMediaTypeError,
 )
+from ..schemas.data_contract.routes.data_contract_bulk_create import (
+    DataContractBulkCreateResponse,
+)
+from ..schemas.data_contract.routes.data_contract_change import DataContractChangeListResponse
 from ..schemas.data_contract.routes.data_contract_create import (
     DataContractCreate,
     DataContractCreateResponse,
 )
 from ..schemas.data_contract.routes.data_contract_delete import (
+    DataContractBulkDelete,
+    DataContractBulkDeleteResponse,
     DataContractDelete,
     DataContractDeleteResponse,
 )
 from ..schemas.data_contract.routes.data_contract_get import DataContractGetResponse
-from ..schemas.data_contract.routes.data_contract_list import DataContractListResponse
+from ..schemas.data_contract.routes.data_contract_list import (
+    DataContractFilter,
+    DataContractListResponse,
+    DataContractSummaryListResponse,
+)
+from ..schemas.data_contract.routes.data_contract_patch import DataContractPatchResponse
+from ..schemas.data_contract.routes.data_contract_revision import (
+    DataContractRevisionGetResponse,
+    DataContractRevisionListResponse,
+)
+from ..schemas.data_contract.routes.data_contract_search import DataContractSearchResponse
 from ..schemas.data_contract.routes.data_contract_update import (
     DataContractUpdate,
     DataContractUpdateResponse,
 )
-from ..services.data_contract import data_contract_service
+from ..services.data_contract import async_data_contract_service
+from ..utils.bulk import is_ndjson, read_bulk_items
+from ..utils.change_feed import (
+    EVENT_STREAM_MEDIA_TYPE,
+    accepts_event_stream,
+    parse_last_event_id,
+    serialize_change_events,
+)
+from ..utils.conditional import is_not_modified, list_etag, parse_if_match, validator_headers
+from ..utils.config import settings
+from ..utils.content import (
+    CODECS,
+    NegotiatedRoute,
+    accepted_media_type,
+    encode_map,
+    request_codec,
+)
+from ..utils.example_model import LazyExample
+from ..utils.export import (
+    EXPORT_MEDIA_TYPES,
+    JSON_FORMATS,
+    ExportFormat,
+    serialize_data_contracts,
+)
 from ..utils.logger import get_logger
+from ..utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ..utils.patch import (
+    ACCEPT_PATCH,
+    JSON_PATCH_MEDIA_TYPE,
+    MERGE_PATCH_MEDIA_TYPE,
+    is_json_patch,
+)
+from ..utils.responses import PydanticJSONResponse
 
 
 logger = get_logger(__name__)
 
+# Messages of the get and list responses
+GET_MESSAGE = " ✅ Data contract retrieved successfully"
+LIST_MESSAGE = " ✅ Data contracts retrieved successfully"
+
+# Envelope of the get response, in which the cached data contract JSON is spliced
+GET_RESPONSE_PREFIX = (
+    b'{"message":' + json.dumps(GET_MESSAGE, ensure_ascii=False).encode() + b',"data":'
+)
+
+# Envelope of the full list response, in which the canonical JSON of the page is spliced
+LIST_RESPONSE_PREFIX = (
+    b'{"message":' + json.dumps(LIST_MESSAGE, ensure_ascii=False).encode() + b',"data":['
+)
+
+# Maximum time in seconds a long-polling consumer of the change feed waits for a change
+MAX_CHANGE_FEED_WAIT = 60
 
-router = APIRouter(tags=["Data Contract"])
+
+router = APIRouter(tags=["Data Contract"], route_class=NegotiatedRoute)
 
 
 @router.post(
@@ -44,7 +136,9 @@ router = APIRouter(tags=["Data Contract"])
     response_description="Successfully created data contract",
     responses={
         201: {
-            "content": {"application/json": {"example": DataContractCreateResponse.get_example()}},
+            "content": {
+                "application/json": {"example": LazyExample(DataContractCreateResponse.get_example)}
+            },
         },
         400: {
             "description": "Invalid input",
@@ -83,7 +177,7 @@ router = APIRouter(tags=["Data Contract"])
 )
 async def create_data_contract_route(
     data_contract: DataContractCreate,
-) -> DataContractCreateResponse:
+) -> PydanticJSONResponse:
     """
     Creates a new data contract and stores it in the database.
 
@@ -92,7 +186,7 @@ async def create_data_contract_route(
     If an error occurs during the process, it raises an appropriate HTTP exception.
 
     :param DataContractCreate data_contract: The data contract to be created
-    :return DataContractCreateResponse: A response containing the created data contract
+    :return PydanticJSONResponse: A `DataContractCreateResponse` containing the created data contract
     :raises HTTPException:
         - 400 Bad Request: If the input data is invalid
         - 422 Unprocessable Entity: If the request payload fails validation
@@ -103,10 +197,13 @@ async def create_data_contract_route(
         if not data_contract.id:
             raise_missing_id_error()
 
-        created_contract = data_contract_service.create_data_contract(data_contract)
-        return DataContractCreateResponse(
-            message=" ✅ Data contract created successfully",
-            data=created_contract,
+        created_contract = await async_data_contract_service.create_data_contract(data_contract)
+        return PydanticJSONResponse(
+            DataContractCreateResponse(
+                message=" ✅ Data contract created successfully",
+                data=created_contract,
+            ),
+            status_code=status.HTTP_201_CREATED,
         )
 
     except DataContractValidationError as ve:
@@ -119,6 +216,511 @@ async def create_data_contract_route(
         raise_internal_error(e, "create")
 
 
+@router.post(
+    "/bulk",
+    response_model=DataContractBulkCreateResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Create data contracts in bulk",
+    description="Creates many data contracts at once from a JSON array or an NDJSON stream "
+    "(`Content-Type: application/x-ndjson`), reporting the outcome of each item.",
+    response_description="Items processed, see the outcome of each item",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/DataContractCreate"},
+                    }
+                },
+                "application/x-ndjson": {
+                    "schema": {"type": "string", "description": "One data contract per line"}
+                },
+            },
+        }
+    },
+    responses={
+        200: {
+            "content": {
+                "application/json": {
+                    "example": LazyExample(DataContractBulkCreateResponse.get_example)
+                }
+            },
+        },
+        400: {
+            "description": "Malformed request body",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Invalid bulk request body: expected a JSON array"}
+                }
+            },
+        },
+        413: {
+            "description": "Too many items",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Too many items in bulk request: at most 10000 are allowed"
+                    }
+                }
+            },
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Failed to create data contract: Internal server error"
+                    }
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def bulk_create_data_contracts_route(request: Request) -> PydanticJSONResponse:
+    """
+    Creates many data contracts at once.
+
+    This endpoint accepts a JSON array of data contracts, or one data contract per line when
+    the body is NDJSON; the array may also be sent as MessagePack or CBOR. All the items are
+    validated, then the valid ones are inserted in batches within a few transactions, instead
+    of one request and one commit per contract. Invalid items and existing IDs do not fail the
+    request: the outcome of each item is reported in the response.
+
+    :param Request request: The request, whose body holds the data contracts
+    :return PydanticJSONResponse: A `DataContractBulkCreateResponse` with the number of created and failed items, and the outcome of each item
+    :raises HTTPException:
+        - 400 Bad Request: If the body is not an array or valid NDJSON
+        - 413 Content Too Large: If the body holds more than DATA_CONTRACT_BULK_MAX_ITEMS items
+        - 500 Internal Server Error: If there's an unexpected error
+    """
+    content_type = request.headers.get("content-type")
+    codec = request_codec(content_type)
+    try:
+        items = await read_bulk_items(
+            request.stream(),
+            ndjson=is_ndjson(content_type),
+            max_items=settings.DATA_CONTRACT_BULK_MAX_ITEMS,
+            loads=codec.loads if codec else json.loads,
+        )
+        results = await async_data_contract_service.bulk_create_data_contracts(items)
+        created = sum(result.status == "created" for result in results)
+        return PydanticJSONResponse(
+            DataContractBulkCreateResponse(
+                message=f" ✅ {created} of {len(results)} data contracts created",
+                created=created,
+                failed=len(results) - created,
+                results=results,
+            )
+        )
+    except TooManyBulkItemsError as te:
+        raise_too_many_bulk_items(te)
+    except InvalidBulkBodyError as be:
+        raise_invalid_bulk_body(be)
+    except Exception as e:
+        raise_internal_error(e, "create")
+
+
+@router.post(
+    "/bulk/delete",
+    response_model=DataContractBulkDeleteResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Delete data contracts in bulk",
+    description="Deletes the data contracts selected by IDs and/or filters in one transaction.",
+    response_description="Successfully deleted data contracts",
+    responses={
+        200: {
+            "content": {
+                "application/json": {
+                    "example": LazyExample(DataContractBulkDeleteResponse.get_example)
+                }
+            },
+        },
+        400: {
+            "description": "No data contract selected",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Data contract IDs or filters are required"}
+                }
+            },
+        },
+        413: {
+            "description": "Too many IDs",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Too many items in bulk request: at most 10000 are allowed"
+                    }
+                }
+            },
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Failed to delete data contract: Internal server error"
+                    }
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def bulk_delete_data_contracts_route(
+    data_contracts: DataContractBulkDelete,
+) -> PydanticJSONResponse:
+    """
+    Deletes many data contracts at once.
+
+    This endpoint accepts a list of IDs, filters, or both, and deletes every data contract
+    having one of the IDs and matching the filters with a single DELETE ... RETURNING
+    statement. Only the IDs of the deleted contracts are returned, unless the deleted
+    documents are requested with `return_documents`. Unknown IDs are ignored.
+
+    :param DataContractBulkDelete data_contracts: The selection of the data contracts to delete
+    :return PydanticJSONResponse: A `DataContractBulkDeleteResponse` containing the IDs of the deleted data contracts, and the data contracts if requested
+    :raises HTTPException:
+        - 400 Bad Request: If neither IDs nor filters are given
+        - 413 Content Too Large: If more than DATA_CONTRACT_BULK_MAX_ITEMS IDs are given
+        - 500 Internal Server Error: If there's an unexpected error
+    """
+    try:
+        filters = data_contracts.filters
+        if data_contracts.ids is None and (
+            filters is None or not filters.model_dump(exclude_none=True)
+        ):
+            raise_missing_selection_error()
+        if data_contracts.ids is not None and (
+            len(data_contracts.ids) > settings.DATA_CONTRACT_BULK_MAX_ITEMS
+        ):
+            raise_too_many_bulk_items(TooManyBulkItemsError(settings.DATA_CONTRACT_BULK_MAX_ITEMS))
+
+        deleted_ids, documents = await async_data_contract_service.bulk_delete_data_contracts(
+            data_contracts
+        )
+        return PydanticJSONResponse(
+            DataContractBulkDeleteResponse(
+                message=f" ✅ {len(deleted_ids)} data contracts deleted successfully",
+                ids=deleted_ids,
+                data=documents,
+            )
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise_internal_error(e, "delete")
+
+
+@router.get(
+    "/search",
+    response_model=DataContractSearchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Search data contracts",
+    description="Full-text search over the data contract titles, descriptions, model names, "
+    "field names and field descriptions, most relevant first.",
+    response_description="Successfully searched data contracts",
+    responses={
+        200: {
+            "content": {
+                "application/json": {"example": LazyExample(DataContractSearchResponse.get_example)}
+            },
+        },
+        400: {
+            "description": "Invalid pagination cursor",
+            "content": {
+                "application/json": {"example": {"detail": " ❌ Invalid pagination cursor: abc"}}
+            },
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Failed to search data contract: Internal server error"
+                    }
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def search_data_contracts_route(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=256,
+        description='The search query. Supports "quoted phrases", `or` and `-excluded` terms.',
+    ),
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of data contracts to return.",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="The `next_cursor` returned with the previous page.",
+    ),
+) -> PydanticJSONResponse:
+    """
+    Searches the data contracts matching a full-text query.
+
+    Titles weigh the most, then descriptions, then model and field names, then model and
+    field descriptions. Each result carries its rank and an excerpt of the matching text
+    with the matched terms highlighted. When more results are available, the response
+    carries a `next_cursor` to pass back to get the next page.
+
+    :param str q: The search query.
+    :param int limit: The maximum number of data contracts to return.
+    :param Optional[str] cursor: The cursor returned with the previous page, if any.
+    :return PydanticJSONResponse: A `DataContractSearchResponse` containing a success message, the page of matching data contracts and the next page cursor.
+    :raises HTTPException:
+        - 400 Bad Request: If the cursor is malformed.
+        - 500 Internal Server Error: If there's an unexpected error during the search.
+    """
+    try:
+        results, next_cursor = await async_data_contract_service.search_data_contracts(
+            q, limit=limit, cursor=cursor
+        )
+        return PydanticJSONResponse(
+            DataContractSearchResponse(
+                message=" ✅ Data contracts searched successfully",
+                data=results,
+                next_cursor=next_cursor,
+            )
+        )
+    except InvalidCursorError as ce:
+        raise_invalid_cursor(ce)
+    except Exception as e:
+        raise_internal_error(e, "search")
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Export data contracts",
+    description="Streams every data contract, ordered by ID, as NDJSON, a JSON array or a "
+    "stream of YAML documents. Contracts can be filtered like in the listing.",
+    response_description="Successfully exported data contracts",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {media_type: {} for media_type, _ in EXPORT_MEDIA_TYPES.values()},
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Failed to export data contract: Internal server error"
+                    }
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def export_data_contracts_route(
+    export_format: ExportFormat = Query(
+        "ndjson",
+        alias="format",
+        description="`ndjson` for one JSON document per line, `json` for a JSON array, "
+        "`yaml` for a stream of datacontract.yaml documents.",
+    ),
+    tag: list[str] | None = Query(
+        None,
+        description="Only export data contracts carrying this tag. Repeat to require several tags.",
+    ),
+    owner: str | None = Query(None, description="Only export data contracts with this owner."),
+    contract_status: Literal["proposed", "in development", "active", "deprecated", "retired"]
+    | None = Query(
+        None,
+        alias="status",
+        description="Only export data contracts with this status.",
+    ),
+    server_type: str | None = Query(
+        None,
+        description="Only export data contracts with a server of this type.",
+    ),
+    environment: str | None = Query(
+        None,
+        description="Only export data contracts with a server in this environment.",
+    ),
+) -> StreamingResponse:
+    """
+    Exports the data contracts as a stream.
+
+    The data contracts are read from a server-side cursor and serialized as they are
+    fetched, so memory use does not depend on the size of the catalog and the first bytes
+    are sent as soon as the first rows are read. The first chunk is produced before the
+    response starts, so that a failure to query the database still gets an error status;
+    a failure later on aborts the transfer.
+
+    :param str export_format: Either "ndjson", "json" or "yaml".
+    :param Optional[List[str]] tag: Tags the data contracts must all carry.
+    :param Optional[str] owner: The owner of the data contracts.
+    :param Optional[str] contract_status: The status of the data contracts.
+    :param Optional[str] server_type: The type of one of the servers of the data contracts.
+    :param Optional[str] environment: The environment of one of the servers of the data contracts.
+    :return StreamingResponse: The export, as an attachment.
+    :raises HTTPException:
+        - 500 Internal Server Error: If there's an unexpected error before the export starts.
+    """
+    filters = DataContractFilter(
+        tag=tag,
+        owner=owner,
+        status=contract_status,
+        server_type=server_type,
+        environment=environment,
+    )
+    chunks = serialize_data_contracts(
+        async_data_contract_service.export_data_contracts(
+            filters, as_json=export_format in JSON_FORMATS
+        ),
+        export_format,
+    )
+    try:
+        first_chunk = await anext(chunks, b"")
+    except Exception as e:
+        raise_internal_error(e, "export")
+
+    media_type, extension = EXPORT_MEDIA_TYPES[export_format]
+    return StreamingResponse(
+        _prepend(first_chunk, chunks),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="data_contracts.{extension}"',
+            "Cache-Control": "no-store",
+        },
+    )
+
+
+async def _prepend(first_chunk: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Yields a chunk already read from a stream, then the rest of the stream.
+
+    :param bytes first_chunk: The chunk already read
+    :param AsyncIterator[bytes] chunks: The rest of the stream
+    :return AsyncIterator[bytes]: The whole stream
+    """
+    if first_chunk:
+        yield first_chunk
+    async for chunk in chunks:
+        yield chunk
+
+
+@router.get(
+    "/changes",
+    response_model=DataContractChangeListResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Follow the changes of data contracts",
+    description="Serves the committed creations, updates and deletions of data contracts "
+    "following an offset, as a long-polled JSON page or as a stream of Server-Sent Events.",
+    response_description="Successfully retrieved data contract changes",
+    responses={
+        200: {
+            "content": {
+                "application/json": {
+                    "example": LazyExample(DataContractChangeListResponse.get_example)
+                },
+                EVENT_STREAM_MEDIA_TYPE: {},
+            },
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Failed to retrieve data contract: Internal server error"
+                    }
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def list_data_contract_changes_route(
+    since: int = Query(
+        0,
+        ge=0,
+        description="The offset of the last change already processed, 0 to start from the "
+        "first one.",
+    ),
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of changes per page, or per batch of events.",
+    ),
+    wait: float = Query(
+        0,
+        ge=0,
+        le=MAX_CHANGE_FEED_WAIT,
+        description="Maximum time in seconds to wait for a change when there is none yet.",
+    ),
+    accept: str | None = Header(None),
+    last_event_id: str | None = Header(None),
+) -> PydanticJSONResponse | StreamingResponse:
+    """
+    Serves the change feed of data contracts, to process deltas instead of polling the list.
+
+    Every creation, update and deletion is appended to the feed in the transaction of the
+    write, so the feed holds exactly the committed changes. Changes are only served once no
+    older write is still in flight, so a change never shows up before one already served.
+    Offsets identify changes but are not served in increasing order: consumers store the
+    offset of the last change they processed and pass it back as `since` to resume.
+
+    - With `Accept: text/event-stream`, the changes are streamed as Server-Sent Events until
+      the client disconnects, each event identified by its offset; a reconnecting client
+      resumes from its `Last-Event-ID`, which takes precedence over `since`.
+    - Otherwise, one page of changes is returned, after waiting up to `wait` seconds for one
+      when there is none yet (long polling). `next_offset` is the `since` of the next call.
+
+    :param int since: The offset of the last change already processed.
+    :param int limit: The maximum number of changes per page, or per batch of events.
+    :param float wait: The maximum time in seconds to wait for a change.
+    :param Optional[str] accept: The Accept header, selecting Server-Sent Events.
+    :param Optional[str] last_event_id: The ID of the last event received before reconnecting.
+    :return Union[PydanticJSONResponse, StreamingResponse]: The page of changes,
+        or the stream of events.
+    :raises HTTPException:
+        - 500 Internal Server Error: If there's an unexpected error before the changes are sent.
+    """
+    if accepts_event_stream(accept):
+        resumed = parse_last_event_id(last_event_id)
+        events = serialize_change_events(
+            async_data_contract_service.stream_data_contract_changes(
+                resumed if resumed is not None else since, limit
+            )
+        )
+        try:
+            first_chunk = await anext(events)
+        except Exception as e:
+            raise_internal_error(e, "retrieve")
+        return StreamingResponse(
+            _prepend(first_chunk, events),
+            media_type=EVENT_STREAM_MEDIA_TYPE,
+            headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+        )
+
+    try:
+        changes = await async_data_contract_service.list_data_contract_changes(
+            since, limit=limit, wait=wait
+        )
+        return PydanticJSONResponse(
+            DataContractChangeListResponse(
+                message=" ✅ Data contract changes retrieved successfully",
+                data=changes,
+                next_offset=changes[-1].offset if changes else since,
+            )
+        )
+    except Exception as e:
+        raise_internal_error(e, "retrieve")
+
+
 @router.get(
     "/{id}",
     response_model=DataContractGetResponse,
@@ -128,7 +730,12 @@ async def create_data_contract_route(
     response_description="Successfully retrieved data contract",
     responses={
         200: {
-            "content": {"application/json": {"example": DataContractGetResponse.get_example()}},
+            "content": {
+                "application/json": {"example": LazyExample(DataContractGetResponse.get_example)}
+            },
+        },
+        304: {
+            "description": "Data contract not modified since the version known by the client",
         },
         404: {
             "description": "Data contract not found",
@@ -149,44 +756,261 @@ async def create_data_contract_route(
 )
 async def get_data_contract_route(
     id: str,
-) -> DataContractGetResponse:
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
+) -> Response:
     """
     Retrieves a data contract from the database by its ID.
 
     This endpoint accepts a data contract ID, attempts to retrieve the corresponding
-    data contract from the database. If successful, it returns the retrieved contract.
+    data contract from the read cache or the database. If successful, it returns the
+    retrieved contract with its ETag and Last-Modified validators.
+    When the request carries If-None-Match or If-Modified-Since and the client's copy is
+    still current, only the version of the contract is read and 304 Not Modified is returned.
     If the contract is not found or an error occurs, it raises an appropriate HTTP exception.
 
     :param str id: The unique identifier of the data contract to retrieve. Example: "urn:datacontract:checkout:orders-latest"
-    :return DataContractGetResponse: A response containing a success message and the retrieved data contract.
+    :param Optional[str] if_none_match: The entity tags of the copies known by the client, if any.
+    :param Optional[str] if_modified_since: The modification time of the client's copy, if any.
+    :return Response: A `DataContractGetResponse` containing a success message and the retrieved data contract, or an empty 304 response.
     :raises HTTPException:
         - 404 Not Found: If the data contract with the given ID is not found.
         - 500 Internal Server Error: If there's an unexpected error during contract retrieval.
     """
     try:
-        retrieved_contract = data_contract_service.get_data_contract(id)
-        if retrieved_contract is None:
+        if if_none_match is not None or if_modified_since is not None:
+            version = await async_data_contract_service.get_data_contract_version(id)
+            if version is None:
+                raise_not_found(id)
+            if is_not_modified(version.etag, version.updated_at, if_none_match, if_modified_since):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers=validator_headers(version.etag, version.last_modified),
+                )
+
+        # Served from the read cache's pre-serialized JSON, spliced into the response envelope,
+        # or from the encoding it caches in the negotiated binary media type
+        entry = await async_data_contract_service.get_data_contract_entry(id)
+        headers = validator_headers(entry.version.etag, entry.version.last_modified)
+        accepted = accepted_media_type()
+        if accepted is not None:
+            return Response(
+                content=encode_map(
+                    accepted, {"message": GET_MESSAGE}, {"data": entry.encoded(accepted)}
+                ),
+                media_type=accepted,
+                headers=headers,
+            )
+        return Response(
+            content=GET_RESPONSE_PREFIX + entry.json + b"}",
+            media_type="application/json",
+            headers=headers,
+        )
+    except HTTPException:
+        raise
+    except DataContractNotFoundError:
+        raise_not_found(id)
+    except Exception as e:
+        raise_internal_error(e, "retrieve")
+
+
+@router.get(
+    "/{id}/revisions",
+    response_model=DataContractRevisionListResponse,
+    status_code=status.HTTP_200_OK,
+    summary="List the revisions of a data contract",
+    description="Retrieves one page of the history of a data contract, latest revision first.",
+    response_description="Successfully retrieved data contract revisions",
+    responses={
+        200: {
+            "content": {
+                "application/json": {
+                    "example": LazyExample(DataContractRevisionListResponse.get_example)
+                }
+            },
+        },
+        400: {
+            "description": "Invalid pagination cursor",
+            "content": {
+                "application/json": {"example": {"detail": " ❌ Invalid pagination cursor: abc"}}
+            },
+        },
+        404: {
+            "description": "Data contract not found",
+            "content": {"application/json": {"example": {"detail": " ❌ Data contract not found"}}},
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Failed to retrieve data contract: Internal server error"
+                    }
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def list_data_contract_revisions_route(
+    id: str,
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of revisions to return.",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="The `next_cursor` returned with the previous page.",
+    ),
+) -> PydanticJSONResponse:
+    """
+    Retrieves one page of the history of a data contract.
+
+    Revisions are returned latest first, without their documents: each one tells whether it
+    is stored as a full snapshot or as a diff against an earlier snapshot. When more
+    revisions are available, the response carries a `next_cursor` to pass back to get the
+    next page. Data contracts written before the history was kept only have the revisions
+    written since.
+
+    :param str id: The unique identifier of the data contract. Example: "urn:datacontract:checkout:orders-latest"
+    :param int limit: The maximum number of revisions to return.
+    :param Optional[str] cursor: The cursor returned with the previous page, if any.
+    :return PydanticJSONResponse: A `DataContractRevisionListResponse` containing a success message, the page of revisions and the next page cursor.
+    :raises HTTPException:
+        - 400 Bad Request: If the cursor is malformed.
+        - 404 Not Found: If the data contract with the given ID is not found.
+        - 500 Internal Server Error: If there's an unexpected error during the retrieval.
+    """
+    try:
+        revisions, next_cursor = await async_data_contract_service.list_data_contract_revisions(
+            id, limit=limit, cursor=cursor
+        )
+        # An empty history is only expected of a data contract that does not exist
+        if (
+            not revisions
+            and cursor is None
+            and await async_data_contract_service.get_data_contract_version(id) is None
+        ):
             raise_not_found(id)
-        return DataContractGetResponse(
-            message=" ✅ Data contract retrieved successfully",
-            data=retrieved_contract,
+        return PydanticJSONResponse(
+            DataContractRevisionListResponse(
+                message=" ✅ Data contract revisions retrieved successfully",
+                data=revisions,
+                next_cursor=next_cursor,
+            )
         )
     except HTTPException:
         raise
+    except InvalidCursorError as ce:
+        raise_invalid_cursor(ce)
+    except Exception as e:
+        raise_internal_error(e, "retrieve")
+
+
+@router.get(
+    "/{id}/revisions/{revision}",
+    response_model=DataContractRevisionGetResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get a revision of a data contract",
+    description="Retrieves a data contract as it was at one of its revisions.",
+    response_description="Successfully retrieved data contract revision",
+    responses={
+        200: {
+            "content": {
+                "application/json": {
+                    "example": LazyExample(DataContractRevisionGetResponse.get_example)
+                }
+            },
+        },
+        404: {
+            "description": "Data contract revision not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Revision 3 of data contract with id 'x' not found"}
+                }
+            },
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Failed to retrieve data contract: Internal server error"
+                    }
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def get_data_contract_revision_route(
+    id: str,
+    revision: int = Path(..., ge=1, description="The revision number."),
+) -> PydanticJSONResponse:
+    """
+    Retrieves a data contract as it was at one of its revisions.
+
+    The document is rebuilt from the nearest snapshot: at most two stored rows are read,
+    whatever the length of the history. The response carries the ETag of the revision.
+
+    :param str id: The unique identifier of the data contract. Example: "urn:datacontract:checkout:orders-latest"
+    :param int revision: The revision number.
+    :return PydanticJSONResponse: A `DataContractRevisionGetResponse` containing a success message and the data contract at this revision.
+    :raises HTTPException:
+        - 404 Not Found: If the revision is not in the history of the data contract.
+        - 500 Internal Server Error: If there's an unexpected error during the retrieval.
+    """
+    try:
+        data_contract, version = await async_data_contract_service.get_data_contract_revision(
+            id, revision
+        )
+        return PydanticJSONResponse(
+            DataContractRevisionGetResponse(
+                message=" ✅ Data contract revision retrieved successfully",
+                revision=version.revision,
+                created_at=version.updated_at,
+                data=data_contract,
+            ),
+            headers=validator_headers(version.etag, version.last_modified),
+        )
+    except DataContractRevisionNotFoundError:
+        raise_revision_not_found(id, revision)
     except Exception as e:
         raise_internal_error(e, "retrieve")
 
 
 @router.get(
     "/",
-    response_model=DataContractListResponse,
+    response_model=DataContractListResponse | DataContractSummaryListResponse,
     status_code=status.HTTP_200_OK,
-    summary="List all data contracts",
-    description="Retrieves all data contracts from the database.",
+    summary="List data contracts",
+    description="Retrieves one page of data contracts from the database, ordered by ID. "
+    "Contracts can be filtered by tag, owner, status, server type and server environment. "
+    "With `view=summary`, only the ID, title, version, description, owner and status are returned.",
     response_description="Successfully retrieved data contracts",
     responses={
         200: {
-            "content": {"application/json": {"example": DataContractListResponse.get_example()}},
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "full": {"value": LazyExample(DataContractListResponse.get_example)},
+                        "summary": {
+                            "value": LazyExample(DataContractSummaryListResponse.get_example)
+                        },
+                    }
+                }
+            },
+        },
+        304: {
+            "description": "Page not modified since the version known by the client",
+        },
+        400: {
+            "description": "Invalid pagination cursor",
+            "content": {
+                "application/json": {"example": {"detail": " ❌ Invalid pagination cursor: abc"}}
+            },
         },
         500: {
             "description": "Internal server error",
@@ -201,24 +1025,153 @@ async def get_data_contract_route(
     },
     tags=["Data Contract"],
 )
-async def list_data_contracts_route() -> DataContractListResponse:
+async def list_data_contracts_route(
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of data contracts to return.",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="The `next_cursor` returned with the previous page.",
+    ),
+    view: Literal["full", "summary"] = Query(
+        "full",
+        description="`full` returns complete data contracts, `summary` a lightweight projection.",
+    ),
+    tag: list[str] | None = Query(
+        None,
+        description="Only return data contracts carrying this tag. Repeat to require several tags.",
+    ),
+    owner: str | None = Query(None, description="Only return data contracts with this owner."),
+    contract_status: Literal["proposed", "in development", "active", "deprecated", "retired"]
+    | None = Query(
+        None,
+        alias="status",
+        description="Only return data contracts with this status.",
+    ),
+    server_type: str | None = Query(
+        None,
+        description="Only return data contracts with a server of this type.",
+    ),
+    environment: str | None = Query(
+        None,
+        description="Only return data contracts with a server in this environment.",
+    ),
+    *,
+    if_none_match: str | None = Header(None),
+) -> PydanticJSONResponse | Response:
     """
-    Retrieves all data contracts from the database.
+    Retrieves one page of data contracts from the database.
 
-    This endpoint attempts to retrieve all data contracts from the database.
-    If successful, it returns a list of all contracts.
+    This endpoint returns at most `limit` data contracts ordered by ID. When more contracts
+    are available, the response carries a `next_cursor` to pass back to get the next page.
+    In summary view, only the columns needed by listings are read and no full data contract
+    is built or validated. In full view, with trusted reads, the canonical JSON stored on
+    write is sent as is. Filters are evaluated by the database, using the table indexes.
+    The page carries an ETag computed from the versions of its contracts, read with them.
+    When If-None-Match is sent, the versions are read first, and 304 Not Modified is returned
+    without loading any contract if the ETag matches.
     If an error occurs during the process, it raises an appropriate HTTP exception.
 
-    :return DataContractListResponse: A response containing a success message and the list of data contracts.
+    :param int limit: The maximum number of data contracts to return.
+    :param Optional[str] cursor: The cursor returned with the previous page, if any.
+    :param str view: Either "full" for complete data contracts or "summary" for summaries.
+    :param Optional[List[str]] tag: Tags the data contracts must all carry.
+    :param Optional[str] owner: The owner of the data contracts.
+    :param Optional[str] contract_status: The status of the data contracts.
+    :param Optional[str] server_type: The type of one of the servers of the data contracts.
+    :param Optional[str] environment: The environment of one of the servers of the data contracts.
+    :param Optional[str] if_none_match: The entity tags of the pages known by the client, if any.
+    :return PydanticJSONResponse | Response: A `DataContractListResponse` or `DataContractSummaryListResponse` containing a success message, the page of data contracts and the next page cursor, or an empty 304 response.
     :raises HTTPException:
+        - 400 Bad Request: If the cursor is malformed.
         - 500 Internal Server Error: If there's an unexpected error during contract retrieval.
     """
+    filters = DataContractFilter(
+        tag=tag,
+        owner=owner,
+        status=contract_status,
+        server_type=server_type,
+        environment=environment,
+    )
     try:
-        contracts = data_contract_service.list_data_contracts()
-        return DataContractListResponse(
-            message=" ✅ Data contracts retrieved successfully",
-            data=contracts,
+        # Only a conditional request needs the versions before the page is loaded
+        if if_none_match is not None:
+            versions, has_more = await async_data_contract_service.list_data_contract_versions(
+                limit=limit, cursor=cursor, filters=filters
+            )
+            etag = list_etag(view, versions, has_more)
+            if is_not_modified(etag, None, if_none_match, None):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag)
+                )
+
+        if view == "summary":
+            (
+                summaries,
+                versions,
+                next_cursor,
+            ) = await async_data_contract_service.list_versioned_data_contract_summaries(
+                limit=limit, cursor=cursor, filters=filters
+            )
+            return PydanticJSONResponse(
+                DataContractSummaryListResponse(
+                    message=LIST_MESSAGE,
+                    data=summaries,
+                    next_cursor=next_cursor,
+                ),
+                headers=validator_headers(list_etag(view, versions, next_cursor is not None)),
+            )
+
+        if settings.DATA_CONTRACT_TRUSTED_READS:
+            # The canonical JSON stored on write, spliced into the response envelope
+            (
+                json_documents,
+                versions,
+                next_cursor,
+            ) = await async_data_contract_service.list_data_contract_json(
+                limit=limit, cursor=cursor, filters=filters
+            )
+            headers = validator_headers(list_etag(view, versions, next_cursor is not None))
+            accepted = accepted_media_type()
+            if accepted is not None:
+                values = {
+                    "message": LIST_MESSAGE,
+                    "data": [pydantic_core.from_json(document) for document in json_documents],
+                    "next_cursor": next_cursor,
+                }
+                return Response(
+                    content=CODECS[accepted].dumps(values), media_type=accepted, headers=headers
+                )
+            return Response(
+                content=LIST_RESPONSE_PREFIX
+                + b",".join(json_documents)
+                + b'],"next_cursor":'
+                + json.dumps(next_cursor).encode()
+                + b"}",
+                media_type="application/json",
+                headers=headers,
+            )
+
+        (
+            contracts,
+            versions,
+            next_cursor,
+        ) = await async_data_contract_service.list_versioned_data_contracts(
+            limit=limit, cursor=cursor, filters=filters
+        )
+        return PydanticJSONResponse(
+            DataContractListResponse(
+                message=LIST_MESSAGE,
+                data=contracts,
+                next_cursor=next_cursor,
+            ),
+            headers=validator_headers(list_etag(view, versions, next_cursor is not None)),
         )
+    except InvalidCursorError as ce:
+        raise_invalid_cursor(ce)
     except Exception as e:
         raise_internal_error(e, "retrieve")
 
@@ -227,16 +1180,39 @@ async def list_data_contracts_route() -> DataContractListResponse:
     "/{id}",
     response_model=DataContractUpdateResponse,
     status_code=status.HTTP_200_OK,
-    summary="Update a data contract",
-    description="Updates an existing data contract in the database.",
-    response_description="Successfully updated data contract",
+    summary="Create or replace a data contract",
+    description="Stores a data contract under its ID, creating it or replacing the stored one.",
+    response_description="Successfully replaced data contract",
     responses={
         200: {
-            "content": {"application/json": {"example": DataContractUpdateResponse.get_example()}},
+            "content": {
+                "application/json": {"example": LazyExample(DataContractUpdateResponse.get_example)}
+            },
         },
-        404: {
-            "description": "Data contract not found",
-            "content": {"application/json": {"example": {"detail": " ❌ Data contract not found"}}},
+        201: {
+            "description": "Successfully created data contract",
+            "content": {
+                "application/json": {"example": LazyExample(DataContractUpdateResponse.get_example)}
+            },
+        },
+        400: {
+            "description": "Path and body IDs differ",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Data contract ID 'b' does not match the path ID 'a'"}
+                }
+            },
+        },
+        412: {
+            "description": "If-Match precondition failed",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Data contract with id '123' does not match the If-Match "
+                        "precondition"
+                    }
+                }
+            },
         },
         500: {
             "description": "Internal server error",
@@ -254,35 +1230,204 @@ async def list_data_contracts_route() -> DataContractListResponse:
 async def update_data_contract_route(
     id: str,
     data_contract_update: DataContractUpdate,
-) -> DataContractUpdateResponse:
+    if_match: str | None = Header(None),
+) -> PydanticJSONResponse:
     """
-    Updates an existing data contract in the database.
+    Creates or replaces a data contract.
 
-    This endpoint accepts a data contract ID and update information, attempts to update the corresponding
-    data contract in the database. If successful, it returns the updated contract.
-    If the contract is not found or an error occurs, it raises an appropriate HTTP exception.
+    This endpoint accepts a data contract ID and the complete data contract to store under it.
+    The data contract is written in a single upsert statement: it is created if the ID is
+    unknown, and replaces the stored one otherwise. With an If-Match header, the data contract
+    is only replaced, and only if it is still at one of the given ETags: the check and the
+    write are one compare-and-swap statement, no lock being held. The stored contract is
+    returned along with its new ETag and Last-Modified validators.
+    If the IDs differ or an error occurs, it raises an appropriate HTTP exception.
 
-    :param str id: The unique identifier of the data contract to update.
-    :param DataContractUpdate data_contract_update: The update information for the data contract.
-    :return DataContractUpdateResponse: A response containing a success message and the updated data contract.
+    :param str id: The unique identifier of the data contract to store.
+    :param DataContractUpdate data_contract_update: The complete data contract.
+    :param Optional[str] if_match: The ETags the stored data contract must match, if any.
+    :return PydanticJSONResponse: A `DataContractUpdateResponse` containing a success message and the stored data contract.
     :raises HTTPException:
-        - 404 Not Found: If the data contract with the given ID is not found.
-        - 500 Internal Server Error: If there's an unexpected error during contract update.
+        - 400 Bad Request: If the ID of the body differs from the ID of the path.
+        - 412 Precondition Failed: If the data contract does not match the If-Match header.
+        - 500 Internal Server Error: If there's an unexpected error during contract storage.
     """
     try:
-        updated_contract = data_contract_service.update_data_contract(id, data_contract_update)
-        if updated_contract is None:
-            raise_not_found(id)
-        return DataContractUpdateResponse(
-            message=" ✅ Data contract updated successfully",
-            data=updated_contract,
+        if data_contract_update.id != id:
+            raise_id_mismatch_error(id, data_contract_update.id)
+
+        stored_contract, version, created = await async_data_contract_service.upsert_data_contract(
+            data_contract_update, parse_if_match(if_match)
+        )
+        return PydanticJSONResponse(
+            DataContractUpdateResponse(
+                message=" ✅ Data contract created successfully"
+                if created
+                else " ✅ Data contract updated successfully",
+                data=stored_contract,
+            ),
+            status_code=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+            headers=validator_headers(version.etag, version.last_modified),
         )
+    except DataContractPreconditionFailedError as pe:
+        raise_precondition_failed(pe)
     except HTTPException:
         raise
     except Exception as e:
         raise_internal_error(e, "update")
 
 
+@router.patch(
+    "/{id}",
+    response_model=DataContractPatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Patch a data contract",
+    description="Applies a JSON Merge Patch (`application/merge-patch+json`, the default) or a "
+    "JSON Patch (`application/json-patch+json`) to a data contract. Patches are only accepted "
+    "as JSON: MessagePack and CBOR bodies are rejected with 415 Unsupported Media Type.",
+    response_description="Successfully patched data contract",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                MERGE_PATCH_MEDIA_TYPE: {
+                    "schema": {"type": "object"},
+                    "example": {"info": {"version": "2.0.0"}, "servers": {"staging": None}},
+                },
+                JSON_PATCH_MEDIA_TYPE: {
+                    "schema": {"type": "array", "items": {"type": "object"}},
+                    "example": [
+                        {"op": "test", "path": "/info/version", "value": "1.0.0"},
+                        {"op": "replace", "path": "/info/version", "value": "2.0.0"},
+                    ],
+                },
+            },
+        }
+    },
+    responses={
+        200: {
+            "content": {
+                "application/json": {"example": LazyExample(DataContractPatchResponse.get_example)}
+            },
+        },
+        400: {
+            "description": "Malformed patch, or patched data contract invalid",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Invalid patch: path '/id' cannot be changed"}
+                }
+            },
+        },
+        404: {
+            "description": "Data contract not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Data contract with id '123' not found"}
+                }
+            },
+        },
+        409: {
+            "description": "Patch test failed, or concurrent modifications",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Patch test failed at '/info/version'"}
+                }
+            },
+        },
+        412: {
+            "description": "If-Match precondition failed",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Data contract with id '123' does not match the If-Match "
+                        "precondition"
+                    }
+                }
+            },
+        },
+        415: {
+            "description": "Unsupported patch format, including MessagePack and CBOR bodies",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Unsupported patch media type 'text/plain'"}
+                }
+            },
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Failed to patch data contract: Internal server error"
+                    }
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def patch_data_contract_route(
+    id: str, request: Request, if_match: str | None = Header(None)
+) -> PydanticJSONResponse:
+    """
+    Patches a data contract.
+
+    This endpoint accepts a data contract ID and a patch: a JSON Merge Patch (RFC 7386), or a
+    JSON Patch (RFC 6902) when the Content-Type is `application/json-patch+json`. Only the
+    sections the patch touches are read, validated and written, and for servers, models and
+    definitions only the touched entries. The new revision is returned along with the new
+    ETag and Last-Modified validators, rather than the whole data contract. With an If-Match
+    header, the patch only applies to one of the given ETags. Unlike the other routes, the
+    patch is only read as JSON, the patch formats having no MessagePack or CBOR media type.
+
+    :param str id: The unique identifier of the data contract to patch.
+    :param Request request: The request, whose body holds the patch.
+    :param Optional[str] if_match: The ETags the data contract must match, if any.
+    :return PydanticJSONResponse: A `DataContractPatchResponse` containing a success message and the new revision.
+    :raises HTTPException:
+        - 400 Bad Request: If the patch is malformed or the patched data contract is invalid.
+        - 404 Not Found: If no data contract with the given ID exists.
+        - 409 Conflict: If a 'test' operation fails or concurrent writes keep conflicting.
+        - 412 Precondition Failed: If the data contract does not match the If-Match header.
+        - 415 Unsupported Media Type: If the patch is neither a merge patch nor a JSON Patch.
+        - 500 Internal Server Error: If there's an unexpected error during the patch.
+    """
+    try:
+        json_patch = is_json_patch(request.headers.get("content-type"))
+        try:
+            patch = json.loads(await request.body())
+        except ValueError as e:
+            raise MalformedPatchBodyError from e
+
+        version = await async_data_contract_service.patch_data_contract(
+            id, patch, json_patch, parse_if_match(if_match)
+        )
+        if version is None:
+            raise_not_found(id)
+        return PydanticJSONResponse(
+            DataContractPatchResponse(
+                message=" ✅ Data contract patched successfully",
+                id=id,
+                revision=version.revision,
+            ),
+            headers=validator_headers(version.etag, version.last_modified),
+        )
+    except UnsupportedPatchMediaTypeError as me:
+        raise_unsupported_patch_media_type(me, ACCEPT_PATCH)
+    except InvalidPatchError as pe:
+        raise_invalid_patch(pe)
+    except (PatchTestFailedError, DataContractConflictError) as ce:
+        raise_patch_conflict(ce)
+    except DataContractPreconditionFailedError as pe:
+        raise_precondition_failed(pe)
+    except DataContractValidationError as ve:
+        raise_invalid_schema(ve)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise_internal_error(e, "patch")
+
+
 @router.delete(
     "/{id}",
     response_model=DataContractDeleteResponse,
@@ -292,12 +1437,25 @@ async def update_data_contract_route(
     response_description="Successfully deleted data contract",
     responses={
         200: {
-            "content": {"application/json": {"example": DataContractDeleteResponse.get_example()}},
+            "content": {
+                "application/json": {"example": LazyExample(DataContractDeleteResponse.get_example)}
+            },
         },
         404: {
             "description": "Data contract not found",
             "content": {"application/json": {"example": {"detail": " ❌ Data contract not found"}}},
         },
+        412: {
+            "description": "If-Match precondition failed",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": " ❌ Data contract with id '123' does not match the If-Match "
+                        "precondition"
+                    }
+                }
+            },
+        },
         500: {
             "description": "Internal server error",
             "content": {
@@ -313,29 +1471,39 @@ async def update_data_contract_route(
 )
 async def delete_data_contract_route(
     id: str = "urn:datacontract:checkout:orders-latest",
-) -> DataContractDeleteResponse:
+    if_match: str | None = Header(None),
+) -> PydanticJSONResponse:
     """
     Deletes an existing data contract from the database.
 
     This endpoint accepts a data contract ID, attempts to delete the corresponding
     data contract from the database. If successful, it returns the deleted contract.
+    With an If-Match header, it is only deleted if it is still at one of the given ETags.
     If the contract is not found or an error occurs, it raises an appropriate HTTP exception.
 
     :param str id: The unique identifier of the data contract to delete.
-    :return DataContractDeleteResponse: A response containing a success message and the deleted data contract.
+    :param Optional[str] if_match: The ETags the data contract must match, if any.
+    :return PydanticJSONResponse: A `DataContractDeleteResponse` containing a success message and the deleted data contract.
     :raises HTTPException:
         - 404 Not Found: If the data contract with the given ID is not found.
+        - 412 Precondition Failed: If the data contract does not match the If-Match header.
         - 500 Internal Server Error: If there's an unexpected error during contract deletion.
     """
     try:
         data_contract_delete = DataContractDelete(id=id)
-        deleted_contract = data_contract_service.delete_data_contract(data_contract_delete)
+        deleted_contract = await async_data_contract_service.delete_data_contract(
+            data_contract_delete, parse_if_match(if_match)
+        )
         if deleted_contract is None:
             raise_not_found(id)
-        return DataContractDeleteResponse(
-            message=" ✅ Data contract deleted successfully",
-            data=deleted_contract,
+        return PydanticJSONResponse(
+            DataContractDeleteResponse(
+                message=" ✅ Data contract deleted successfully",
+                data=deleted_contract,
+            )
         )
+    except DataContractPreconditionFailedError as pe:
+        raise_precondition_failed(pe)
     except HTTPException:
         raise
     except Exception as e:
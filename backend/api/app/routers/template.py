@@ -9,10 +9,13 @@ from ..exceptions.routers.template import raise_internal_error, raise_not_found
 from ..schemas.template.routes.template_get import TemplateGetResponse
 from ..schemas.template.routes.template_list import TemplateListResponse
 from ..services.template import template_service
+from ..utils.content import NegotiatedRoute
+from ..utils.example_model import LazyExample
 from ..utils.logger import get_logger
+from ..utils.responses import PydanticJSONResponse
 
 
-router = APIRouter(tags=["Template"])
+router = APIRouter(tags=["Template"], route_class=NegotiatedRoute)
 logger = get_logger(__name__)
 
 
@@ -26,7 +29,9 @@ logger = get_logger(__name__)
     responses={
         200: {
             "description": "Successfully retrieved templates",
-            "content": {"application/json": {"example": TemplateListResponse.get_example()}},
+            "content": {
+                "application/json": {"example": LazyExample(TemplateListResponse.get_example)}
+            },
         },
         500: {
             "description": "Internal server error",
@@ -38,7 +43,7 @@ logger = get_logger(__name__)
         },
     },
 )
-async def list_templates_route() -> TemplateListResponse:
+async def list_templates_route() -> PydanticJSONResponse:
     """
     Retrieves all templates.
 
@@ -46,13 +51,15 @@ async def list_templates_route() -> TemplateListResponse:
     If successful, it returns a list of all templates.
     If an error occurs during the process, it raises an appropriate HTTP exception.
 
-    :return TemplateListResponse: A response containing a success message and the list of templates.
+    :return PydanticJSONResponse: A `TemplateListResponse` containing a success message and the list of templates.
     :raises HTTPException:
         - 500 Internal Server Error: If there's an unexpected error during template retrieval.
     """
     try:
         templates = template_service.list_templates()
-        return TemplateListResponse(message=" ✅ Templates retrieved successfully", data=templates)
+        return PydanticJSONResponse(
+            TemplateListResponse(message=" ✅ Templates retrieved successfully", data=templates)
+        )
     except Exception as e:
         raise_internal_error(e, "retrieve")
 
@@ -67,7 +74,9 @@ async def list_templates_route() -> TemplateListResponse:
     responses={
         200: {
             "description": "Successfully retrieved template",
-            "content": {"application/json": {"example": TemplateGetResponse.get_example()}},
+            "content": {
+                "application/json": {"example": LazyExample(TemplateGetResponse.get_example)}
+            },
         },
         404: {
             "description": "Template not found",
@@ -83,7 +92,7 @@ async def list_templates_route() -> TemplateListResponse:
         },
     },
 )
-async def get_template_route(template_id: str) -> TemplateGetResponse:
+async def get_template_route(template_id: str) -> PydanticJSONResponse:
     """
     Retrieves a specific template by its ID.
 
@@ -92,7 +101,7 @@ async def get_template_route(template_id: str) -> TemplateGetResponse:
     If the template is not found or an error occurs, it raises an appropriate HTTP exception.
 
     :param str template_id: The unique identifier of the template to retrieve.
-    :return TemplateGetResponse: A response containing a success message and the retrieved template.
+    :return PydanticJSONResponse: A `TemplateGetResponse` containing a success message and the retrieved template.
     :raises HTTPException:
         - 404 Not Found: If the template with the given ID is not found.
         - 500 Internal Server Error: If there's an unexpected error during template retrieval.
@@ -101,6 +110,8 @@ async def get_template_route(template_id: str) -> TemplateGetResponse:
         template = template_service.get_template(template_id)
         if template is None:
             raise_not_found(template_id)
-        return TemplateGetResponse(message=" ✅ Template retrieved successfully", data=template)
+        return PydanticJSONResponse(
+            TemplateGetResponse(message=" ✅ Template retrieved successfully", data=template)
+        )
     except Exception as e:
         raise_internal_error(e, "retrieve")
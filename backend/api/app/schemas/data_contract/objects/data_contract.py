@@ -1,6 +1,6 @@
 from pydantic import AliasChoices, ConfigDict, Field, HttpUrl
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from .definition_object import DefinitionObject
 from .example_object import ExampleObject
 from .info_object import InfoObject
@@ -30,42 +30,42 @@ class DataContract(BaseModelWithExample):
     info: InfoObject = Field(
         ...,
         description="REQUIRED. Specifies the metadata of the data contract.",
-        json_schema_extra={"example": InfoObject.get_example()},
+        json_schema_extra=LazyExample(InfoObject.get_example),
     )
     servers: dict[str, ServerObject] | None = Field(
         None,
         description="Specifies the servers of the data contract.",
-        json_schema_extra={"example": {"production": ServerObject.get_example()}},
+        json_schema_extra=LazyExample(lambda: {"production": ServerObject.get_example()}),
     )
     terms: TermObject | None = Field(
         None,
         description="Specifies the terms and conditions of the data contract.",
-        json_schema_extra={"example": TermObject.get_example()},
+        json_schema_extra=LazyExample(TermObject.get_example),
     )
     models: dict[str, ModelObject] | None = Field(
         None,
         description="Specifies the logical data model.",
-        json_schema_extra={"example": {"orders": ModelObject.get_example()}},
+        json_schema_extra=LazyExample(lambda: {"orders": ModelObject.get_example()}),
     )
     definitions: dict[str, DefinitionObject] | None = Field(
         None,
         description="Specifies definitions.",
-        json_schema_extra={"example": {"order_id": DefinitionObject.get_example()}},
+        json_schema_extra=LazyExample(lambda: {"order_id": DefinitionObject.get_example()}),
     )
     examples: list[ExampleObject] | None = Field(
         None,
         description="Specifies example data sets for the data model.",
-        json_schema_extra={"example": [ExampleObject.get_example()]},
+        json_schema_extra=LazyExample(lambda: [ExampleObject.get_example()]),
     )
     service_level: ServiceLevelObject | None = Field(
         None,
         description="Specifies the service level of the provided data.",
-        json_schema_extra={"example": ServiceLevelObject.get_example()},
+        json_schema_extra=LazyExample(ServiceLevelObject.get_example),
     )
     quality: QualityObject | None = Field(
         None,
         description="Specifies the quality attributes and checks.",
-        json_schema_extra={"example": QualityObject.get_example()},
+        json_schema_extra=LazyExample(QualityObject.get_example),
     )
     links: dict[str, HttpUrl] | None = Field(
         None,
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample
+
+
+class DataContractChange(BaseModelWithExample):
+    """
+    Represents one committed change of a data contract in the change feed.
+    """
+
+    offset: int = Field(
+        ...,
+        description="The identifier of the change in the feed, to resume after it. Offsets "
+        "are unique but not always increasing along the feed.",
+        json_schema_extra={"example": 4182},
+    )
+    op: Literal["create", "update", "delete"] = Field(
+        ...,
+        description="The operation: a creation, an update or a deletion.",
+        json_schema_extra={"example": "update"},
+    )
+    id: str = Field(
+        ...,
+        description="The ID of the changed data contract.",
+        json_schema_extra={"example": "urn:datacontract:checkout:orders-latest"},
+    )
+    revision: int | None = Field(
+        None,
+        description="The revision written, null for a deletion.",
+        json_schema_extra={"example": 12},
+    )
+    created_at: datetime = Field(
+        ...,
+        description="When the change was written.",
+        json_schema_extra={"example": "2024-05-01T12:00:00Z"},
+    )
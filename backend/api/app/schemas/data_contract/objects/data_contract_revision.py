@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample
+
+
+class DataContractRevision(BaseModelWithExample):
+    """
+    Represents one revision in the history of a data contract, without its document.
+
+    Snapshots store the whole document. Other revisions store a JSON diff against the
+    snapshot they are based on, so any revision is rebuilt from at most two stored rows.
+    """
+
+    revision: int = Field(
+        ...,
+        description="The revision number, starting at 1 and bumped by every write.",
+        json_schema_extra={"example": 12},
+    )
+    created_at: datetime = Field(
+        ...,
+        description="When the revision was written.",
+        json_schema_extra={"example": "2024-05-01T12:00:00Z"},
+    )
+    snapshot: bool = Field(
+        ...,
+        description="Whether the revision is stored as a full snapshot of the document.",
+        json_schema_extra={"example": False},
+    )
+    base_revision: int | None = Field(
+        None,
+        description="The snapshot the revision is stored as a diff of, null for a snapshot.",
+        json_schema_extra={"example": 11},
+    )
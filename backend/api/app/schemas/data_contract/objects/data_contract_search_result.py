@@ -0,0 +1,22 @@
+from pydantic import Field
+
+from .data_contract_summary import DataContractSummary
+
+
+class DataContractSearchResult(DataContractSummary):
+    """
+    Represents a data contract matching a full-text search, as a summary with its relevance.
+    """
+
+    rank: float = Field(
+        ...,
+        description="The relevance of the data contract to the search, higher is better.",
+        json_schema_extra={"example": 0.6},
+    )
+    highlight: str | None = Field(
+        None,
+        description="Excerpts of the matching text, with the matched terms wrapped in <mark> tags.",
+        json_schema_extra={
+            "example": "Customer <mark>Orders</mark> Data Contract ... one row per <mark>order</mark>"
+        },
+    )
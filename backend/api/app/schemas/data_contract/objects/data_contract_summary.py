@@ -0,0 +1,47 @@
+from typing import Literal
+
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample
+
+
+class DataContractSummary(BaseModelWithExample):
+    """
+    Represents a lightweight view of a data contract, as shown in contract listings.
+
+    Only the identifier and a handful of 'info' attributes are carried, so listings
+    don't have to load and validate the full contract document.
+    """
+
+    id: str = Field(
+        ...,
+        description="REQUIRED. An organization-wide unique technical identifier.",
+        json_schema_extra={"example": "urn:datacontract:checkout:orders-latest"},
+    )
+    title: str | None = Field(
+        None,
+        description="The title of the data contract.",
+        json_schema_extra={"example": "Customer Orders Data Contract"},
+    )
+    version: str | None = Field(
+        None,
+        description="The version of the data contract document.",
+        json_schema_extra={"example": "1.0.0"},
+    )
+    description: str | None = Field(
+        None,
+        description="A description of the data contract.",
+        json_schema_extra={
+            "example": "This data contract defines the structure and rules for customer order data."
+        },
+    )
+    owner: str | None = Field(
+        None,
+        description="The owner or team responsible for managing the data contract.",
+        json_schema_extra={"example": "Customer Data Team"},
+    )
+    status: Literal["proposed", "in development", "active", "deprecated", "retired"] | None = Field(
+        None,
+        description="The status of the data contract.",
+        json_schema_extra={"example": "active"},
+    )
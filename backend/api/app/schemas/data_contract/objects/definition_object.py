@@ -2,7 +2,7 @@ from typing import Any
 
 from pydantic import ConfigDict, Field, HttpUrl
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from .data_type import DataType
 from .field_object import FieldObject
 
@@ -136,27 +136,33 @@ class DefinitionObject(BaseModelWithExample):
         None,
         description="The nested fields of the object, record, or struct. "
         "Use only when type is object, record, or struct.",
-        json_schema_extra={
-            "example": {
+        json_schema_extra=LazyExample(
+            lambda: {
                 "street": FieldObject(type="string", description="Street name"),
                 "number": FieldObject(type="integer", description="House number"),
             }
-        },
+        ),
     )
     items: FieldObject | None = Field(
         None,
         description="The type of the elements in the array. Use only when type is array.",
-        json_schema_extra={"example": FieldObject(type="string", description="Product SKU")},
+        json_schema_extra=LazyExample(
+            lambda: FieldObject(type="string", description="Product SKU")
+        ),
     )
     keys: FieldObject | None = Field(
         None,
         description="Describes the key structure of a map. Use only when type is map.",
-        json_schema_extra={"example": FieldObject(type="string", description="Country code")},
+        json_schema_extra=LazyExample(
+            lambda: FieldObject(type="string", description="Country code")
+        ),
     )
     values: FieldObject | None = Field(
         None,
         description="Describes the value structure of a map. Use only when type is map.",
-        json_schema_extra={"example": FieldObject(type="string", description="Country name")},
+        json_schema_extra=LazyExample(
+            lambda: FieldObject(type="string", description="Country name")
+        ),
     )
 
     model_config = ConfigDict(extra="allow")
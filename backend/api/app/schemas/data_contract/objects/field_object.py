@@ -1,6 +1,6 @@
 from typing import Any, Optional
 
-from pydantic import Field
+from pydantic import AliasChoices, Field
 
 from ....utils.example_model import BaseModelWithExample
 from .config_object import ConfigObject
@@ -146,6 +146,8 @@ class FieldObject(BaseModelWithExample):
     ref: str | None = Field(
         None,
         alias="$ref",
+        # Data contracts stored before sections were dumped by alias hold it under "ref"
+        validation_alias=AliasChoices("$ref", "ref"),
         description="A reference URI to a definition in the specification, internally or externally.",
         json_schema_extra={"example": "#/definitions/order_id"},
     )
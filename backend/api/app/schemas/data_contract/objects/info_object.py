@@ -2,7 +2,7 @@ from typing import Literal
 
 from pydantic import Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from .contact_object import ContactObject
 
 
@@ -43,6 +43,6 @@ class InfoObject(BaseModelWithExample):
     )
     contact: ContactObject | None = Field(
         None,
-        json_schema_extra={"example": ContactObject.get_example()},
+        json_schema_extra=LazyExample(ContactObject.get_example),
         description="Contact information for the data contract.",
     )
@@ -1,6 +1,6 @@
 from pydantic import Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from .config_object import ConfigObject
 from .field_object import FieldObject
 
@@ -34,8 +34,8 @@ class ModelObject(BaseModelWithExample):
     fields: dict[str, FieldObject] = Field(
         ...,
         description="The fields (e.g. columns) of the data model.",
-        json_schema_extra={
-            "example": {
+        json_schema_extra=LazyExample(
+            lambda: {
                 "order_id": FieldObject(
                     description="Unique identifier for the order",
                     type="string",
@@ -52,10 +52,10 @@ class ModelObject(BaseModelWithExample):
                     example="2024-09-09T08:30:00Z",
                 ),
             }
-        },
+        ),
     )
     config: ConfigObject | None = Field(
         None,
         description="Any additional key-value pairs that might be useful for further tooling.",
-        json_schema_extra={"example": ConfigObject.get_example()},
+        json_schema_extra=LazyExample(ConfigObject.get_example),
     )
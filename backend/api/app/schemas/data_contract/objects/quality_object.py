@@ -2,7 +2,7 @@ from typing import Literal
 
 from pydantic import Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 
 
 class SodaCLQualityObject(BaseModelWithExample):
@@ -127,5 +127,5 @@ class QualityObject(BaseModelWithExample):
     ) = Field(
         ...,
         description="REQUIRED. The specification of the quality attributes.",
-        json_schema_extra={"example": SodaCLQualityObject.get_example()},
+        json_schema_extra=LazyExample(SodaCLQualityObject.get_example),
     )
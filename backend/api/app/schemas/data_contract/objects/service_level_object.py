@@ -1,6 +1,6 @@
 from pydantic import Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 
 
 class AvailabilityObject(BaseModelWithExample):
@@ -213,35 +213,35 @@ class ServiceLevelObject(BaseModelWithExample):
     availability: AvailabilityObject | None = Field(
         None,
         description="Availability service level.",
-        json_schema_extra={"example": AvailabilityObject.get_example()},
+        json_schema_extra=LazyExample(AvailabilityObject.get_example),
     )
     retention: RetentionObject | None = Field(
         None,
         description="Data retention service level.",
-        json_schema_extra={"example": RetentionObject.get_example()},
+        json_schema_extra=LazyExample(RetentionObject.get_example),
     )
     latency: LatencyObject | None = Field(
         None,
         description="Latency service level.",
-        json_schema_extra={"example": LatencyObject.get_example()},
+        json_schema_extra=LazyExample(LatencyObject.get_example),
     )
     freshness: FreshnessObject | None = Field(
         None,
         description="Data freshness service level.",
-        json_schema_extra={"example": FreshnessObject.get_example()},
+        json_schema_extra=LazyExample(FreshnessObject.get_example),
     )
     frequency: FrequencyObject | None = Field(
         None,
         description="Data delivery frequency service level.",
-        json_schema_extra={"example": FrequencyObject.get_example()},
+        json_schema_extra=LazyExample(FrequencyObject.get_example),
     )
     support: SupportObject | None = Field(
         None,
         description="Support service level.",
-        json_schema_extra={"example": SupportObject.get_example()},
+        json_schema_extra=LazyExample(SupportObject.get_example),
     )
     backup: BackupObject | None = Field(
         None,
         description="Backup service level.",
-        json_schema_extra={"example": BackupObject.get_example()},
+        json_schema_extra=LazyExample(BackupObject.get_example),
     )
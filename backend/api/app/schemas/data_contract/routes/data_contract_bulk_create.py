@@ -0,0 +1,59 @@
+from typing import Literal
+
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample, LazyExample
+
+
+class DataContractBulkItemResult(BaseModelWithExample):
+    """
+    Represents the outcome of one item of a bulk data contract creation.
+    """
+
+    index: int = Field(
+        ...,
+        json_schema_extra={"example": 0},
+        description="The 0-based position of the item in the request.",
+    )
+    id: str | None = Field(
+        None,
+        json_schema_extra={"example": "urn:datacontract:checkout:orders-latest"},
+        description="The ID of the data contract, if the item has one.",
+    )
+    status: Literal["created", "error"] = Field(
+        ...,
+        json_schema_extra={"example": "created"},
+        description="Whether the data contract was created.",
+    )
+    error: str | list[dict] | None = Field(
+        None,
+        json_schema_extra={"example": None},
+        description="Why the data contract was not created: a message, or the validation errors.",
+    )
+
+
+class DataContractBulkCreateResponse(BaseModelWithExample):
+    """
+    Represents the response of a bulk data contract creation.
+    """
+
+    message: str = Field(
+        ...,
+        json_schema_extra={"example": " ✅ Data contracts processed successfully"},
+        description="A message summarizing the bulk creation.",
+    )
+    created: int = Field(
+        ...,
+        json_schema_extra={"example": 1},
+        description="The number of data contracts created.",
+    )
+    failed: int = Field(
+        ...,
+        json_schema_extra={"example": 0},
+        description="The number of items that were not created.",
+    )
+    results: list[DataContractBulkItemResult] = Field(
+        ...,
+        json_schema_extra=LazyExample(lambda: [DataContractBulkItemResult.get_example()]),
+        description="The outcome of each item, in request order.",
+    )
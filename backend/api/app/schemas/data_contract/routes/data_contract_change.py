@@ -0,0 +1,26 @@
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample, LazyExample
+from ..objects.data_contract_change import DataContractChange
+
+
+class DataContractChangeListResponse(BaseModelWithExample):
+    """
+    Represents the response for a successful data contract change feed retrieval.
+    """
+
+    message: str = Field(
+        ...,
+        json_schema_extra={"example": " ✅ Data contract changes retrieved successfully"},
+        description="A success message indicating the changes were retrieved.",
+    )
+    data: list[DataContractChange] = Field(
+        ...,
+        json_schema_extra=LazyExample(lambda: [DataContractChange.get_example()]),
+        description="The changes following the requested offset, in feed order.",
+    )
+    next_offset: int = Field(
+        ...,
+        json_schema_extra={"example": 4182},
+        description="The offset to pass back as `since` to fetch the following changes.",
+    )
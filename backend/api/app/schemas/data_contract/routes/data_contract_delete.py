@@ -1,7 +1,8 @@
 from pydantic import Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from ..objects.data_contract import DataContract
+from .data_contract_list import DataContractFilter
 
 
 class DataContractDelete(BaseModelWithExample):
@@ -28,6 +29,53 @@ class DataContractDeleteResponse(BaseModelWithExample):
     )
     data: DataContract = Field(
         ...,
-        json_schema_extra={"example": DataContract.get_example()},
+        json_schema_extra=LazyExample(DataContract.get_example),
         description="The deleted data contract information.",
     )
+
+
+class DataContractBulkDelete(BaseModelWithExample):
+    """
+    Represents the input model for deleting many data contracts at once.
+
+    The data contracts to delete are selected by ID, by filters, or both: with both, a data
+    contract is deleted when it has one of the IDs and matches the filters.
+    """
+
+    ids: list[str] | None = Field(
+        None,
+        json_schema_extra={"example": ["urn:datacontract:checkout:orders-latest"]},
+        description="The IDs of the data contracts to delete.",
+    )
+    filters: DataContractFilter | None = Field(
+        None,
+        json_schema_extra={"example": None},
+        description="The filters the data contracts to delete must match.",
+    )
+    return_documents: bool = Field(
+        False,
+        json_schema_extra={"example": False},
+        description="Whether to return the deleted data contracts, rather than only their IDs.",
+    )
+
+
+class DataContractBulkDeleteResponse(BaseModelWithExample):
+    """
+    Represents the API response for a bulk data contract deletion.
+    """
+
+    message: str = Field(
+        ...,
+        json_schema_extra={"example": " ✅ 1 data contracts deleted successfully"},
+        description="A success message indicating how many data contracts were deleted.",
+    )
+    ids: list[str] = Field(
+        ...,
+        json_schema_extra={"example": ["urn:datacontract:checkout:orders-latest"]},
+        description="The IDs of the deleted data contracts.",
+    )
+    data: list[DataContract] | None = Field(
+        None,
+        json_schema_extra={"example": None},
+        description="The deleted data contracts, when requested with 'return_documents'.",
+    )
@@ -1,6 +1,6 @@
 from pydantic import ConfigDict, Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from ..objects.data_contract import DataContract
 
 
@@ -16,7 +16,7 @@ class DataContractGetResponse(BaseModelWithExample):
     )
     data: DataContract = Field(
         ...,
-        json_schema_extra={"example": DataContract.get_example()},
+        json_schema_extra=LazyExample(DataContract.get_example),
         description="The retrieved data contract.",
     )
 
@@ -1,7 +1,45 @@
+from typing import Literal
+
 from pydantic import ConfigDict, Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from ..objects.data_contract import DataContract
+from ..objects.data_contract_summary import DataContractSummary
+
+
+class DataContractFilter(BaseModelWithExample):
+    """
+    Represents the filters applied when listing data contracts.
+
+    All given filters must match. Server filters apply to a single server: with both
+    'server_type' and 'environment', a contract matches when one of its servers has both.
+    """
+
+    tag: list[str] | None = Field(
+        None,
+        json_schema_extra={"example": ["orders", "checkout"]},
+        description="Tags the data contracts must all carry.",
+    )
+    owner: str | None = Field(
+        None,
+        json_schema_extra={"example": "Checkout Team"},
+        description="The owner of the data contracts.",
+    )
+    status: Literal["proposed", "in development", "active", "deprecated", "retired"] | None = Field(
+        None,
+        json_schema_extra={"example": "active"},
+        description="The status of the data contracts.",
+    )
+    server_type: str | None = Field(
+        None,
+        json_schema_extra={"example": "postgres"},
+        description="The type of one of the servers of the data contracts.",
+    )
+    environment: str | None = Field(
+        None,
+        json_schema_extra={"example": "prod"},
+        description="The environment of one of the servers of the data contracts.",
+    )
 
 
 class DataContractListResponse(BaseModelWithExample):
@@ -16,8 +54,39 @@ class DataContractListResponse(BaseModelWithExample):
     )
     data: list[DataContract] = Field(
         ...,
-        json_schema_extra={"example": DataContract.get_example()},
+        json_schema_extra=LazyExample(DataContract.get_example),
         description="The list of retrieved data contracts.",
     )
+    next_cursor: str | None = Field(
+        None,
+        json_schema_extra={
+            "example": "eyJrIjoidXJuOmRhdGFjb250cmFjdDpjaGVja291dDpvcmRlcnMtbGF0ZXN0In0"
+        },
+        description="Opaque cursor to pass back to fetch the next page, or null on the last page.",
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class DataContractSummaryListResponse(BaseModelWithExample):
+    """
+    Represents the response for a successful data contract summary list retrieval.
+    """
+
+    message: str = Field(
+        ...,
+        json_schema_extra={"example": " ✅ Data contracts retrieved successfully"},
+        description="A success message indicating the data contracts were retrieved.",
+    )
+    data: list[DataContractSummary] = Field(
+        ...,
+        json_schema_extra=LazyExample(DataContractSummary.get_example),
+        description="The list of retrieved data contract summaries.",
+    )
+    next_cursor: str | None = Field(
+        None,
+        json_schema_extra={
+            "example": "eyJrIjoidXJuOmRhdGFjb250cmFjdDpjaGVja291dDpvcmRlcnMtbGF0ZXN0In0"
+        },
+        description="Opaque cursor to pass back to fetch the next page, or null on the last page.",
+    )
@@ -0,0 +1,29 @@
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample
+
+
+class DataContractPatchResponse(BaseModelWithExample):
+    """
+    Represents the response for a successful data contract patch.
+
+    :param str message: A success message indicating the data contract was patched.
+    :param str id: The ID of the patched data contract.
+    :param int revision: The revision of the data contract after the patch.
+    """
+
+    message: str = Field(
+        ...,
+        json_schema_extra={"example": " ✅ Data contract patched successfully"},
+        description="A success message indicating the data contract was patched.",
+    )
+    id: str = Field(
+        ...,
+        json_schema_extra={"example": "urn:datacontract:checkout:orders-latest"},
+        description="The ID of the patched data contract.",
+    )
+    revision: int = Field(
+        ...,
+        json_schema_extra={"example": 2},
+        description="The revision of the data contract after the patch.",
+    )
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from pydantic import ConfigDict, Field
+
+from ....utils.example_model import BaseModelWithExample, LazyExample
+from ..objects.data_contract import DataContract
+from ..objects.data_contract_revision import DataContractRevision
+
+
+class DataContractRevisionListResponse(BaseModelWithExample):
+    """
+    Represents the response for a successful data contract revision list retrieval.
+    """
+
+    message: str = Field(
+        ...,
+        json_schema_extra={"example": " ✅ Data contract revisions retrieved successfully"},
+        description="A success message indicating the revisions were retrieved.",
+    )
+    data: list[DataContractRevision] = Field(
+        ...,
+        json_schema_extra=LazyExample(lambda: [DataContractRevision.get_example()]),
+        description="The revisions of the data contract, latest first.",
+    )
+    next_cursor: str | None = Field(
+        None,
+        json_schema_extra={"example": "eyJrIjoiMTEifQ"},
+        description="Opaque cursor to pass back to fetch the next page, or null on the last page.",
+    )
+
+
+class DataContractRevisionGetResponse(BaseModelWithExample):
+    """
+    Represents the response for a successful data contract revision retrieval.
+    """
+
+    message: str = Field(
+        ...,
+        json_schema_extra={"example": " ✅ Data contract revision retrieved successfully"},
+        description="A success message indicating the revision was retrieved.",
+    )
+    revision: int = Field(
+        ...,
+        json_schema_extra={"example": 12},
+        description="The revision number.",
+    )
+    created_at: datetime = Field(
+        ...,
+        json_schema_extra={"example": "2024-05-01T12:00:00Z"},
+        description="When the revision was written.",
+    )
+    data: DataContract = Field(
+        ...,
+        json_schema_extra=LazyExample(DataContract.get_example),
+        description="The data contract as it was at this revision.",
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
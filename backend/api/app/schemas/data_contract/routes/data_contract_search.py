@@ -0,0 +1,26 @@
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample, LazyExample
+from ..objects.data_contract_search_result import DataContractSearchResult
+
+
+class DataContractSearchResponse(BaseModelWithExample):
+    """
+    Represents the response for a successful data contract search.
+    """
+
+    message: str = Field(
+        ...,
+        json_schema_extra={"example": " ✅ Data contracts searched successfully"},
+        description="A success message indicating the search was performed.",
+    )
+    data: list[DataContractSearchResult] = Field(
+        ...,
+        json_schema_extra=LazyExample(lambda: [DataContractSearchResult.get_example()]),
+        description="The matching data contracts, most relevant first.",
+    )
+    next_cursor: str | None = Field(
+        None,
+        json_schema_extra={"example": "eyJyIjowLjYsImsiOiJ1cm46ZGF0YWNvbnRyYWN0OmNoZWNrb3V0In0"},
+        description="Opaque cursor to pass back to fetch the next page, or null on the last page.",
+    )
@@ -2,6 +2,7 @@ from typing import Literal
 
 from pydantic import Field
 
+from ....utils.example_model import LazyExample
 from .array_item import ArrayItem
 from .field import TemplateField
 
@@ -17,5 +18,8 @@ class ArrayField(TemplateField):
     items: ArrayItem = Field(
         ...,
         description="Items of the array",
-        json_schema_extra={"example": [ArrayItem.get_example()]},
+        json_schema_extra=LazyExample(lambda: [ArrayItem.get_example()]),
     )
+
+
+ArrayItem.model_rebuild()
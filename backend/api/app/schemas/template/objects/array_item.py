@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING, Literal, Union
 
 from pydantic import Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from .boolean_field import BooleanField
 from .number_field import NumberField
 from .password_field import PasswordField
@@ -36,5 +36,5 @@ class ArrayItem(BaseModelWithExample):
     ] = Field(
         ...,
         description="List of nested field properties",
-        json_schema_extra={"example": [TextField.get_example()]},
+        json_schema_extra=LazyExample(lambda: [TextField.get_example()]),
     )
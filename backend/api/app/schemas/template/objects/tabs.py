@@ -1,6 +1,6 @@
 from pydantic import ConfigDict, Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from .array_field import ArrayField
 from .boolean_field import BooleanField
 from .number_field import NumberField
@@ -34,6 +34,6 @@ class TemplateTab(BaseModelWithExample):
     ] = Field(
         ...,
         description="List of fields for the tab",
-        json_schema_extra={"example": [TextField.get_example()]},
+        json_schema_extra=LazyExample(lambda: [TextField.get_example()]),
     )
     model_config = ConfigDict(populate_by_name=True)
@@ -1,6 +1,6 @@
 from pydantic import ConfigDict, Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from .array_field import ArrayField
 from .tabs import TemplateTab
 
@@ -21,9 +21,9 @@ class Template(BaseModelWithExample):
     tabs: dict[str, TemplateTab] = Field(
         ...,
         description="List of tabs for the template",
-        json_schema_extra={
-            "example": {"info": TemplateTab.get_example(), "schema": ArrayField.get_example()}
-        },
+        json_schema_extra=LazyExample(
+            lambda: {"info": TemplateTab.get_example(), "schema": ArrayField.get_example()}
+        ),
     )
     id: str = Field(
         ...,
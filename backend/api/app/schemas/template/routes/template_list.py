@@ -1,6 +1,6 @@
 from pydantic import ConfigDict, Field
 
-from ....utils.example_model import BaseModelWithExample
+from ....utils.example_model import BaseModelWithExample, LazyExample
 from ..objects.template import Template
 
 
@@ -16,7 +16,7 @@ class TemplateListResponse(BaseModelWithExample):
     )
     data: list[Template] = Field(
         ...,
-        json_schema_extra={"example": Template.get_example()},
+        json_schema_extra=LazyExample(Template.get_example),
         description="The list of retrieved templates.",
     )
 
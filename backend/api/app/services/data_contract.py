@@ -1,23 +1,176 @@
 """Data Contract service module."""
 
-from ..crud.data_contract import DataContractCRUD
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from pydantic import ValidationError
+
+from ..crud.data_contract import AsyncDataContractCRUD, DataContractCRUD, DataContractWrite
+from ..crud.data_contract_change import AsyncDataContractChangeCRUD
+from ..crud.data_contract_revision import AsyncDataContractRevisionCRUD
 from ..database.manager import db_manager
+from ..database.notifications import DATA_CONTRACT_CHANNEL, notification_listener
 from ..schemas.data_contract.objects.data_contract import DataContract
+from ..schemas.data_contract.objects.data_contract_change import DataContractChange
+from ..schemas.data_contract.objects.data_contract_revision import DataContractRevision
+from ..schemas.data_contract.objects.data_contract_search_result import DataContractSearchResult
+from ..schemas.data_contract.objects.data_contract_summary import DataContractSummary
+from ..schemas.data_contract.routes.data_contract_bulk_create import DataContractBulkItemResult
 from ..schemas.data_contract.routes.data_contract_create import DataContractCreate
-from ..schemas.data_contract.routes.data_contract_delete import DataContractDelete
+from ..schemas.data_contract.routes.data_contract_delete import (
+    DataContractBulkDelete,
+    DataContractDelete,
+)
+from ..schemas.data_contract.routes.data_contract_list import DataContractFilter
 from ..schemas.data_contract.routes.data_contract_update import DataContractUpdate
+from ..utils.batching import WriteCoalescer
+from ..utils.cache import LRUCache
+from ..utils.canonical import CanonicalDocument
+from ..utils.conditional import IfMatch, ResourceVersion
+from ..utils.config import settings
+from ..utils.content import encode_json
 from ..utils.logger import get_logger
+from ..utils.pagination import DEFAULT_PAGE_SIZE
+from ..utils.trusted import ReadVerifier
 
 
 logger = get_logger(__name__)
 
 
+class CachedDataContract:
+    """
+    A cached data contract: its serialized JSON, its version and its validated model, which
+    trusted reads only build from the JSON when it is first needed, like its encodings in the
+    binary media types.
+    """
+
+    __slots__ = ("_encoded", "_model", "json", "version")
+
+    def __init__(self, json: bytes, version: ResourceVersion, model: DataContract | None = None):
+        """
+        Initialize the cache entry.
+
+        :param bytes json: The serialized JSON of the data contract
+        :param ResourceVersion version: The version the data contract was read at
+        :param Optional[DataContract] model: The validated model, built from the JSON if None
+        """
+        self.json = json
+        self.version = version
+        self._model = model
+        self._encoded: dict[str, bytes] = {}
+
+    @property
+    def model(self) -> DataContract:
+        """
+        The validated model of the data contract.
+
+        :return DataContract: The data contract
+        """
+        if self._model is None:
+            self._model = DataContract.model_validate_json(self.json)
+        return self._model
+
+    def encoded(self, media_type: str) -> bytes:
+        """
+        Encodes the data contract in a binary media type, once per media type.
+
+        :param str media_type: The media type, one of `CODECS`
+        :return bytes: The encoded data contract
+        """
+        encoded = self._encoded.get(media_type)
+        if encoded is None:
+            encoded = self._encoded[media_type] = encode_json(self.json, media_type)
+        return encoded
+
+
+def create_data_contract_cache() -> LRUCache[CachedDataContract]:
+    """
+    Create a data contract read cache configured from the settings.
+
+    :return LRUCache[CachedDataContract]: The cache, keyed by data contract ID
+    """
+    return LRUCache(
+        maxsize=settings.DATA_CONTRACT_CACHE_SIZE,
+        ttl=settings.DATA_CONTRACT_CACHE_TTL or None,
+    )
+
+
+def _cache_data_contract(
+    cache: LRUCache[CachedDataContract],
+    data_contract: DataContract,
+    version: ResourceVersion,
+    generation: int,
+) -> CachedDataContract:
+    """
+    Serialize a data contract read from the database and store it in the cache.
+
+    :param LRUCache[CachedDataContract] cache: The cache
+    :param DataContract data_contract: The data contract read from the database
+    :param ResourceVersion version: The version the data contract was read at
+    :param int generation: The cache generation observed before the read
+    :return CachedDataContract: The cache entry
+    """
+    entry = CachedDataContract(
+        data_contract.model_dump_json(by_alias=True).encode(), version, data_contract
+    )
+    cache.set(data_contract.id, entry, generation)
+    return entry
+
+
+def _cache_document(
+    cache: LRUCache[CachedDataContract],
+    verifier: ReadVerifier,
+    id: str,
+    document: CanonicalDocument,
+    version: ResourceVersion,
+    generation: int,
+) -> CachedDataContract:
+    """
+    Cache the canonical JSON of a data contract as stored, validating it only when the read
+    is sampled for verification.
+
+    :param LRUCache[CachedDataContract] cache: The cache
+    :param ReadVerifier verifier: The verifier sampling trusted reads
+    :param str id: The ID of the data contract
+    :param CanonicalDocument document: The canonical JSON, as read from the database
+    :param ResourceVersion version: The version the data contract was read at
+    :param int generation: The cache generation observed before the read
+    :return CachedDataContract: The cache entry
+    """
+    json_document, data_contract = document.json, None
+    if verifier.sample():
+        json_document, data_contract = verifier.verify_json(*document)
+    entry = CachedDataContract(json_document, version, data_contract)
+    cache.set(id, entry, generation)
+    return entry
+
+
+def _invalidate_notified(cache: LRUCache[CachedDataContract], payload: dict[str, Any]) -> None:
+    """
+    Invalidate the cache entries of the data contracts changed by another worker.
+
+    :param LRUCache[CachedDataContract] cache: The cache
+    :param Dict[str, Any] payload: The notification, naming one "id" or many "ids"
+    """
+    for id in payload.get("ids") or [payload["id"]]:
+        cache.invalidate(id)
+
+
 class DataContractService:
     """Service class for managing data contracts."""
 
-    def __init__(self):
-        """Initialize the data contract service."""
+    def __init__(self, cache: LRUCache[CachedDataContract] | None = None):
+        """
+        Initialize the data contract service.
+
+        :param Optional[LRUCache[CachedDataContract]] cache: The read cache, a new one if None
+        """
         self._crud = DataContractCRUD()
+        self._cache = cache if cache is not None else create_data_contract_cache()
 
     def create_data_contract(self, data_contract: DataContractCreate) -> DataContract:
         """
@@ -33,53 +186,712 @@ class DataContractService:
 
     def get_data_contract(self, id: str) -> DataContract | None:
         """
-        Get a data contract by its ID.
+        Get a data contract by its ID, from the read cache when possible.
 
         :param str id: The ID of the data contract
         :return Optional[DataContract]: The data contract if found, None otherwise
         :raises SQLAlchemyError: If there's a database error
         """
+        cached = self._cache.get(id)
+        if cached is not None:
+            return cached.model
+
+        generation = self._cache.generation
         with db_manager.get_db() as db:
-            return self._crud.get_data_contract(db, id)
+            data_contract, version = self._crud.get_data_contract_with_version(db, id)
+        return _cache_data_contract(self._cache, data_contract, version, generation).model
 
     def update_data_contract(
         self,
         id: str,
         data_contract: DataContractUpdate,
+        expected: IfMatch | None = None,
     ) -> DataContract | None:
         """
         Update an existing data contract.
 
         :param str id: The ID of the data contract to update
         :param DataContractUpdate data_contract: The update data
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any
         :return Optional[DataContract]: The updated data contract if found, None otherwise
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
         :raises SQLAlchemyError: If there's a database error
         :raises ValueError: If the data is invalid
         """
+        try:
+            with db_manager.get_db() as db:
+                return self._crud.update_data_contract(db, id, data_contract, expected)
+        finally:
+            self._cache.invalidate(id)
+
+    def list_data_contracts(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContract], str | None]:
+        """
+        List one page of data contracts.
+
+        :param int limit: The maximum number of data contracts to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return tuple[list[DataContract], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises SQLAlchemyError: If there's a database error
+        """
+        with db_manager.get_db() as db:
+            return self._crud.list_data_contracts(db, limit=limit, cursor=cursor, filters=filters)
+
+    def list_data_contract_summaries(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContractSummary], str | None]:
+        """
+        List one page of data contract summaries.
+
+        :param int limit: The maximum number of summaries to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return tuple[list[DataContractSummary], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises SQLAlchemyError: If there's a database error
+        """
+        with db_manager.get_db() as db:
+            return self._crud.list_data_contract_summaries(
+                db, limit=limit, cursor=cursor, filters=filters
+            )
+
+    def search_data_contracts(
+        self,
+        q: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[DataContractSearchResult], str | None]:
+        """
+        Search data contracts with a full-text query.
+
+        :param str q: The search query
+        :param int limit: The maximum number of results to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :return tuple[list[DataContractSearchResult], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises SQLAlchemyError: If there's a database error
+        """
+        with db_manager.get_db() as db:
+            return self._crud.search_data_contracts(db, q, limit=limit, cursor=cursor)
+
+    def index_data_contracts_for_search(self) -> int:
+        """
+        Index the data contracts stored before full-text search was available.
+
+        :return int: The number of data contracts indexed
+        :raises SQLAlchemyError: If there's a database error
+        """
         with db_manager.get_db() as db:
-            return self._crud.update_data_contract(db, id, data_contract)
+            return self._crud.index_data_contracts_for_search(db)
 
-    def list_data_contracts(self) -> list[DataContract]:
+    def migrate_legacy_references(self) -> int:
         """
-        List all data contracts.
+        Rewrite the field references of the data contracts stored under "ref" to "$ref".
 
-        :return list[DataContract]: List of all data contracts
+        :return int: The number of data contracts rewritten
         :raises SQLAlchemyError: If there's a database error
         """
         with db_manager.get_db() as db:
-            return self._crud.list_data_contracts(db)
+            return self._crud.migrate_legacy_references(db)
+
+    def store_canonical_documents(self) -> int:
+        """
+        Store the canonical document of the data contracts stored before it was available.
 
-    def delete_data_contract(self, data_contract: DataContractDelete) -> DataContract | None:
+        :return int: The number of data contracts whose canonical document was stored
+        :raises SQLAlchemyError: If there's a database error
+        """
+        with db_manager.get_db() as db:
+            return self._crud.store_canonical_documents(db)
+
+    def delete_data_contract(
+        self, data_contract: DataContractDelete, expected: IfMatch | None = None
+    ) -> DataContract | None:
         """
         Delete a data contract.
 
         :param DataContractDelete data_contract: The data contract to delete
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any
         :return Optional[DataContract]: The deleted data contract if found, None otherwise
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
         :raises SQLAlchemyError: If there's a database error
         """
-        with db_manager.get_db() as db:
-            return self._crud.delete_data_contract(db, data_contract)
+        try:
+            with db_manager.get_db() as db:
+                return self._crud.delete_data_contract(db, data_contract, expected)
+        finally:
+            self._cache.invalidate(data_contract.id)
+
+
+class AsyncDataContractService:
+    """Asynchronous service class for managing data contracts, used by the API routes."""
+
+    def __init__(
+        self,
+        cache: LRUCache[CachedDataContract] | None = None,
+        write_batch_size: int | None = None,
+        write_batch_delay: float | None = None,
+    ):
+        """
+        Initialize the asynchronous data contract service.
+
+        :param Optional[LRUCache[CachedDataContract]] cache: The read cache, a new one if None
+        :param Optional[int] write_batch_size: The maximum number of creates and replacements
+            committed together, from the settings if None
+        :param Optional[float] write_batch_delay: The maximum time in seconds a write waits
+            for others, from the settings if None
+        """
+        self._crud = AsyncDataContractCRUD()
+        self._revisions = AsyncDataContractRevisionCRUD()
+        self._changes = AsyncDataContractChangeCRUD()
+        self._cache = cache if cache is not None else create_data_contract_cache()
+        self._verifier = ReadVerifier()
+        self.write_coalescer: WriteCoalescer[DataContractWrite, Any] = WriteCoalescer(
+            self._apply_writes,
+            max_batch_size=(
+                write_batch_size
+                if write_batch_size is not None
+                else settings.DATA_CONTRACT_WRITE_BATCH_SIZE
+            ),
+            max_delay=(
+                write_batch_delay
+                if write_batch_delay is not None
+                else settings.DATA_CONTRACT_WRITE_BATCH_DELAY_MS / 1000
+            ),
+        )
+
+    async def _apply_writes(self, writes: list[DataContractWrite]) -> list[Any]:
+        """
+        Commit a batch of coalesced writes in one transaction.
+
+        :param List[DataContractWrite] writes: The writes, in order
+        :return List[Any]: The result of each write, or its error
+        """
+        try:
+            async with db_manager.get_async_db() as db:
+                return await self._crud.apply_data_contract_writes(db, writes)
+        finally:
+            for write in writes:
+                if write.operation == "upsert":
+                    self._cache.invalidate(write.data_contract.id)
+
+    async def create_data_contract(self, data_contract: DataContractCreate) -> DataContract:
+        """
+        Create a new data contract.
+
+        With write coalescing enabled, the data contract is committed along with the other
+        writes arriving at the same time.
+
+        :param DataContractCreate data_contract: The data contract to create
+        :return DataContract: The created data contract
+        :raises SQLAlchemyError: If there's a database error
+        :raises ValueError: If the data is invalid
+        """
+        if self.write_coalescer.enabled:
+            return await self.write_coalescer.submit(DataContractWrite("create", data_contract))
+        async with db_manager.get_async_db() as db:
+            return await self._crud.create_data_contract(db, data_contract)
+
+    async def bulk_create_data_contracts(
+        self, items: list[Any]
+    ) -> list[DataContractBulkItemResult]:
+        """
+        Validate then create many data contracts, reporting the outcome of each item.
+
+        All the items are validated first; the valid ones are then inserted in batches,
+        chunked as configured by DATA_CONTRACT_BULK_CHUNK_SIZE. An item fails if it is invalid,
+        if an earlier item has the same ID, or if its ID already exists.
+
+        :param List[Any] items: The decoded items of the request
+        :return List[DataContractBulkItemResult]: The outcome of each item, in request order
+        """
+        results: list[DataContractBulkItemResult] = []
+        valid: dict[str, DataContract] = {}
+        for index, item in enumerate(items):
+            id = item.get("id") if isinstance(item, dict) else None
+            result = DataContractBulkItemResult(
+                index=index, id=id if isinstance(id, str) else None, status="error"
+            )
+            results.append(result)
+            try:
+                data_contract = DataContractCreate.model_validate(item)
+            except ValidationError as e:
+                result.error = json.loads(e.json(include_url=False))
+                continue
+            if not data_contract.id:
+                result.error = " ❌ Data contract ID is required"
+            elif data_contract.id in valid:
+                result.error = f" ❌ Duplicate data contract id '{data_contract.id}' in request"
+            else:
+                valid[data_contract.id] = data_contract
+
+        errors: dict[str, str | None] = {}
+        if valid:
+            async with db_manager.get_async_db() as db:
+                errors = await self._crud.bulk_create_data_contracts(
+                    db, list(valid.values()), settings.DATA_CONTRACT_BULK_CHUNK_SIZE
+                )
+
+        for result in results:
+            if result.error is None and result.id in errors:
+                result.error = errors[result.id]
+                result.status = "created" if result.error is None else "error"
+        return results
+
+    async def get_data_contract(self, id: str) -> DataContract | None:
+        """
+        Get a data contract by its ID, from the read cache when possible.
+
+        :param str id: The ID of the data contract
+        :return Optional[DataContract]: The data contract if found, None otherwise
+        :raises SQLAlchemyError: If there's a database error
+        """
+        return (await self.get_data_contract_entry(id)).model
+
+    async def get_data_contract_entry(self, id: str) -> CachedDataContract:
+        """
+        Get a data contract with its serialized JSON and version, from the read cache when
+        possible, reading and caching it on a miss.
+
+        With trusted reads, a miss caches the canonical JSON stored on write as is, and the
+        model is only validated when it is first needed.
+
+        :param str id: The ID of the data contract
+        :return CachedDataContract: The data contract, its serialized JSON and its version
+        :raises DataContractNotFoundError: If the data contract is not found
+        :raises SQLAlchemyError: If there's a database error
+        """
+        cached = self._cache.get(id)
+        if cached is not None:
+            return cached
+
+        generation = self._cache.generation
+        async with db_manager.get_async_db() as db:
+            if settings.DATA_CONTRACT_TRUSTED_READS:
+                document, version = await self._crud.get_data_contract_json(db, id)
+                return _cache_document(
+                    self._cache, self._verifier, id, document, version, generation
+                )
+            data_contract, version = await self._crud.get_data_contract_with_version(db, id)
+        return _cache_data_contract(self._cache, data_contract, version, generation)
+
+    async def get_data_contract_version(self, id: str) -> ResourceVersion | None:
+        """
+        Get the version of a data contract, from the read cache when possible, without
+        loading its document otherwise.
+
+        :param str id: The ID of the data contract
+        :return Optional[ResourceVersion]: The version, or None if the data contract is not found
+        :raises SQLAlchemyError: If there's a database error
+        """
+        cached = self._cache.get(id)
+        if cached is not None:
+            return cached.version
+
+        async with db_manager.get_async_db() as db:
+            return await self._crud.get_data_contract_version(db, id)
+
+    async def update_data_contract(
+        self,
+        id: str,
+        data_contract: DataContractUpdate,
+        expected: IfMatch | None = None,
+    ) -> DataContract | None:
+        """
+        Update an existing data contract.
+
+        :param str id: The ID of the data contract to update
+        :param DataContractUpdate data_contract: The update data
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any
+        :return Optional[DataContract]: The updated data contract if found, None otherwise
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
+        :raises SQLAlchemyError: If there's a database error
+        :raises ValueError: If the data is invalid
+        """
+        try:
+            async with db_manager.get_async_db() as db:
+                return await self._crud.update_data_contract(db, id, data_contract, expected)
+        finally:
+            self._cache.invalidate(id)
+
+    async def upsert_data_contract(
+        self, data_contract: DataContractUpdate, expected: IfMatch | None = None
+    ) -> tuple[DataContract, ResourceVersion, bool]:
+        """
+        Create a data contract, or replace the stored one with the same ID.
+
+        With write coalescing enabled, the data contract is committed along with the other
+        writes arriving at the same time.
+
+        :param DataContractUpdate data_contract: The complete data contract to store
+        :param Optional[IfMatch] expected: The versions the replaced data contract must be at;
+            with a precondition, the data contract is only replaced
+        :return Tuple[DataContract, ResourceVersion, bool]: The stored data contract, its
+            version, and whether it was created rather than replaced
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
+        :raises SQLAlchemyError: If there's a database error
+        """
+        if self.write_coalescer.enabled:
+            return await self.write_coalescer.submit(
+                DataContractWrite("upsert", data_contract, expected)
+            )
+        try:
+            async with db_manager.get_async_db() as db:
+                return await self._crud.upsert_data_contract(db, data_contract, expected)
+        finally:
+            self._cache.invalidate(data_contract.id)
+
+    async def patch_data_contract(
+        self, id: str, patch: Any, json_patch: bool = False, expected: IfMatch | None = None
+    ) -> ResourceVersion | None:
+        """
+        Apply a JSON Merge Patch or a JSON Patch to a data contract.
+
+        :param str id: The ID of the data contract
+        :param Any patch: The merge patch, or the JSON Patch operations
+        :param bool json_patch: Whether the patch is a JSON Patch rather than a merge patch
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any
+        :return Optional[ResourceVersion]: The new version, or None if the data contract is not found
+        :raises InvalidPatchError: If the patch is malformed or cannot be applied
+        :raises PatchTestFailedError: If a JSON Patch 'test' operation does not match
+        :raises DataContractValidationError: If a patched section is invalid
+        :raises DataContractConflictError: If concurrent writes kept changing the data contract
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
+        :raises SQLAlchemyError: If there's a database error
+        """
+        try:
+            async with db_manager.get_async_db() as db:
+                return await self._crud.patch_data_contract(db, id, patch, json_patch, expected)
+        finally:
+            self._cache.invalidate(id)
+
+    async def list_data_contracts(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContract], str | None]:
+        """
+        List one page of data contracts.
+
+        :param int limit: The maximum number of data contracts to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return tuple[list[DataContract], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises SQLAlchemyError: If there's a database error
+        """
+        async with db_manager.get_async_db() as db:
+            return await self._crud.list_data_contracts(
+                db, limit=limit, cursor=cursor, filters=filters
+            )
+
+    async def list_data_contract_summaries(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContractSummary], str | None]:
+        """
+        List one page of data contract summaries.
+
+        :param int limit: The maximum number of summaries to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return tuple[list[DataContractSummary], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises SQLAlchemyError: If there's a database error
+        """
+        async with db_manager.get_async_db() as db:
+            return await self._crud.list_data_contract_summaries(
+                db, limit=limit, cursor=cursor, filters=filters
+            )
+
+    async def list_versioned_data_contracts(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContract], list[tuple[str, int, datetime]], str | None]:
+        """
+        List one page of data contracts, with the version of each of them.
+
+        :param int limit: The maximum number of data contracts to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return tuple[list[DataContract], list[tuple[str, int, datetime]], Optional[str]]: The page, its versions and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises SQLAlchemyError: If there's a database error
+        """
+        async with db_manager.get_async_db() as db:
+            return await self._crud.list_versioned_data_contracts(
+                db, limit=limit, cursor=cursor, filters=filters
+            )
+
+    async def list_data_contract_json(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[bytes], list[tuple[str, int, datetime]], str | None]:
+        """
+        List the canonical JSON of one page of data contracts, with the version of each of
+        them, as stored on write, only the reads sampled for verification being validated.
+
+        :param int limit: The maximum number of data contracts to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return tuple[list[bytes], list[tuple[str, int, datetime]], Optional[str]]: The JSON of the page, its versions and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises SQLAlchemyError: If there's a database error
+        """
+        async with db_manager.get_async_db() as db:
+            documents, versions, next_cursor = await self._crud.list_data_contract_json(
+                db, limit=limit, cursor=cursor, filters=filters
+            )
+        json_documents = [
+            self._verifier.verify_json(*document)[0] if self._verifier.sample() else document.json
+            for document in documents
+        ]
+        return json_documents, versions, next_cursor
+
+    async def list_versioned_data_contract_summaries(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[DataContractSummary], list[tuple[str, int, datetime]], str | None]:
+        """
+        List one page of data contract summaries, with the version of each data contract.
+
+        :param int limit: The maximum number of summaries to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return tuple[list[DataContractSummary], list[tuple[str, int, datetime]], Optional[str]]: The page, its versions and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises SQLAlchemyError: If there's a database error
+        """
+        async with db_manager.get_async_db() as db:
+            return await self._crud.list_versioned_data_contract_summaries(
+                db, limit=limit, cursor=cursor, filters=filters
+            )
+
+    async def list_data_contract_versions(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filters: DataContractFilter | None = None,
+    ) -> tuple[list[tuple[str, int, datetime]], bool]:
+        """
+        List the versions of the data contracts of one page, without loading their documents.
+
+        :param int limit: The maximum number of data contracts in the page
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :return tuple[list[tuple[str, int, datetime]], bool]: The versions and whether another page follows
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises SQLAlchemyError: If there's a database error
+        """
+        async with db_manager.get_async_db() as db:
+            return await self._crud.list_data_contract_versions(
+                db, limit=limit, cursor=cursor, filters=filters
+            )
+
+    async def export_data_contracts(
+        self, filters: DataContractFilter | None = None, as_json: bool = False
+    ) -> AsyncIterator[DataContract | bytes]:
+        """
+        Stream every data contract, ordered by ID, bypassing the read cache.
+
+        The database session stays open until the stream is exhausted or closed. When the
+        caller accepts JSON and reads are trusted, the canonical JSON stored on write is sent
+        as is, only the reads sampled for verification being validated.
+
+        :param Optional[DataContractFilter] filters: The filters the data contracts must match
+        :param bool as_json: Whether the data contracts may be streamed as serialized JSON
+        :return AsyncIterator[Union[DataContract, bytes]]: The data contracts, as they are
+            fetched, either validated or serialized
+        :raises DataContractOperationError: If there's a database error
+        """
+        async with db_manager.get_async_db() as db:
+            if as_json and settings.DATA_CONTRACT_TRUSTED_READS:
+                async for document in self._crud.stream_data_contract_json(db, filters):
+                    if self._verifier.sample():
+                        yield self._verifier.verify_json(*document)[0]
+                    else:
+                        yield document.json
+            else:
+                async for data_contract in self._crud.stream_data_contracts(db, filters):
+                    yield data_contract
+
+    async def list_data_contract_revisions(
+        self,
+        id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[DataContractRevision], str | None]:
+        """
+        List one page of the history of a data contract, latest revision first.
+
+        :param str id: The ID of the data contract
+        :param int limit: The maximum number of revisions to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :return tuple[list[DataContractRevision], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises DataContractOperationError: If there's a database error
+        """
+        async with db_manager.get_async_db() as db:
+            return await self._revisions.list_revisions(db, id, limit=limit, cursor=cursor)
+
+    async def get_data_contract_revision(
+        self, id: str, revision: int
+    ) -> tuple[DataContract, ResourceVersion]:
+        """
+        Get a data contract as it was at a revision, bypassing the read cache.
+
+        :param str id: The ID of the data contract
+        :param int revision: The revision
+        :return tuple[DataContract, ResourceVersion]: The data contract and the version it was at
+        :raises DataContractRevisionNotFoundError: If the revision is not in the history
+        :raises DataContractOperationError: If there's a database error
+        """
+        async with db_manager.get_async_db() as db:
+            return await self._revisions.get_revision(db, id, revision)
+
+    async def list_data_contract_changes(
+        self, since: int = 0, limit: int = DEFAULT_PAGE_SIZE, wait: float = 0
+    ) -> list[DataContractChange]:
+        """
+        List the changes following an offset, waiting for one when there is none yet.
+
+        The database session is only held while looking for changes, not while waiting.
+
+        :param int since: The offset of the last change already processed, 0 for none
+        :param int limit: The maximum number of changes to return
+        :param float wait: The maximum time in seconds to wait for a change
+        :return list[DataContractChange]: The changes, in feed order, empty if none came in time
+        :raises DataContractOperationError: If there's a database error
+        """
+        deadline = time.monotonic() + wait
+        while True:
+            async with db_manager.get_async_db() as db:
+                changes = await self._changes.list_changes(db, since, limit)
+            remaining = deadline - time.monotonic()
+            if changes or remaining <= 0:
+                return changes
+            await asyncio.sleep(min(settings.CHANGE_FEED_POLL_INTERVAL_MS / 1000, remaining))
+
+    async def stream_data_contract_changes(
+        self, since: int = 0, limit: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[list[DataContractChange]]:
+        """
+        Stream the changes following an offset, as they are committed, until closed.
+
+        The feed is polled, right away while it has a backlog, then every
+        CHANGE_FEED_POLL_INTERVAL_MS milliseconds.
+
+        :param int since: The offset of the last change already processed, 0 for none
+        :param int limit: The maximum number of changes per batch
+        :return AsyncIterator[list[DataContractChange]]: The batches of changes, in feed order,
+            an empty one after each poll that found nothing
+        :raises DataContractOperationError: If there's a database error
+        """
+        while True:
+            async with db_manager.get_async_db() as db:
+                changes = await self._changes.list_changes(db, since, limit)
+            yield changes
+            if changes:
+                since = changes[-1].offset
+            if len(changes) < limit:
+                await asyncio.sleep(settings.CHANGE_FEED_POLL_INTERVAL_MS / 1000)
+
+    async def search_data_contracts(
+        self,
+        q: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[DataContractSearchResult], str | None]:
+        """
+        Search data contracts with a full-text query.
+
+        :param str q: The search query
+        :param int limit: The maximum number of results to return
+        :param Optional[str] cursor: The cursor returned with the previous page, if any
+        :return tuple[list[DataContractSearchResult], Optional[str]]: The page and the next page cursor
+        :raises InvalidCursorError: If the cursor is malformed
+        :raises SQLAlchemyError: If there's a database error
+        """
+        async with db_manager.get_async_db() as db:
+            return await self._crud.search_data_contracts(db, q, limit=limit, cursor=cursor)
+
+    async def delete_data_contract(
+        self, data_contract: DataContractDelete, expected: IfMatch | None = None
+    ) -> DataContract | None:
+        """
+        Delete a data contract.
+
+        :param DataContractDelete data_contract: The data contract to delete
+        :param Optional[IfMatch] expected: The versions the data contract must be at, if any
+        :return Optional[DataContract]: The deleted data contract if found, None otherwise
+        :raises DataContractPreconditionFailedError: If the data contract is missing or at
+            another version than expected
+        :raises SQLAlchemyError: If there's a database error
+        """
+        try:
+            async with db_manager.get_async_db() as db:
+                return await self._crud.delete_data_contract(db, data_contract, expected)
+        finally:
+            self._cache.invalidate(data_contract.id)
+
+    async def bulk_delete_data_contracts(
+        self, data_contracts: DataContractBulkDelete
+    ) -> tuple[list[str], list[DataContract] | None]:
+        """
+        Delete the data contracts selected by IDs and/or filters, in one transaction.
+
+        :param DataContractBulkDelete data_contracts: The selection of the data contracts
+        :return Tuple[List[str], Optional[List[DataContract]]]: The IDs of the deleted data
+            contracts, and the deleted data contracts if requested
+        :raises SQLAlchemyError: If there's a database error
+        """
+        try:
+            async with db_manager.get_async_db() as db:
+                deleted_ids, documents = await self._crud.bulk_delete_data_contracts(
+                    db,
+                    ids=data_contracts.ids,
+                    filters=data_contracts.filters,
+                    return_documents=data_contracts.return_documents,
+                )
+        except Exception:
+            # The deleted IDs are unknown: drop every cached data contract
+            self._cache.clear()
+            raise
+        for id in deleted_ids:
+            self._cache.invalidate(id)
+        return deleted_ids, documents
+
 
+# Singleton instances, sharing one read cache
+data_contract_cache = create_data_contract_cache()
+data_contract_service = DataContractService(data_contract_cache)
+async_data_contract_service = AsyncDataContractService(data_contract_cache)
 
-# Singleton instance
-data_contract_service = DataContractService()
+# Keep the read cache coherent with the writes of the other workers
+notification_listener.subscribe(
+    DATA_CONTRACT_CHANNEL, lambda payload: _invalidate_notified(data_contract_cache, payload)
+)
+notification_listener.on_resync(data_contract_cache.clear)
@@ -1,9 +1,12 @@
+import threading
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from ..crud.template import TemplateCRUD
+from ..database.manager import db_manager
+from ..database.notifications import TEMPLATE_CHANNEL, notification_listener, notify
 from ..utils.logger import get_logger
 
 
@@ -11,14 +14,18 @@ logger = get_logger(__name__)
 
 
 class TemplateService:
-    """Service class for managing templates."""
+    """
+    Service class for managing templates.
+
+    Templates are only kept in memory. Requests and the notification listener thread both
+    read and change them, so loading and changes are serialized by a lock.
+    """
 
     def __init__(self):
-        """Initialize the template service."""
+        """Initialize the template service, the templates being loaded on first use."""
         self._crud = TemplateCRUD()
         self._loaded = False
-        self._loading = False  # Guard against recursive loading
-        self._ensure_templates_loaded()
+        self._lock = threading.Lock()
 
     def create_template(self, template_id: str, template_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -29,8 +36,11 @@ class TemplateService:
         :return Dict[str, Any]: The created template
         :raises ValueError: If template already exists
         """
-        self._ensure_templates_loaded()
-        return self._crud.create_template(template_id, template_data)
+        with self._lock:
+            self._ensure_templates_loaded()
+            template = self._crud.create_template(template_id, template_data)
+        self._publish_change("put", template_id, template)
+        return template
 
     def get_template(self, template_id: str) -> dict[str, Any] | None:
         """
@@ -39,8 +49,9 @@ class TemplateService:
         :param template_id: The ID of the template to retrieve
         :return: The template if found, None otherwise
         """
-        self._ensure_templates_loaded()
-        return self._crud.read_template(template_id)
+        with self._lock:
+            self._ensure_templates_loaded()
+            return self._crud.read_template(template_id)
 
     def update_template(self, template_id: str, template_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -51,8 +62,11 @@ class TemplateService:
         :return: The updated template
         :raises ValueError: If template doesn't exist
         """
-        self._ensure_templates_loaded()
-        return self._crud.update_template(template_id, template_data)
+        with self._lock:
+            self._ensure_templates_loaded()
+            template = self._crud.update_template(template_id, template_data)
+        self._publish_change("put", template_id, template)
+        return template
 
     def delete_template(self, template_id: str) -> dict[str, Any]:
         """
@@ -62,8 +76,11 @@ class TemplateService:
         :return: The deleted template
         :raises ValueError: If template doesn't exist
         """
-        self._ensure_templates_loaded()
-        return self._crud.delete_template(template_id)
+        with self._lock:
+            self._ensure_templates_loaded()
+            template = self._crud.delete_template(template_id)
+        self._publish_change("delete", template_id)
+        return template
 
     def list_templates(self) -> list[dict[str, Any]]:
         """
@@ -71,17 +88,71 @@ class TemplateService:
 
         :return: List of all templates
         """
-        self._ensure_templates_loaded()
-        return self._crud.list_templates()
+        with self._lock:
+            self._ensure_templates_loaded()
+            return self._crud.list_templates()
+
+    def apply_change(self, payload: dict[str, Any]) -> None:
+        """
+        Apply a template change made by another worker.
+
+        :param Dict[str, Any] payload: The change notification, with the operation ("put" or
+            "delete"), the template ID and, for "put", the template data
+        """
+        template_id = payload["id"]
+        with self._lock:
+            self._ensure_templates_loaded()
+            if payload["op"] == "delete":
+                if self._crud.read_template(template_id) is not None:
+                    self._crud.delete_template(template_id)
+            elif self._crud.read_template(template_id) is None:
+                self._crud.create_template(template_id, payload["data"])
+            else:
+                self._crud.update_template(template_id, payload["data"])
+        logger.debug(f" 💡 Applied template change from another worker: {template_id}")
+
+    @staticmethod
+    def resync_templates() -> None:
+        """
+        Handle notifications possibly missed while the listener was disconnected.
+
+        Templates created or changed through the API are only held in memory, by each
+        worker: reloading the template files would drop them, and there is no other store to
+        catch up from. The templates are kept as they are, the missed changes being lost.
+        """
+        logger.warning(
+            " ⚠️ Template changes made by other workers may have been missed; "
+            "keeping the templates in memory"
+        )
+
+    @staticmethod
+    def _publish_change(
+        operation: str, template_id: str, template_data: dict[str, Any] | None = None
+    ) -> None:
+        """
+        Notify the other workers of a template change.
+
+        :param str operation: The operation, "put" or "delete"
+        :param str template_id: The ID of the changed template
+        :param Optional[Dict[str, Any]] template_data: The template data, for "put"
+        """
+        if db_manager.engine is None:
+            return
+        try:
+            notify(
+                db_manager.engine,
+                TEMPLATE_CHANNEL,
+                {"op": operation, "id": template_id, "data": template_data},
+            )
+        except Exception:
+            logger.exception(f" ❌ Failed to notify the change of template {template_id}")
 
     def _ensure_templates_loaded(self) -> None:
-        """Ensure templates are loaded from files."""
-        if not self._loaded and not self._loading:
-            self._loading = True
+        """Ensure templates are loaded from files. The lock must be held."""
+        if not self._loaded:
             try:
                 self._load_templates()
             finally:
-                self._loading = False
                 self._loaded = True
 
     def _load_templates(self) -> None:
@@ -126,3 +197,7 @@ class TemplateService:
 
 # Singleton instance
 template_service = TemplateService()
+
+# Keep the templates in sync with the changes made by the other workers
+notification_listener.subscribe(TEMPLATE_CHANNEL, template_service.apply_change)
+notification_listener.on_resync(template_service.resync_templates)
@@ -0,0 +1,125 @@
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+W = TypeVar("W")
+R = TypeVar("R")
+
+BatchFlush = Callable[[list[W]], Awaitable[list[R | Exception]]]
+
+
+class WriteCoalescer(Generic[W, R]):
+    """
+    Group-commit coalescer for small concurrent writes.
+
+    The writes submitted within `max_delay` seconds of the first one, up to `max_batch_size`,
+    are flushed together by a single call, typically one transaction and one commit. Each
+    caller gets back its own result, or its own error. The sizes of the flushed batches are
+    recorded in a histogram with power-of-two buckets.
+    """
+
+    def __init__(self, flush: BatchFlush, max_batch_size: int, max_delay: float):
+        """
+        Initialize the coalescer.
+
+        :param BatchFlush flush: Writes a batch, returning one result or exception per write,
+            in order
+        :param int max_batch_size: The maximum number of writes per batch, 1 or less
+            disabling coalescing
+        :param float max_delay: The maximum time in seconds a write waits for others
+        """
+        self.flush = flush
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: list[tuple[W, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushing: set[asyncio.Task] = set()
+        self._histogram: Counter[int] = Counter()
+        self.batches = 0
+        self.writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether writes are coalesced, rather than written one by one by their callers.
+
+        :return bool: True if batches can hold more than one write
+        """
+        return self.max_batch_size > 1
+
+    async def submit(self, write: W) -> R:
+        """
+        Queue a write for the next batch and wait for its outcome.
+
+        :param W write: The write
+        :return R: The result of the write
+        :raises Exception: The error of the write, or of its whole batch
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((write, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush_pending)
+        return await future
+
+    def _flush_pending(self) -> None:
+        """Start flushing the pending writes in the background."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._flush_batch(batch))
+            self._flushing.add(task)
+            task.add_done_callback(self._flushing.discard)
+
+    async def _flush_batch(self, batch: list[tuple[W, asyncio.Future]]) -> None:
+        """
+        Flush a batch and hand each caller its outcome.
+
+        :param List[Tuple[W, asyncio.Future]] batch: The writes and the futures of their callers
+        """
+        self.batches += 1
+        self.writes += len(batch)
+        self._histogram[1 << (len(batch) - 1).bit_length()] += 1
+        try:
+            results = await self.flush([write for write, _ in batch])
+        except Exception as e:
+            logger.exception(f" ❌ Failed to flush a batch of {len(batch)} writes")
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                # The caller went away: its write was still applied
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the coalescer counters.
+
+        :return Dict[str, Any]: The settings, the number of batches and writes, and the
+            histogram of the batch sizes, keyed by the upper bound of each bucket
+        """
+        return {
+            "enabled": self.enabled,
+            "max_batch_size": self.max_batch_size,
+            "max_delay": self.max_delay,
+            "batches": self.batches,
+            "writes": self.writes,
+            "mean_batch_size": round(self.writes / self.batches, 2) if self.batches else 0.0,
+            "batch_sizes": {
+                f"le_{bound}": self._histogram[bound] for bound in sorted(self._histogram)
+            },
+        }
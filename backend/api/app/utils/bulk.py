@@ -0,0 +1,89 @@
+import json
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from ..exceptions.utils.bulk import (
+    InvalidBulkBodyError,
+    NotABulkArrayError,
+    TooManyBulkItemsError,
+)
+
+
+# Media types of bodies holding one JSON document per line
+NDJSON_MEDIA_TYPES = frozenset({"application/x-ndjson", "application/ndjson", "application/jsonl"})
+
+
+def is_ndjson(content_type: str | None) -> bool:
+    """
+    Tells whether a Content-Type header designates newline-delimited JSON.
+
+    :param Optional[str] content_type: The Content-Type header, if any
+    :return bool: True for NDJSON, False for a JSON array
+    """
+    if not content_type:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() in NDJSON_MEDIA_TYPES
+
+
+async def read_bulk_items(
+    chunks: AsyncIterator[bytes],
+    ndjson: bool,
+    max_items: int,
+    loads: Callable[[bytes], Any] = json.loads,
+) -> list[Any]:
+    """
+    Reads the items of a bulk request body, either an array or NDJSON.
+
+    NDJSON is decoded line by line as the body is received, blank lines being skipped.
+
+    :param AsyncIterator[bytes] chunks: The body, as received
+    :param bool ndjson: Whether the body is NDJSON rather than an array
+    :param int max_items: The maximum number of items
+    :param Callable[[bytes], Any] loads: The function decoding an array body, JSON by default
+    :return List[Any]: The decoded items, not validated yet
+    :raises InvalidBulkBodyError: If the body is malformed
+    :raises TooManyBulkItemsError: If the body holds more than max_items items
+    """
+    if not ndjson:
+        body = b"".join([chunk async for chunk in chunks])
+        try:
+            items = loads(body)
+        except (ValueError, TypeError) as err:
+            raise InvalidBulkBodyError(str(err) or type(err).__name__) from err
+        if not isinstance(items, list):
+            raise NotABulkArrayError
+        if len(items) > max_items:
+            raise TooManyBulkItemsError(max_items)
+        return items
+
+    items: list[Any] = []
+    line_number = 0
+    pending = b""
+    async for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            line_number += 1
+            _append_ndjson_line(items, line, line_number, max_items)
+    _append_ndjson_line(items, pending, line_number + 1, max_items)
+    return items
+
+
+def _append_ndjson_line(items: list[Any], line: bytes, line_number: int, max_items: int) -> None:
+    """
+    Decodes one NDJSON line and appends its document to the items.
+
+    :param List[Any] items: The items decoded so far
+    :param bytes line: The line, without its line break
+    :param int line_number: The 1-based number of the line, for error messages
+    :param int max_items: The maximum number of items
+    :raises InvalidBulkBodyError: If the line is not valid JSON
+    :raises TooManyBulkItemsError: If the line would exceed max_items
+    """
+    if not line.strip():
+        return
+    if len(items) >= max_items:
+        raise TooManyBulkItemsError(max_items)
+    try:
+        items.append(json.loads(line))
+    except ValueError as err:
+        raise InvalidBulkBodyError(str(err), line_number) from err
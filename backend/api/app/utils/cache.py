@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from time import monotonic
+from typing import Any, Generic, TypeVar
+
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """
+    Thread-safe, size-bounded cache with least-recently-used eviction and a time to live.
+
+    Entries are evicted when the cache is full (least recently used first) and are dropped on
+    access once they are older than the time to live. Each invalidation bumps a generation
+    number: a value read from the source of truth before an invalidation can be stored with
+    the generation observed before the read, and is then discarded instead of caching stale data.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        """
+        Initialize the cache.
+
+        :param int maxsize: The maximum number of entries, 0 disabling the cache
+        :param Optional[float] ttl: The time to live of the entries in seconds, None for no expiry
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        The number of invalidations so far, to pass back to `set`.
+
+        :return int: The current generation
+        """
+        return self._generation
+
+    def get(self, key: Hashable) -> V | None:
+        """
+        Get a value from the cache, marking it as recently used.
+
+        :param Hashable key: The key of the value
+        :return Optional[V]: The value, or None if it is not cached or has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V, generation: int | None = None) -> bool:
+        """
+        Store a value in the cache, evicting the least recently used entries if it is full.
+
+        :param Hashable key: The key of the value
+        :param V value: The value to store
+        :param Optional[int] generation: The generation observed before the value was read, if
+            any; the value is not stored if the cache has been invalidated since
+        :return bool: True if the value was stored
+        """
+        with self._lock:
+            if self.maxsize <= 0 or (generation is not None and generation != self._generation):
+                return False
+            self._entries[key] = (monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove a value from the cache.
+
+        :param Hashable key: The key of the value
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all the values from the cache."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the cache counters.
+
+        :return Dict[str, Any]: The size, capacity, hits, misses, evictions and expirations
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,52 @@
+"""Canonical documents: the serialized JSON of data contracts, stored with their sections."""
+
+import zlib
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+from .config import settings
+from .trusted import document_hash, render_document, trusted_document
+
+
+# zlib streams start with this byte at the compression method used, JSON documents with '{'
+ZLIB_HEADER = 0x78
+
+
+class CanonicalDocument(NamedTuple):
+    """The canonical JSON of a data contract, and its stored hash, if it was stored."""
+
+    json: bytes
+    hash: str | None = None
+
+
+def canonical_columns(columns: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Builds the canonical document columns of a data contract from its section columns.
+
+    The canonical JSON is the document reads serve, so that it can be sent as is. It is
+    compressed when it reaches `DATA_CONTRACT_DOCUMENT_COMPRESSION_THRESHOLD` bytes, and
+    hashed before compression.
+
+    :param Mapping[str, Any] columns: The section columns, such as insert parameters or a row
+    :return Dict[str, Any]: The "document" and "document_hash" columns
+    """
+    json = render_document(trusted_document(columns))
+    threshold = settings.DATA_CONTRACT_DOCUMENT_COMPRESSION_THRESHOLD
+    stored = zlib.compress(json) if 0 < threshold <= len(json) else json
+    return {"document": stored, "document_hash": document_hash(json)}
+
+
+def read_canonical(row: Mapping[str, Any]) -> CanonicalDocument:
+    """
+    Reads the canonical JSON of a data contract, rebuilding it from the section columns when
+    the data contract was stored without one.
+
+    :param Mapping[str, Any] row: The "document" and "document_hash" columns, and the section
+        columns when the document is missing
+    :return CanonicalDocument: The canonical JSON, and its hash when it was stored
+    """
+    stored = row["document"]
+    if stored is None:
+        return CanonicalDocument(render_document(trusted_document(row)))
+    json = zlib.decompress(stored) if stored[0] == ZLIB_HEADER else bytes(stored)
+    return CanonicalDocument(json, row["document_hash"])
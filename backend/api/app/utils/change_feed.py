@@ -0,0 +1,76 @@
+import time
+from collections.abc import AsyncIterator
+
+from ..schemas.data_contract.objects.data_contract_change import DataContractChange
+
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+# An idle stream gets a comment line this often, so that proxies do not close it
+SSE_HEARTBEAT_INTERVAL = 15.0
+
+# Time in milliseconds clients wait before reconnecting after the stream is lost
+SSE_RETRY_MS = 3000
+
+
+def accepts_event_stream(accept: str | None) -> bool:
+    """
+    Tells whether a client asks for Server-Sent Events.
+
+    :param Optional[str] accept: The Accept header of the request, if any
+    :return bool: True if the header lists the text/event-stream media type
+    """
+    return accept is not None and any(
+        media_range.split(";")[0].strip() == EVENT_STREAM_MEDIA_TYPE
+        for media_range in accept.split(",")
+    )
+
+
+def parse_last_event_id(last_event_id: str | None) -> int | None:
+    """
+    Reads the offset a reconnecting Server-Sent Events client resumes from.
+
+    :param Optional[str] last_event_id: The Last-Event-ID header of the request, if any
+    :return Optional[int]: The offset of the last event the client received, None if the
+        header is missing or is not an offset
+    """
+    if last_event_id is None or not last_event_id.strip().isdigit():
+        return None
+    return int(last_event_id)
+
+
+def _to_event(change: DataContractChange) -> bytes:
+    """
+    Serializes a change as one Server-Sent Event, identified by its offset.
+
+    :param DataContractChange change: The change
+    :return bytes: The event, with its operation as event type
+    """
+    return f"id: {change.offset}\nevent: {change.op}\ndata: {change.model_dump_json()}\n\n".encode()
+
+
+async def serialize_change_events(
+    batches: AsyncIterator[list[DataContractChange]],
+) -> AsyncIterator[bytes]:
+    """
+    Serializes a stream of change batches into a Server-Sent Events stream.
+
+    Each event carries the offset of its change as ID, so that a client reconnecting with
+    Last-Event-ID resumes right after it. The first chunk, holding the reconnection delay
+    and the first batch, is only produced once the first batch has been fetched.
+
+    :param AsyncIterator[List[DataContractChange]] batches: The batches of changes, an empty
+        one after each poll that found nothing
+    :return AsyncIterator[bytes]: The chunks of the stream, one per batch
+    """
+    prefix = f"retry: {SSE_RETRY_MS}\n\n".encode()
+    last_sent = time.monotonic()
+    async for changes in batches:
+        now = time.monotonic()
+        if changes or prefix:
+            yield prefix + b"".join(_to_event(change) for change in changes)
+            prefix = b""
+            last_sent = now
+        elif now - last_sent >= SSE_HEARTBEAT_INTERVAL:
+            yield b": keep-alive\n\n"
+            last_sent = now
@@ -0,0 +1,167 @@
+"""Helpers for HTTP conditional requests (ETag, Last-Modified, 304 Not Modified)."""
+
+import hashlib
+import re
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import NamedTuple
+
+
+# Entity tags are the revision and the modification time in microseconds since the epoch
+ETAG_PATTERN = re.compile(r'"(\d+)-([0-9a-f]+)"')
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class ResourceVersion(NamedTuple):
+    """The version of a stored resource: its revision number and last modification time."""
+
+    revision: int
+    updated_at: datetime
+
+    @property
+    def etag(self) -> str:
+        """
+        The strong entity tag of the resource.
+
+        The modification time is part of the tag so that a resource deleted then created
+        again, whose revision starts over, does not get the tag of its former self.
+
+        :return str: The quoted entity tag
+        """
+        microseconds = (as_utc(self.updated_at) - EPOCH) // timedelta(microseconds=1)
+        return f'"{self.revision}-{microseconds:x}"'
+
+    @property
+    def last_modified(self) -> str:
+        """
+        The Last-Modified header value of the resource.
+
+        :return str: The modification time as an HTTP date
+        """
+        return format_datetime(as_utc(self.updated_at), usegmt=True)
+
+
+class IfMatch(NamedTuple):
+    """The versions of a resource an If-Match header allows a write to apply to."""
+
+    any_version: bool
+    versions: tuple[ResourceVersion, ...]
+
+    def matches(self, version: ResourceVersion | None) -> bool:
+        """
+        Tell whether the current version of a resource satisfies the precondition.
+
+        :param Optional[ResourceVersion] version: The current version, None if there is none
+        :return bool: True if the write can apply to the resource
+        """
+        if version is None:
+            return False
+        return self.any_version or version.etag in {expected.etag for expected in self.versions}
+
+
+def parse_etag(etag: str) -> ResourceVersion | None:
+    """
+    Read back the version of a resource from one of its strong entity tags.
+
+    :param str etag: The quoted entity tag
+    :return Optional[ResourceVersion]: The version, or None for a weak or foreign tag
+    """
+    match = ETAG_PATTERN.fullmatch(etag.strip())
+    if match is None:
+        return None
+    updated_at = EPOCH + timedelta(microseconds=int(match.group(2), 16))
+    return ResourceVersion(int(match.group(1)), updated_at)
+
+
+def parse_if_match(if_match: str | None) -> IfMatch | None:
+    """
+    Parse an If-Match header, as specified by RFC 9110.
+
+    If-Match is evaluated with the strong comparison function: weak and unknown entity tags
+    never match.
+
+    :param Optional[str] if_match: The If-Match header, if any
+    :return Optional[IfMatch]: The precondition, or None if there is none
+    """
+    if if_match is None:
+        return None
+    if if_match.strip() == "*":
+        return IfMatch(any_version=True, versions=())
+    versions = (parse_etag(etag) for etag in if_match.split(","))
+    return IfMatch(any_version=False, versions=tuple(v for v in versions if v is not None))
+
+
+def as_utc(value: datetime) -> datetime:
+    """
+    Make a datetime timezone-aware, naive datetimes being read back as UTC.
+
+    :param datetime value: The datetime
+    :return datetime: The datetime in UTC
+    """
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def list_etag(view: str, versions: list[tuple[str, int, datetime]], has_more: bool) -> str:
+    """
+    Compute the entity tag of a page of resources from the versions of its items.
+
+    :param str view: The representation of the items in the page
+    :param List[Tuple[str, int, datetime]] versions: The id, revision and modification time
+        of each item of the page, in page order
+    :param bool has_more: Whether another page follows
+    :return str: The quoted entity tag
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{view}|{int(has_more)}".encode())
+    for id, revision, updated_at in versions:
+        digest.update(f"|{id}|{ResourceVersion(revision, updated_at).etag}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def is_not_modified(
+    etag: str,
+    last_modified: datetime | None,
+    if_none_match: str | None,
+    if_modified_since: str | None,
+) -> bool:
+    """
+    Evaluate the conditional GET headers of a request, as specified by RFC 9110.
+
+    If-None-Match takes precedence over If-Modified-Since, and is evaluated with the weak
+    comparison function. If-Modified-Since has a one second precision.
+
+    :param str etag: The current entity tag of the resource
+    :param Optional[datetime] last_modified: The current modification time, if known
+    :param Optional[str] if_none_match: The If-None-Match header, if any
+    :param Optional[str] if_modified_since: The If-Modified-Since header, if any
+    :return bool: True if the client's copy is current and 304 Not Modified can be answered
+    """
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in candidates
+
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return as_utc(last_modified).replace(microsecond=0) <= as_utc(since)
+
+    return False
+
+
+def validator_headers(etag: str, last_modified: str | None = None) -> dict[str, str]:
+    """
+    Build the headers letting clients revalidate their copy of a resource.
+
+    :param str etag: The entity tag of the resource
+    :param Optional[str] last_modified: The Last-Modified header value, if any
+    :return Dict[str, str]: The ETag, Last-Modified and Cache-Control headers
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = last_modified
+    return headers
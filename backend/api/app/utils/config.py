@@ -3,6 +3,8 @@ from os import getenv
 from typing import Final
 
 from app.exceptions.utils.config import (
+    InvalidBooleanError,
+    InvalidIntegerError,
     InvalidPortError,
     MissingEnvironmentVariableError,
 )
@@ -32,6 +34,62 @@ class Settings:
         self.POSTGRES_SOCKET: str | None = self._get_env("POSTGRES_SOCKET")
         self.POSTGRES_PORT: int | None = self._get_port("POSTGRES_PORT")
 
+        # Database connection pool configuration
+        self.DB_POOL_SIZE: int = self._get_int("DB_POOL_SIZE", 5)
+        self.DB_MAX_OVERFLOW: int = self._get_int("DB_MAX_OVERFLOW", 10)
+        self.DB_POOL_TIMEOUT: int = self._get_int("DB_POOL_TIMEOUT", 30)
+        self.DB_POOL_RECYCLE: int = self._get_int("DB_POOL_RECYCLE", 3600)
+        self.DB_POOL_PRE_PING: bool = self._get_bool("DB_POOL_PRE_PING", True)
+        self.DB_POOL_USE_LIFO: bool = self._get_bool("DB_POOL_USE_LIFO", False)
+
+        # Data contract read cache configuration (0 disables the cache / the expiry)
+        self.DATA_CONTRACT_CACHE_SIZE: int = self._get_int("DATA_CONTRACT_CACHE_SIZE", 1024)
+        self.DATA_CONTRACT_CACHE_TTL: int = self._get_int("DATA_CONTRACT_CACHE_TTL", 300)
+
+        # Data contract bulk creation (0 chunk size commits the whole request at once)
+        self.DATA_CONTRACT_BULK_CHUNK_SIZE: int = self._get_int(
+            "DATA_CONTRACT_BULK_CHUNK_SIZE", 500
+        )
+        self.DATA_CONTRACT_BULK_MAX_ITEMS: int = self._get_int(
+            "DATA_CONTRACT_BULK_MAX_ITEMS", 10000
+        )
+
+        # Data contract write coalescing: creates and replacements arriving within the delay
+        # are committed together, up to the batch size (1 or less disables coalescing)
+        self.DATA_CONTRACT_WRITE_BATCH_SIZE: int = self._get_int(
+            "DATA_CONTRACT_WRITE_BATCH_SIZE", 1
+        )
+        self.DATA_CONTRACT_WRITE_BATCH_DELAY_MS: int = self._get_int(
+            "DATA_CONTRACT_WRITE_BATCH_DELAY_MS", 5
+        )
+
+        # Data contract revision history: one full snapshot every this many revisions, the
+        # revisions in between being stored as JSON diffs against their snapshot
+        self.DATA_CONTRACT_SNAPSHOT_INTERVAL: int = self._get_int(
+            "DATA_CONTRACT_SNAPSHOT_INTERVAL", 10
+        )
+
+        # Trusted reads: stored data contracts were validated on write, so reads serve them as
+        # stored, validating only one read in this many to catch drift (0 never validates)
+        self.DATA_CONTRACT_TRUSTED_READS: bool = self._get_bool("DATA_CONTRACT_TRUSTED_READS", True)
+        self.DATA_CONTRACT_READ_VERIFY_INTERVAL: int = self._get_int(
+            "DATA_CONTRACT_READ_VERIFY_INTERVAL", 100
+        )
+
+        # Canonical documents: stored zlib-compressed from this many bytes of JSON (0 never
+        # compresses them, PostgreSQL compressing large values on its own)
+        self.DATA_CONTRACT_DOCUMENT_COMPRESSION_THRESHOLD: int = self._get_int(
+            "DATA_CONTRACT_DOCUMENT_COMPRESSION_THRESHOLD", 0
+        )
+
+        # Change feed: how often waiting consumers look for new changes in the outbox
+        self.CHANGE_FEED_POLL_INTERVAL_MS: int = self._get_int("CHANGE_FEED_POLL_INTERVAL_MS", 1000)
+
+        # Cross-worker change notifications (PostgreSQL LISTEN/NOTIFY)
+        self.CHANGE_NOTIFICATIONS_ENABLED: bool = self._get_bool(
+            "CHANGE_NOTIFICATIONS_ENABLED", True
+        )
+
         # Security settings
         self.ALLOWED_HOSTS: list[str] = self._get_required_env("ALLOWED_HOSTS", "*").split(",")
 
@@ -69,6 +127,42 @@ class Settings:
                 raise InvalidPortError(key, value) from err
         return None
 
+    def _get_int(self, key: str, default: int) -> int:
+        """
+        Get and convert an integer from environment variable.
+
+        :param str key: Environment variable key
+        :param int default: The default value if the environment variable is not set
+        :return int: The integer value
+        :raises InvalidIntegerError: If the value is not a valid integer
+        """
+        value = self._get_env(key)
+        if value is None:
+            return default
+        try:
+            return int(value)
+        except ValueError as err:
+            raise InvalidIntegerError(key, value) from err
+
+    def _get_bool(self, key: str, default: bool) -> bool:
+        """
+        Get and convert a boolean from environment variable.
+
+        :param str key: Environment variable key
+        :param bool default: The default value if the environment variable is not set
+        :return bool: The boolean value
+        :raises InvalidBooleanError: If the value is not a recognized boolean
+        """
+        value = self._get_env(key)
+        if value is None:
+            return default
+        normalized = value.strip().lower()
+        if normalized in ("1", "true", "yes", "on"):
+            return True
+        if normalized in ("0", "false", "no", "off"):
+            return False
+        raise InvalidBooleanError(key, value)
+
     def _get_required_env(self, key: str, default: str | None = None) -> str:
         """
         Get a required environment variable.
@@ -0,0 +1,342 @@
+"""Content negotiation of API requests and responses between JSON, MessagePack and CBOR."""
+
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar
+from typing import Any, NamedTuple
+
+import msgpack
+import pydantic_core
+from fastapi import HTTPException, Request, Response, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from ..exceptions.utils.content import InvalidRequestBodyError
+
+
+try:
+    import cbor2
+except ImportError:  # CBOR is only supported with the "cbor" extra installed
+    cbor2 = None
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+CBOR_MEDIA_TYPE = "application/cbor"
+
+# Media types still sent by clients for the registered ones
+MEDIA_TYPE_ALIASES = {"application/x-msgpack": MSGPACK_MEDIA_TYPE}
+
+# The binary media type negotiated for the response of the current request, None for JSON
+_accepted_media_type: ContextVar[str | None] = ContextVar("accepted_media_type", default=None)
+
+
+class Codec(NamedTuple):
+    """
+    The functions decoding and encoding a binary media type, to and from JSON values.
+
+    Like `json.loads`, `loads` raises a ValueError when its input is malformed. `map_header`
+    encodes the start of a map of the given number of entries, which the encoded keys and
+    values then follow.
+    """
+
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes]
+    map_header: Callable[[int], bytes]
+
+
+def _msgpack_loads(body: bytes) -> Any:
+    """
+    Decodes a MessagePack document.
+
+    :param bytes body: The document
+    :return Any: The decoded values
+    :raises ValueError: If the document is malformed
+    """
+    try:
+        return msgpack.unpackb(body)
+    except msgpack.UnpackException as e:
+        raise ValueError(str(e) or type(e).__name__) from e
+
+
+def _cbor_loads(body: bytes) -> Any:
+    """
+    Decodes a CBOR document.
+
+    :param bytes body: The document
+    :return Any: The decoded values
+    :raises ValueError: If the document is malformed
+    """
+    try:
+        return cbor2.loads(body)
+    except cbor2.CBORDecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+# Largest size CBOR encodes in the initial byte of a map, larger ones following in 1 to 8 bytes
+CBOR_INLINE_SIZE = 23
+
+
+def _cbor_map_header(size: int) -> bytes:
+    """
+    Encodes the start of a CBOR map.
+
+    :param int size: The number of entries of the map
+    :return bytes: The major type 5 initial byte, followed by the size when it exceeds 23
+    """
+    if size <= CBOR_INLINE_SIZE:
+        return bytes([0xA0 | size])
+    length = next(length for length in (1, 2, 4, 8) if size < 1 << 8 * length)
+    info = CBOR_INLINE_SIZE + length.bit_length()
+    return bytes([0xA0 | info]) + size.to_bytes(length, "big")
+
+
+CODECS: dict[str, Codec] = {
+    MSGPACK_MEDIA_TYPE: Codec(
+        _msgpack_loads, msgpack.packb, lambda size: msgpack.Packer().pack_map_header(size)
+    )
+}
+if cbor2 is not None:
+    CODECS[CBOR_MEDIA_TYPE] = Codec(_cbor_loads, cbor2.dumps, _cbor_map_header)
+
+
+def media_type(header: str | None) -> str | None:
+    """
+    Reads the media type of a Content-Type header, or of one media range of an Accept header.
+
+    :param Optional[str] header: The header value, if any
+    :return Optional[str]: The lowercase media type, without parameters, None if missing
+    """
+    if not header:
+        return None
+    name = header.split(";", 1)[0].strip().lower()
+    return MEDIA_TYPE_ALIASES.get(name, name)
+
+
+def request_codec(content_type: str | None) -> Codec | None:
+    """
+    Returns the codec of a request body, when it is not JSON.
+
+    :param Optional[str] content_type: The Content-Type header of the request, if any
+    :return Optional[Codec]: The codec, None for JSON and the other media types
+    """
+    return CODECS.get(media_type(content_type))
+
+
+def negotiate_media_type(accept: str | None) -> str | None:
+    """
+    Picks the binary media type a client prefers over JSON for the response, if any.
+
+    Media ranges are ranked by quality, then by their order in the header. Wildcards and
+    unsupported media types only ever select JSON, the default.
+
+    :param Optional[str] accept: The Accept header of the request, if any
+    :return Optional[str]: One of the media types in `CODECS`, None for JSON
+    """
+    if not accept:
+        return None
+    best, best_quality = None, 0.0
+    for media_range in accept.split(","):
+        name, *parameters = media_range.split(";")
+        quality = 1.0
+        for parameter in parameters:
+            key, _, value = parameter.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        name = media_type(name)
+        if quality > best_quality and (name in CODECS or name == JSON_MEDIA_TYPE):
+            best, best_quality = name, quality
+    return best if best in CODECS else None
+
+
+def decode_body(body: bytes, media_type: str) -> Any:
+    """
+    Decodes a binary request body to the values its JSON equivalent would hold.
+
+    :param bytes body: The request body
+    :param str media_type: Its media type, one of `CODECS`
+    :return Any: The decoded values
+    :raises InvalidRequestBodyError: If the body is malformed
+    """
+    try:
+        return CODECS[media_type].loads(body)
+    except (ValueError, TypeError) as e:
+        raise InvalidRequestBodyError(media_type, str(e) or type(e).__name__) from e
+
+
+def encode_json(json: bytes, media_type: str) -> bytes:
+    """
+    Encodes a JSON document in a binary media type.
+
+    :param bytes json: The JSON document
+    :param str media_type: The media type, one of `CODECS`
+    :return bytes: The encoded document
+    """
+    return CODECS[media_type].dumps(pydantic_core.from_json(json))
+
+
+def encode_map(media_type: str, values: Mapping[str, Any], encoded: Mapping[str, bytes]) -> bytes:
+    """
+    Encodes a map in a binary media type, some of its values already encoded, such as a
+    document encoded once and cached, spliced as they are.
+
+    :param str media_type: The media type, one of `CODECS`
+    :param Mapping[str, Any] values: The entries to encode
+    :param Mapping[str, bytes] encoded: The entries whose values are already encoded, after
+        the others
+    :return bytes: The encoded map
+    """
+    codec = CODECS[media_type]
+    return b"".join(
+        [
+            codec.map_header(len(values) + len(encoded)),
+            *(codec.dumps(key) + codec.dumps(value) for key, value in values.items()),
+            *(codec.dumps(key) + value for key, value in encoded.items()),
+        ]
+    )
+
+
+def accepted_media_type() -> str | None:
+    """
+    Returns the binary media type negotiated for the response of the current request.
+
+    Routes of a `NegotiatedRoute` rendering their response themselves encode it in this
+    media type, when there is one, instead of having their JSON response transcoded.
+
+    :return Optional[str]: One of the media types in `CODECS`, None for JSON
+    """
+    return _accepted_media_type.get()
+
+
+class NegotiatedRoute(APIRoute):
+    """
+    A route reading and writing MessagePack, and CBOR when installed, besides JSON, with
+    the same models.
+
+    A binary request body is decoded before FastAPI validates it against the body model of
+    the route, as a JSON body would be. A JSON response is encoded in the media type the
+    Accept header prefers, keys and values unchanged; streams and error responses stay as
+    they are. Routes reading their body themselves handle its media type on their own.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        """
+        Wraps the handler of the route with the content negotiation.
+
+        :return Callable[[Request], Any]: The request handler
+        """
+        handler = super().get_route_handler()
+        decodes_body = self.body_field is not None
+
+        async def negotiated_handler(request: Request) -> Response:
+            content_type = media_type(request.headers.get("content-type"))
+            if decodes_body and content_type in CODECS:
+                request = await _as_json_request(request, content_type)
+            accepted = negotiate_media_type(request.headers.get("accept"))
+            token = _accepted_media_type.set(accepted)
+            try:
+                response = await handler(request)
+            finally:
+                _accepted_media_type.reset(token)
+            response.headers.append("Vary", "Accept")
+            if (
+                accepted is None
+                or isinstance(response, StreamingResponse)
+                or response.media_type != JSON_MEDIA_TYPE
+                or response.status_code >= status.HTTP_400_BAD_REQUEST
+            ):
+                return response
+            headers = {
+                key: value
+                for key, value in response.headers.items()
+                if key not in {"content-length", "content-type"}
+            }
+            return Response(
+                content=encode_json(response.body, accepted),
+                status_code=response.status_code,
+                headers=headers,
+                media_type=accepted,
+                background=response.background,
+            )
+
+        return negotiated_handler
+
+
+class _DecodedRequest(Request):
+    """A request declaring a JSON body, whose binary body was already read and decoded."""
+
+    def __init__(self, request: Request, body: bytes, values: Any):
+        """
+        Initialize the request.
+
+        :param Request request: The request, with its binary body
+        :param bytes body: Its body, as read
+        :param Any values: The decoded values of its body
+        """
+        scope = dict(request.scope)
+        scope["headers"] = [
+            (key, value) for key, value in request.scope["headers"] if key != b"content-type"
+        ] + [(b"content-type", JSON_MEDIA_TYPE.encode())]
+        super().__init__(scope, request.receive)
+        self._decoded_body = body
+        self._decoded_values = values
+
+    async def body(self) -> bytes:
+        """
+        Returns the body of the request, as read before it was decoded.
+
+        :return bytes: The body
+        """
+        return self._decoded_body
+
+    async def json(self) -> Any:
+        """
+        Returns the decoded values of the body, as FastAPI reads a JSON body.
+
+        :return Any: The values
+        """
+        return self._decoded_values
+
+
+async def _as_json_request(request: Request, content_type: str) -> Request:
+    """
+    Returns the request with its binary body decoded, as FastAPI reads a JSON body.
+
+    :param Request request: The request
+    :param str content_type: The media type of its body, one of `CODECS`
+    :return Request: The request, declaring a JSON body already decoded
+    :raises HTTPException: 400 Bad Request if the body is malformed
+    """
+    body = await request.body()
+    try:
+        values = decode_body(body, content_type) if body else None
+    except InvalidRequestBodyError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message) from e
+    return _DecodedRequest(request, body, values)
+
+
+class NegotiatedGZipMiddleware(GZipMiddleware):
+    """
+    A GZip middleware leaving uncompressed the responses negotiated in a binary media type.
+
+    MessagePack and CBOR are chosen to spare the CPU time of JSON: compressing them again
+    would cost more than it saves, so requests preferring them are passed through untouched.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Compresses the response, unless the request prefers a binary media type.
+
+        :param Scope scope: The ASGI connection scope
+        :param Receive receive: The ASGI receive channel
+        :param Send send: The ASGI send channel
+        """
+        if scope["type"] == "http" and negotiate_media_type(Headers(scope=scope).get("accept")):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
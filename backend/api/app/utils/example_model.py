@@ -1,6 +1,66 @@
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import BaseModel
+from pydantic.json_schema import JsonDict
+from pydantic_core import to_jsonable_python
+
+
+class LazyExample:
+    """
+    An example built only when it is requested, instead of when its module is imported.
+
+    It is used as the `json_schema_extra` of a field, adding the example to the field's JSON
+    schema, or in place of an example in the `responses` of a route, resolved when the
+    OpenAPI schema is first built.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        """
+        :param Callable[[], Any] factory: The function building the example
+        """
+        self._factory = factory
+
+    def __call__(self, schema: JsonDict) -> None:
+        """
+        Adds the example to a JSON schema, converted like Pydantic converts a dictionary
+        `json_schema_extra`.
+
+        :param JsonDict schema: The JSON schema of the field
+        """
+        schema["example"] = to_jsonable_python(self._factory())
+
+    @property
+    def value(self) -> Any:
+        """
+        Builds the example.
+
+        :return Any: The example
+        """
+        return self._factory()
+
+
+def resolve_examples(value: Any) -> None:
+    """
+    Builds, in place, the lazy examples held by some content, such as the `responses` of a
+    route.
+
+    The content is updated rather than copied, so that the routes FastAPI derives from a
+    route when its router is included, which share its nested dictionaries, see the examples.
+
+    :param Any value: The content, whose dictionaries and lists are searched
+    """
+    if isinstance(value, dict):
+        items = list(value.items())
+    elif isinstance(value, list):
+        items = list(enumerate(value))
+    else:
+        return
+    for key, item in items:
+        if isinstance(item, LazyExample):
+            value[key] = item.value
+        else:
+            resolve_examples(item)
 
 
 class BaseModelWithExample(BaseModel):
@@ -13,6 +73,8 @@ class BaseModelWithExample(BaseModel):
         """
         example = {}
         for field_name, field in cls.model_fields.items():
-            if field.json_schema_extra and "example" in field.json_schema_extra:
+            if isinstance(field.json_schema_extra, LazyExample):
+                example[field_name] = field.json_schema_extra.value
+            elif field.json_schema_extra and "example" in field.json_schema_extra:
                 example[field_name] = field.json_schema_extra["example"]
         return example
@@ -0,0 +1,107 @@
+from collections.abc import AsyncIterator, Callable
+from typing import Literal
+
+import yaml
+
+from ..schemas.data_contract.objects.data_contract import DataContract
+
+
+ExportFormat = Literal["ndjson", "json", "yaml"]
+
+# Media type and file extension of each export format
+EXPORT_MEDIA_TYPES: dict[str, tuple[str, str]] = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "json": ("application/json", "json"),
+    "yaml": ("application/yaml", "yaml"),
+}
+
+# Serialized documents are sent in chunks of about this many bytes, the first one right away
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# The libyaml dumper is an order of magnitude faster than the pure Python one
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _to_json(data_contract: DataContract | bytes) -> bytes:
+    """
+    Serializes a data contract as one item of a JSON array.
+
+    :param Union[DataContract, bytes] data_contract: The data contract, or its serialized JSON
+    :return bytes: The JSON document
+    """
+    if isinstance(data_contract, bytes):
+        return data_contract
+    return data_contract.model_dump_json(by_alias=True).encode()
+
+
+def _to_ndjson(data_contract: DataContract | bytes) -> bytes:
+    """
+    Serializes a data contract as one line of newline-delimited JSON.
+
+    :param Union[DataContract, bytes] data_contract: The data contract, or its serialized JSON
+    :return bytes: The JSON document, followed by a newline
+    """
+    return _to_json(data_contract) + b"\n"
+
+
+def _to_yaml(data_contract: DataContract) -> bytes:
+    """
+    Serializes a data contract as one document of a YAML stream, in the datacontract.yaml
+    layout: aliased keys in declaration order, unset attributes left out.
+
+    :param DataContract data_contract: The data contract
+    :return bytes: The YAML document, starting with its '---' marker
+    """
+    document = data_contract.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return yaml.dump(
+        document,
+        Dumper=YAML_DUMPER,
+        explicit_start=True,
+        sort_keys=False,
+        allow_unicode=True,
+        encoding="utf-8",
+    )
+
+
+# Formats whose serializers accept data contracts already serialized to JSON
+JSON_FORMATS = frozenset({"ndjson", "json"})
+
+SERIALIZERS: dict[str, Callable[[DataContract], bytes]] = {
+    "ndjson": _to_ndjson,
+    "json": _to_json,
+    "yaml": _to_yaml,
+}
+
+
+async def serialize_data_contracts(
+    data_contracts: AsyncIterator[DataContract | bytes], export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """
+    Serializes a stream of data contracts into a stream of bytes.
+
+    - ``ndjson``: one JSON document per line
+    - ``json``: a JSON array
+    - ``yaml``: a stream of YAML documents, each starting with '---'
+
+    :param AsyncIterator[Union[DataContract, bytes]] data_contracts: The data contracts, as
+        they are fetched, serialized to JSON already for the formats in `JSON_FORMATS`
+    :param ExportFormat export_format: The format of the export
+    :return AsyncIterator[bytes]: The chunks of the export
+    """
+    serialize = SERIALIZERS[export_format]
+
+    separator = b"," if export_format == "json" else b""
+    buffer = bytearray(b"[" if export_format == "json" else b"")
+    first = True
+    async for data_contract in data_contracts:
+        if not first:
+            buffer += separator
+        buffer += serialize(data_contract)
+        if first or len(buffer) >= EXPORT_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+        first = False
+    if export_format == "json":
+        buffer += b"]"
+    if buffer:
+        yield bytes(buffer)
@@ -0,0 +1,72 @@
+import base64
+import binascii
+import json
+
+from ..exceptions.utils.pagination import InvalidCursorError
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(last_key: str) -> str:
+    """
+    Encodes the sort key of the last row of a page into an opaque cursor.
+
+    :param str last_key: The sort key of the last row returned
+    :return str: A URL-safe opaque cursor
+    """
+    payload = json.dumps({"k": last_key}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Decodes an opaque cursor back into the sort key it was built from.
+
+    :param str cursor: The cursor returned by a previous page
+    :return str: The sort key of the last row of the previous page
+    :raises InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_key = payload["k"]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as err:
+        raise InvalidCursorError(cursor) from err
+
+    if not isinstance(last_key, str):
+        raise InvalidCursorError(cursor)
+    return last_key
+
+
+def encode_ranked_cursor(last_rank: float, last_key: str) -> str:
+    """
+    Encodes the rank and sort key of the last row of a ranked page into an opaque cursor.
+
+    :param float last_rank: The rank of the last row returned
+    :param str last_key: The sort key of the last row returned, breaking rank ties
+    :return str: A URL-safe opaque cursor
+    """
+    payload = json.dumps({"r": last_rank, "k": last_key}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_ranked_cursor(cursor: str) -> tuple[float, str]:
+    """
+    Decodes an opaque ranked cursor back into the rank and sort key it was built from.
+
+    :param str cursor: The cursor returned by a previous page
+    :return Tuple[float, str]: The rank and sort key of the last row of the previous page
+    :raises InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_rank, last_key = payload["r"], payload["k"]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as err:
+        raise InvalidCursorError(cursor) from err
+
+    if not isinstance(last_rank, int | float) or not isinstance(last_key, str):
+        raise InvalidCursorError(cursor)
+    return float(last_rank), last_key
@@ -0,0 +1,233 @@
+import copy
+from typing import Any
+
+from ..exceptions.utils.patch import (
+    InvalidPatchOperationError,
+    InvalidPointerError,
+    NotAJsonPatchError,
+    PatchPathError,
+    PatchTestFailedError,
+    UnsupportedPatchMediaTypeError,
+)
+
+
+# Media types selecting the patch format, RFC 7386 merge patches being the default
+MERGE_PATCH_MEDIA_TYPE = "application/merge-patch+json"
+JSON_PATCH_MEDIA_TYPE = "application/json-patch+json"
+
+# Accept-Patch header advertising the supported patch formats
+ACCEPT_PATCH = f"{MERGE_PATCH_MEDIA_TYPE}, {JSON_PATCH_MEDIA_TYPE}"
+
+# JSON Patch operations and the members they require besides 'op' and 'path'
+JSON_PATCH_OPERATIONS = {
+    "add": ("value",),
+    "remove": (),
+    "replace": ("value",),
+    "move": ("from",),
+    "copy": ("from",),
+    "test": ("value",),
+}
+
+
+def is_json_patch(content_type: str | None) -> bool:
+    """
+    Tells which patch format a Content-Type header designates.
+
+    :param Optional[str] content_type: The Content-Type header, if any
+    :return bool: True for a JSON Patch, False for a merge patch
+    :raises UnsupportedPatchMediaTypeError: If the media type is not a supported patch format
+    """
+    media_type = (content_type or MERGE_PATCH_MEDIA_TYPE).split(";", 1)[0].strip().lower()
+    if media_type == JSON_PATCH_MEDIA_TYPE:
+        return True
+    if media_type in {MERGE_PATCH_MEDIA_TYPE, "application/json"}:
+        return False
+    raise UnsupportedPatchMediaTypeError(media_type)
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """
+    Applies a JSON Merge Patch (RFC 7386) to a document.
+
+    :param Any target: The document, left unchanged
+    :param Any patch: The merge patch
+    :return Any: The patched document
+    """
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+def parse_pointer(pointer: str) -> list[str]:
+    """
+    Splits a JSON Pointer (RFC 6901) into its unescaped reference tokens.
+
+    :param str pointer: The pointer, such as "/models/orders/fields"
+    :return List[str]: The reference tokens, empty for the whole document
+    :raises InvalidPointerError: If the pointer is malformed
+    """
+    if pointer == "":
+        return []
+    if not isinstance(pointer, str) or not pointer.startswith("/"):
+        raise InvalidPointerError(pointer)
+    return [segment.replace("~1", "/").replace("~0", "~") for segment in pointer[1:].split("/")]
+
+
+def validate_json_patch(operations: Any) -> list[dict[str, Any]]:
+    """
+    Checks that a document is a well-formed JSON Patch (RFC 6902).
+
+    :param Any operations: The decoded patch
+    :return List[Dict[str, Any]]: The operations
+    :raises InvalidPatchError: If the patch is not a list of valid operations
+    """
+    if not isinstance(operations, list):
+        raise NotAJsonPatchError
+    for operation in operations:
+        if not isinstance(operation, dict) or operation.get("op") not in JSON_PATCH_OPERATIONS:
+            raise InvalidPatchOperationError(operation)
+        for member in ("path", *JSON_PATCH_OPERATIONS[operation["op"]]):
+            if member not in operation:
+                raise InvalidPatchOperationError(operation["op"], member)
+        parse_pointer(operation["path"])
+        if "from" in JSON_PATCH_OPERATIONS[operation["op"]]:
+            parse_pointer(operation["from"])
+    return operations
+
+
+def apply_json_patch(document: Any, operations: list[dict[str, Any]]) -> Any:
+    """
+    Applies the operations of a JSON Patch (RFC 6902) to a document, in order.
+
+    :param Any document: The document, left unchanged
+    :param List[Dict[str, Any]] operations: The operations, checked by validate_json_patch
+    :return Any: The patched document
+    :raises InvalidPatchError: If an operation cannot be applied
+    :raises PatchTestFailedError: If a 'test' operation does not match
+    """
+    result = copy.deepcopy(document)
+    for operation in operations:
+        op, segments = operation["op"], parse_pointer(operation["path"])
+        if op == "test":
+            if _get(result, segments, operation["path"]) != operation["value"]:
+                raise PatchTestFailedError(operation["path"])
+            continue
+        if op in {"move", "copy"}:
+            source = parse_pointer(operation["from"])
+            value = copy.deepcopy(_get(result, source, operation["from"]))
+            if op == "move":
+                if segments[: len(source)] == source and segments != source:
+                    raise PatchPathError(operation["path"], "is inside the moved value")
+                result = _remove(result, source, operation["from"])
+            result = _add(result, segments, value, operation["path"])
+        elif op == "remove":
+            result = _remove(result, segments, operation["path"])
+        elif op == "replace":
+            result = _remove(result, segments, operation["path"])
+            result = _add(result, segments, copy.deepcopy(operation["value"]), operation["path"])
+        else:
+            result = _add(result, segments, copy.deepcopy(operation["value"]), operation["path"])
+    return result
+
+
+def diff_documents(source: Any, target: Any, pointer: str = "") -> list[dict[str, Any]]:
+    """
+    Computes a JSON Patch (RFC 6902) turning a document into another.
+
+    Objects are compared member by member, down to the changed values. Arrays and scalars
+    that differ are replaced as a whole.
+
+    :param Any source: The original document
+    :param Any target: The document to reach
+    :param str pointer: The JSON Pointer of the compared values, the whole document by default
+    :return List[Dict[str, Any]]: The operations, empty if the documents are equal
+    """
+    if source == target:
+        return []
+    if not isinstance(source, dict) or not isinstance(target, dict):
+        return [{"op": "replace", "path": pointer, "value": target}]
+
+    operations = []
+    for key, value in source.items():
+        path = f"{pointer}/{key.replace('~', '~0').replace('/', '~1')}"
+        if key not in target:
+            operations.append({"op": "remove", "path": path})
+        else:
+            operations += diff_documents(value, target[key], path)
+    for key, value in target.items():
+        if key not in source:
+            path = f"{pointer}/{key.replace('~', '~0').replace('/', '~1')}"
+            operations.append({"op": "add", "path": path, "value": value})
+    return operations
+
+
+def _get(document: Any, segments: list[str], pointer: str) -> Any:
+    """
+    Resolves a parsed JSON Pointer.
+
+    :param Any document: The document
+    :param List[str] segments: The reference tokens
+    :param str pointer: The pointer, for error messages
+    :return Any: The referenced value
+    :raises InvalidPatchError: If the value does not exist
+    """
+    for segment in segments:
+        if isinstance(document, dict) and segment in document:
+            document = document[segment]
+        elif isinstance(document, list) and segment.isdigit() and int(segment) < len(document):
+            document = document[int(segment)]
+        else:
+            raise PatchPathError(pointer)
+    return document
+
+
+def _add(document: Any, segments: list[str], value: Any, pointer: str) -> Any:
+    """
+    Adds a value at a parsed JSON Pointer, replacing a member or inserting an array item.
+
+    :param Any document: The document, modified in place
+    :param List[str] segments: The reference tokens
+    :param Any value: The value to add
+    :param str pointer: The pointer, for error messages
+    :return Any: The document, or the value when the pointer is the whole document
+    :raises InvalidPatchError: If the parent of the target does not exist
+    """
+    if not segments:
+        return value
+    parent, segment = _get(document, segments[:-1], pointer), segments[-1]
+    if isinstance(parent, dict):
+        parent[segment] = value
+    elif isinstance(parent, list) and segment == "-":
+        parent.append(value)
+    elif isinstance(parent, list) and segment.isdigit() and int(segment) <= len(parent):
+        parent.insert(int(segment), value)
+    else:
+        raise PatchPathError(pointer, "cannot be added to")
+    return document
+
+
+def _remove(document: Any, segments: list[str], pointer: str) -> Any:
+    """
+    Removes the value at a parsed JSON Pointer.
+
+    :param Any document: The document, modified in place
+    :param List[str] segments: The reference tokens
+    :param str pointer: The pointer, for error messages
+    :return Any: The document, None when the pointer is the whole document
+    :raises InvalidPatchError: If the value does not exist
+    """
+    if not segments:
+        return None
+    _get(document, segments, pointer)
+    parent, segment = _get(document, segments[:-1], pointer), segments[-1]
+    if isinstance(parent, dict):
+        del parent[segment]
+    else:
+        del parent[int(segment)]
+    return document
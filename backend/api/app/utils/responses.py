@@ -0,0 +1,81 @@
+"""JSON responses rendered straight from Pydantic models."""
+
+from collections.abc import Mapping
+from functools import cache
+from typing import Any
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+
+from .content import CODECS, accepted_media_type
+
+
+@cache
+def _adapter(model_class: type[BaseModel]) -> TypeAdapter:
+    """
+    Returns the type adapter of a model class, built once per class.
+
+    :param Type[BaseModel] model_class: The model class
+    :return TypeAdapter: The adapter
+    """
+    return TypeAdapter(model_class)
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    A JSON response rendering a Pydantic model to bytes in one pass.
+
+    Routes returning a response model let FastAPI validate it against the route's
+    `response_model` again, then encode it, before it is rendered. Returning this response
+    instead skips both steps: the model, already validated when it was built, is serialized
+    once by the Rust core of Pydantic, straight to UTF-8 bytes. The output is the one FastAPI
+    would produce, keys named by alias and unset attributes kept as null.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = status.HTTP_200_OK,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ):
+        """
+        Initialize the response, encoding a model in the binary media type negotiated for the
+        request instead of JSON, if there is one.
+
+        The model is then dumped to JSON values and encoded from them, rather than rendered
+        to JSON first and transcoded.
+
+        :param Any content: A Pydantic model, or any content JSONResponse can render
+        :param int status_code: The status code, errors always being rendered to JSON
+        :param Optional[Mapping[str, str]] headers: The headers
+        :param Optional[str] media_type: The media type, JSON if None
+        :param Optional[BackgroundTask] background: The task run once the response is sent
+        """
+        accepted = accepted_media_type()
+        self._codec = None
+        if (
+            accepted is not None
+            and media_type is None
+            and isinstance(content, BaseModel)
+            and status_code < status.HTTP_400_BAD_REQUEST
+        ):
+            self._codec, media_type = CODECS[accepted], accepted
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        """
+        Renders the content of the response.
+
+        :param Any content: A Pydantic model, or any content JSONResponse can render
+        :return bytes: The JSON document, or the model in the negotiated media type
+        """
+        if isinstance(content, BaseModel):
+            adapter = _adapter(type(content))
+            if self._codec is not None:
+                return self._codec.dumps(adapter.dump_python(content, mode="json", by_alias=True))
+            return adapter.dump_json(content, by_alias=True)
+        return super().render(content)
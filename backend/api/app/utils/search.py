@@ -0,0 +1,81 @@
+from collections.abc import Iterator
+from typing import Any
+
+
+# PostgreSQL text search configuration used to build and query the search vectors
+SEARCH_CONFIG = "english"
+
+# Options of the highlighted excerpt returned with search results
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5"
+
+
+def build_search_sections(
+    info: dict[str, Any] | None, models: dict[str, Any] | None
+) -> dict[str, str]:
+    """
+    Extracts the searchable text of a data contract, grouped by text search weight.
+
+    - A: the title
+    - B: the description
+    - C: the model and field names
+    - D: the model and field descriptions
+
+    :param Optional[Dict[str, Any]] info: The 'info' section of the data contract
+    :param Optional[Dict[str, Any]] models: The 'models' section of the data contract
+    :return Dict[str, str]: The text of each weight, empty weights being omitted
+    """
+    info = info or {}
+    names: list[str] = []
+    descriptions: list[str] = []
+
+    for model_name, model in (models or {}).items():
+        names.append(model_name)
+        _append_text(descriptions, model.get("title"), model.get("description"))
+        for field_name, field in _iter_fields(model.get("fields")):
+            names.append(field_name)
+            _append_text(descriptions, field.get("title"), field.get("description"))
+
+    sections = {
+        "A": info.get("title") or "",
+        "B": info.get("description") or "",
+        "C": " ".join(names),
+        "D": " ".join(descriptions),
+    }
+    return {weight: text for weight, text in sections.items() if text}
+
+
+def build_search_text(sections: dict[str, str]) -> str:
+    """
+    Joins the searchable sections into the plain text used for excerpts and LIKE matching.
+
+    :param Dict[str, str] sections: The sections built by build_search_sections
+    :return str: The searchable text, one section per line
+    """
+    return "\n".join(sections.values())
+
+
+def _iter_fields(fields: dict[str, Any] | None) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Walks a field mapping depth-first, including the nested object, array and map fields.
+
+    :param Optional[Dict[str, Any]] fields: The fields of a model or of an object field
+    :return Iterator[Tuple[str, Dict[str, Any]]]: The name and definition of each field
+    """
+    for name, field in (fields or {}).items():
+        if not isinstance(field, dict):
+            continue
+        yield name, field
+        yield from _iter_fields(field.get("fields"))
+        for nested in ("items", "keys", "values"):
+            if isinstance(field.get(nested), dict):
+                yield from _iter_fields(field[nested].get("fields"))
+
+
+def _append_text(texts: list[str], *values: str | None) -> None:
+    """
+    Appends the non-empty values to a list of texts.
+
+    :param List[str] texts: The list to append to
+    :param Optional[str] values: The values to append
+    """
+    texts.extend(value for value in values if value)
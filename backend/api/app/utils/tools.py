@@ -6,6 +6,43 @@ from ..schemas.data_contract.objects.data_contract import (
 )
 
 
+# Sections stored as NULL rather than as an empty collection
+EMPTY_AS_NULL_SECTIONS = ("servers", "models", "definitions", "examples", "links")
+
+
+def as_data_contract(pydantic_model: PydanticDataContract) -> PydanticDataContract:
+    """
+    Converts a validated request model, such as a DataContractCreate, to a DataContract
+    without validating it again.
+
+    The request models only subclass DataContract, so their attribute values are already
+    the ones of a validated DataContract.
+
+    :param PydanticDataContract pydantic_model: The validated model to convert.
+    :return PydanticDataContract: The DataContract, the model itself if it is one.
+    """
+    if type(pydantic_model) is PydanticDataContract:
+        return pydantic_model
+    return PydanticDataContract.model_construct(
+        pydantic_model.model_fields_set,
+        **{name: getattr(pydantic_model, name) for name in PydanticDataContract.model_fields},
+    )
+
+
+def data_contract_columns(pydantic_model: PydanticDataContract) -> dict[str, Any]:
+    """
+    Maps a validated DataContract to the values of its document columns, the whole document
+    being serialized in a single pass.
+
+    :param PydanticDataContract pydantic_model: The Pydantic model to map.
+    :return Dict[str, Any]: The value of each document column, by name.
+    """
+    columns = pydantic_model.model_dump(mode="json", by_alias=True)
+    for section in EMPTY_AS_NULL_SECTIONS:
+        columns[section] = columns[section] or None
+    return columns
+
+
 def pydantic_to_db_model(pydantic_model: PydanticDataContract) -> DBDataContract:
     """
     Converts a Pydantic DataContract model to a SQLAlchemy DataContract model.
@@ -13,42 +50,7 @@ def pydantic_to_db_model(pydantic_model: PydanticDataContract) -> DBDataContract
     :param PydanticDataContract pydantic_model: The Pydantic model to convert.
     :return DBDataContract: The corresponding SQLAlchemy model.
     """
-    return DBDataContract(
-        id=pydantic_model.id,
-        data_contract_specification=pydantic_model.data_contract_specification,
-        info=pydantic_model.info.model_dump(mode="json"),
-        servers=(
-            {k: v.model_dump(mode="json") for k, v in pydantic_model.servers.items()}
-            if pydantic_model.servers
-            else None
-        ),
-        terms=pydantic_model.terms.model_dump(mode="json") if pydantic_model.terms else None,
-        models=(
-            {k: v.model_dump(mode="json") for k, v in pydantic_model.models.items()}
-            if pydantic_model.models
-            else None
-        ),
-        definitions=(
-            {k: v.model_dump(mode="json") for k, v in pydantic_model.definitions.items()}
-            if pydantic_model.definitions
-            else None
-        ),
-        examples=(
-            [example.model_dump(mode="json") for example in pydantic_model.examples]
-            if pydantic_model.examples
-            else None
-        ),
-        service_level=(
-            pydantic_model.service_level.model_dump(mode="json")
-            if pydantic_model.service_level
-            else None
-        ),
-        quality=pydantic_model.quality.model_dump(mode="json") if pydantic_model.quality else None,
-        links={str(k): str(v) for k, v in pydantic_model.links.items()}
-        if pydantic_model.links
-        else None,
-        tags=pydantic_model.tags,
-    )
+    return DBDataContract(**data_contract_columns(pydantic_model))
 
 
 def db_to_pydantic_model(db_model: DBDataContract) -> PydanticDataContract:
@@ -59,7 +61,7 @@ def db_to_pydantic_model(db_model: DBDataContract) -> PydanticDataContract:
     :return PydanticDataContract: The corresponding Pydantic model.
     """
     db_dict: dict[str, Any] = {
-        c.name: getattr(db_model, c.name) for c in db_model.__table__.columns
+        name: getattr(db_model, name) for name in PydanticDataContract.model_fields
     }
 
     # Use Pydantic's model_validate to create the Pydantic model
@@ -0,0 +1,130 @@
+"""Trusted reads: serving stored data contracts without validating them again."""
+
+import hashlib
+import itertools
+import json
+from collections.abc import Mapping
+from typing import Any
+
+import pydantic_core
+
+from ..schemas.data_contract.objects.data_contract import DataContract
+from .config import settings
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def trusted_document(values: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Extracts the document of a data contract from its stored column values.
+
+    Sections are stored as they were dumped after validation on write, so the document is
+    what validating and dumping them again would produce, unset sections included as None.
+
+    :param Mapping[str, Any] values: The column values, such as a row or a model instance
+    :return Dict[str, Any]: The document, in the declaration order of its sections
+    """
+    if isinstance(values, Mapping):
+        return {name: values.get(name) for name in DataContract.model_fields}
+    return {name: getattr(values, name) for name in DataContract.model_fields}
+
+
+def render_document(document: dict[str, Any]) -> bytes:
+    """
+    Serializes the document of a data contract to JSON, as its validated model would be.
+
+    :param Dict[str, Any] document: The document, as returned by `trusted_document`
+    :return bytes: The JSON document
+    """
+    return pydantic_core.to_json(document)
+
+
+def document_hash(json_document: bytes) -> str:
+    """
+    Hashes the serialized JSON of a data contract.
+
+    :param bytes json_document: The JSON document
+    :return str: The hexadecimal SHA-256 digest
+    """
+    return hashlib.sha256(json_document).hexdigest()
+
+
+class ReadVerifier:
+    """
+    Samples trusted reads to validate them, so that stored documents drifting from the schema
+    are noticed even though reads do not validate them anymore.
+
+    One read in `interval` is validated: a document that no longer validates, or that
+    validation changes, is logged as drift, and the validated document is served instead.
+    """
+
+    def __init__(self, interval: int | None = None):
+        """
+        Initialize the verifier.
+
+        :param Optional[int] interval: The number of reads per verification, from the settings
+            if None, 0 or less never verifying
+        """
+        self._interval = interval
+        self._reads = itertools.count()
+
+    @property
+    def interval(self) -> int:
+        """
+        The number of reads per verification.
+
+        :return int: The verification interval
+        """
+        if self._interval is not None:
+            return self._interval
+        return settings.DATA_CONTRACT_READ_VERIFY_INTERVAL
+
+    def sample(self) -> bool:
+        """
+        Tells whether the current read is one to verify.
+
+        :return bool: Whether to verify the read
+        """
+        interval = self.interval
+        return interval > 0 and next(self._reads) % interval == 0
+
+    @staticmethod
+    def verify(document: dict[str, Any]) -> tuple[dict[str, Any], DataContract]:
+        """
+        Validates a stored document, logging any drift from what validation produces.
+
+        :param Dict[str, Any] document: The document, as returned by `trusted_document`
+        :return Tuple[Dict[str, Any], DataContract]: The validated document and model
+        :raises ValidationError: If the stored document is no longer valid
+        """
+        try:
+            data_contract = DataContract.model_validate(document)
+        except Exception:
+            logger.exception(f" ❌ Stored data contract no longer validates: {document.get('id')}")
+            raise
+        validated = json.loads(data_contract.model_dump_json(by_alias=True))
+        if validated != document:
+            logger.warning(f" ⚠️ Stored data contract drifted from its schema: {document.get('id')}")
+        return validated, data_contract
+
+    @classmethod
+    def verify_json(
+        cls, json_document: bytes, digest: str | None = None
+    ) -> tuple[bytes, DataContract]:
+        """
+        Validates a stored JSON document, checking it against its hash when it has one.
+
+        :param bytes json_document: The stored JSON document
+        :param Optional[str] digest: The hash stored with the document, if any
+        :return Tuple[bytes, DataContract]: The validated JSON document and model
+        :raises ValidationError: If the stored document is no longer valid
+        """
+        if digest is not None and document_hash(json_document) != digest:
+            logger.warning(" ⚠️ Stored data contract does not match its hash")
+        document = json.loads(json_document)
+        validated, data_contract = cls.verify(document)
+        if validated != document:
+            json_document = render_document(validated)
+        return json_document, data_contract
@@ -0,0 +1,187 @@
+"""
+Benchmark of the writes appending to the change feed of data contracts, on PostgreSQL.
+
+Concurrent writers each run transactions that do some work, append one change to the feed
+and commit, while a consumer follows the feed from the last change it processed:
+
+- ``lock``: the former path, the appending transactions serialized by an advisory lock
+  held until they commit
+- ``snapshot``: the current path, taking no lock, the feed only serving the changes of the
+  transactions older than every one still in flight
+
+The consumer must receive every change exactly once, or the benchmark fails. The changes it
+appends are deleted at the end: run it against a scratch database, since the consumers of
+the feed see them in the meantime.
+
+Run it from backend/api, with the settings of the PostgreSQL database in the environment:
+
+    python -m benchmarks.change_feed --writers 16 --transactions 200 --work 2
+"""
+
+import argparse
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Callable
+
+from sqlalchemy import delete, text
+from sqlalchemy.orm import Session
+
+from app.crud.data_contract_change import ChangeEvent, DataContractChangeCRUD
+from app.database.manager import db_manager
+from app.models.data_contract_change import DataContractChange as DataContractChangeModel
+
+
+# Key of the advisory lock the former path took
+CHANGE_FEED_LOCK_KEY = 0x6D7963656C69756D
+
+
+def record_with_lock(db: Session, changes: list[ChangeEvent]) -> None:
+    """
+    Appends changes to the feed like the former path, under the advisory lock.
+
+    :param Session db: The database session
+    :param List[ChangeEvent] changes: The changes
+    """
+    db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": CHANGE_FEED_LOCK_KEY})
+    DataContractChangeCRUD.record_changes(db, changes)
+
+
+VARIANTS: dict[str, Callable[[Session, list[ChangeEvent]], None]] = {
+    "lock": record_with_lock,
+    "snapshot": DataContractChangeCRUD.record_changes,
+}
+
+
+def write(
+    record: Callable[[Session, list[ChangeEvent]], None],
+    prefix: str,
+    transactions: int,
+    work: float,
+) -> None:
+    """
+    Runs the transactions of one writer.
+
+    :param Callable record: The function appending the changes
+    :param str prefix: The prefix of the IDs of the changed data contracts
+    :param int transactions: The number of transactions
+    :param float work: The time each transaction spends before appending, in seconds
+    """
+    for i in range(transactions):
+        with db_manager.SessionLocal() as db:
+            db.execute(text("SELECT pg_sleep(:work)"), {"work": work})
+            record(db, [ChangeEvent("update", f"{prefix}{i}", 1)])
+            db.commit()
+
+
+def consume(prefix: str, since: int, done: threading.Event) -> list[str]:
+    """
+    Follows the feed until the writers are done and it is drained.
+
+    :param str prefix: The prefix of the IDs of the data contracts to collect
+    :param int since: The offset of the last change already in the feed
+    :param threading.Event done: Set once the writers are done
+    :return List[str]: The IDs of the changed data contracts, in feed order
+    """
+    received = []
+    while True:
+        finished = done.is_set()
+        with db_manager.SessionLocal() as db:
+            changes = DataContractChangeCRUD.list_changes(db, since, 1000)
+        received += [change.id for change in changes if change.id.startswith(prefix)]
+        if changes:
+            since = changes[-1].offset
+        elif finished:
+            return received
+        else:
+            time.sleep(0.01)
+
+
+def drain() -> int:
+    """
+    Reads the whole feed.
+
+    :return int: The offset of its last change, 0 if empty
+    """
+    since = 0
+    while True:
+        with db_manager.SessionLocal() as db:
+            changes = DataContractChangeCRUD.list_changes(db, since, 1000)
+        if not changes:
+            return since
+        since = changes[-1].offset
+
+
+def measure(variant: str, writers: int, transactions: int, work: float) -> float:
+    """
+    Runs concurrent writers and a consumer, checking the consumer got every change once.
+
+    :param str variant: The name of the variant
+    :param int writers: The number of concurrent writers
+    :param int transactions: The number of transactions per writer
+    :param float work: The time each transaction spends before appending, in seconds
+    :return float: The committed transactions per second
+    """
+    run = f"benchmark:{variant}:{uuid.uuid4().hex}:"
+    since = drain()
+    done = threading.Event()
+    consumed: list[list[str]] = []
+    consumer = threading.Thread(target=lambda: consumed.append(consume(run, since, done)))
+    consumer.start()
+
+    threads = [
+        threading.Thread(target=write, args=(VARIANTS[variant], f"{run}{w}:", transactions, work))
+        for w in range(writers)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    consumer.join()
+
+    with db_manager.SessionLocal() as db:
+        db.execute(
+            delete(DataContractChangeModel).where(
+                DataContractChangeModel.data_contract_id.startswith(run)
+            )
+        )
+        db.commit()
+
+    received = consumed[0]
+    if len(received) != writers * transactions or len(set(received)) != len(received):
+        sys.exit(
+            f" ❌ The consumer received {len(received)} changes, "
+            f"{len(set(received))} distinct, of {writers * transactions} in {variant}"
+        )
+    return writers * transactions / elapsed
+
+
+def main() -> None:
+    """Runs the benchmark and writes a report to the standard output."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--writers", type=int, default=16, help="concurrent writers")
+    parser.add_argument("--transactions", type=int, default=200, help="transactions per writer")
+    parser.add_argument("--work", type=float, default=2, help="ms of work per transaction")
+    args = parser.parse_args()
+
+    db_manager.setup_engine()
+    if db_manager.engine.dialect.name != "postgresql":
+        sys.exit(" ❌ The change feed benchmark needs a PostgreSQL database")
+    db_manager.create_tables()
+    db_manager.run_migrations()
+
+    sys.stdout.write(
+        f"{args.writers} writers of {args.transactions} transactions, "
+        f"{args.work:g} ms of work each\n\n{'variant':<12}{'tx/s':>12}\n"
+    )
+    for variant in VARIANTS:
+        throughput = measure(variant, args.writers, args.transactions, args.work / 1000)
+        sys.stdout.write(f"{variant:<12}{throughput:>12.0f}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark of the media types the data contract and template routes negotiate.
+
+Compares, on a large data contract, the size of its document and the CPU time to encode and
+decode it, in:
+
+- ``json``: JSON, as rendered by the API and read by ``json.loads``
+- ``json+gzip``: JSON compressed like by the GZip middleware of the API
+- ``msgpack``: MessagePack, encoded from the document values
+- ``msgpack+gzip``: MessagePack compressed like by the GZip middleware of the API
+- ``msgpack_from_json``: MessagePack, transcoded from the rendered JSON, as the API still
+  encodes the responses other than models
+- ``msgpack_from_model``: MessagePack, encoded from the values of the validated model, as
+  the API encodes response models
+- ``cbor``: CBOR, when the "cbor" extra is installed
+
+Run it from backend/api, with the settings the API needs in the environment:
+
+    python -m benchmarks.content_negotiation --models 300 --fields 30
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+from pydantic import TypeAdapter
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.utils.content import CBOR_MEDIA_TYPE, CODECS, MSGPACK_MEDIA_TYPE, encode_json
+
+
+# The compression level of Starlette's GZipMiddleware
+GZIP_LEVEL = 9
+
+
+class Variant:
+    """How one media type encodes a document, and how a client decodes it."""
+
+    def __init__(self, encode: Callable[[Any], bytes], decode: Callable[[bytes], Any]):
+        self.encode = encode
+        self.decode = decode
+
+
+def build_document(models: int, fields: int) -> dict[str, Any]:
+    """
+    Builds the document of a data contract with many models of many fields.
+
+    :param int models: The number of models
+    :param int fields: The number of fields per model
+    :return Dict[str, Any]: The document, as served by the API
+    """
+    example = json.loads(
+        DataContract.model_validate(DataContract.get_example()).model_dump_json(by_alias=True)
+    )
+    model = next(iter(example["models"].values()))
+    field = next(iter(model["fields"].values()))
+    example["models"] = {
+        f"model_{m}": {
+            **model,
+            "description": f"Model {m} of the benchmark",
+            "fields": {
+                f"field_{f}": {**field, "description": f"Field {f} of model {m}"}
+                for f in range(fields)
+            },
+        }
+        for m in range(models)
+    }
+    return json.loads(DataContract.model_validate(example).model_dump_json(by_alias=True))
+
+
+def build_variants(data_contract: DataContract) -> dict[str, Variant]:
+    """
+    Lists the variants to compare, CBOR only when it is installed.
+
+    :param DataContract data_contract: The validated model of the document
+    :return Dict[str, Variant]: The variants, by name
+    """
+    msgpack_codec = CODECS[MSGPACK_MEDIA_TYPE]
+    adapter = TypeAdapter(DataContract)
+    variants = {
+        "json": Variant(pydantic_core.to_json, json.loads),
+        "json+gzip": Variant(
+            lambda document: gzip.compress(pydantic_core.to_json(document), GZIP_LEVEL),
+            lambda body: json.loads(gzip.decompress(body)),
+        ),
+        "msgpack": Variant(msgpack_codec.dumps, msgpack_codec.loads),
+        "msgpack+gzip": Variant(
+            lambda document: gzip.compress(msgpack_codec.dumps(document), GZIP_LEVEL),
+            lambda body: msgpack_codec.loads(gzip.decompress(body)),
+        ),
+        "msgpack_from_json": Variant(
+            lambda document: encode_json(pydantic_core.to_json(document), MSGPACK_MEDIA_TYPE),
+            msgpack_codec.loads,
+        ),
+        "msgpack_from_model": Variant(
+            lambda _: msgpack_codec.dumps(
+                adapter.dump_python(data_contract, mode="json", by_alias=True)
+            ),
+            msgpack_codec.loads,
+        ),
+    }
+    if CBOR_MEDIA_TYPE in CODECS:
+        cbor_codec = CODECS[CBOR_MEDIA_TYPE]
+        variants["cbor"] = Variant(cbor_codec.dumps, cbor_codec.loads)
+    return variants
+
+
+def measure(run: Callable[[], Any], repeat: int) -> float:
+    """
+    Times runs of a function, after a warm-up one, in CPU time.
+
+    :param Callable[[], Any] run: The function
+    :param int repeat: The number of timed runs
+    :return float: The median CPU time of a run, in seconds
+    """
+    run()
+    durations = []
+    for _ in range(repeat):
+        start = time.process_time()
+        run()
+        durations.append(time.process_time() - start)
+    return statistics.median(durations)
+
+
+def main() -> None:
+    """Runs the benchmark and writes a report to the standard output."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--models", type=int, default=300, help="models per data contract")
+    parser.add_argument("--fields", type=int, default=30, help="fields per model")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per variant")
+    args = parser.parse_args()
+
+    document = build_document(args.models, args.fields)
+    variants = build_variants(DataContract.model_validate(document))
+    bodies = {name: variant.encode(document) for name, variant in variants.items()}
+    if any(variants[name].decode(body) != document for name, body in bodies.items()):
+        sys.exit(" ❌ The variants do not decode to the encoded document")
+
+    sys.stdout.write(
+        f"1 contract of {args.models} models of {args.fields} fields, "
+        f"median of {args.repeat} runs\n\n"
+        f"{'variant':<20}{'bytes':>12}{'ratio':>8}{'encode ms':>12}{'decode ms':>12}\n"
+    )
+    json_size = len(bodies["json"])
+    for name, variant in variants.items():
+        body = bodies[name]
+        encode = measure(lambda variant=variant: variant.encode(document), args.repeat)
+        decode = measure(lambda variant=variant, body=body: variant.decode(body), args.repeat)
+        sys.stdout.write(
+            f"{name:<20}{len(body):>12}{len(body) / json_size:>8.2f}"
+            f"{encode * 1000:>12.2f}{decode * 1000:>12.2f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark of the cold start of an API worker.
+
+Measures, in fresh interpreters, the wall-clock time of each step of a worker start-up that
+does not depend on the database:
+
+- ``libraries``: importing FastAPI, SQLAlchemy and Pydantic
+- ``schemas``: importing the data contract and template schemas
+- ``routers``: importing the routers, which builds their routes
+- ``openapi``: building the OpenAPI schema, deferred until ``/docs`` or ``/openapi.json`` is
+  first requested
+
+The import of the schemas and routers is checked against a budget.
+
+Run it from backend/api, with the settings the API needs in the environment:
+
+    python -m benchmarks.import_time --runs 10 --budget 500
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+# Times each step in a fresh interpreter, writing them as JSON on the standard output
+STARTUP_SCRIPT = """
+import json, sys, time
+
+steps = {}
+start = time.perf_counter()
+import fastapi, pydantic, sqlalchemy
+steps["libraries"] = time.perf_counter() - start
+
+start = time.perf_counter()
+import app.schemas.data_contract.routes.data_contract_get
+import app.schemas.template.routes.template_get
+steps["schemas"] = time.perf_counter() - start
+
+start = time.perf_counter()
+from app.routers import data_contract, template
+steps["routers"] = time.perf_counter() - start
+
+from fastapi.routing import APIRoute
+from app.utils.example_model import resolve_examples
+
+start = time.perf_counter()
+api = fastapi.FastAPI()
+for router in (data_contract.router, template.router):
+    for route in router.routes:
+        if isinstance(route, APIRoute):
+            resolve_examples(route.responses)
+            resolve_examples(route.openapi_extra)
+    api.include_router(router)
+api.openapi()
+steps["openapi"] = time.perf_counter() - start
+
+sys.stdout.write(json.dumps(steps))
+"""
+
+STEPS = ("libraries", "schemas", "routers", "openapi")
+
+
+def measure_startup() -> dict[str, float]:
+    """
+    Starts a fresh interpreter and times each step of the start-up.
+
+    :return Dict[str, float]: The wall-clock time of each step, in seconds
+    """
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", STARTUP_SCRIPT],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    """Runs the benchmark and writes a report to the standard output."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters started")
+    parser.add_argument(
+        "--budget", type=float, default=500, help="median ms allowed for schemas and routers"
+    )
+    args = parser.parse_args()
+
+    runs = [measure_startup() for _ in range(args.runs)]
+
+    sys.stdout.write(
+        f"{args.runs} fresh interpreters\n\n"
+        f"{'step':<12}{'median ms':>12}{'min ms':>12}{'max ms':>12}\n"
+    )
+    for step in STEPS:
+        durations = [run[step] for run in runs]
+        sys.stdout.write(
+            f"{step:<12}{statistics.median(durations) * 1000:>12.1f}"
+            f"{min(durations) * 1000:>12.1f}{max(durations) * 1000:>12.1f}\n"
+        )
+
+    app_import = statistics.median(run["schemas"] + run["routers"] for run in runs) * 1000
+    if app_import > args.budget:
+        sys.exit(f" ❌ Importing the API took {app_import:.1f} ms, over {args.budget:.0f} ms")
+    sys.stdout.write(f"\n ✅ Importing the API took {app_import:.1f} ms, within budget\n")
+
+
+if __name__ == "__main__":
+    main()
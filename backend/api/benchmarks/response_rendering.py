@@ -0,0 +1,177 @@
+"""
+Benchmark of the rendering of data contract responses.
+
+Compares, on a page of large data contracts, the time to turn a response model into the
+bytes of the HTTP body:
+
+- ``revalidate``: the path of FastAPI releases without direct JSON serialization, the
+  model dumped to a dict, validated again against the response model, dumped to JSON-able
+  Python objects and encoded by ``json.dumps``
+- ``fastapi``: the route returns the model and the installed FastAPI renders it
+- ``pydantic_json_response``: the route returns a ``PydanticJSONResponse``
+
+The last two go through a whole ASGI request, so that they include the framework overhead.
+
+Run it from backend/api, with the settings the API needs in the environment:
+
+    python -m benchmarks.response_rendering --contracts 100 --models 20 --fields 30
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.schemas.data_contract.routes.data_contract_list import DataContractListResponse
+from app.utils.responses import PydanticJSONResponse
+
+
+def build_page(contracts: int, models: int, fields: int) -> DataContractListResponse:
+    """
+    Builds a page of data contracts, each with many models of many fields.
+
+    :param int contracts: The number of data contracts in the page
+    :param int models: The number of models per data contract
+    :param int fields: The number of fields per model
+    :return DataContractListResponse: The page
+    """
+    example = DataContract.model_validate(DataContract.get_example()).model_dump(mode="json")
+    model = next(iter(example["models"].values()))
+    field = next(iter(model["fields"].values()))
+    example["models"] = {
+        f"model_{m}": {**model, "fields": {f"field_{f}": field for f in range(fields)}}
+        for m in range(models)
+    }
+    return DataContractListResponse(
+        message=" ✅ Data contracts retrieved successfully",
+        data=[
+            DataContract.model_validate({**example, "id": f"urn:datacontract:bench:{c}"})
+            for c in range(contracts)
+        ],
+        next_cursor=None,
+    )
+
+
+def asgi_renderer(page: DataContractListResponse, direct: bool) -> Callable[[], bytes]:
+    """
+    Builds a function rendering the page through a whole ASGI request to a FastAPI route.
+
+    :param DataContractListResponse page: The page the route returns
+    :param bool direct: Whether the route returns a PydanticJSONResponse, or the model
+    :return Callable[[], bytes]: The function, returning the body of the response
+    """
+    app = FastAPI()
+
+    @app.get("/", response_model=DataContractListResponse)
+    async def route() -> Any:
+        return PydanticJSONResponse(page) if direct else page
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "server": ("bench", 80),
+        "client": ("bench", 1),
+    }
+
+    async def request() -> bytes:
+        body = bytearray()
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.body":
+                body.extend(message.get("body", b""))
+
+        await app(scope, receive, send)
+        return bytes(body)
+
+    loop = asyncio.new_event_loop()
+    return lambda: loop.run_until_complete(request())
+
+
+def revalidating_renderer(page: DataContractListResponse) -> Callable[[], bytes]:
+    """
+    Builds a function rendering the page like FastAPI releases validating the response again.
+
+    :param DataContractListResponse page: The page
+    :return Callable[[], bytes]: The function, returning the body of the response
+    """
+    adapter = TypeAdapter(DataContractListResponse)
+
+    def render() -> bytes:
+        value = adapter.validate_python(page.model_dump(by_alias=True), from_attributes=True)
+        return JSONResponse(adapter.dump_python(value, mode="json", by_alias=True)).body
+
+    return render
+
+
+def measure(render: Callable[[], bytes], repeat: int) -> list[float]:
+    """
+    Times the renderings of a response, after a warm-up one.
+
+    :param Callable[[], bytes] render: The function rendering the response
+    :param int repeat: The number of timed renderings
+    :return List[float]: The duration of each rendering, in seconds
+    """
+    render()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main() -> None:
+    """Runs the benchmark and writes a report to the standard output."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--contracts", type=int, default=100, help="data contracts per page")
+    parser.add_argument("--models", type=int, default=20, help="models per data contract")
+    parser.add_argument("--fields", type=int, default=30, help="fields per model")
+    parser.add_argument("--repeat", type=int, default=20, help="timed renderings per variant")
+    args = parser.parse_args()
+
+    page = build_page(args.contracts, args.models, args.fields)
+    renderers = {
+        "revalidate": revalidating_renderer(page),
+        "fastapi": asgi_renderer(page, direct=False),
+        "pydantic_json_response": asgi_renderer(page, direct=True),
+    }
+    bodies = {name: render() for name, render in renderers.items()}
+    if len(set(bodies.values())) != 1:
+        sys.exit(" ❌ The variants render different bodies")
+
+    size = len(bodies["pydantic_json_response"])
+    sys.stdout.write(
+        f"{args.contracts} contracts of {args.models} models of {args.fields} fields, "
+        f"{size / 1024 / 1024:.1f} MiB, {args.repeat} renderings\n\n"
+        f"{'variant':<24}{'median ms':>12}{'min ms':>12}{'MiB/s':>10}\n"
+    )
+    for name, render in renderers.items():
+        durations = measure(render, args.repeat)
+        median = statistics.median(durations)
+        sys.stdout.write(
+            f"{name:<24}{median * 1000:>12.1f}{min(durations) * 1000:>12.1f}"
+            f"{size / 1024 / 1024 / median:>10.1f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
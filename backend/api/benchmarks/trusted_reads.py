@@ -0,0 +1,117 @@
+"""
+Benchmark of trusted reads of data contracts.
+
+Compares, on a large stored data contract, the time to turn its stored column values into
+the JSON served by the API:
+
+- ``validate``: the stored document validated against the schema, then dumped to JSON
+- ``trusted``: the stored document serialized as is
+- ``trusted_sampled``: trusted reads, one in ``--interval`` validated to catch drift
+
+Run it from backend/api, with the settings the API needs in the environment:
+
+    python -m benchmarks.trusted_reads --models 20 --fields 90
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.utils.tools import pydantic_to_db_model
+from app.utils.trusted import ReadVerifier, render_document, trusted_document
+
+
+def build_document(models: int, fields: int) -> dict[str, Any]:
+    """
+    Builds the stored document of a data contract with many models of many fields.
+
+    :param int models: The number of models
+    :param int fields: The number of fields per model
+    :return Dict[str, Any]: The document, as read from the database
+    """
+    example = DataContract.model_validate(DataContract.get_example()).model_dump(mode="json")
+    model = next(iter(example["models"].values()))
+    field = next(iter(model["fields"].values()))
+    example["models"] = {
+        f"model_{m}": {**model, "fields": {f"field_{f}": field for f in range(fields)}}
+        for m in range(models)
+    }
+    stored = pydantic_to_db_model(DataContract.model_validate(example))
+    # Stored sections come back from the database as new objects, not as the dumped ones
+    return json.loads(json.dumps(trusted_document(stored)))
+
+
+def sampled_reader(document: dict[str, Any], interval: int) -> Callable[[], bytes]:
+    """
+    Builds a function reading the document like trusted reads sampled for verification.
+
+    :param Dict[str, Any] document: The stored document
+    :param int interval: The number of reads per verification
+    :return Callable[[], bytes]: The function, returning the JSON document
+    """
+    verifier = ReadVerifier(interval)
+
+    def read() -> bytes:
+        served = verifier.verify(document)[0] if verifier.sample() else document
+        return render_document(served)
+
+    return read
+
+
+def measure(read: Callable[[], bytes], repeat: int) -> list[float]:
+    """
+    Times the reads of a document, after a warm-up one.
+
+    :param Callable[[], bytes] read: The function reading the document
+    :param int repeat: The number of timed reads
+    :return List[float]: The duration of each read, in seconds
+    """
+    read()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        read()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main() -> None:
+    """Runs the benchmark and writes a report to the standard output."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--models", type=int, default=20, help="models per data contract")
+    parser.add_argument("--fields", type=int, default=90, help="fields per model")
+    parser.add_argument("--interval", type=int, default=100, help="reads per verification")
+    parser.add_argument("--repeat", type=int, default=200, help="timed reads per variant")
+    args = parser.parse_args()
+
+    document = build_document(args.models, args.fields)
+    readers = {
+        "validate": lambda: DataContract.model_validate(document).model_dump_json(by_alias=True),
+        "trusted": lambda: render_document(document),
+        "trusted_sampled": sampled_reader(document, args.interval),
+    }
+    bodies = [json.loads(read()) for read in readers.values()]
+    if any(body != bodies[0] for body in bodies):
+        sys.exit(" ❌ The variants read different documents")
+
+    size = len(readers["trusted"]())
+    sys.stdout.write(
+        f"1 contract of {args.models} models of {args.fields} fields, "
+        f"{size / 1024:.0f} KiB, {args.repeat} reads\n\n"
+        f"{'variant':<20}{'median ms':>12}{'mean ms':>12}{'min ms':>12}\n"
+    )
+    for name, read in readers.items():
+        durations = measure(read, args.repeat)
+        sys.stdout.write(
+            f"{name:<20}{statistics.median(durations) * 1000:>12.2f}"
+            f"{statistics.mean(durations) * 1000:>12.2f}{min(durations) * 1000:>12.2f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
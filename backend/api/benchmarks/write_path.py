@@ -0,0 +1,146 @@
+"""
+Benchmark of the write path of data contracts.
+
+Compares, on a large data contract, the CPU time to turn the request body FastAPI validated
+into the values of its row:
+
+- ``revalidate``: the former path, the request model dumped and validated again as a
+  DataContract, each section then dumped on its own into a SQLAlchemy model
+- ``single_pass``: the request model used as validated, its document dumped in one pass
+
+Run it from backend/api, with the settings the API needs in the environment:
+
+    python -m benchmarks.write_path --models 20 --fields 90
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from app.models.data_contract import DataContract as DataContractModel
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
+from app.utils.tools import as_data_contract, data_contract_columns
+
+
+def build_request(models: int, fields: int) -> DataContractCreate:
+    """
+    Builds a validated creation request for a data contract with many models of many fields.
+
+    :param int models: The number of models
+    :param int fields: The number of fields per model
+    :return DataContractCreate: The request body, as validated by FastAPI
+    """
+    example = json.loads(
+        DataContract.model_validate(DataContract.get_example()).model_dump_json(by_alias=True)
+    )
+    model = next(iter(example["models"].values()))
+    field = next(iter(model["fields"].values()))
+    example["models"] = {
+        f"model_{m}": {**model, "fields": {f"field_{f}": field for f in range(fields)}}
+        for m in range(models)
+    }
+    return DataContractCreate.model_validate(example)
+
+
+def revalidate(request: DataContractCreate) -> dict[str, Any]:
+    """
+    Maps a request to its row like the write path did before the single pass pipeline.
+
+    :param DataContractCreate request: The validated request body
+    :return Dict[str, Any]: The values of the row
+    """
+    data_contract = DataContract.model_validate(request.model_dump())
+
+    def dump(value: Any) -> Any:
+        return value.model_dump(mode="json", by_alias=True)
+
+    row = DataContractModel(
+        id=data_contract.id,
+        data_contract_specification=data_contract.data_contract_specification,
+        info=dump(data_contract.info),
+        servers={k: dump(v) for k, v in data_contract.servers.items()}
+        if data_contract.servers
+        else None,
+        terms=dump(data_contract.terms) if data_contract.terms else None,
+        models={k: dump(v) for k, v in data_contract.models.items()}
+        if data_contract.models
+        else None,
+        definitions={k: dump(v) for k, v in data_contract.definitions.items()}
+        if data_contract.definitions
+        else None,
+        examples=[dump(example) for example in data_contract.examples]
+        if data_contract.examples
+        else None,
+        service_level=dump(data_contract.service_level) if data_contract.service_level else None,
+        quality=dump(data_contract.quality) if data_contract.quality else None,
+        links={str(k): str(v) for k, v in data_contract.links.items()}
+        if data_contract.links
+        else None,
+        tags=data_contract.tags,
+    )
+    return {key: value for key, value in vars(row).items() if not key.startswith("_")}
+
+
+def single_pass(request: DataContractCreate) -> dict[str, Any]:
+    """
+    Maps a request to its row like the write path does.
+
+    :param DataContractCreate request: The validated request body
+    :return Dict[str, Any]: The values of the row
+    """
+    return data_contract_columns(as_data_contract(request))
+
+
+def measure(
+    write: Callable[[DataContractCreate], Any], request: DataContractCreate, repeat: int
+) -> list[float]:
+    """
+    Times the mappings of a request, after a warm-up one, in CPU time.
+
+    :param Callable[[DataContractCreate], Any] write: The function mapping the request
+    :param DataContractCreate request: The validated request body
+    :param int repeat: The number of timed mappings
+    :return List[float]: The CPU time of each mapping, in seconds
+    """
+    write(request)
+    durations = []
+    for _ in range(repeat):
+        start = time.process_time()
+        write(request)
+        durations.append(time.process_time() - start)
+    return durations
+
+
+def main() -> None:
+    """Runs the benchmark and writes a report to the standard output."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--models", type=int, default=20, help="models per data contract")
+    parser.add_argument("--fields", type=int, default=90, help="fields per model")
+    parser.add_argument("--repeat", type=int, default=100, help="timed mappings per variant")
+    args = parser.parse_args()
+
+    request = build_request(args.models, args.fields)
+    variants = {"revalidate": revalidate, "single_pass": single_pass}
+    rows = [variant(request) for variant in variants.values()]
+    if rows[0] != rows[1]:
+        sys.exit(" ❌ The variants map the request to different rows")
+
+    sys.stdout.write(
+        f"1 contract of {args.models} models of {args.fields} fields, {args.repeat} mappings\n\n"
+        f"{'variant':<16}{'median ms':>12}{'mean ms':>12}{'min ms':>12}\n"
+    )
+    for name, write in variants.items():
+        durations = measure(write, request, args.repeat)
+        sys.stdout.write(
+            f"{name:<16}{statistics.median(durations) * 1000:>12.2f}"
+            f"{statistics.mean(durations) * 1000:>12.2f}{min(durations) * 1000:>12.2f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
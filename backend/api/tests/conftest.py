@@ -1,10 +1,18 @@
 """Test configuration and fixtures."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -58,6 +66,59 @@ def db_session(test_engine) -> Generator[Session, None, None]:
         session.close()
 
 
+@pytest.fixture
+async def async_test_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Creates an aiosqlite engine for testing the asynchronous database layer."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(db_manager.Base.metadata.create_all)
+
+    # Configure database manager for tests
+    db_manager.async_engine = engine
+    db_manager.AsyncSessionLocal = async_sessionmaker(
+        bind=engine, autoflush=False, expire_on_commit=False
+    )
+
+    yield engine
+
+    db_manager.async_engine = None
+    db_manager.AsyncSessionLocal = None
+    await engine.dispose()
+
+
+@pytest.fixture
+async def async_db_session(
+    async_test_engine: AsyncEngine,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create a new asynchronous database session for testing."""
+    async with db_manager.AsyncSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+async def api_client(async_test_engine: AsyncEngine) -> AsyncGenerator[AsyncClient, None]:
+    """Create an HTTP client of the data contract routes, served from the test database."""
+    # Import the router here to avoid early initialization
+    from app.routers.data_contract import router
+    from app.services.data_contract import data_contract_cache
+
+    # The router imports the models of the tables it reads
+    async with async_test_engine.begin() as conn:
+        await conn.run_sync(db_manager.Base.metadata.create_all)
+    app = FastAPI()
+    app.include_router(router, prefix="/data_contract")
+    data_contract_cache.clear()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+    data_contract_cache.clear()
+
+
 @pytest.fixture
 def client(db_session: Session) -> Generator[TestClient, None, None]:
     """Create a new FastAPI TestClient."""
@@ -0,0 +1,143 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.crud.data_contract import DataContractCRUD
+from app.crud.data_contract_change import ChangeEvent, DataContractChangeCRUD
+from app.models.data_contract_change import DataContractChange as DataContractChangeModel
+from app.schemas.data_contract.objects.contact_object import ContactObject
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.schemas.data_contract.objects.info_object import InfoObject
+from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
+from app.schemas.data_contract.routes.data_contract_delete import DataContractDelete
+
+
+@pytest.fixture
+def data_contract_crud() -> DataContractCRUD:
+    """Creates a DataContractCRUD instance for testing."""
+    return DataContractCRUD()
+
+
+@pytest.fixture
+def change_crud() -> DataContractChangeCRUD:
+    """Creates a DataContractChangeCRUD instance for testing."""
+    return DataContractChangeCRUD()
+
+
+def _data_contract(id: str) -> DataContractCreate:
+    """Builds a minimal data contract."""
+    return DataContractCreate(
+        data_contract_specification="1.0.0",
+        id=id,
+        info=InfoObject(
+            title=id,
+            version="1.0.0",
+            owner="Test Team",
+            contact=ContactObject(name="Test Contact", email="test@example.com"),
+        ),
+    )
+
+
+def _feed(db: Session, change_crud: DataContractChangeCRUD, since: int = 0) -> list[tuple]:
+    """Lists the changes following an offset as (op, id, revision) tuples."""
+    return [
+        (change.op, change.id, change.revision)
+        for change in change_crud.list_changes(db, since=since)
+    ]
+
+
+class TestDataContractChangeCRUD:
+    """Test suite for the change feed of data contracts."""
+
+    def test_record_changes(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        change_crud: DataContractChangeCRUD,
+    ) -> None:
+        """Test that every write and deletion is appended to the feed, in order."""
+        data_contract_crud.create_data_contract(db_session, _data_contract("a"))
+        data_contract_crud.patch_data_contract(db_session, "a", {"tags": ["feed"]})
+        data_contract_crud.update_data_contract(db_session, "a", _data_contract("a"))
+        data_contract_crud.bulk_create_data_contracts(
+            db_session, [DataContract.model_validate(_data_contract("b").model_dump())]
+        )
+        data_contract_crud.upsert_data_contracts(
+            db_session,
+            [DataContract.model_validate(_data_contract(id).model_dump()) for id in ("b", "c")],
+        )
+        data_contract_crud.delete_data_contract(db_session, DataContractDelete(id="a"))
+        data_contract_crud.bulk_delete_data_contracts(db_session, ids=["b", "c"])
+
+        feed = _feed(db_session, change_crud)
+        assert feed[:6] == [
+            ("create", "a", 1),
+            ("update", "a", 2),
+            ("update", "a", 3),
+            ("create", "b", 1),
+            ("update", "b", 2),
+            ("create", "c", 1),
+        ]
+        assert feed[6] == ("delete", "a", None)
+        assert sorted(feed[7:]) == [("delete", "b", None), ("delete", "c", None)]
+
+    def test_rolled_back_changes(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        change_crud: DataContractChangeCRUD,
+    ) -> None:
+        """Test that the changes of a write are only in the feed if the write committed."""
+        data_contract_crud.create_data_contract(db_session, _data_contract("a"))
+        change_crud.record_changes(db_session, [ChangeEvent("update", "a", 2)])
+        db_session.rollback()
+
+        assert data_contract_crud.update_data_contract(db_session, "x", _data_contract("x")) is None
+        assert _feed(db_session, change_crud) == [("create", "a", 1)]
+
+    def test_list_changes(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        change_crud: DataContractChangeCRUD,
+    ) -> None:
+        """Test that consumers resume from the offset of the last change they processed."""
+        for id in ("a", "b", "c"):
+            data_contract_crud.create_data_contract(db_session, _data_contract(id))
+
+        first, second = change_crud.list_changes(db_session, limit=2)
+        rest = change_crud.list_changes(db_session, since=second.offset)
+
+        assert first.offset < second.offset
+        assert [change.id for change in rest] == ["c"]
+        assert change_crud.list_changes(db_session, since=rest[0].offset) == []
+
+    def test_list_changes_by_transaction(
+        self, db_session: Session, change_crud: DataContractChangeCRUD
+    ) -> None:
+        """Test that changes are ordered by transaction, then by offset, when resuming."""
+        # Offsets 1 and 3 are allocated by the transaction that started second
+        db_session.execute(
+            insert(DataContractChangeModel),
+            [
+                {"offset": offset, "op": "update", "data_contract_id": id, "xact_id": xact_id}
+                for offset, id, xact_id in [(1, "a", 20), (2, "b", 10), (3, "c", 20), (4, "d", 0)]
+            ],
+        )
+
+        feed = change_crud.list_changes(db_session, limit=2)
+        assert [change.id for change in feed] == ["d", "b"]
+        rest = change_crud.list_changes(db_session, since=feed[-1].offset)
+        assert [change.id for change in rest] == ["a", "c"]
+        assert change_crud.list_changes(db_session, since=rest[-1].offset) == []
+
+    def test_list_changes_snapshot_filter(self, change_crud: DataContractChangeCRUD) -> None:
+        """Test that on PostgreSQL only the transactions older than the ones in flight are read."""
+        sql = str(
+            change_crud._list_statement("postgresql", 5, 10).compile(dialect=postgresql.dialect())
+        )
+
+        assert "< CAST(CAST(pg_snapshot_xmin(pg_current_snapshot()) AS TEXT) AS BIGINT)" in sql
+        assert 'ORDER BY data_contract_changes.xact_id, data_contract_changes."offset"' in sql
+        assert "pg_snapshot_xmin" not in str(change_crud._list_statement("sqlite", 5, 10))
@@ -1,16 +1,34 @@
+import json
 import uuid
 
 import pytest
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.crud.data_contract import DataContractCRUD
+from app.crud.data_contract import AsyncDataContractCRUD, DataContractCRUD, DataContractWrite
+from app.crud.data_contract_change import DataContractChangeCRUD
 from app.exceptions.crud.data_contract import (
     DataContractNotFoundError,
+    DataContractOperationError,
+    DataContractPreconditionFailedError,
+    DataContractValidationError,
 )
+from app.exceptions.utils.pagination import InvalidCursorError
+from app.exceptions.utils.patch import PatchPathError, PatchTestFailedError
+from app.models.data_contract import DataContract as DataContractModel
 from app.schemas.data_contract.objects.contact_object import ContactObject
+from app.schemas.data_contract.objects.field_object import FieldObject
 from app.schemas.data_contract.objects.info_object import InfoObject
+from app.schemas.data_contract.objects.model_object import ModelObject
+from app.schemas.data_contract.objects.server_object import ServerObject
 from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
 from app.schemas.data_contract.routes.data_contract_delete import DataContractDelete
+from app.schemas.data_contract.routes.data_contract_list import DataContractFilter
+from app.utils.conditional import parse_if_match
+from app.utils.pagination import encode_cursor
+from app.utils.trusted import document_hash
 
 
 @pytest.fixture
@@ -62,6 +80,33 @@ class TestDataContractCRUD:
         assert retrieved.id == created.id
         assert retrieved.info.title == created.info.title
 
+    def test_create_keeps_field_references(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that field references, only accepted by their alias, survive a write."""
+        sample_data_contract.models = {
+            "orders": ModelObject(
+                type="table",
+                fields={
+                    "customer": FieldObject.model_validate(
+                        {"type": "object", "$ref": "#/definitions/customer"}
+                    )
+                },
+            )
+        }
+
+        created = data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        retrieved = data_contract_crud.get_data_contract(db_session, created.id)
+        row = db_session.get(DataContractModel, created.id)
+
+        assert type(created) is not DataContractCreate
+        assert created.models["orders"].fields["customer"].ref == "#/definitions/customer"
+        assert retrieved.models["orders"].fields["customer"].ref == "#/definitions/customer"
+        assert row.models["orders"]["fields"]["customer"]["$ref"] == "#/definitions/customer"
+
     def test_get_nonexistent_data_contract(
         self, db_session: Session, data_contract_crud: DataContractCRUD
     ) -> None:
@@ -91,6 +136,90 @@ class TestDataContractCRUD:
         assert updated is not None
         assert updated.info.title == "Updated Title"
 
+    def test_update_data_contract_bumps_version(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that updating a data contract bumps its revision and modification time."""
+        created = data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        _, version = data_contract_crud.get_data_contract_with_version(db_session, created.id)
+        assert version.revision == 1
+        assert data_contract_crud.get_data_contract_version(db_session, created.id) == version
+
+        data_contract_crud.update_data_contract(db_session, created.id, sample_data_contract)
+
+        updated = data_contract_crud.get_data_contract_version(db_session, created.id)
+        assert updated.revision == 2
+        assert updated.updated_at >= version.updated_at
+        assert updated.etag != version.etag
+        assert data_contract_crud.get_data_contract_version(db_session, "nonexistent-id") is None
+
+        versions, has_more = data_contract_crud.list_data_contract_versions(db_session)
+        assert (created.id, 2, updated.updated_at) in versions
+        assert has_more is False
+
+        # The pages loaded with their versions agree with the versions read on their own
+        page, page_versions, next_cursor = data_contract_crud.list_versioned_data_contracts(
+            db_session
+        )
+        assert page_versions == versions
+        assert next_cursor is None
+        documents, json_versions, _ = data_contract_crud.list_data_contract_json(db_session)
+        assert json_versions == versions
+        assert [json.loads(document.json) for document in documents] == [
+            contract.model_dump(mode="json", by_alias=True) for contract in page
+        ]
+        _, summary_versions, _ = data_contract_crud.list_versioned_data_contract_summaries(
+            db_session
+        )
+        assert summary_versions == versions
+
+    def test_conditional_writes(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that If-Match writes only apply to the expected versions."""
+        created = data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        stale = parse_if_match(
+            data_contract_crud.get_data_contract_version(db_session, created.id).etag
+        )
+
+        data_contract_crud.update_data_contract(db_session, created.id, sample_data_contract, stale)
+        with pytest.raises(DataContractPreconditionFailedError):
+            data_contract_crud.update_data_contract(
+                db_session, created.id, sample_data_contract, stale
+            )
+        with pytest.raises(DataContractPreconditionFailedError):
+            data_contract_crud.upsert_data_contract(db_session, sample_data_contract, stale)
+        with pytest.raises(DataContractPreconditionFailedError):
+            data_contract_crud.patch_data_contract(
+                db_session, created.id, {"tags": ["x"]}, expected=stale
+            )
+        with pytest.raises(DataContractPreconditionFailedError):
+            data_contract_crud.delete_data_contract(
+                db_session, DataContractDelete(id=created.id), stale
+            )
+        assert data_contract_crud.get_data_contract_version(db_session, created.id).revision == 2
+
+        current = parse_if_match(
+            data_contract_crud.get_data_contract_version(db_session, created.id).etag
+        )
+        version = data_contract_crud.patch_data_contract(
+            db_session, created.id, {"tags": ["x"]}, expected=current
+        )
+        assert version.revision == 3
+        assert data_contract_crud.delete_data_contract(
+            db_session, DataContractDelete(id=created.id), parse_if_match(version.etag)
+        )
+        with pytest.raises(DataContractPreconditionFailedError):
+            data_contract_crud.upsert_data_contract(
+                db_session, sample_data_contract, parse_if_match("*")
+            )
+
     def test_delete_data_contract(
         self,
         db_session: Session,
@@ -108,6 +237,39 @@ class TestDataContractCRUD:
         with pytest.raises(DataContractNotFoundError):
             data_contract_crud.get_data_contract(db_session, created.id)
 
+    def test_bulk_delete_data_contracts(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test deleting data contracts selected by IDs and by filters."""
+        other_owner = sample_data_contract.info.model_copy(update={"owner": "Other Team"})
+        data_contract_crud.bulk_create_data_contracts(
+            db_session,
+            [
+                sample_data_contract.model_copy(update={"id": "a"}),
+                sample_data_contract.model_copy(update={"id": "b"}),
+                sample_data_contract.model_copy(update={"id": "c", "info": other_owner}),
+            ],
+        )
+
+        deleted_ids, documents = data_contract_crud.bulk_delete_data_contracts(
+            db_session, ids=["a", "unknown"]
+        )
+        assert deleted_ids == ["a"]
+        assert documents is None
+
+        deleted_ids, documents = data_contract_crud.bulk_delete_data_contracts(
+            db_session, filters=DataContractFilter(owner="Other Team"), return_documents=True
+        )
+        assert deleted_ids == ["c"]
+        assert [document.info.owner for document in documents] == ["Other Team"]
+
+        assert data_contract_crud.bulk_delete_data_contracts(db_session) == ([], None)
+        contracts, _ = data_contract_crud.list_data_contracts(db_session)
+        assert [contract.id for contract in contracts] == ["b"]
+
     def test_delete_nonexistent_data_contract(
         self, db_session: Session, data_contract_crud: DataContractCRUD
     ) -> None:
@@ -128,7 +290,658 @@ class TestDataContractCRUD:
         created = data_contract_crud.create_data_contract(db_session, sample_data_contract)
 
         # List all data contracts
-        contracts = data_contract_crud.list_data_contracts(db_session)
+        contracts, next_cursor = data_contract_crud.list_data_contracts(db_session)
 
         assert len(contracts) >= 1
         assert any(contract.id == created.id for contract in contracts)
+        assert next_cursor is None
+
+    def test_list_data_contracts_paginated(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test walking through the data contracts page by page with the cursor."""
+        ids = [f"contract-{i:02d}" for i in range(5)]
+        for contract_id in reversed(ids):
+            data_contract_crud.create_data_contract(
+                db_session, sample_data_contract.model_copy(update={"id": contract_id})
+            )
+
+        seen, cursor = [], None
+        for _ in range(3):
+            page, cursor = data_contract_crud.list_data_contracts(
+                db_session, limit=2, cursor=cursor
+            )
+            seen.extend(contract.id for contract in page)
+            if cursor is None:
+                break
+
+        assert seen == ids
+        assert cursor is None
+
+    def test_list_data_contracts_invalid_cursor(
+        self, db_session: Session, data_contract_crud: DataContractCRUD
+    ) -> None:
+        """Test that a malformed cursor raises InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            data_contract_crud.list_data_contracts(db_session, cursor="not-a-cursor")
+
+    def test_list_data_contract_summaries(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test listing data contract summaries projected from the info section."""
+        created = data_contract_crud.create_data_contract(db_session, sample_data_contract)
+
+        summaries, next_cursor = data_contract_crud.list_data_contract_summaries(db_session)
+
+        assert next_cursor is None
+        assert [summary.id for summary in summaries] == [created.id]
+        assert summaries[0].title == "Test Contract"
+        assert summaries[0].version == "1.0.0"
+        assert summaries[0].owner == "Test Team"
+        assert summaries[0].status is None
+
+    def test_list_data_contracts_filtered(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that the listing filters are applied by the database."""
+        orders = sample_data_contract.model_copy(
+            update={
+                "id": "orders",
+                "tags": ["orders", "checkout"],
+                "servers": {
+                    "production": ServerObject(type="postgres", environment="prod"),
+                    "staging": ServerObject(type="s3", environment="stg"),
+                },
+            }
+        )
+        customers = sample_data_contract.model_copy(
+            update={
+                "id": "customers",
+                "info": sample_data_contract.info.model_copy(
+                    update={"owner": "CRM Team", "status": "active"}
+                ),
+                "tags": ["customers"],
+                "servers": {"production": ServerObject(type="s3", environment="prod")},
+            }
+        )
+        for contract in (orders, customers):
+            data_contract_crud.create_data_contract(db_session, contract)
+
+        def list_ids(**filters) -> list[str]:
+            contracts, _ = data_contract_crud.list_data_contracts(
+                db_session, filters=DataContractFilter(**filters)
+            )
+            return [contract.id for contract in contracts]
+
+        assert list_ids() == ["customers", "orders"]
+        assert list_ids(tag=["checkout"]) == ["orders"]
+        assert list_ids(tag=["orders", "customers"]) == []
+        assert list_ids(owner="CRM Team") == ["customers"]
+        assert list_ids(status="active") == ["customers"]
+        assert list_ids(server_type="s3") == ["customers", "orders"]
+        assert list_ids(server_type="s3", environment="prod") == ["customers"]
+        assert list_ids(server_type="postgres", tag=["customers"]) == []
+
+    def test_search_data_contracts(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test searching the data contracts by title, model, field names and descriptions."""
+        orders = sample_data_contract.model_copy(
+            update={
+                "id": "orders",
+                "models": {
+                    "line_items": ModelObject(
+                        type="table",
+                        fields={
+                            "sku": FieldObject(type="string", description="Stock keeping unit"),
+                            "shipping": FieldObject(
+                                type="object",
+                                fields={"carrier": FieldObject(type="string")},
+                            ),
+                        },
+                    )
+                },
+            }
+        )
+        customers = sample_data_contract.model_copy(
+            update={
+                "id": "customers",
+                "info": sample_data_contract.info.model_copy(update={"title": "Customers"}),
+            }
+        )
+        for contract in (orders, customers):
+            data_contract_crud.create_data_contract(db_session, contract)
+
+        def search_ids(q: str, **kwargs) -> list[str]:
+            results, _ = data_contract_crud.search_data_contracts(db_session, q, **kwargs)
+            return [result.id for result in results]
+
+        assert search_ids("line_items") == ["orders"]
+        assert search_ids("keeping unit") == ["orders"]
+        assert search_ids("carrier") == ["orders"]
+        assert search_ids("customers") == ["customers"]
+        assert search_ids("description") == ["customers", "orders"]
+        assert search_ids("sku customers") == []
+        assert search_ids("description -customers") == ["orders"]
+        assert search_ids('"keeping unit" -line_items') == []
+
+        page, cursor = data_contract_crud.search_data_contracts(db_session, "description", limit=1)
+        assert [result.id for result in page] == ["customers"]
+        assert page[0].title == "Customers"
+        page, cursor = data_contract_crud.search_data_contracts(
+            db_session, "description", limit=1, cursor=cursor
+        )
+        assert [result.id for result in page] == ["orders"]
+        assert cursor is None
+
+    def test_search_data_contracts_tied_ranks(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that paging through results of the same rank skips none of them."""
+        ids = [f"contract-{index}" for index in range(5)]
+        for contract_id in ids:
+            data_contract_crud.create_data_contract(
+                db_session, sample_data_contract.model_copy(update={"id": contract_id})
+            )
+
+        found, cursor = [], None
+        while True:
+            page, cursor = data_contract_crud.search_data_contracts(
+                db_session, "description", limit=2, cursor=cursor
+            )
+            found += [result.id for result in page]
+            if cursor is None:
+                break
+
+        assert found == ids
+
+    def test_search_rank_is_double_precision(self) -> None:
+        """Test that the PostgreSQL rank is compared as double precision, like the cursor."""
+        _, rank, _ = DataContractCRUD._search_clauses("postgresql", "orders")
+
+        compiled = str(rank.compile(dialect=postgresql.dialect()))
+
+        assert compiled.startswith("CAST(ts_rank_cd(")
+        assert compiled.endswith("AS DOUBLE PRECISION)")
+
+    def test_search_data_contracts_invalid_cursor(
+        self, db_session: Session, data_contract_crud: DataContractCRUD
+    ) -> None:
+        """Test that a cursor from another listing is rejected by the search."""
+        with pytest.raises(InvalidCursorError):
+            data_contract_crud.search_data_contracts(
+                db_session, "orders", cursor=encode_cursor("orders")
+            )
+
+    def test_index_data_contracts_for_search(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test backfilling the search columns of data contracts stored before search existed."""
+        created = data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        db_session.query(DataContractModel).update({DataContractModel.search_text: None})
+        db_session.commit()
+        assert data_contract_crud.search_data_contracts(db_session, "test")[0] == []
+
+        assert data_contract_crud.index_data_contracts_for_search(db_session) == 1
+        assert data_contract_crud.index_data_contracts_for_search(db_session) == 0
+
+        results, _ = data_contract_crud.search_data_contracts(db_session, "test")
+        assert [result.id for result in results] == [created.id]
+
+    def test_index_for_search_postgresql(self, mocker) -> None:
+        """Test that PostgreSQL search vectors weight each section of the contract."""
+        db = mocker.MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        db_data_contract = DataContractModel(
+            info={"title": "Orders", "description": "All orders"},
+            models={"orders": {"fields": {"sku": {"description": "Stock keeping unit"}}}},
+        )
+
+        DataContractCRUD._index_for_search(db, db_data_contract)
+
+        assert db_data_contract.search_text == "Orders\nAll orders\norders sku\nStock keeping unit"
+        sql = str(db_data_contract.search_vector.compile(dialect=postgresql.dialect()))
+        for weight in "ABCD":
+            assert f"'{weight}')" in sql
+
+    def test_bulk_create_data_contracts(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test creating data contracts in chunks, existing IDs being reported."""
+        existing = data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        data_contracts = [
+            sample_data_contract.model_copy(update={"id": f"bulk-{index}"}) for index in range(3)
+        ]
+
+        results = data_contract_crud.bulk_create_data_contracts(
+            db_session, [*data_contracts, sample_data_contract], chunk_size=2
+        )
+
+        assert results == {
+            "bulk-0": None,
+            "bulk-1": None,
+            "bulk-2": None,
+            existing.id: f" ❌ Data contract with id '{existing.id}' already exists",
+        }
+        retrieved, version = data_contract_crud.get_data_contract_with_version(db_session, "bulk-2")
+        assert retrieved.info.title == sample_data_contract.info.title
+        assert version.revision == 1
+        found, _ = data_contract_crud.search_data_contracts(db_session, "test")
+        assert len(found) == 4
+
+    def test_upsert_data_contract(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that upserting creates a data contract, then replaces it."""
+        created, version, was_created = data_contract_crud.upsert_data_contract(
+            db_session, sample_data_contract
+        )
+        assert was_created is True
+        assert version.revision == 1
+
+        replacement = sample_data_contract.model_copy(
+            update={"info": sample_data_contract.info.model_copy(update={"title": "Replaced"})}
+        )
+        replaced, new_version, was_created = data_contract_crud.upsert_data_contract(
+            db_session, replacement
+        )
+
+        assert was_created is False
+        assert new_version.revision == 2
+        assert replaced.info.title == "Replaced"
+        retrieved, stored_version = data_contract_crud.get_data_contract_with_version(
+            db_session, created.id
+        )
+        assert retrieved == replaced
+        assert stored_version == new_version
+        found, _ = data_contract_crud.search_data_contracts(db_session, "replaced")
+        assert [result.id for result in found] == [created.id]
+
+    def test_upsert_statement_postgresql(self) -> None:
+        """Test that PostgreSQL upserts replace the row and bump its revision in one statement."""
+        statement = DataContractCRUD._upsert_statement(postgresql=True)
+        sql = str(statement.compile(dialect=postgresql.dialect(), column_keys=["id", "info"]))
+
+        assert "ON CONFLICT (id) DO UPDATE SET" in sql
+        assert "info = excluded.info" in sql
+        assert "search_vector = excluded.search_vector" in sql
+        assert "revision = (data_contracts.revision + %(revision_1)s::INTEGER)" in sql
+        assert sql.endswith("RETURNING data_contracts.revision, data_contracts.updated_at")
+
+    def test_bulk_insert_statement_postgresql(self) -> None:
+        """Test that PostgreSQL bulk inserts skip existing IDs and compute the search vector."""
+        statement = DataContractCRUD._bulk_insert_statement(postgresql=True)
+        sql = str(statement.compile(dialect=postgresql.dialect(), column_keys=["id", "info"]))
+
+        assert sql.endswith(
+            "ON CONFLICT (id) DO NOTHING RETURNING data_contracts.id, data_contracts.updated_at"
+        )
+        for weight in "ABCD":
+            assert f"%(search_{weight})s" in sql
+            assert f"'{weight}')" in sql
+
+    def test_apply_data_contract_writes(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that batched writes are committed together, failed ones being rolled back alone."""
+        other = sample_data_contract.model_copy(update={"id": f"test-contract-{uuid.uuid4()}"})
+        replaced = sample_data_contract.model_copy(
+            update={"info": sample_data_contract.info.model_copy(update={"title": "Replaced"})}
+        )
+
+        results = data_contract_crud.apply_data_contract_writes(
+            db_session,
+            [
+                DataContractWrite("create", sample_data_contract),
+                DataContractWrite("create", sample_data_contract),
+                DataContractWrite("upsert", replaced),
+                DataContractWrite("upsert", other, parse_if_match("*")),
+                DataContractWrite("create", other),
+            ],
+        )
+
+        assert results[0].id == sample_data_contract.id
+        assert isinstance(results[1], DataContractOperationError)
+        assert results[2][1].revision == 2
+        assert isinstance(results[3], DataContractPreconditionFailedError)
+        assert results[4].id == other.id
+        stored = data_contract_crud.get_data_contract(db_session, sample_data_contract.id)
+        assert stored.info.title == "Replaced"
+        assert data_contract_crud.get_data_contract_version(db_session, other.id).revision == 1
+
+    def test_upsert_data_contracts(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that bulk upserts tell created data contracts from replaced ones."""
+        data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        replaced = sample_data_contract.model_copy(
+            update={"info": sample_data_contract.info.model_copy(update={"title": "Replaced"})}
+        )
+        other = sample_data_contract.model_copy(update={"id": f"test-contract-{uuid.uuid4()}"})
+
+        created = data_contract_crud.upsert_data_contracts(db_session, [replaced, other])
+
+        assert created == {sample_data_contract.id: False, other.id: True}
+        stored = data_contract_crud.get_data_contract(db_session, sample_data_contract.id)
+        assert stored.info.title == "Replaced"
+        assert data_contract_crud.get_data_contract_version(db_session, other.id).revision == 1
+        assert data_contract_crud.upsert_data_contracts(db_session, []) == {}
+
+    def test_patch_data_contract(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that merge patches write the touched sections and entries only."""
+        contract = sample_data_contract.model_copy(
+            update={
+                "servers": {
+                    "prod": ServerObject(type="postgres", host="prod", port=5432),
+                    "dev": ServerObject(type="postgres", host="dev", port=5432),
+                }
+            }
+        )
+        data_contract_crud.create_data_contract(db_session, contract)
+
+        version = data_contract_crud.patch_data_contract(
+            db_session,
+            contract.id,
+            {
+                "info": {"title": "Patched", "description": None},
+                "servers": {"dev": None, "test": {"type": "postgres", "host": "test"}},
+                "tags": ["patched"],
+            },
+        )
+
+        assert version.revision == 2
+        patched = data_contract_crud.get_data_contract(db_session, contract.id)
+        assert patched.info.title == "Patched"
+        assert patched.info.description is None
+        assert patched.info.owner == "Test Team"
+        assert set(patched.servers) == {"prod", "test"}
+        assert patched.servers["prod"].host == "prod"
+        assert patched.tags == ["patched"]
+        found, _ = data_contract_crud.search_data_contracts(db_session, "patched")
+        assert [result.id for result in found] == [contract.id]
+        # The canonical document is cleared by the patch, rebuilt by reads until backfilled
+        document, _ = data_contract_crud.get_data_contract_json(db_session, contract.id)
+        assert document.hash is None
+        assert json.loads(document.json) == json.loads(patched.model_dump_json(by_alias=True))
+        assert data_contract_crud.store_canonical_documents(db_session) == 1
+        stored, version = data_contract_crud.get_data_contract_json(db_session, contract.id)
+        assert stored == (document.json, document_hash(document.json))
+        assert version.revision == 2
+
+    def test_get_data_contract_json(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test reading canonical JSON, rebuilt for data contracts stored without it."""
+        created = data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        expected = json.loads(created.model_dump_json(by_alias=True))
+
+        document, version = data_contract_crud.get_data_contract_json(db_session, created.id)
+        assert json.loads(document.json) == expected
+        assert document.hash == document_hash(document.json)
+        assert version.revision == 1
+        with pytest.raises(DataContractNotFoundError):
+            data_contract_crud.get_data_contract_json(db_session, "missing")
+
+        db_session.execute(update(DataContractModel).values(document=None, document_hash=None))
+        db_session.commit()
+        document, _ = data_contract_crud.get_data_contract_json(db_session, created.id)
+        assert (json.loads(document.json), document.hash) == (expected, None)
+        assert [
+            json.loads(d.json) for d in data_contract_crud.stream_data_contract_json(db_session)
+        ] == [expected]
+
+        assert data_contract_crud.store_canonical_documents(db_session) == 1
+        assert data_contract_crud.store_canonical_documents(db_session) == 0
+        document, _ = data_contract_crud.get_data_contract_json(db_session, created.id)
+        assert document.hash == document_hash(document.json)
+
+    def test_migrate_legacy_references(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that field references stored under "ref" are rewritten to "$ref"."""
+        sample_data_contract.models = {
+            "orders": ModelObject(
+                type="table",
+                fields={"order_id": FieldObject(type="string", ref="#/definitions/order_id")},
+            )
+        }
+        created = data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        expected = json.loads(created.model_dump_json(by_alias=True))
+        # As stored before sections were dumped by alias
+        legacy_models = json.loads(json.dumps(expected["models"]).replace('"$ref"', '"ref"'))
+        db_session.execute(
+            update(DataContractModel).values(
+                models=legacy_models, document=None, document_hash=None
+            )
+        )
+        db_session.commit()
+        document, _ = data_contract_crud.get_data_contract_json(db_session, created.id)
+        assert "ref" in json.loads(document.json)["models"]["orders"]["fields"]["order_id"]
+
+        assert data_contract_crud.migrate_legacy_references(db_session) == 1
+        document, version = data_contract_crud.get_data_contract_json(db_session, created.id)
+        assert json.loads(document.json) == expected
+        assert document.hash == document_hash(document.json)
+        # The served document changed: its copies are no longer current
+        assert version.revision == 2
+        revision, _ = data_contract_crud._revisions.get_revision(db_session, created.id, 2)
+        assert revision == created
+        change = DataContractChangeCRUD.list_changes(db_session)[-1]
+        assert (change.op, change.id, change.revision) == ("update", created.id, 2)
+
+        # Once recorded as complete, the migration does not scan the data contracts again
+        db_session.execute(update(DataContractModel).values(models=legacy_models))
+        db_session.commit()
+        assert data_contract_crud.migrate_legacy_references(db_session) == 0
+        stored = db_session.get(DataContractModel, created.id)
+        db_session.refresh(stored)
+        assert stored.models == legacy_models
+
+    def test_store_canonical_documents_validates(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that the backfill stores what validation renders, not the legacy sections."""
+        sample_data_contract.models = {
+            "orders": ModelObject(
+                type="table",
+                fields={"order_id": FieldObject(type="string", ref="#/definitions/order_id")},
+            )
+        }
+        created = data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        expected = json.loads(created.model_dump_json(by_alias=True))
+        legacy_models = json.loads(json.dumps(expected["models"]).replace('"$ref"', '"ref"'))
+        db_session.execute(
+            update(DataContractModel).values(
+                models=legacy_models, document=None, document_hash=None
+            )
+        )
+        db_session.commit()
+
+        assert data_contract_crud.store_canonical_documents(db_session) == 1
+        document, version = data_contract_crud.get_data_contract_json(db_session, created.id)
+        assert json.loads(document.json) == expected
+        assert document.hash == document_hash(document.json)
+        assert version.revision == 2
+        stored = db_session.get(DataContractModel, created.id)
+        db_session.refresh(stored)
+        assert stored.models == expected["models"]
+        assert data_contract_crud.migrate_legacy_references(db_session) == 0
+
+    def test_json_patch_data_contract(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that JSON Patches are applied atomically, their tests guarding the write."""
+        data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        operations = [
+            {"op": "test", "path": "/info/version", "value": "1.0.0"},
+            {"op": "replace", "path": "/info/version", "value": "2.0.0"},
+            {"op": "add", "path": "/servers", "value": {}},
+            {"op": "add", "path": "/servers/prod", "value": {"type": "postgres"}},
+        ]
+
+        version = data_contract_crud.patch_data_contract(
+            db_session, sample_data_contract.id, operations, json_patch=True
+        )
+
+        assert version.revision == 2
+        patched = data_contract_crud.get_data_contract(db_session, sample_data_contract.id)
+        assert patched.info.version == "2.0.0"
+        assert patched.servers["prod"].type == "postgres"
+        with pytest.raises(PatchTestFailedError):
+            data_contract_crud.patch_data_contract(
+                db_session, sample_data_contract.id, operations[:2], json_patch=True
+            )
+
+    def test_patch_data_contract_errors(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that invalid patches leave the data contract unchanged."""
+        data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        id = sample_data_contract.id
+
+        with pytest.raises(PatchPathError):
+            data_contract_crud.patch_data_contract(db_session, id, {"id": "other"})
+        with pytest.raises(PatchPathError):
+            data_contract_crud.patch_data_contract(db_session, id, {"unknown": 1})
+        with pytest.raises(DataContractValidationError, match="/info/version"):
+            data_contract_crud.patch_data_contract(db_session, id, {"info": {"version": None}})
+        with pytest.raises(DataContractValidationError, match="/servers/prod"):
+            data_contract_crud.patch_data_contract(
+                db_session, id, {"servers": {"prod": {"port": "not a port"}}}
+            )
+
+        assert data_contract_crud.get_data_contract_version(db_session, id).revision == 1
+        assert data_contract_crud.patch_data_contract(db_session, "missing", {"tags": []}) is None
+
+    def test_patch_entries_postgresql(self) -> None:
+        """Test that PostgreSQL writes patched entries in place with jsonb_set."""
+        column = DataContractModel.servers
+        expression = DataContractCRUD._set_entry(column, "prod", {"type": "s3"}, True)
+        expression = DataContractCRUD._remove_entry(expression, "dev", True)
+        sql = str(expression.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("jsonb_set(coalesce(data_contracts.servers, CAST(")
+        assert "AS TEXT[])" in sql
+        assert sql.endswith("AS JSONB)) - CAST(%(param_4)s::VARCHAR AS TEXT)")
+
+    def test_filter_predicates_postgresql(self) -> None:
+        """Test that PostgreSQL filters use the indexable JSONB operators."""
+        predicates = DataContractCRUD._filter_predicates(
+            DataContractFilter(tag=["orders"], owner="Team", server_type='a"b', environment="prod"),
+            "postgresql",
+        )
+        compiled = [predicate.compile(dialect=postgresql.dialect()) for predicate in predicates]
+        sql = [str(statement) for statement in compiled]
+
+        assert sql[0] == "data_contracts.tags @> %(param_1)s::JSONB"
+        assert compiled[0].params == {"param_1": ["orders"]}
+        assert sql[1] == "(data_contracts.info ->> 'owner') = %(param_1)s::VARCHAR"
+        assert sql[2] == "data_contracts.servers @? CAST(%(param_1)s::VARCHAR AS JSONPATH)"
+        assert compiled[2].params == {
+            "param_1": '$.* ? (@.type == "a\\"b" && @.environment == "prod")'
+        }
+
+
+class TestAsyncDataContractCRUD:
+    """Test suite for asynchronous Data Contract CRUD operations."""
+
+    async def test_create_and_get_data_contract(
+        self, async_db_session: AsyncSession, sample_data_contract: DataContractCreate
+    ) -> None:
+        """Test creating then retrieving a data contract through the async session."""
+        crud = AsyncDataContractCRUD()
+
+        created = await crud.create_data_contract(async_db_session, sample_data_contract)
+        retrieved = await crud.get_data_contract(async_db_session, created.id)
+
+        assert retrieved.id == sample_data_contract.id
+        assert retrieved.info.title == sample_data_contract.info.title
+
+    async def test_list_and_delete_data_contract(
+        self, async_db_session: AsyncSession, sample_data_contract: DataContractCreate
+    ) -> None:
+        """Test listing then deleting a data contract through the async session."""
+        crud = AsyncDataContractCRUD()
+        created = await crud.create_data_contract(async_db_session, sample_data_contract)
+
+        contracts, next_cursor = await crud.list_data_contracts(async_db_session)
+        deleted = await crud.delete_data_contract(
+            async_db_session, DataContractDelete(id=created.id)
+        )
+
+        assert [contract.id for contract in contracts] == [created.id]
+        assert next_cursor is None
+        assert deleted is not None
+        with pytest.raises(DataContractNotFoundError):
+            await crud.get_data_contract(async_db_session, created.id)
+
+    async def test_stream_data_contracts(
+        self, async_db_session: AsyncSession, sample_data_contract: DataContractCreate
+    ) -> None:
+        """Test streaming every data contract by id, filters applying as in the listing."""
+        crud = AsyncDataContractCRUD()
+        for suffix in ("b", "a", "c"):
+            await crud.create_data_contract(
+                async_db_session, sample_data_contract.model_copy(update={"id": f"stream-{suffix}"})
+            )
+
+        streamed = [contract.id async for contract in crud.stream_data_contracts(async_db_session)]
+        filtered = [
+            contract.id
+            async for contract in crud.stream_data_contracts(
+                async_db_session, DataContractFilter(owner="Nobody")
+            )
+        ]
+
+        assert streamed == ["stream-a", "stream-b", "stream-c"]
+        assert filtered == []
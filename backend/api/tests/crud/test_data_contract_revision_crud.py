@@ -0,0 +1,158 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.crud.data_contract import DataContractCRUD
+from app.crud.data_contract_revision import DataContractRevisionCRUD
+from app.exceptions.crud.data_contract import DataContractRevisionNotFoundError
+from app.exceptions.utils.pagination import InvalidCursorError
+from app.models.data_contract_revision import DataContractRevision as DataContractRevisionModel
+from app.schemas.data_contract.objects.contact_object import ContactObject
+from app.schemas.data_contract.objects.info_object import InfoObject
+from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
+from app.schemas.data_contract.routes.data_contract_delete import DataContractDelete
+
+
+@pytest.fixture
+def revision_crud() -> DataContractRevisionCRUD:
+    """Creates a revision history taking a snapshot every 3 revisions."""
+    return DataContractRevisionCRUD(snapshot_interval=3)
+
+
+@pytest.fixture
+def data_contract_crud(revision_crud: DataContractRevisionCRUD) -> DataContractCRUD:
+    """Creates a DataContractCRUD instance recording its writes in the history."""
+    return DataContractCRUD(revisions=revision_crud)
+
+
+@pytest.fixture
+def sample_data_contract() -> DataContractCreate:
+    """Creates a sample data contract for testing."""
+    return DataContractCreate(
+        data_contract_specification="1.0.0",
+        id="test-contract-history",
+        info=InfoObject(
+            title="Revision 1",
+            version="1.0.0",
+            owner="Test Team",
+            contact=ContactObject(name="Test Contact", email="test@example.com"),
+        ),
+    )
+
+
+def _stored_revisions(db: Session, id: str) -> list[tuple[int, int | None]]:
+    """Lists the stored revisions of a data contract with their base snapshot."""
+    model = DataContractRevisionModel
+    return [
+        (row.revision, row.base_revision)
+        for row in db.execute(
+            select(model.revision, model.base_revision)
+            .where(model.data_contract_id == id)
+            .order_by(model.revision)
+        )
+    ]
+
+
+class TestDataContractRevisionCRUD:
+    """Test suite for the revision history of data contracts."""
+
+    def test_record_revisions(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that every write is recorded, as a snapshot every 3 revisions, a diff otherwise."""
+        id = sample_data_contract.id
+        data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        for title in ("Revision 2", "Revision 3", "Revision 4"):
+            data_contract_crud.patch_data_contract(db_session, id, {"info": {"title": title}})
+        replaced = sample_data_contract.model_copy(
+            update={"info": sample_data_contract.info.model_copy(update={"title": "Revision 5"})}
+        )
+        data_contract_crud.upsert_data_contract(db_session, replaced)
+        data_contract_crud.update_data_contract(db_session, id, sample_data_contract)
+        data_contract_crud.upsert_data_contracts(db_session, [replaced])
+
+        assert _stored_revisions(db_session, id) == [
+            (1, None),
+            (2, 1),
+            (3, 1),
+            (4, None),
+            (5, 4),
+            (6, 4),
+            (7, None),
+        ]
+
+    def test_get_revision(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        revision_crud: DataContractRevisionCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that revisions are rebuilt from their snapshot, as they were written."""
+        id = sample_data_contract.id
+        data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        data_contract_crud.patch_data_contract(
+            db_session, id, {"info": {"title": "Revision 2"}, "tags": ["history"]}
+        )
+        data_contract_crud.patch_data_contract(db_session, id, {"tags": None})
+
+        first, version = revision_crud.get_revision(db_session, id, 1)
+        second, _ = revision_crud.get_revision(db_session, id, 2)
+        third, _ = revision_crud.get_revision(db_session, id, 3)
+
+        assert first == data_contract_crud.get_data_contract(db_session, id).model_copy(
+            update={"info": sample_data_contract.info}
+        )
+        assert version.revision == 1
+        assert (second.info.title, second.tags) == ("Revision 2", ["history"])
+        assert third == data_contract_crud.get_data_contract(db_session, id)
+        with pytest.raises(DataContractRevisionNotFoundError):
+            revision_crud.get_revision(db_session, id, 4)
+
+    def test_list_revisions(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        revision_crud: DataContractRevisionCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that the history is paginated, latest revision first."""
+        id = sample_data_contract.id
+        data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        for index in range(4):
+            data_contract_crud.patch_data_contract(db_session, id, {"tags": [str(index)]})
+
+        page, cursor = revision_crud.list_revisions(db_session, id, limit=3)
+        rest, end = revision_crud.list_revisions(db_session, id, limit=3, cursor=cursor)
+
+        assert [revision.revision for revision in page] == [5, 4, 3]
+        assert [(revision.revision, revision.snapshot) for revision in rest] == [
+            (2, False),
+            (1, True),
+        ]
+        assert end is None
+        with pytest.raises(InvalidCursorError):
+            revision_crud.list_revisions(db_session, id, cursor="abc")
+
+    def test_delete_history(
+        self,
+        db_session: Session,
+        data_contract_crud: DataContractCRUD,
+        sample_data_contract: DataContractCreate,
+    ) -> None:
+        """Test that deleting a data contract deletes its history, which starts over."""
+        id = sample_data_contract.id
+        data_contract_crud.create_data_contract(db_session, sample_data_contract)
+        data_contract_crud.patch_data_contract(db_session, id, {"tags": ["x"]})
+
+        data_contract_crud.delete_data_contract(db_session, DataContractDelete(id=id))
+        assert _stored_revisions(db_session, id) == []
+
+        data_contract_crud.bulk_create_data_contracts(db_session, [sample_data_contract])
+        assert _stored_revisions(db_session, id) == [(1, None)]
+
+        data_contract_crud.bulk_delete_data_contracts(db_session, ids=[id])
+        assert _stored_revisions(db_session, id) == []
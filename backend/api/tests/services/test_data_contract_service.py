@@ -14,7 +14,7 @@ from app.schemas.data_contract.objects.info_object import InfoObject
 from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
 from app.schemas.data_contract.routes.data_contract_delete import DataContractDelete
 from app.schemas.data_contract.routes.data_contract_update import DataContractUpdate
-from app.services.data_contract import DataContractService
+from app.services.data_contract import AsyncDataContractService, DataContractService
 
 
 @pytest.fixture
@@ -125,6 +125,31 @@ class TestDataContractService:
             assert retrieved.id == sample_data_contract.id
             assert retrieved.info.title == sample_data_contract.info.title
 
+    def test_get_data_contract_cached(
+        self,
+        data_contract_service: DataContractService,
+        mock_db,
+        sample_data_contract: DataContractCreate,
+        db_data_contract: DataContractModel,
+        mock_db_session,
+    ):
+        """Test that reads are served from the cache until the data contract is written."""
+        with patch("app.services.data_contract.db_manager.get_db", mock_db):
+            mock_db_session.query.return_value.filter_by.return_value.first.return_value = (
+                db_data_contract
+            )
+            mock_db_session.execute.return_value.one_or_none.return_value = db_data_contract
+
+            first = data_contract_service.get_data_contract(sample_data_contract.id)
+            second = data_contract_service.get_data_contract(sample_data_contract.id)
+            assert second is first
+            assert mock_db_session.query.call_count == 1
+
+            data_contract_service.delete_data_contract(DataContractDelete(id=first.id))
+            mock_db_session.query.reset_mock()
+            data_contract_service.get_data_contract(sample_data_contract.id)
+            assert mock_db_session.query.call_count == 1
+
     def test_get_nonexistent_data_contract(
         self, data_contract_service: DataContractService, mock_db, mock_db_session
     ):
@@ -219,11 +244,41 @@ class TestDataContractService:
         """Test listing all data contracts through the service."""
         with patch("app.services.data_contract.db_manager.get_db", mock_db):
             # Setup mock
-            mock_db_session.query.return_value.all.return_value = [db_data_contract]
+            mock_db_session.query.return_value.order_by.return_value.limit.return_value.all.return_value = [
+                db_data_contract
+            ]
 
             # Execute
-            contracts = data_contract_service.list_data_contracts()
+            contracts, next_cursor = data_contract_service.list_data_contracts()
 
             # Verify
             assert len(contracts) >= 1
             assert contracts[0].id == db_data_contract.id
+            assert next_cursor is None
+
+
+class TestAsyncDataContractService:
+    """Test suite for asynchronous Data Contract Service operations."""
+
+    async def test_data_contract_lifecycle(
+        self, async_test_engine, sample_data_contract: DataContractCreate
+    ):
+        """Test the create, get, update, list and delete round trip through the async service."""
+        service = AsyncDataContractService()
+
+        created = await service.create_data_contract(sample_data_contract)
+        update_data = DataContractUpdate(
+            **{
+                **sample_data_contract.model_dump(),
+                "info": {**sample_data_contract.info.model_dump(), "title": "Updated Title"},
+            }
+        )
+        updated = await service.update_data_contract(created.id, update_data)
+        retrieved = await service.get_data_contract(created.id)
+        summaries, _ = await service.list_data_contract_summaries()
+        deleted = await service.delete_data_contract(DataContractDelete(id=created.id))
+
+        assert updated.info.title == "Updated Title"
+        assert retrieved.info.title == "Updated Title"
+        assert [summary.title for summary in summaries] == ["Updated Title"]
+        assert deleted.id == created.id
@@ -22,6 +22,7 @@ class TestTemplateService:
         """Create a TemplateService instance with the mock CRUD."""
         service = TemplateService()
         service._crud = mock_crud  # Injecter le mock CRUD
+        service._loaded = True  # Keep the template files out of the mock CRUD
         return service
 
     @pytest.fixture
@@ -94,6 +95,14 @@ class TestTemplateService:
         assert deleted == sample_template
         assert template_service.get_template(sample_template["id"]) is None
 
+    def test_templates_loaded_on_first_use(self):
+        """Test that the template files are only loaded when the templates are first used."""
+        service = TemplateService()
+
+        assert not service._loaded
+        assert service.list_templates()
+        assert service._loaded
+
     def test_list_templates(self, template_service: TemplateService, sample_template):
         """Test listing all templates through the service."""
         # Setup
@@ -0,0 +1,50 @@
+import asyncio
+
+from app.utils.batching import WriteCoalescer
+
+
+class TestWriteCoalescer:
+    """Test suite for the group-commit write coalescer."""
+
+    async def test_concurrent_writes_are_batched(self) -> None:
+        """Test that concurrent writes are flushed together, each caller getting its result."""
+        batches: list[list[int]] = []
+
+        async def flush(writes: list[int]) -> list[int | Exception]:
+            batches.append(writes)
+            return [write * 10 if write != 3 else ValueError(write) for write in writes]
+
+        coalescer = WriteCoalescer(flush, max_batch_size=4, max_delay=0.01)
+        results = await asyncio.gather(
+            *(coalescer.submit(write) for write in range(6)), return_exceptions=True
+        )
+
+        assert batches == [[0, 1, 2, 3], [4, 5]]
+        assert results[:3] == [0, 10, 20]
+        assert isinstance(results[3], ValueError)
+        assert results[4:] == [40, 50]
+        stats = coalescer.stats()
+        assert stats["batches"] == 2
+        assert stats["writes"] == 6
+        assert stats["mean_batch_size"] == 3.0
+        assert stats["batch_sizes"] == {"le_2": 1, "le_4": 1}
+
+    async def test_failed_flush_fails_every_write(self) -> None:
+        """Test that an error of the whole batch is raised to every caller."""
+
+        async def flush(writes: list[int]) -> list[int | Exception]:
+            raise ConnectionError
+
+        coalescer = WriteCoalescer(flush, max_batch_size=8, max_delay=0.001)
+
+        results = await asyncio.gather(
+            coalescer.submit(1), coalescer.submit(2), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert coalescer.stats()["batch_sizes"] == {"le_2": 1}
+
+    def test_disabled(self) -> None:
+        """Test that batches of one write disable coalescing."""
+        assert not WriteCoalescer(None, max_batch_size=1, max_delay=0.005).enabled
+        assert WriteCoalescer(None, max_batch_size=2, max_delay=0.005).enabled
@@ -0,0 +1,60 @@
+from collections.abc import AsyncIterator
+
+import msgpack
+import pytest
+
+from app.exceptions.utils.bulk import InvalidBulkBodyError, TooManyBulkItemsError
+from app.utils.bulk import is_ndjson, read_bulk_items
+
+
+async def _chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    """Yields the given chunks, as a request body stream would."""
+    for chunk in chunks:
+        yield chunk
+
+
+class TestBulk:
+    """Test suite for the bulk request body helpers."""
+
+    def test_is_ndjson(self) -> None:
+        """Test that NDJSON media types are recognized, with or without parameters."""
+        assert is_ndjson("application/x-ndjson")
+        assert is_ndjson("application/jsonl; charset=utf-8")
+        assert not is_ndjson("application/json")
+        assert not is_ndjson(None)
+
+    async def test_read_json_array(self) -> None:
+        """Test reading a JSON array received in several chunks."""
+        items = await read_bulk_items(_chunks(b'[{"id": "a"}, ', b'{"id": "b"}]'), False, 10)
+
+        assert items == [{"id": "a"}, {"id": "b"}]
+
+    async def test_read_ndjson(self) -> None:
+        """Test reading NDJSON whose lines are split across chunks, blank lines being skipped."""
+        items = await read_bulk_items(_chunks(b'{"id": "a"}\n\n{"id"', b': "b"}'), True, 10)
+
+        assert items == [{"id": "a"}, {"id": "b"}]
+
+    async def test_read_invalid_body(self) -> None:
+        """Test that malformed bodies are rejected."""
+        with pytest.raises(InvalidBulkBodyError):
+            await read_bulk_items(_chunks(b'{"id": "a"}'), False, 10)
+        with pytest.raises(InvalidBulkBodyError, match=r"\(line 2\)"):
+            await read_bulk_items(_chunks(b'{"id": "a"}\nnot json\n'), True, 10)
+
+    async def test_read_too_many_items(self) -> None:
+        """Test that bodies holding more items than allowed are rejected."""
+        with pytest.raises(TooManyBulkItemsError):
+            await read_bulk_items(_chunks(b"[1, 2, 3]"), False, 2)
+        with pytest.raises(TooManyBulkItemsError):
+            await read_bulk_items(_chunks(b"1\n2\n3"), True, 2)
+
+    async def test_read_msgpack_array(self) -> None:
+        """Test reading an array encoded by another codec, and rejecting one it cannot decode."""
+        body = msgpack.packb([{"id": "a"}, {"id": "b"}])
+
+        items = await read_bulk_items(_chunks(body[:5], body[5:]), False, 10, msgpack.unpackb)
+
+        assert items == [{"id": "a"}, {"id": "b"}]
+        with pytest.raises(InvalidBulkBodyError):
+            await read_bulk_items(_chunks(b"\xc1"), False, 10, msgpack.unpackb)
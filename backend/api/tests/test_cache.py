@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+from app.utils.cache import LRUCache
+
+
+class TestLRUCache:
+    """Test suite for the LRUCache class."""
+
+    def test_hit_and_miss(self) -> None:
+        """Test that lookups are counted as hits or misses."""
+        cache: LRUCache[str] = LRUCache(maxsize=2)
+        cache.set("a", "A")
+
+        assert cache.get("a") == "A"
+        assert cache.get("b") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_least_recently_used_eviction(self) -> None:
+        """Test that the least recently used entry is evicted when the cache is full."""
+        cache: LRUCache[str] = LRUCache(maxsize=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["size"] == 2
+
+    def test_expiry(self) -> None:
+        """Test that entries older than the time to live are dropped."""
+        cache: LRUCache[str] = LRUCache(maxsize=2, ttl=10)
+        with patch("app.utils.cache.monotonic", return_value=100.0):
+            cache.set("a", "A")
+        with patch("app.utils.cache.monotonic", return_value=105.0):
+            assert cache.get("a") == "A"
+        with patch("app.utils.cache.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["size"] == 0
+
+    def test_invalidation_discards_stale_reads(self) -> None:
+        """Test that a value read before an invalidation is not stored."""
+        cache: LRUCache[str] = LRUCache(maxsize=2)
+        generation = cache.generation
+        cache.invalidate("a")
+
+        assert cache.set("a", "stale", generation) is False
+        assert cache.get("a") is None
+        assert cache.set("a", "fresh", cache.generation) is True
+        assert cache.get("a") == "fresh"
+
+    def test_disabled(self) -> None:
+        """Test that a cache without capacity stores nothing."""
+        cache: LRUCache[str] = LRUCache(maxsize=0)
+
+        assert cache.set("a", "A") is False
+        assert cache.get("a") is None
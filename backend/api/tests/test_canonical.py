@@ -0,0 +1,46 @@
+import json
+import zlib
+
+import pytest
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.utils.canonical import canonical_columns, read_canonical
+from app.utils.config import settings
+from app.utils.tools import data_contract_columns
+from app.utils.trusted import document_hash
+
+
+@pytest.fixture
+def columns() -> dict:
+    """The section columns of the example data contract."""
+    return data_contract_columns(DataContract.model_validate(DataContract.get_example()))
+
+
+class TestCanonicalDocuments:
+    """Test suite for the canonical JSON stored with the sections of data contracts."""
+
+    def test_canonical_json(self, columns: dict) -> None:
+        """Test that the canonical JSON is the serialized model, hashed, and read back as is."""
+        stored = canonical_columns(columns)
+        expected = DataContract.model_validate(columns).model_dump_json(by_alias=True).encode()
+
+        assert json.loads(stored["document"]) == json.loads(expected)
+        assert stored["document_hash"] == document_hash(stored["document"])
+        assert read_canonical(stored) == (stored["document"], stored["document_hash"])
+
+    def test_compression(self, columns: dict, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that documents reaching the threshold are stored compressed."""
+        monkeypatch.setattr(settings, "DATA_CONTRACT_DOCUMENT_COMPRESSION_THRESHOLD", 64)
+        stored = canonical_columns(columns)
+        json_document = zlib.decompress(stored["document"])
+
+        assert len(stored["document"]) < len(json_document)
+        assert stored["document_hash"] == document_hash(json_document)
+        assert read_canonical(stored).json == json_document
+
+    def test_missing_document(self, columns: dict) -> None:
+        """Test that a data contract stored without canonical JSON has it rebuilt."""
+        document = read_canonical({**columns, "document": None, "document_hash": None})
+
+        assert document.hash is None
+        assert document.json == canonical_columns(columns)["document"]
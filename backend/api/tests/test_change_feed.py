@@ -0,0 +1,71 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import pytest
+
+from app.schemas.data_contract.objects.data_contract_change import DataContractChange
+from app.utils import change_feed
+from app.utils.change_feed import (
+    accepts_event_stream,
+    parse_last_event_id,
+    serialize_change_events,
+)
+
+
+def _change(offset: int, op: str = "update") -> DataContractChange:
+    """Builds a change of the feed."""
+    return DataContractChange(
+        offset=offset,
+        op=op,
+        id=f"contract-{offset}",
+        revision=None if op == "delete" else 2,
+        created_at=datetime(2024, 5, 1, tzinfo=UTC),
+    )
+
+
+async def _batches(*batches: list[DataContractChange]) -> AsyncIterator[list[DataContractChange]]:
+    """Yields batches of changes, as the polling of the feed would."""
+    for batch in batches:
+        yield batch
+
+
+class TestChangeFeed:
+    """Test suite for the Server-Sent Events serialization of the change feed."""
+
+    def test_accepts_event_stream(self) -> None:
+        """Test that Server-Sent Events are only served to clients asking for them."""
+        assert accepts_event_stream("text/event-stream")
+        assert accepts_event_stream("application/json;q=0.5, text/event-stream; q=1")
+        assert not accepts_event_stream("application/json")
+        assert not accepts_event_stream(None)
+
+    def test_parse_last_event_id(self) -> None:
+        """Test that only offsets are resumed from."""
+        assert parse_last_event_id("42") == 42
+        assert parse_last_event_id("abc") is None
+        assert parse_last_event_id(None) is None
+
+    async def test_serialize_change_events(self) -> None:
+        """Test that each change is one event, identified by its offset."""
+        chunks = [
+            chunk
+            async for chunk in serialize_change_events(
+                _batches([], [_change(1), _change(2, "delete")], [])
+            )
+        ]
+
+        assert chunks[0] == b"retry: 3000\n\n"
+        events = chunks[1].decode().split("\n\n")
+        assert events[0].startswith("id: 1\nevent: update\ndata: {")
+        assert events[1].startswith("id: 2\nevent: delete\ndata: {")
+        assert DataContractChange.model_validate_json(events[1].split("data: ")[1]).revision is None
+        assert len(chunks) == 2
+
+    async def test_heartbeat(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an idle stream gets comment lines to keep it open."""
+        monkeypatch.setattr(change_feed, "SSE_HEARTBEAT_INTERVAL", 0)
+
+        chunks = [chunk async for chunk in serialize_change_events(_batches([_change(1)], [], []))]
+
+        assert chunks[0].startswith(b"retry: 3000\n\nid: 1\n")
+        assert chunks[1:] == [b": keep-alive\n\n", b": keep-alive\n\n"]
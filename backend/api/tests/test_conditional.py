@@ -0,0 +1,76 @@
+from datetime import UTC, datetime, timedelta
+
+from app.utils.conditional import (
+    ResourceVersion,
+    is_not_modified,
+    list_etag,
+    parse_etag,
+    parse_if_match,
+)
+
+
+UPDATED_AT = datetime(2024, 5, 1, 12, 30, 15, 250000, tzinfo=UTC)
+
+
+class TestConditional:
+    """Test suite for the conditional request helpers."""
+
+    def test_resource_version_validators(self) -> None:
+        """Test that the validators depend on the revision and the modification time."""
+        version = ResourceVersion(3, UPDATED_AT)
+
+        assert version.etag.startswith('"3-') and version.etag.endswith('"')
+        assert version.etag != ResourceVersion(4, UPDATED_AT).etag
+        assert version.etag != ResourceVersion(3, UPDATED_AT + timedelta(microseconds=1)).etag
+        assert version.etag == ResourceVersion(3, UPDATED_AT.replace(tzinfo=None)).etag
+        assert version.last_modified == "Wed, 01 May 2024 12:30:15 GMT"
+
+    def test_parse_etag(self) -> None:
+        """Test that the version is read back exactly from strong entity tags only."""
+        version = ResourceVersion(3, UPDATED_AT)
+
+        assert parse_etag(version.etag) == version
+        assert parse_etag(f"W/{version.etag}") is None
+        assert parse_etag('"not-a-version"') is None
+
+    def test_if_match(self) -> None:
+        """Test that If-Match is evaluated with the strong comparison function."""
+        version = ResourceVersion(2, UPDATED_AT)
+        naive = ResourceVersion(2, UPDATED_AT.replace(tzinfo=None))
+
+        assert parse_if_match(None) is None
+        assert parse_if_match("*").matches(version)
+        assert not parse_if_match("*").matches(None)
+        assert parse_if_match(f'"other", {version.etag}').matches(naive)
+        assert not parse_if_match(f"W/{version.etag}").matches(version)
+        assert not parse_if_match(ResourceVersion(1, UPDATED_AT).etag).matches(version)
+
+    def test_if_none_match(self) -> None:
+        """Test that If-None-Match is evaluated with the weak comparison function."""
+        etag = ResourceVersion(1, UPDATED_AT).etag
+
+        assert is_not_modified(etag, None, etag, None)
+        assert is_not_modified(etag, None, f'"other", W/{etag}', None)
+        assert is_not_modified(etag, None, "*", None)
+        assert not is_not_modified(etag, None, '"other"', None)
+
+    def test_if_modified_since(self) -> None:
+        """Test that If-Modified-Since is evaluated with a one second precision."""
+        version = ResourceVersion(1, UPDATED_AT)
+
+        assert is_not_modified(version.etag, UPDATED_AT, None, version.last_modified)
+        assert not is_not_modified(version.etag, UPDATED_AT, None, "Wed, 01 May 2024 12:30:14 GMT")
+        assert not is_not_modified(version.etag, UPDATED_AT, None, "not a date")
+        # If-None-Match takes precedence
+        assert not is_not_modified(version.etag, UPDATED_AT, '"other"', version.last_modified)
+
+    def test_list_etag(self) -> None:
+        """Test that the list entity tag changes with the view and the items of the page."""
+        versions = [("a", 1, UPDATED_AT), ("b", 2, UPDATED_AT)]
+        etag = list_etag("full", versions, False)
+
+        assert etag == list_etag("full", list(versions), False)
+        assert etag != list_etag("summary", versions, False)
+        assert etag != list_etag("full", versions, True)
+        assert etag != list_etag("full", versions[:1], False)
+        assert etag != list_etag("full", [("a", 2, UPDATED_AT), versions[1]], False)
@@ -0,0 +1,172 @@
+import cbor2
+import msgpack
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+
+from app.exceptions.utils.content import InvalidRequestBodyError
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.schemas.data_contract.routes.data_contract_get import DataContractGetResponse
+from app.utils import content
+from app.utils.content import (
+    CBOR_MEDIA_TYPE,
+    CODECS,
+    MSGPACK_MEDIA_TYPE,
+    NegotiatedGZipMiddleware,
+    NegotiatedRoute,
+    decode_body,
+    encode_map,
+    media_type,
+    negotiate_media_type,
+)
+from app.utils.responses import PydanticJSONResponse
+
+
+def _client() -> TestClient:
+    """Serves routes reading and writing data contracts through a negotiated router."""
+    router = APIRouter(route_class=NegotiatedRoute)
+
+    @router.post("/echo", response_model=DataContractGetResponse, status_code=201)
+    async def echo(data_contract: DataContract) -> PydanticJSONResponse:
+        return PydanticJSONResponse(
+            DataContractGetResponse(message=" ✅ Echoed", data=data_contract),
+            status_code=201,
+            headers={"ETag": '"1-0"'},
+        )
+
+    @router.get("/stream")
+    async def stream() -> StreamingResponse:
+        return StreamingResponse(iter([b"{}\n"]), media_type="application/x-ndjson")
+
+    @router.get("/large")
+    async def large() -> dict[str, str]:
+        return {"padding": "x" * 2000}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(NegotiatedGZipMiddleware, minimum_size=1000)
+    return TestClient(app)
+
+
+class TestContentNegotiation:
+    """Test suite for reading and writing MessagePack and CBOR besides JSON."""
+
+    def test_media_type(self) -> None:
+        """Test that parameters are dropped, and aliases mapped to the registered type."""
+        assert media_type("application/JSON; charset=utf-8") == "application/json"
+        assert media_type("application/x-msgpack") == MSGPACK_MEDIA_TYPE
+        assert media_type(None) is None
+
+    @pytest.mark.parametrize(
+        ("accept", "expected"),
+        [
+            (None, None),
+            ("*/*", None),
+            ("application/msgpack", MSGPACK_MEDIA_TYPE),
+            ("application/json, application/cbor", None),
+            ("application/json;q=0.5, application/cbor", CBOR_MEDIA_TYPE),
+            ("application/msgpack;q=0.2, application/json;q=0.9", None),
+            ("text/html, application/x-msgpack;q=0.1", MSGPACK_MEDIA_TYPE),
+            ("application/msgpack;q=0", None),
+        ],
+    )
+    def test_negotiate_media_type(self, accept: str | None, expected: str | None) -> None:
+        """Test that the preferred supported media type is picked, JSON winning ties."""
+        assert negotiate_media_type(accept) == expected
+
+    @pytest.mark.parametrize("content_type", [MSGPACK_MEDIA_TYPE, CBOR_MEDIA_TYPE])
+    @pytest.mark.parametrize("size", [2, 30, 300])
+    def test_encode_map(self, content_type: str, size: int) -> None:
+        """Test that maps spliced from encoded values are the ones encoded at once."""
+        codec = CODECS[content_type]
+        values = {f"key_{i}": i for i in range(size - 1)}
+        document = {"id": "urn:test", "tags": ["a", "b"]}
+
+        encoded = encode_map(content_type, values, {"data": codec.dumps(document)})
+
+        assert encoded == codec.dumps(values | {"data": document})
+
+    def test_decode_invalid_body(self) -> None:
+        """Test that malformed bodies are rejected."""
+        with pytest.raises(InvalidRequestBodyError, match="msgpack"):
+            decode_body(b"\xc1", MSGPACK_MEDIA_TYPE)
+        with pytest.raises(InvalidRequestBodyError, match="cbor"):
+            decode_body(b"\x1c", CBOR_MEDIA_TYPE)
+
+    @pytest.mark.parametrize(
+        ("content_type", "dumps", "loads"),
+        [
+            (MSGPACK_MEDIA_TYPE, msgpack.packb, msgpack.unpackb),
+            (CBOR_MEDIA_TYPE, cbor2.dumps, cbor2.loads),
+        ],
+    )
+    def test_round_trip(self, content_type: str, dumps: object, loads: object) -> None:
+        """Test that a binary request and response hold the same values as their JSON ones."""
+        client = _client()
+        data_contract = DataContract.model_validate(DataContract.get_example())
+        example = client.post(
+            "/echo",
+            content=data_contract.model_dump_json(by_alias=True),
+            headers={"Content-Type": "application/json"},
+        ).json()["data"]
+
+        response = client.post(
+            "/echo",
+            content=dumps(example),
+            headers={"Content-Type": content_type, "Accept": content_type},
+        )
+
+        assert (response.status_code, response.headers["etag"]) == (201, '"1-0"')
+        assert response.headers["content-type"] == content_type
+        assert response.headers["vary"] == "Accept"
+        assert loads(response.content)["data"] == example
+
+    def test_models_encoded(self, mocker: MockerFixture) -> None:
+        """Test that response models are encoded from their values, not transcoded from JSON."""
+        encode_json = mocker.spy(content, "encode_json")
+        data_contract = DataContract.model_validate(DataContract.get_example())
+
+        response = _client().post(
+            "/echo",
+            content=data_contract.model_dump_json(by_alias=True),
+            headers={"Content-Type": "application/json", "Accept": MSGPACK_MEDIA_TYPE},
+        )
+
+        assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        assert msgpack.unpackb(response.content)["data"] == data_contract.model_dump(
+            mode="json", by_alias=True
+        )
+        assert encode_json.call_count == 0
+
+    def test_binary_responses_uncompressed(self) -> None:
+        """Test that only the responses negotiated in JSON are compressed."""
+        client = _client()
+        gzip = {"Accept-Encoding": "gzip"}
+
+        compressed = client.get("/large", headers=gzip)
+        uncompressed = client.get("/large", headers=gzip | {"Accept": MSGPACK_MEDIA_TYPE})
+
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in uncompressed.headers
+        assert msgpack.unpackb(uncompressed.content) == compressed.json()
+
+    def test_json_responses_kept(self) -> None:
+        """Test that errors and streams stay as they are, and malformed bodies are rejected."""
+        client = _client()
+        accept = {"Accept": MSGPACK_MEDIA_TYPE}
+
+        invalid = client.post(
+            "/echo",
+            content=msgpack.packb({"id": 1}),
+            headers=accept | {"Content-Type": MSGPACK_MEDIA_TYPE},
+        )
+        malformed = client.post(
+            "/echo", content=b"\xc1", headers={"Content-Type": MSGPACK_MEDIA_TYPE}
+        )
+        stream = client.get("/stream", headers=accept)
+
+        assert (invalid.status_code, invalid.headers["content-type"]) == (422, "application/json")
+        assert malformed.status_code == 400
+        assert stream.headers["content-type"] == "application/x-ndjson"
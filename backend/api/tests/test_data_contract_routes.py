@@ -0,0 +1,218 @@
+from typing import Any
+
+import msgpack
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.utils.config import settings
+from app.utils.content import MSGPACK_MEDIA_TYPE
+
+
+def _document(id: str) -> dict[str, Any]:
+    """Builds the JSON document of a valid data contract."""
+    document = DataContract.model_validate(DataContract.get_example()).model_dump(
+        mode="json", by_alias=True, exclude_none=True
+    )
+    return {**document, "id": id}
+
+
+@pytest.fixture
+async def stored(api_client: AsyncClient) -> list[str]:
+    """Stores two data contracts through the API."""
+    ids = ["urn:test:a", "urn:test:b"]
+    for id in ids:
+        response = await api_client.post("/data_contract/", json=_document(id))
+        assert response.status_code == 201
+    return ids
+
+
+class TestConditionalGet:
+    """Test suite for the entity tags and conditional requests of the read routes."""
+
+    async def test_get_not_modified(self, api_client: AsyncClient, stored: list[str]) -> None:
+        """Test that a data contract is not sent again while it is unchanged."""
+        response = await api_client.get(f"/data_contract/{stored[0]}")
+        etag, last_modified = response.headers["ETag"], response.headers["Last-Modified"]
+        assert response.status_code == 200
+
+        for headers in ({"If-None-Match": etag}, {"If-Modified-Since": last_modified}):
+            response = await api_client.get(f"/data_contract/{stored[0]}", headers=headers)
+            assert response.status_code == 304
+            assert response.headers["ETag"] == etag
+            assert not response.content
+
+        response = await api_client.get(
+            f"/data_contract/{stored[0]}", headers={"If-None-Match": '"0-stale"'}
+        )
+        assert response.status_code == 200
+        assert response.json()["data"]["id"] == stored[0]
+
+    async def test_get_msgpack(self, api_client: AsyncClient, stored: list[str]) -> None:
+        """Test that a data contract negotiated in MessagePack holds the values of its JSON."""
+        expected = (await api_client.get(f"/data_contract/{stored[0]}")).json()
+
+        for _ in range(2):
+            response = await api_client.get(
+                f"/data_contract/{stored[0]}", headers={"Accept": MSGPACK_MEDIA_TYPE}
+            )
+            assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+            assert msgpack.unpackb(response.content) == expected
+
+    async def test_get_modified(self, api_client: AsyncClient, stored: list[str]) -> None:
+        """Test that an updated data contract is sent again, with a new entity tag."""
+        etag = (await api_client.get(f"/data_contract/{stored[0]}")).headers["ETag"]
+        document = {**_document(stored[0]), "tags": ["updated"]}
+        assert (await api_client.put(f"/data_contract/{stored[0]}", json=document)).is_success
+
+        response = await api_client.get(
+            f"/data_contract/{stored[0]}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    @pytest.mark.parametrize("view", ["full", "summary"])
+    async def test_list_not_modified(
+        self, api_client: AsyncClient, stored: list[str], view: str
+    ) -> None:
+        """Test that the entity tag sent with a page is the one its conditional request checks."""
+        response = await api_client.get("/data_contract/", params={"view": view})
+        etag = response.headers["ETag"]
+        assert response.status_code == 200
+        assert [contract["id"] for contract in response.json()["data"]] == stored
+
+        response = await api_client.get(
+            "/data_contract/", params={"view": view}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    async def test_list_modified(self, api_client: AsyncClient, stored: list[str]) -> None:
+        """Test that a page is sent again once one of its data contracts changes."""
+        etag = (await api_client.get("/data_contract/")).headers["ETag"]
+        document = {**_document(stored[1]), "tags": ["updated"]}
+        assert (await api_client.put(f"/data_contract/{stored[1]}", json=document)).is_success
+
+        response = await api_client.get("/data_contract/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    async def test_list_etag_per_page(self, api_client: AsyncClient, stored: list[str]) -> None:
+        """Test that the pages and views of the same data contracts have distinct entity tags."""
+        etags = {
+            (await api_client.get("/data_contract/", params=params)).headers["ETag"]
+            for params in ({}, {"view": "summary"}, {"limit": 1})
+        }
+        assert len(etags) == 3
+
+
+class TestListRoute:
+    """Test suite for the data contract list route."""
+
+    async def test_list_trusted(
+        self,
+        api_client: AsyncClient,
+        stored: list[str],
+        monkeypatch: pytest.MonkeyPatch,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that the full view sends the stored documents without validating them."""
+        monkeypatch.setattr(settings, "DATA_CONTRACT_READ_VERIFY_INTERVAL", 0)
+        model_validate = mocker.spy(DataContract, "model_validate")
+
+        response = await api_client.get("/data_contract/", params={"limit": 1})
+        assert response.status_code == 200
+        assert model_validate.call_count == 0
+        body = response.json()
+        assert body["data"] == [
+            DataContract.model_validate(_document(stored[0])).model_dump(mode="json", by_alias=True)
+        ]
+        assert body["next_cursor"] is not None
+
+        response = await api_client.get("/data_contract/", params={"cursor": body["next_cursor"]})
+        assert [contract["id"] for contract in response.json()["data"]] == stored[1:]
+        assert response.json()["next_cursor"] is None
+
+    async def test_list_msgpack(self, api_client: AsyncClient, stored: list[str]) -> None:
+        """Test that a page negotiated in MessagePack holds the values of the JSON one."""
+        expected = (await api_client.get("/data_contract/")).json()
+
+        response = await api_client.get("/data_contract/", headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+        assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        assert msgpack.unpackb(response.content) == expected
+
+    async def test_list_untrusted(
+        self, api_client: AsyncClient, stored: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the validated documents are the same as the trusted ones."""
+        trusted = (await api_client.get("/data_contract/")).json()
+        monkeypatch.setattr(settings, "DATA_CONTRACT_TRUSTED_READS", False)
+        assert (await api_client.get("/data_contract/")).json() == trusted
+
+
+class TestPatchRoute:
+    """Test suite for the data contract patch route."""
+
+    async def test_merge_patch(self, api_client: AsyncClient, stored: list[str]) -> None:
+        """Test that a patch returns the new revision with validators matching a later read."""
+        etag = (await api_client.get(f"/data_contract/{stored[0]}")).headers["ETag"]
+
+        response = await api_client.patch(
+            f"/data_contract/{stored[0]}",
+            content=b'{"tags": ["patched"]}',
+            headers={"Content-Type": "application/merge-patch+json", "If-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.json()["revision"] == 2
+        assert response.headers["ETag"] != etag
+
+        read = await api_client.get(f"/data_contract/{stored[0]}")
+        assert read.headers["ETag"] == response.headers["ETag"]
+        assert read.headers["Last-Modified"] == response.headers["Last-Modified"]
+        assert read.json()["data"]["tags"] == ["patched"]
+
+    @pytest.mark.parametrize("content_type", ["text/plain", "application/msgpack"])
+    async def test_unsupported_media_type(
+        self, api_client: AsyncClient, stored: list[str], content_type: str
+    ) -> None:
+        """Test that bodies in other media types than the patch formats are rejected."""
+        response = await api_client.patch(
+            f"/data_contract/{stored[0]}",
+            content=b"\x81\xa4tags\x90",
+            headers={"Content-Type": content_type},
+        )
+        assert response.status_code == 415
+        assert "application/json-patch+json" in response.headers["Accept-Patch"]
+
+    async def test_stale_if_match(self, api_client: AsyncClient, stored: list[str]) -> None:
+        """Test that a patch based on an outdated revision is not applied."""
+        etag = (await api_client.get(f"/data_contract/{stored[0]}")).headers["ETag"]
+        patch = {"Content-Type": "application/merge-patch+json", "If-Match": etag}
+        first = await api_client.patch(
+            f"/data_contract/{stored[0]}", content=b'{"tags": ["first"]}', headers=patch
+        )
+        assert first.status_code == 200
+
+        response = await api_client.patch(
+            f"/data_contract/{stored[0]}", content=b'{"tags": ["second"]}', headers=patch
+        )
+        assert response.status_code == 412
+        read = await api_client.get(f"/data_contract/{stored[0]}")
+        assert read.json()["data"]["tags"] == ["first"]
+
+    async def test_failed_test_operation(self, api_client: AsyncClient, stored: list[str]) -> None:
+        """Test that a JSON Patch whose 'test' operation fails is not applied."""
+        etag = (await api_client.get(f"/data_contract/{stored[0]}")).headers["ETag"]
+
+        response = await api_client.patch(
+            f"/data_contract/{stored[0]}",
+            json=[
+                {"op": "test", "path": "/info/version", "value": "0.0.0"},
+                {"op": "replace", "path": "/info/version", "value": "2.0.0"},
+            ],
+            headers={"Content-Type": "application/json-patch+json"},
+        )
+        assert response.status_code == 409
+        assert (await api_client.get(f"/data_contract/{stored[0]}")).headers["ETag"] == etag
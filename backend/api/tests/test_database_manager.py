@@ -2,10 +2,11 @@ from unittest.mock import MagicMock
 
 import pytest
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.database.dsn import PostgresDSN
 from app.database.manager import DatabaseManager
+from app.database.pool import PoolStatistics
 from app.exceptions import DatabaseInitializationError
 
 
@@ -124,18 +125,76 @@ class TestDatabaseManager:
         mock_session = MagicMock()
         db_manager.SessionLocal = MagicMock(return_value=mock_session)
 
-        # Mock the text function
-        mock_text = mocker.patch("app.database.manager.text")
-        mock_text.return_value = "SELECT 1"  # Simulating the SQL text object
-
-        # Make the session raise an OperationalError when trying to use it
-        mock_session.execute = MagicMock(side_effect=OperationalError("mock error", None, None))
+        # Make the session raise an OperationalError when checking out a connection
+        mock_session.connection = MagicMock(side_effect=OperationalError("mock error", None, None))
 
         with pytest.raises(OperationalError):
             db_manager.get_db()
 
-        # Verify the session was closed
+        # Verify the session was closed and no probe query was issued
         mock_session.close.assert_called_once()
+        mock_session.execute.assert_not_called()
+
+    def test_get_db_records_pool_statistics(self, test_engine) -> None:
+        """
+        Test that checking out a session feeds the pool statistics.
+        """
+        db_manager = DatabaseManager()
+        db_manager.engine = test_engine
+        db_manager.SessionLocal = sessionmaker(bind=test_engine)
+        db_manager.pool_stats = PoolStatistics()
+        db_manager._register_pool_listeners(test_engine, db_manager.pool_stats)
+
+        session = db_manager.get_db()
+        assert db_manager.pool_stats.checked_out == 1
+        session.close()
 
-        # Verify execute was called with the right SQL
-        mock_session.execute.assert_called_once_with("SELECT 1")
+        stats = db_manager.pool_stats.snapshot()
+        assert stats["checkouts"] == 1
+        assert stats["checkins"] == 1
+        assert stats["checked_out"] == 0
+        assert stats["peak_checked_out"] == 1
+        assert stats["max_wait_ms"] >= 0
+
+    def test_pool_options_from_settings(self, mocker) -> None:
+        """
+        Test that the pool options are read from the settings.
+        """
+        mocker.patch.multiple(
+            "app.database.manager.settings",
+            DB_POOL_SIZE=20,
+            DB_MAX_OVERFLOW=0,
+            DB_POOL_TIMEOUT=5,
+            DB_POOL_RECYCLE=600,
+            DB_POOL_PRE_PING=False,
+            DB_POOL_USE_LIFO=True,
+        )
+
+        assert DatabaseManager._pool_options() == {
+            "pool_size": 20,
+            "max_overflow": 0,
+            "pool_timeout": 5,
+            "pool_recycle": 600,
+            "pool_pre_ping": False,
+            "pool_use_lifo": True,
+        }
+
+    def test_setup_lock(self, db_manager: DatabaseManager) -> None:
+        """Test that the setup holds an advisory lock on PostgreSQL for the whole block."""
+        engine = db_manager.engine
+        db_manager.engine = MagicMock()
+        db_manager.engine.dialect.name = "postgresql"
+        conn = db_manager.engine.connect.return_value.__enter__.return_value
+        try:
+            with db_manager.setup_lock():
+                statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+                assert statements == ["SELECT pg_advisory_lock(:key)"]
+            statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+            assert statements[-1] == "SELECT pg_advisory_unlock(:key)"
+        finally:
+            db_manager.engine = engine
+
+    def test_setup_lock_sqlite(self, db_manager: DatabaseManager) -> None:
+        """Test that the setup takes no lock on other databases."""
+        with db_manager.setup_lock():
+            pass
@@ -0,0 +1,45 @@
+from pydantic import Field
+
+from app.schemas.data_contract.objects.field_object import FieldObject
+from app.schemas.data_contract.objects.model_object import ModelObject
+from app.utils.example_model import BaseModelWithExample, LazyExample, resolve_examples
+
+
+class TestLazyExample:
+    """Test suite for the examples built when they are requested."""
+
+    def test_built_on_request(self) -> None:
+        """Test that a lazy example is only built by the JSON schema or `get_example`."""
+        calls = []
+
+        class Lazy(BaseModelWithExample):
+            name: str = Field(json_schema_extra=LazyExample(lambda: calls.append(1) or "x"))
+
+        assert calls == []
+        assert Lazy.get_example() == {"name": "x"}
+        assert Lazy.model_json_schema()["properties"]["name"]["example"] == "x"
+        assert len(calls) == 2
+
+    def test_schema_matches_eager_example(self) -> None:
+        """Test that model examples are rendered in the JSON schema like eager ones."""
+        example = {"id": FieldObject(type="string", description="Identifier")}
+
+        class Eager(BaseModelWithExample):
+            fields: dict[str, FieldObject] = Field(json_schema_extra={"example": example})
+
+        class Lazy(BaseModelWithExample):
+            fields: dict[str, FieldObject] = Field(json_schema_extra=LazyExample(lambda: example))
+
+        assert Lazy.model_json_schema() == {**Eager.model_json_schema(), "title": "Lazy"}
+        assert Lazy.get_example() == Eager.get_example()
+        assert isinstance(ModelObject.get_example()["fields"]["order_id"], FieldObject)
+
+    def test_resolve_examples(self) -> None:
+        """Test that lazy examples are replaced in place, in nested dictionaries and lists."""
+        content = {"application/json": {"example": LazyExample(lambda: {"id": 1})}}
+        responses = {200: {"content": content}, 404: [LazyExample(lambda: "missing")]}
+
+        resolve_examples(responses)
+
+        assert content == {"application/json": {"example": {"id": 1}}}
+        assert responses[404] == ["missing"]
@@ -0,0 +1,62 @@
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+import yaml
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.utils import export
+from app.utils.export import serialize_data_contracts
+
+
+def _data_contract(id: str) -> DataContract:
+    """Builds a minimal data contract."""
+    return DataContract.model_validate(
+        {"dataContractSpecification": "1.1.0", "id": id, "info": {"title": id, "version": "1"}}
+    )
+
+
+async def _stream(*ids: str) -> AsyncIterator[DataContract]:
+    """Yields data contracts, as the database stream would."""
+    for id in ids:
+        yield _data_contract(id)
+
+
+async def _export(export_format: str, *ids: str) -> list[bytes]:
+    """Collects the chunks of an export."""
+    return [chunk async for chunk in serialize_data_contracts(_stream(*ids), export_format)]
+
+
+class TestExport:
+    """Test suite for the streaming serialization of data contract exports."""
+
+    async def test_ndjson(self) -> None:
+        """Test that NDJSON exports hold one JSON document per line."""
+        body = b"".join(await _export("ndjson", "a", "b"))
+
+        assert [json.loads(line)["id"] for line in body.splitlines()] == ["a", "b"]
+
+    async def test_json(self) -> None:
+        """Test that JSON exports are one array, empty when there is nothing to export."""
+        assert json.loads(b"".join(await _export("json", "a", "b", "c")))[2]["id"] == "c"
+        assert await _export("json") == [b"[]"]
+
+    async def test_yaml(self) -> None:
+        """Test that YAML exports are a stream of documents, without unset attributes."""
+        documents = list(yaml.safe_load_all(b"".join(await _export("yaml", "a", "b"))))
+
+        assert [document["id"] for document in documents] == ["a", "b"]
+        assert "servers" not in documents[0]
+        assert DataContract.model_validate(documents[1]) == _data_contract("b")
+
+    @pytest.mark.parametrize("export_format", ["ndjson", "json", "yaml"])
+    async def test_chunks(self, export_format: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the first document is sent right away, the next ones in larger chunks."""
+        ids = [f"contract-{index}" for index in range(10)]
+        one = await _export(export_format, ids[0])
+        monkeypatch.setattr(export, "EXPORT_CHUNK_SIZE", 3 * len(one[0]))
+
+        chunks = await _export(export_format, *ids)
+
+        assert chunks[0] == one[0]
+        assert 2 < len(chunks) < len(ids)
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import yaml
+from sqlalchemy.orm import Session
+
+from app.cli.importer import DataContractImporter, ImportJournal, discover_files
+from app.crud.data_contract import DataContractCRUD
+
+
+def _write_contract(path: Path, id: str, title: str = "Imported Contract") -> Path:
+    """Writes a minimal data contract file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "dataContractSpecification": "1.1.0",
+        "id": id,
+        "info": {"title": title, "version": "1.0.0"},
+    }
+    path.write_text(yaml.safe_dump(document), encoding="utf-8")
+    return path
+
+
+class TestDataContractImporter:
+    """Test suite for the bulk importer of data contract files."""
+
+    def test_discover_files(self, tmp_path: Path) -> None:
+        """Test that data contract files are found at any depth, other files being ignored."""
+        _write_contract(tmp_path / "a" / "orders.datacontract.yaml", "orders")
+        _write_contract(tmp_path / "b" / "c" / "datacontract.yml", "customers")
+        (tmp_path / "notes.yaml").write_text("not a contract", encoding="utf-8")
+
+        files = discover_files(tmp_path)
+
+        assert [path.name for path in files] == ["orders.datacontract.yaml", "datacontract.yml"]
+
+    def test_import(self, tmp_path: Path, db_session: Session) -> None:
+        """Test that valid files are imported in chunks, invalid and duplicate ones reported."""
+        for index in range(5):
+            _write_contract(tmp_path / f"{index}.datacontract.yaml", f"import-{index}")
+        _write_contract(tmp_path / "dup.datacontract.yaml", "import-0")
+        (tmp_path / "broken.datacontract.yaml").write_text("id: [unclosed", encoding="utf-8")
+        (tmp_path / "invalid.datacontract.yaml").write_text("id: no-info", encoding="utf-8")
+
+        importer = DataContractImporter(chunk_size=2, workers=0)
+        report = importer.run(db_session, discover_files(tmp_path))
+
+        assert report.discovered == report.parsed == 8
+        assert report.created == 5
+        errors = dict(report.errors)
+        assert errors[str(tmp_path / "dup.datacontract.yaml")].startswith("duplicate ID")
+        assert errors[str(tmp_path / "broken.datacontract.yaml")].startswith("invalid YAML")
+        assert "info" in errors[str(tmp_path / "invalid.datacontract.yaml")]
+        assert DataContractCRUD().get_data_contract(db_session, "import-4") is not None
+
+    def test_import_existing(self, tmp_path: Path, db_session: Session) -> None:
+        """Test that existing data contracts are kept, or replaced on demand."""
+        path = _write_contract(tmp_path / "datacontract.yaml", "import-existing")
+        DataContractImporter(workers=0).run(db_session, [path])
+        _write_contract(path, "import-existing", title="Updated Contract")
+
+        kept = DataContractImporter(workers=0).run(db_session, [path])
+        replaced = DataContractImporter(workers=0, replace=True).run(db_session, [path])
+
+        assert (kept.existing, kept.created, kept.failed) == (1, 0, 0)
+        assert (replaced.replaced, replaced.created) == (1, 0)
+        stored = DataContractCRUD().get_data_contract(db_session, "import-existing")
+        assert stored.info.title == "Updated Contract"
+
+    def test_resume(self, tmp_path: Path, db_session: Session) -> None:
+        """Test that journaled files are skipped until they change."""
+        journal = ImportJournal(tmp_path / "journal.jsonl")
+        first = _write_contract(tmp_path / "1.datacontract.yaml", "import-resume-1")
+        second = _write_contract(tmp_path / "2.datacontract.yaml", "import-resume-2")
+        DataContractImporter(workers=0, journal=journal).run(db_session, [first])
+
+        report = DataContractImporter(workers=0, journal=journal, replace=True).run(
+            db_session, [first, second]
+        )
+        assert (report.resumed, report.created) == (1, 1)
+
+        _write_contract(first, "import-resume-1", title="Changed since the last import")
+        report = DataContractImporter(workers=0, journal=journal, replace=True).run(
+            db_session, [first, second]
+        )
+        assert (report.resumed, report.replaced) == (1, 1)
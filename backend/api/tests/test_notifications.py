@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+from sqlalchemy.orm import Session
+
+from app.database.notifications import (
+    DATA_CONTRACT_CHANNEL,
+    WORKER_ID,
+    NotificationListener,
+    notification_listener,
+    notify,
+    notify_ids,
+)
+from app.services.data_contract import data_contract_cache
+from app.services.template import TemplateService
+
+
+class TestNotify:
+    """Test suite for the notify function."""
+
+    def test_notify_skipped_without_postgresql(self, db_session: Session) -> None:
+        """Test that nothing is sent on databases without LISTEN/NOTIFY."""
+        assert notify(db_session, DATA_CONTRACT_CHANNEL, {"op": "update", "id": "a"}) is False
+
+    def test_notify_in_session_transaction(self) -> None:
+        """Test that the notification is sent within the session's transaction."""
+        db = MagicMock(spec=Session)
+        db.get_bind.return_value.dialect.name = "postgresql"
+
+        assert notify(db, DATA_CONTRACT_CHANNEL, {"op": "update", "id": "a"}) is True
+
+        statement, params = db.execute.call_args.args
+        assert str(statement) == "SELECT pg_notify(:channel, :payload)"
+        assert params["channel"] == DATA_CONTRACT_CHANNEL
+        assert json.loads(params["payload"]) == {"op": "update", "id": "a", "origin": WORKER_ID}
+
+    def test_notify_payload_too_large(self) -> None:
+        """Test that payloads PostgreSQL would reject are not sent."""
+        db = MagicMock(spec=Session)
+        db.get_bind.return_value.dialect.name = "postgresql"
+
+        assert notify(db, DATA_CONTRACT_CHANNEL, {"data": "x" * 8000}) is False
+        db.execute.assert_not_called()
+
+    def test_notify_ids_split(self) -> None:
+        """Test that many IDs are split into notifications that each fit in a payload."""
+        db = MagicMock(spec=Session)
+        db.get_bind.return_value.dialect.name = "postgresql"
+        ids = [f"urn:datacontract:{index:04}" for index in range(1000)]
+
+        assert notify_ids(db, DATA_CONTRACT_CHANNEL, "delete", ids) is True
+
+        payloads = [call.args[1]["payload"] for call in db.execute.call_args_list]
+        assert len(payloads) > 1
+        assert all(len(payload.encode("utf-8")) <= 7999 for payload in payloads)
+        assert [id for payload in payloads for id in json.loads(payload)["ids"]] == ids
+
+
+class TestNotificationListener:
+    """Test suite for the NotificationListener class."""
+
+    def test_dispatch(self) -> None:
+        """Test that notifications from other workers reach the channel subscribers."""
+        listener = NotificationListener()
+        received, other = [], []
+        listener.subscribe("changes", MagicMock(side_effect=RuntimeError))
+        listener.subscribe("changes", received.append)
+        listener.subscribe("other", other.append)
+
+        listener.dispatch("changes", json.dumps({"id": "a", "origin": "another-worker"}))
+        listener.dispatch("changes", json.dumps({"id": "b", "origin": WORKER_ID}))
+        listener.dispatch("changes", "not json")
+
+        assert received == [{"id": "a", "origin": "another-worker"}]
+        assert other == []
+
+    def test_start_skipped_without_postgresql(self, test_engine) -> None:
+        """Test that no listener thread is started on databases without LISTEN/NOTIFY."""
+        listener = NotificationListener()
+        listener.start(test_engine)
+
+        assert listener._thread is None
+
+    def test_data_contract_cache_invalidated(self) -> None:
+        """Test that a change made by another worker evicts the cached data contract."""
+        data_contract_cache.set("contract", MagicMock())
+
+        notification_listener.dispatch(
+            DATA_CONTRACT_CHANNEL,
+            json.dumps({"op": "update", "id": "contract", "origin": "another-worker"}),
+        )
+
+        assert data_contract_cache.get("contract") is None
+
+    def test_data_contract_cache_invalidated_in_bulk(self) -> None:
+        """Test that a bulk change made by another worker evicts every cached data contract."""
+        data_contract_cache.set("a", MagicMock())
+        data_contract_cache.set("b", MagicMock())
+
+        notification_listener.dispatch(
+            DATA_CONTRACT_CHANNEL,
+            json.dumps({"op": "delete", "ids": ["a", "b"], "origin": "another-worker"}),
+        )
+
+        assert data_contract_cache.get("a") is None
+        assert data_contract_cache.get("b") is None
+
+    def test_template_change_applied(self, mocker) -> None:
+        """Test that template changes made by another worker are applied locally."""
+        mocker.patch.object(TemplateService, "_load_templates")
+        service = TemplateService()
+
+        service.apply_change({"op": "put", "id": "t", "data": {"id": "t", "v": 1}})
+        service.apply_change({"op": "put", "id": "t", "data": {"id": "t", "v": 2}})
+        assert service.get_template("t") == {"id": "t", "v": 2}
+
+        service.apply_change({"op": "delete", "id": "t"})
+        assert service.get_template("t") is None
+
+    def test_template_resync_keeps_templates(self, mocker) -> None:
+        """Test that a resync keeps the templates that only exist in memory."""
+        mocker.patch.object(TemplateService, "_load_templates")
+        service = TemplateService()
+        service.create_template("t", {"id": "t"})
+
+        service.resync_templates()
+
+        assert service.get_template("t") == {"id": "t"}
+
+    def test_template_first_load_once(self, mocker) -> None:
+        """Test that the listener thread and a request loading the templates load them once."""
+        load = mocker.patch.object(
+            TemplateService, "_load_templates", side_effect=lambda: time.sleep(0.05)
+        )
+        service = TemplateService()
+        listener = threading.Thread(
+            target=service.apply_change, args=({"op": "put", "id": "t", "data": {"id": "t"}},)
+        )
+
+        listener.start()
+        templates = service.list_templates()
+        listener.join()
+
+        assert load.call_count == 1
+        assert templates in ([], [{"id": "t"}])
+        assert service.get_template("t") == {"id": "t"}
@@ -0,0 +1,108 @@
+import pytest
+
+from app.exceptions.utils.patch import (
+    InvalidPatchOperationError,
+    InvalidPointerError,
+    NotAJsonPatchError,
+    PatchPathError,
+    PatchTestFailedError,
+    UnsupportedPatchMediaTypeError,
+)
+from app.utils.patch import (
+    apply_json_patch,
+    diff_documents,
+    is_json_patch,
+    merge_patch,
+    parse_pointer,
+    validate_json_patch,
+)
+
+
+class TestPatch:
+    """Test suite for the JSON Merge Patch and JSON Patch helpers."""
+
+    def test_is_json_patch(self) -> None:
+        """Test that the patch format is picked from the media type, merge patches by default."""
+        assert is_json_patch("application/json-patch+json; charset=utf-8")
+        assert not is_json_patch("application/merge-patch+json")
+        assert not is_json_patch("application/json")
+        assert not is_json_patch(None)
+        with pytest.raises(UnsupportedPatchMediaTypeError):
+            is_json_patch("text/plain")
+
+    def test_merge_patch(self) -> None:
+        """Test the merge patch examples of RFC 7386."""
+        target = {"a": "b", "c": {"d": "e", "f": "g"}}
+
+        patched = merge_patch(target, {"a": "z", "c": {"f": None}, "h": [1]})
+
+        assert patched == {"a": "z", "c": {"d": "e"}, "h": [1]}
+        assert target == {"a": "b", "c": {"d": "e", "f": "g"}}
+        assert merge_patch({"a": [{"b": "c"}]}, {"a": [1]}) == {"a": [1]}
+        assert merge_patch({"a": "b"}, ["c"]) == ["c"]
+
+    def test_parse_pointer(self) -> None:
+        """Test that pointer tokens are split and unescaped."""
+        assert parse_pointer("") == []
+        assert parse_pointer("/models/a~1b/m~0n") == ["models", "a/b", "m~n"]
+        with pytest.raises(InvalidPointerError):
+            parse_pointer("models")
+
+    def test_validate_json_patch(self) -> None:
+        """Test that malformed JSON Patches are rejected."""
+        with pytest.raises(NotAJsonPatchError):
+            validate_json_patch({"op": "add"})
+        with pytest.raises(InvalidPatchOperationError):
+            validate_json_patch([{"op": "rename", "path": "/a"}])
+        with pytest.raises(InvalidPatchOperationError):
+            validate_json_patch([{"op": "add", "path": "/a"}])
+
+    def test_apply_json_patch(self) -> None:
+        """Test every JSON Patch operation, the document being left unchanged."""
+        document = {"info": {"title": "A", "tags": ["x"]}, "servers": {"prod": {"port": 1}}}
+
+        patched = apply_json_patch(
+            document,
+            [
+                {"op": "test", "path": "/info/title", "value": "A"},
+                {"op": "replace", "path": "/info/title", "value": "B"},
+                {"op": "add", "path": "/info/tags/-", "value": "y"},
+                {"op": "add", "path": "/info/tags/0", "value": "w"},
+                {"op": "copy", "from": "/servers/prod", "path": "/servers/dev"},
+                {"op": "move", "from": "/servers/prod", "path": "/servers/live"},
+                {"op": "remove", "path": "/servers/dev/port"},
+            ],
+        )
+
+        assert patched == {
+            "info": {"title": "B", "tags": ["w", "x", "y"]},
+            "servers": {"dev": {}, "live": {"port": 1}},
+        }
+        assert document == {"info": {"title": "A", "tags": ["x"]}, "servers": {"prod": {"port": 1}}}
+
+    def test_apply_json_patch_errors(self) -> None:
+        """Test that failed tests and missing paths abort the patch."""
+        document = {"info": {"title": "A"}}
+
+        with pytest.raises(PatchTestFailedError):
+            apply_json_patch(document, [{"op": "test", "path": "/info/title", "value": "B"}])
+        with pytest.raises(PatchPathError):
+            apply_json_patch(document, [{"op": "remove", "path": "/info/owner"}])
+        with pytest.raises(PatchPathError):
+            apply_json_patch(document, [{"op": "add", "path": "/servers/prod", "value": {}}])
+
+    def test_diff_documents(self) -> None:
+        """Test that diffs only hold the changed members and turn one document into the other."""
+        source = {"info": {"title": "A", "owner": "x"}, "models": {"a/b": {"f": [1, 2]}}, "t": 1}
+        target = {"info": {"title": "B", "owner": "x"}, "models": {"a/b": {"f": [1]}}, "u": 2}
+
+        diff = diff_documents(source, target)
+
+        assert diff == [
+            {"op": "replace", "path": "/info/title", "value": "B"},
+            {"op": "replace", "path": "/models/a~1b/f", "value": [1]},
+            {"op": "remove", "path": "/t"},
+            {"op": "add", "path": "/u", "value": 2},
+        ]
+        assert apply_json_patch(source, diff) == target
+        assert diff_documents(target, target) == []
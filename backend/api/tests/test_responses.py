@@ -0,0 +1,44 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.schemas.data_contract.routes.data_contract_get import DataContractGetResponse
+from app.schemas.data_contract.routes.data_contract_list import DataContractListResponse
+from app.utils.responses import PydanticJSONResponse
+
+
+def _client(model: DataContractGetResponse | DataContractListResponse) -> TestClient:
+    """Serves a response model through FastAPI's default rendering and PydanticJSONResponse."""
+    app = FastAPI()
+
+    @app.get("/default", response_model=type(model))
+    async def default() -> DataContractGetResponse | DataContractListResponse:
+        return model
+
+    @app.get("/direct", response_model=type(model))
+    async def direct() -> PydanticJSONResponse:
+        return PydanticJSONResponse(model, status_code=201, headers={"ETag": '"1-0"'})
+
+    return TestClient(app)
+
+
+class TestPydanticJSONResponse:
+    """Test suite for the JSON responses rendered straight from Pydantic models."""
+
+    def test_same_body_as_default_rendering(self) -> None:
+        """Test that the rendered body is the one FastAPI renders for the response model."""
+        data_contract = DataContract.model_validate(DataContract.get_example())
+        for model in (
+            DataContractGetResponse(message=" ✅ Retrieved", data=data_contract),
+            DataContractListResponse(message=" ✅ Retrieved", data=[data_contract, data_contract]),
+        ):
+            client = _client(model)
+            default, direct = client.get("/default"), client.get("/direct")
+
+            assert direct.content == default.content
+            assert direct.headers["content-type"] == "application/json"
+            assert (direct.status_code, direct.headers["etag"]) == (201, '"1-0"')
+
+    def test_render_plain_content(self) -> None:
+        """Test that content other than a model is rendered like by JSONResponse."""
+        assert PydanticJSONResponse({"detail": "é"}).body == '{"detail":"é"}'.encode()
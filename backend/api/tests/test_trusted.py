@@ -0,0 +1,70 @@
+import json
+from typing import Any
+
+import pytest
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.utils.tools import pydantic_to_db_model
+from app.utils.trusted import ReadVerifier, render_document, trusted_document
+
+
+def _stored_document() -> dict[str, Any]:
+    """Stores the example data contract, with a field reference, and reads its document back."""
+    example = json.loads(
+        DataContract.model_validate(DataContract.get_example()).model_dump_json(by_alias=True)
+    )
+    example["models"]["orders"]["fields"]["order_id"]["$ref"] = "#/definitions/order_id"
+    stored = pydantic_to_db_model(DataContract.model_validate(example))
+    return json.loads(json.dumps(trusted_document(stored)))
+
+
+class TestTrustedReads:
+    """Test suite for serving stored data contracts without validating them again."""
+
+    def test_render_matches_validation(self) -> None:
+        """Test that a stored document renders like its validated model, references included."""
+        document = _stored_document()
+        validated = DataContract.model_validate(document)
+
+        assert json.loads(render_document(document)) == json.loads(
+            validated.model_dump_json(by_alias=True)
+        )
+        assert validated.models["orders"].fields["order_id"].ref == "#/definitions/order_id"
+
+    def test_unset_sections(self) -> None:
+        """Test that sections missing from the row are rendered as null."""
+        document = trusted_document({"id": "urn:datacontract:test", "info": {}})
+
+        assert list(document) == list(DataContract.model_fields)
+        assert document["servers"] is None
+
+    @pytest.mark.parametrize(
+        ("interval", "expected"),
+        [(3, [True, False, False, True, False]), (1, [True] * 5), (0, [False] * 5)],
+    )
+    def test_sampling(self, interval: int, expected: list[bool]) -> None:
+        """Test that one read in the interval is sampled, and none when it is 0."""
+        verifier = ReadVerifier(interval)
+
+        assert [verifier.sample() for _ in expected] == expected
+
+    def test_verify_drift(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a document validation changes is logged, and served validated."""
+        document = _stored_document()
+        field = document["models"]["orders"]["fields"]["order_id"]
+        # Rows written before sections were stored by alias hold references under "ref"
+        field["ref"] = field.pop("$ref")
+
+        validated, data_contract = ReadVerifier.verify(document)
+
+        assert "drifted" in caplog.text
+        assert validated == json.loads(data_contract.model_dump_json(by_alias=True))
+        assert "ref" not in validated["models"]["orders"]["fields"]["order_id"]
+        assert validated["models"]["orders"]["fields"]["order_id"]["$ref"] == field["ref"]
+
+    def test_verify_invalid(self) -> None:
+        """Test that a document which no longer validates raises."""
+        document = {**_stored_document(), "info": None}
+
+        with pytest.raises(ValueError):
+            ReadVerifier.verify(document)
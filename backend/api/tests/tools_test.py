@@ -15,7 +15,13 @@ from app.schemas.data_contract.objects.quality_object import QualityObject
 from app.schemas.data_contract.objects.server_object import ServerObject
 from app.schemas.data_contract.objects.service_level_object import ServiceLevelObject
 from app.schemas.data_contract.objects.term_object import TermObject
-from app.utils.tools import db_to_pydantic_model, pydantic_to_db_model
+from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
+from app.utils.tools import (
+    as_data_contract,
+    data_contract_columns,
+    db_to_pydantic_model,
+    pydantic_to_db_model,
+)
 
 
 class TestTools(unittest.TestCase):
@@ -495,6 +501,37 @@ class TestTools(unittest.TestCase):
             converted_pydantic_model.model_dump(mode="json"),
         )
 
+    def test_data_contract_columns(self):
+        """
+        Test the single pass mapping of a data contract to its document columns.
+        """
+        columns = data_contract_columns(self.pydantic_data_contract)
+
+        self.assertEqual(
+            columns, self.pydantic_data_contract.model_dump(mode="json", by_alias=True)
+        )
+        empty = self.pydantic_data_contract.model_copy(update={"servers": {}, "examples": []})
+        self.assertIsNone(data_contract_columns(empty)["servers"])
+        self.assertIsNone(data_contract_columns(empty)["examples"])
+
+    def test_as_data_contract(self):
+        """
+        Test that a validated request model is converted without being validated again.
+        """
+        document = self.pydantic_data_contract.model_dump(mode="json", by_alias=True)
+        document["models"]["orders"]["fields"]["order_id"]["$ref"] = "#/definitions/order_id"
+        request = DataContractCreate.model_validate(document)
+
+        data_contract = as_data_contract(request)
+
+        self.assertIs(type(data_contract), PydanticDataContract)
+        self.assertIs(data_contract.models, request.models)
+        self.assertEqual(
+            data_contract_columns(data_contract)["models"]["orders"]["fields"]["order_id"]["$ref"],
+            "#/definitions/order_id",
+        )
+        self.assertIs(as_data_contract(data_contract), data_contract)
+
 
 if __name__ == "__main__":
     unittest.main()